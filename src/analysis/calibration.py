@@ -0,0 +1,267 @@
+"""
+OU 模型参数标定：用实测序列拟合风速、环境温度、轴承温度与振动模拟器的参数。
+
+各模拟器单步都可写成 AR(1) 形式 y_k = a·y_{k-1} + (1 - a)·m_k + s·ε，
+其中回复目标 m_k 对未知参数是线性的（日变化正弦项、转速二次项），
+因此用条件最大似然（即最小二乘）闭式求解：逐段累积正规方程 XᵀX、Xᵀy、yᵀy，
+所有风机在同一次数组运算中求解，按时间分块累积以保持内存占用有界。
+最后由 (a, s) 按模拟器的离散化方法换算为 tau、sigma。
+
+结果可写成参数文件，键名与模拟器构造参数一致：
+
+    params = load_calibrated_parameters("calibration.json", "002")
+    wind_simulator = WindSpeedSimulator(**params["wind"])
+"""
+
+import json
+import os
+
+import numpy as np
+
+from ..simulations.time_stepping import check_ou_method
+
+CALIBRATION_VERSION = 1
+# 每个分块包含的元素数上限（风机数 × 时间步）
+_BLOCK_ELEMENTS = 1 << 22
+_A_EPS = 1e-9
+
+
+class _LeastSquares:
+    """
+    多条序列并行的带掩码最小二乘：按块累积正规方程，最后批量求解
+    """
+
+    def __init__(self, n_series: int, n_features: int):
+        self.xx = np.zeros((n_series, n_features, n_features))
+        self.xy = np.zeros((n_series, n_features))
+        self.yy = np.zeros(n_series)
+        self.n = np.zeros(n_series)
+
+    def add(self, features: list, y: np.ndarray, mask: np.ndarray):
+        """
+        :param features: K 个 (n_series, block) 回归量
+        :param y: (n_series, block) 因变量
+        :param mask: (n_series, block) 参与拟合的样本
+        """
+        w = mask.astype(float)
+        y = np.where(mask, y, 0.0)
+        features = [np.where(mask, f, 0.0) for f in features]
+        for i, fi in enumerate(features):
+            self.xy[:, i] += (fi * y).sum(axis=1)
+            for j in range(i, len(features)):
+                self.xx[:, i, j] += (fi * features[j]).sum(axis=1)
+                self.xx[:, j, i] = self.xx[:, i, j]
+        self.yy += (y * y).sum(axis=1)
+        self.n += w.sum(axis=1)
+
+    def solve(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        :return: (系数 (n_series, K), 残差方差（最大似然估计，除以 n）)
+        """
+        k = self.xy.shape[1]
+        ok = self.n > k
+        xx = np.where(ok[:, None, None], self.xx, np.eye(k))
+        # 极小的岭项避免退化（如转速恒定时二次项与常数项共线）
+        xx = xx + 1e-12 * np.trace(xx, axis1=1, axis2=2)[:, None, None] * np.eye(k)
+        beta = np.linalg.solve(xx, self.xy[..., None])[..., 0]
+        rss = self.yy - 2 * (beta * self.xy).sum(axis=1) + np.einsum("ni,nij,nj->n", beta, self.xx, beta)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            var = np.where(ok, np.maximum(rss, 0.0) / self.n, np.nan)
+        beta[~ok] = np.nan
+        return beta, var
+
+
+def _as_2d(values) -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    return values[None, :] if values.ndim == 1 else values
+
+
+def _blocks(n_series: int, n_steps: int):
+    """
+    按时间分块的 (起点, 终点)；相邻块重叠一个样本，以保留跨块的 (y_{k-1}, y_k) 样本对
+    """
+    block = max(_BLOCK_ELEMENTS // max(n_series, 1), 2)
+    for lo in range(0, n_steps - 1, block - 1):
+        yield lo, min(lo + block, n_steps)
+
+
+def ou_from_ar1(a, s, dt, method: str = "exact") -> tuple[np.ndarray, np.ndarray]:
+    """
+    AR(1) 系数换算为 OU 参数（ou_coefficients 的逆运算）
+    :param a: 自回归系数，须在 (0, 1) 内
+    :param s: 残差标准差
+    :param dt: 时间步长
+    :param method: 与模拟器一致的离散化方法
+    :return: (tau, sigma)
+    """
+    check_ou_method(method)
+    a = np.clip(np.asarray(a, dtype=float), _A_EPS, 1.0 - _A_EPS)
+    if method == "exact":
+        tau = -dt / np.log(a)
+        sigma = s / np.sqrt(0.5 * tau * (1.0 - a * a))
+    else:
+        tau = dt / (1.0 - a)
+        sigma = s / np.sqrt(dt)
+    return tau, sigma
+
+
+def fit_ar1(series, dt: float = 1.0, method: str = "exact") -> dict:
+    """
+    常数均值 OU 过程的闭式最大似然标定（NaN 样本自动跳过）
+    :param series: (n_steps,) 或 (n_series, n_steps)
+    :return: {"tau", "sigma", "mean", "n"}，各为 (n_series,) 数组
+    """
+    x = _as_2d(series)
+    ls = _LeastSquares(len(x), 2)
+    for lo, hi in _blocks(*x.shape):
+        prev, cur = x[:, lo:hi - 1], x[:, lo + 1:hi]
+        ls.add([prev, np.ones_like(prev)], cur, np.isfinite(prev) & np.isfinite(cur))
+    beta, var = ls.solve()
+    a, c = beta.T
+    tau, sigma = ou_from_ar1(a, np.sqrt(var), dt, method)
+    return {"tau": tau, "sigma": sigma, "mean": c / (1.0 - a), "n": ls.n}
+
+
+def calibrate_wind(speeds, dirs=None, dt: float = 1.0, method: str = "exact") -> dict:
+    """
+    标定 WindSpeedSimulator 参数
+    :param speeds: 风速 (n_turbines, n_steps)，m/s
+    :param dirs: 风向（度），可选；先展开再拟合，避免 ±180° 处的跳变
+    :param dt: 采样间隔（秒）
+    :return: 构造参数名 → (n_turbines,) 数组
+    """
+    fit = fit_ar1(speeds, dt, method)
+    params = {"tau": fit["tau"], "sigma": fit["sigma"], "mean_wind": fit["mean"]}
+    if dirs is not None:
+        dirs = _as_2d(dirs)
+        unwrapped = np.rad2deg(np.unwrap(np.deg2rad(dirs), axis=1))
+        fit_dir = fit_ar1(unwrapped, dt, method)
+        params.update(tau_dir=fit_dir["tau"], sigma_dir=fit_dir["sigma"],
+                      mean_dir=(fit_dir["mean"] + 180.0) % 360.0 - 180.0)
+    return params
+
+
+def calibrate_ambient(temps, dt: float = 1.0, method: str = "exact") -> dict:
+    """
+    标定 TemperatureSimulator 参数（含日变化振幅与相位）
+    回复目标 m(t) = mean + A·sin(2π(t + φ)/24) 展开为 sin/cos 两项后对参数线性。
+    :param temps: 环境温度 (n_turbines, n_steps)，第 k 个样本对应 t = k·dt 小时
+    :param dt: 采样间隔（小时）
+    :return: 构造参数名 → (n_turbines,) 数组
+    """
+    x = _as_2d(temps)
+    omega = 2 * np.pi / 24.0
+    ls = _LeastSquares(len(x), 4)
+    for lo, hi in _blocks(*x.shape):
+        prev, cur = x[:, lo:hi - 1], x[:, lo + 1:hi]
+        t = np.broadcast_to(np.arange(lo + 1, hi) * dt, prev.shape)
+        ls.add([prev, np.ones_like(prev), np.sin(omega * t), np.cos(omega * t)], cur,
+               np.isfinite(prev) & np.isfinite(cur))
+    beta, var = ls.solve()
+    a, b0, b_sin, b_cos = beta.T
+    tau, sigma = ou_from_ar1(a, np.sqrt(var), dt, method)
+    return {
+        "tau": tau,
+        "sigma": sigma,
+        "mean_temp": b0 / (1.0 - a),
+        "daily_amp": np.hypot(b_sin, b_cos) / (1.0 - a),
+        "daily_phase": np.arctan2(b_cos, b_sin) / omega,
+    }
+
+
+def _rpm_scaled_sq(rpm: np.ndarray, rpm_min: float, rpm_rated: float) -> np.ndarray:
+    return np.clip((rpm - rpm_min) / (rpm_rated - rpm_min), 0.0, 1.0) ** 2
+
+
+def calibrate_bearing_temp(temps, ambient, rpm, rpm_min: float = 6.0, rpm_rated: float = 15.0,
+                           dt: float = 1.0, method: str = "exact") -> dict:
+    """
+    标定 BearingTemperatureSimulator 参数
+    运行时段 T_k - T_amb = a (T_{k-1} - T_amb) + (1 - a)·R·x_k² + 噪声，x 为归一化转速；
+    停机时段温度被钳制为环境温度，不参与拟合。
+    :param temps: 轴承温度 (n_turbines, n_steps)，°C
+    :param ambient: 环境温度，可广播到 temps 的形状
+    :param rpm: 转速，可广播到 temps 的形状
+    :param dt: 采样间隔（分钟）
+    :return: 构造参数名 → (n_turbines,) 数组（tau, sigma, temp_rise_at_rated）
+    """
+    x = _as_2d(temps)
+    ambient = np.broadcast_to(_as_2d(ambient), x.shape)
+    rpm = np.broadcast_to(_as_2d(rpm), x.shape)
+    ls = _LeastSquares(len(x), 2)
+    for lo, hi in _blocks(*x.shape):
+        amb = ambient[:, lo + 1:hi]
+        prev, cur = x[:, lo:hi - 1] - amb, x[:, lo + 1:hi] - amb
+        r = rpm[:, lo + 1:hi]
+        ls.add([prev, _rpm_scaled_sq(r, rpm_min, rpm_rated)], cur,
+               (r > rpm_min) & np.isfinite(prev) & np.isfinite(cur))
+    beta, var = ls.solve()
+    a, b = beta.T
+    tau, sigma = ou_from_ar1(a, np.sqrt(var), dt, method)
+    return {"tau": tau, "sigma": sigma, "temp_rise_at_rated": b / (1.0 - a)}
+
+
+def calibrate_bearing_vibration(vibrations, rpm, rpm_min: float = 6.0, rpm_rated: float = 15.0,
+                                dt: float = 1.0, method: str = "exact") -> dict:
+    """
+    标定 BearingVibrationSimulator 参数
+    运行时段 v_k = a v_{k-1} + (1 - a)(base + (rated - base)·x_k²) + 噪声，对 (a, 常数, 二次项) 线性。
+    :param vibrations: 振动 RMS (n_turbines, n_steps)，mm/s
+    :param rpm: 转速，可广播到 vibrations 的形状
+    :param dt: 采样间隔（分钟）
+    :return: 构造参数名 → (n_turbines,) 数组（tau, sigma, base_rms, rms_at_rated）
+    """
+    x = _as_2d(vibrations)
+    rpm = np.broadcast_to(_as_2d(rpm), x.shape)
+    ls = _LeastSquares(len(x), 3)
+    for lo, hi in _blocks(*x.shape):
+        prev, cur = x[:, lo:hi - 1], x[:, lo + 1:hi]
+        r = rpm[:, lo + 1:hi]
+        ls.add([prev, np.ones_like(prev), _rpm_scaled_sq(r, rpm_min, rpm_rated)], cur,
+               (r > rpm_min) & np.isfinite(prev) & np.isfinite(cur))
+    beta, var = ls.solve()
+    a, b0, b2 = beta.T
+    tau, sigma = ou_from_ar1(a, np.sqrt(var), dt, method)
+    base = b0 / (1.0 - a)
+    return {"tau": tau, "sigma": sigma, "base_rms": base, "rms_at_rated": base + b2 / (1.0 - a)}
+
+
+def save_calibrated_parameters(path: str, device_ids, stages: dict, dt: dict | None = None,
+                               method: str = "exact"):
+    """
+    写出参数文件
+    :param path: JSON 文件路径
+    :param device_ids: 风机编号列表，与各参数数组的行对应
+    :param stages: 阶段名（wind / ambient / bearing_temp / bearing_vibration）→ calibrate_* 的返回值
+    :param dt: 阶段名 → 标定时使用的采样间隔，写入参数以便模拟器按相同步长运行
+    :param method: 标定使用的离散化方法
+    """
+    dt = dt or {}
+    turbines = {}
+    for i, device_id in enumerate(device_ids):
+        entry = {}
+        for stage, params in stages.items():
+            values = {name: float(np.asarray(v)[i]) for name, v in params.items()}
+            if stage in dt:
+                values["dt"] = float(dt[stage])
+            entry[stage] = {**values, "method": method}
+        turbines[str(device_id)] = entry
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": CALIBRATION_VERSION, "turbines": turbines}, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def load_calibrated_parameters(path: str, device_id) -> dict:
+    """
+    读取某台风机的标定参数
+    :return: 阶段名 → 模拟器构造参数
+    """
+    with open(path, encoding="utf-8") as f:
+        content = json.load(f)
+    if content.get("version") != CALIBRATION_VERSION:
+        raise ValueError(f"不支持的参数文件版本: {content.get('version')}")
+    try:
+        return content["turbines"][str(device_id)]
+    except KeyError:
+        raise KeyError(f"参数文件中没有风机 {device_id}") from None
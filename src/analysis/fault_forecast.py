@@ -0,0 +1,221 @@
+import numpy as np
+
+from ..simulations.bearing.bearing_temp_simulator import BearingTemperatureSimulator
+from ..simulations.bearing.bearing_vibration_simulator import BearingVibrationSimulator
+from ..simulations.time_stepping import ou_coefficients
+
+# 风险等级编码
+RISK_LOW = 0
+RISK_MEDIUM = 1
+RISK_HIGH = 2
+RISK_LABELS = ("低风险", "中风险", "高风险")
+
+
+def _trend_and_level(residual: np.ndarray, window: int, valid: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    对每台风机最近 window 个残差样本做最小二乘线性拟合（向量化），只使用 valid 为 True 的样本
+    :param residual: (n_turbines, n_history) 残差矩阵
+    :param valid: 与 residual 同形状的有效样本掩码（如运行时段），默认全部有效
+    :return: (斜率[每步], 窗口末端的拟合值)；有效样本不足 2 个时斜率为 0，没有有效样本时拟合值为 0
+    """
+    recent = residual[:, -window:]
+    w = recent.shape[1]
+    weight = np.ones(recent.shape) if valid is None else valid[:, -window:].astype(float)
+    x = np.where(weight > 0, recent, 0.0)
+    # 下标以窗口中心为原点，减小求和的舍入误差
+    t = np.arange(w) - (w - 1) / 2.0
+    n = weight.sum(axis=1)
+    sum_t = weight @ t
+    sum_x = x.sum(axis=1)
+    sum_tt = weight @ (t * t)
+    sum_tx = x @ t
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_mean = sum_t / n
+        x_mean = sum_x / n
+        s_tt = sum_tt - n * t_mean * t_mean
+        slope = (sum_tx - n * t_mean * x_mean) / s_tt
+    slope = np.where((n >= 2) & (s_tt > 1e-12), slope, 0.0)
+    level = np.where(n > 0, x_mean + slope * ((w - 1) / 2.0 - t_mean), 0.0)
+    return slope, level
+
+
+class ForecastResult:
+    """
+    风险预测结果（n_turbines 台风机，报告时刻为 report_minutes）
+    """
+
+    def __init__(self, report_minutes, temp_mean, temp_quantiles, vib_mean, vib_quantiles,
+                 quantile_levels, temp_exceed_prob, vib_exceed_prob, temp_trend, vib_trend):
+        self.report_minutes = report_minutes        # (n_reports,)
+        self.temp_mean = temp_mean                  # (n_turbines, n_reports)
+        self.temp_quantiles = temp_quantiles        # (n_turbines, n_quantiles, n_reports)
+        self.vib_mean = vib_mean
+        self.vib_quantiles = vib_quantiles
+        self.quantile_levels = quantile_levels
+        self.temp_exceed_prob = temp_exceed_prob    # (n_turbines,) 预测期内超过温度限值的概率
+        self.vib_exceed_prob = vib_exceed_prob      # (n_turbines,) 预测期内超过振动限值的概率
+        self.temp_trend = temp_trend                # (n_turbines,) 温度残差趋势（°C/小时）
+        self.vib_trend = vib_trend                  # (n_turbines,) 振动残差趋势（mm/s/小时）
+
+    @property
+    def risk_probability(self) -> np.ndarray:
+        """
+        轴承故障综合风险概率（温度或振动任一超限）的保守估计
+        """
+        return np.maximum(self.temp_exceed_prob, self.vib_exceed_prob)
+
+    def risk_level(self, medium: float = 0.2, high: float = 0.5) -> np.ndarray:
+        """
+        风险等级编码（0=低, 1=中, 2=高），可用 RISK_LABELS 查表
+        """
+        prob = self.risk_probability
+        levels = np.full(prob.shape, RISK_LOW, dtype=np.uint8)
+        levels[prob >= medium] = RISK_MEDIUM
+        levels[prob >= high] = RISK_HIGH
+        return levels
+
+
+class BearingFaultForecaster:
+    """
+    未来 24 小时轴承故障风险预测（对应运维知识库第 6 节）
+
+    以现有轴承温度/振动模拟器的物理模型为基础，从每台风机的当前状态出发做蒙特卡洛推演：
+    - 先用近期历史计算“实测值 - 模型期望值”的残差，并向量化拟合残差的线性趋势，
+      作为尚未被模型解释的劣化（如润滑恶化、早期磨损）向未来外推；
+    - 然后对 (风机数 × 样本数) 的状态矩阵按 OU 精确转移逐分钟并行推进，
+      统计超限概率与各报告时刻的均值、分位数。
+    所有风机、所有样本在同一次数组运算中推进，不含按风机或按样本的 Python 循环。
+    """
+
+    def __init__(
+        self,
+        temp_simulator: BearingTemperatureSimulator | None = None,
+        vib_simulator: BearingVibrationSimulator | None = None,
+        horizon_minutes: int = 24 * 60,
+        n_samples: int = 200,
+        temp_limit: float = 80.0,
+        vibration_limit: float = 7.1,
+        trend_window: int = 24 * 60,
+        report_every: int = 60,
+        quantile_levels=(0.05, 0.5, 0.95),
+        rng=None,
+    ):
+        """
+        :param temp_simulator: 轴承温度模拟器（提供 tau、sigma 与摩擦温升模型），默认参数创建
+        :param vib_simulator: 轴承振动模拟器（提供 tau、sigma 与转速-振动模型），默认参数创建
+        :param horizon_minutes: 预测时长（分钟）
+        :param n_samples: 每台风机的蒙特卡洛样本数
+        :param temp_limit: 轴承温度告警限值（°C）
+        :param vibration_limit: 振动告警限值（mm/s）
+        :param trend_window: 拟合残差趋势使用的历史长度（分钟）
+        :param report_every: 报告均值与分位数的间隔（分钟）
+        :param quantile_levels: 报告的分位数
+        :param rng: numpy Generator，默认 np.random.default_rng()
+        """
+        self.temp_simulator = temp_simulator or BearingTemperatureSimulator()
+        self.vib_simulator = vib_simulator or BearingVibrationSimulator()
+        self.horizon_minutes = horizon_minutes
+        self.n_samples = n_samples
+        self.temp_limit = temp_limit
+        self.vibration_limit = vibration_limit
+        self.trend_window = trend_window
+        self.report_every = report_every
+        self.quantile_levels = tuple(quantile_levels)
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    def _expected(self, ambient: np.ndarray, rpm: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        模型期望的轴承温度、振动均值及停机掩码
+        """
+        idle = rpm <= self.temp_simulator.rpm_min
+        temp = ambient + self.temp_simulator._get_friction_heat_rise_array(rpm)
+        vib = self.vib_simulator._get_mean_rms_from_rpm_array(rpm)
+        return temp, vib, idle
+
+    def forecast(
+        self,
+        temp_history: np.ndarray,
+        vib_history: np.ndarray,
+        ambient_history: np.ndarray,
+        rpm_history: np.ndarray,
+        ambient_future: np.ndarray | None = None,
+        rpm_future: np.ndarray | None = None,
+    ) -> ForecastResult:
+        """
+        对风机群做未来风险预测
+        :param temp_history: 轴承温度历史 (n_turbines, n_history)，分钟级
+        :param vib_history: 振动历史 (n_turbines, n_history)
+        :param ambient_history: 环境温度历史 (n_turbines, n_history)
+        :param rpm_history: 转速历史 (n_turbines, n_history)
+        :param ambient_future: 未来环境温度 (n_turbines, horizon) 或可广播的形状，默认保持最近一小时均值
+        :param rpm_future: 未来转速 (n_turbines, horizon) 或可广播的形状，默认保持最近一小时均值
+        :return: ForecastResult
+        """
+        temp_history = np.atleast_2d(np.asarray(temp_history, dtype=float))
+        vib_history = np.atleast_2d(np.asarray(vib_history, dtype=float))
+        ambient_history = np.atleast_2d(np.asarray(ambient_history, dtype=float))
+        rpm_history = np.atleast_2d(np.asarray(rpm_history, dtype=float))
+        n_turbines = temp_history.shape[0]
+        horizon = self.horizon_minutes
+
+        # 残差趋势：只用运行时段（停机时温度被钳制为环境温度，不含劣化信息）
+        exp_temp, exp_vib, idle = self._expected(ambient_history, rpm_history)
+        temp_slope, temp_level = _trend_and_level(temp_history - exp_temp, self.trend_window, ~idle)
+        vib_slope, vib_level = _trend_and_level(vib_history - exp_vib, self.trend_window, ~idle)
+
+        if ambient_future is None:
+            ambient_future = ambient_history[:, -60:].mean(axis=1, keepdims=True)
+        if rpm_future is None:
+            rpm_future = rpm_history[:, -60:].mean(axis=1, keepdims=True)
+        ambient_future = np.broadcast_to(np.asarray(ambient_future, dtype=float), (n_turbines, horizon))
+        rpm_future = np.broadcast_to(np.asarray(rpm_future, dtype=float), (n_turbines, horizon))
+        fut_temp, fut_vib, fut_idle = self._expected(ambient_future, rpm_future)
+
+        # 目标值 = 模型期望 + 残差水平 + 趋势外推
+        steps = np.arange(1, horizon + 1)
+        temp_target = fut_temp + temp_level[:, None] + temp_slope[:, None] * steps
+        vib_target = fut_vib + vib_level[:, None] + vib_slope[:, None] * steps
+
+        ts, vs = self.temp_simulator, self.vib_simulator
+        a_t, s_t = ou_coefficients(ts.tau, ts.sigma, ts.dt, "exact")
+        a_v, s_v = ou_coefficients(vs.tau, vs.sigma, vs.dt, "exact")
+
+        shape = (n_turbines, self.n_samples)
+        temp = np.repeat(temp_history[:, -1:], self.n_samples, axis=1)
+        vib = np.repeat(vib_history[:, -1:], self.n_samples, axis=1)
+        temp_max = temp.copy()
+        vib_max = vib.copy()
+
+        report_steps = np.arange(self.report_every, horizon + 1, self.report_every)
+        temp_snap = np.empty((len(report_steps),) + shape)
+        vib_snap = np.empty((len(report_steps),) + shape)
+        k = 0
+        for h in range(horizon):
+            amb = ambient_future[:, h:h + 1]
+            idle_h = fut_idle[:, h:h + 1]
+            tt = temp_target[:, h:h + 1]
+            vt = vib_target[:, h:h + 1]
+            temp = tt + a_t * (temp - tt) + s_t * self.rng.standard_normal(shape)
+            temp = np.where(idle_h, amb, np.maximum(temp, amb))
+            vib = vt + a_v * (vib - vt) + s_v * self.rng.standard_normal(shape)
+            vib = np.where(idle_h, vs.base_rms * 0.1, np.maximum(vib, 0.0))
+            np.maximum(temp_max, temp, out=temp_max)
+            np.maximum(vib_max, vib, out=vib_max)
+            if k < len(report_steps) and h + 1 == report_steps[k]:
+                temp_snap[k] = temp
+                vib_snap[k] = vib
+                k += 1
+
+        q = np.asarray(self.quantile_levels)
+        return ForecastResult(
+            report_minutes=report_steps,
+            temp_mean=temp_snap.mean(axis=2).T,
+            temp_quantiles=np.quantile(temp_snap, q, axis=2).transpose(2, 0, 1),
+            vib_mean=vib_snap.mean(axis=2).T,
+            vib_quantiles=np.quantile(vib_snap, q, axis=2).transpose(2, 0, 1),
+            quantile_levels=q,
+            temp_exceed_prob=(temp_max >= self.temp_limit).mean(axis=1),
+            vib_exceed_prob=(vib_max >= self.vibration_limit).mean(axis=1),
+            temp_trend=temp_slope * 60.0 / ts.dt,
+            vib_trend=vib_slope * 60.0 / vs.dt,
+        )
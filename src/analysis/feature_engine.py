@@ -0,0 +1,241 @@
+"""
+SCADA 分钟数据的滚动窗口特征引擎：由 (风机数 × 分钟数) 的功率、转速、轴承温度、轴承振动矩阵
+生成 AnomalyDetection.fit 所需的特征矩阵。
+
+- 均值、标准差、斜率（窗口内最小二乘线性趋势）由沿时间轴的累积和一次求出，代价与窗口长度无关；
+- 最小/最大值使用 van Herk/Gil-Werman 分块前缀/后缀算法（与 rule_engine 相同）；
+- 分位数在 sliding_window_view（步幅技巧，不复制数据）上按时间块求 np.quantile，限制临时内存；
+- 跨信号残差：轴承温度减去由转速和环境温度给出的期望温度、振动减去由转速给出的期望振动，
+  期望值来自轴承模拟器的稳态关系；残差与原始信号一样参与滚动统计；
+- 窗口未填满的位置为 NaN；缺失样本（NaN）只影响包含它的窗口：均值、标准差、斜率在这些窗口为 NaN，
+  最小/最大值与分位数忽略缺失样本（窗口内全部缺失时为 NaN）；
+- append() 保留最大窗口长度的历史尾部，增量结果与整段批量计算一致。
+
+    engine = FeatureEngine(bearing_temp_model=BearingTemperatureSimulator(rpm_min=..., rpm_rated=...))
+    features = engine.transform({"power_kw": power, "rpm": rpm, "bearing_temp": temp,
+                                 "bearing_vibration": vib, "ambient_temp": ambient})
+    X, index = features.to_matrix()
+    AnomalyDetection().fit(X)
+"""
+
+import warnings
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .rule_engine import _rolling_max
+
+# 默认滚动窗口（分钟）：10 分钟、1 小时、24 小时
+DEFAULT_FEATURE_WINDOWS = (10, 60, 24 * 60)
+STATS = ("mean", "std", "slope", "min", "max")
+DEFAULT_QUANTILES = (0.1, 0.5, 0.9)
+# 默认参与滚动统计的信号（存在时）
+DEFAULT_SIGNALS = ("power_kw", "rpm", "bearing_temp", "bearing_vibration",
+                   "bearing_temp_residual", "bearing_vibration_residual")
+# 分位数计算的单块临时数组上限（元素数）
+QUANTILE_BLOCK_ELEMENTS = 8_000_000
+
+
+def _window_sums(csum: np.ndarray, window: int) -> np.ndarray:
+    """
+    由前补 0 的累积和求尾随窗口和，窗口未填满的位置为 NaN
+    """
+    n = csum.shape[1] - 1
+    out = np.full((csum.shape[0], n), np.nan)
+    if n >= window:
+        out[:, window - 1:] = csum[:, window:] - csum[:, :n - window + 1]
+    return out
+
+
+def _rolling_quantiles(x: np.ndarray, window: int, quantiles, has_nan: np.ndarray | None = None) -> np.ndarray:
+    """
+    沿最后一维的滑动窗口分位数，忽略缺失样本
+    :param has_nan: (n_rows, n) 窗口是否含 NaN，只对这些窗口使用较慢的 np.nanquantile
+    :return: (len(quantiles), n_rows, n)，窗口未填满或全部缺失的位置为 NaN
+    """
+    n_rows, n = x.shape
+    out = np.full((len(quantiles), n_rows, n), np.nan)
+    if n < window:
+        return out
+    view = sliding_window_view(x, window, axis=1)          # (n_rows, n - window + 1, window)，不复制
+    step = max(1, QUANTILE_BLOCK_ELEMENTS // max(n_rows * window, 1))
+    for start in range(0, view.shape[1], step):
+        block = view[:, start:start + step]
+        out[:, :, window - 1 + start:window - 1 + start + block.shape[1]] = np.quantile(block, quantiles, axis=2)
+    if has_nan is not None and has_nan.any():
+        rows, ends = np.nonzero(has_nan)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)   # 全部缺失的窗口
+            out[:, rows, ends] = np.nanquantile(view[rows, ends - window + 1], quantiles, axis=-1)
+    return out
+
+
+def rolling_stats(x, window: int, stats=STATS, quantiles=DEFAULT_QUANTILES) -> dict:
+    """
+    单个信号矩阵在一个窗口上的滚动统计
+    :param x: (n_turbines, n_minutes) 矩阵（一维视为单台风机）
+    :param window: 窗口长度（分钟）
+    :param stats: STATS 的子集
+    :param quantiles: 分位数（0~1）
+    :return: 统计名 → (n_turbines, n_minutes) 矩阵；分位数的名称为 "q10"、"q50" 等
+    """
+    x = np.atleast_2d(np.asarray(x, dtype=float))
+    n_rows, n = x.shape
+    result = {}
+    # 各窗口内的缺失样本数（窗口未填满的位置为 NaN）
+    missing = np.isnan(x)
+    csum = np.zeros((n_rows, n + 1))
+    np.cumsum(missing, axis=1, out=csum[:, 1:])
+    n_missing = _window_sums(csum, window)
+    has_nan = n_missing > 0
+    if {"mean", "std", "slope"} & set(stats):
+        # 先减去每行均值再累积，减小长序列累积和的舍入误差；缺失样本按 0 累积，含缺失的窗口最后置为 NaN
+        offset = np.zeros((n_rows, 1))
+        valid_rows = ~missing.all(axis=1)
+        offset[valid_rows, 0] = np.nanmean(x[valid_rows], axis=1)
+        centered = np.where(missing, 0.0, x - offset)
+        t = np.arange(n, dtype=float)
+        np.cumsum(centered, axis=1, out=csum[:, 1:])
+        sum_x = np.where(has_nan, np.nan, _window_sums(csum, window))
+        mean_c = sum_x / window
+        if "mean" in stats:
+            result["mean"] = mean_c + offset
+        if "std" in stats:
+            np.cumsum(centered * centered, axis=1, out=csum[:, 1:])
+            var = _window_sums(csum, window) / window - mean_c ** 2
+            result["std"] = np.sqrt(np.maximum(var, 0.0))
+        if "slope" in stats:
+            # 窗口 [e-w+1, e] 内 Σ(t - t̄) x = Σ t x - t̄ Σ x，Σ(t - t̄)² = w (w² - 1) / 12
+            np.cumsum(centered * t, axis=1, out=csum[:, 1:])
+            t_mean = t - (window - 1) / 2.0
+            denom = window * (window * window - 1) / 12.0
+            if window > 1:
+                result["slope"] = (_window_sums(csum, window) - t_mean * sum_x) / denom
+            else:
+                result["slope"] = np.where(has_nan, np.nan, 0.0)
+    # 最小/最大值忽略缺失样本（_rolling_max 视 NaN 为 -inf），窗口内全部缺失时为 NaN
+    all_missing = n_missing >= window
+    if "max" in stats:
+        result["max"] = np.where(all_missing, np.nan, _rolling_max(x, window))
+    if "min" in stats:
+        result["min"] = np.where(all_missing, np.nan, -_rolling_max(-x, window))
+    if len(quantiles):
+        for q, values in zip(quantiles, _rolling_quantiles(x, window, quantiles, has_nan)):
+            result[f"q{round(q * 100):02d}"] = values
+    return result
+
+
+class Features:
+    """
+    特征张量：values[风机, 分钟, 特征]，names 为特征名（"信号.统计.w窗口"）
+    """
+
+    def __init__(self, names: list, values: np.ndarray, minute_offset: int = 0):
+        self.names = list(names)
+        self.values = values
+        self.minute_offset = minute_offset
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.values[:, :, self.names.index(name)]
+
+    def to_matrix(self, dropna: bool = True) -> tuple[np.ndarray, np.ndarray]:
+        """
+        展开为 AnomalyDetection 使用的二维特征矩阵
+        :param dropna: 是否去掉含 NaN 的行（窗口未填满）
+        :return: (特征矩阵 (n_rows, n_features), 行索引 (n_rows, 2)，每行为 [风机下标, 分钟下标])
+        """
+        n_turbines, n_minutes, n_features = self.values.shape
+        matrix = self.values.reshape(-1, n_features)
+        turbine, minute = np.divmod(np.arange(n_turbines * n_minutes), n_minutes)
+        index = np.column_stack([turbine, minute + self.minute_offset])
+        if dropna:
+            keep = ~np.isnan(matrix).any(axis=1)
+            matrix, index = matrix[keep], index[keep]
+        return matrix, index
+
+
+class FeatureEngine:
+    """
+    滚动窗口特征引擎（批量 transform 与增量 append）
+    """
+
+    def __init__(
+        self,
+        windows=DEFAULT_FEATURE_WINDOWS,
+        stats=STATS,
+        quantiles=DEFAULT_QUANTILES,
+        signals=DEFAULT_SIGNALS,
+        bearing_temp_model=None,
+        bearing_vibration_model=None,
+    ):
+        """
+        :param windows: 滚动窗口长度（分钟）
+        :param stats: 滚动统计（STATS 的子集）
+        :param quantiles: 分位数
+        :param signals: 参与滚动统计的信号名（输入中不存在的跳过）
+        :param bearing_temp_model: BearingTemperatureSimulator，提供 转速 → 稳态温升 关系，用于温度残差
+        :param bearing_vibration_model: BearingVibrationSimulator，提供 转速 → 期望振动 关系，用于振动残差
+        """
+        unknown = set(stats) - set(STATS)
+        if unknown:
+            raise ValueError(f"不支持的滚动统计: {sorted(unknown)}（可选: {', '.join(STATS)}）")
+        self.windows = tuple(int(w) for w in windows)
+        self.stats = tuple(stats)
+        self.quantiles = tuple(quantiles)
+        self.signals = tuple(signals)
+        self.bearing_temp_model = bearing_temp_model
+        self.bearing_vibration_model = bearing_vibration_model
+        self._history = None
+        self._minutes = 0
+
+    def residuals(self, signals: dict) -> dict:
+        """
+        跨信号残差（需要相应模型与输入信号）
+        :return: {"bearing_temp_residual": ..., "bearing_vibration_residual": ...} 中可计算的部分
+        """
+        result = {}
+        if self.bearing_temp_model is not None and {"bearing_temp", "rpm", "ambient_temp"} <= set(signals):
+            rpm = np.asarray(signals["rpm"], dtype=float)
+            expected = (np.asarray(signals["ambient_temp"], dtype=float)
+                        + self.bearing_temp_model._get_friction_heat_rise_array(rpm))
+            result["bearing_temp_residual"] = np.asarray(signals["bearing_temp"], dtype=float) - expected
+        if self.bearing_vibration_model is not None and {"bearing_vibration", "rpm"} <= set(signals):
+            expected = self.bearing_vibration_model._get_mean_rms_from_rpm_array(signals["rpm"])
+            result["bearing_vibration_residual"] = np.asarray(signals["bearing_vibration"], dtype=float) - expected
+        return result
+
+    def transform(self, signals: dict) -> Features:
+        """
+        整段批量计算
+        :param signals: 信号名 → (n_turbines, n_minutes) 矩阵（一维视为单台风机）
+        :return: Features
+        """
+        signals = {name: np.atleast_2d(np.asarray(values, dtype=float)) for name, values in signals.items()}
+        signals.update(self.residuals(signals))
+        names, columns = [], []
+        for signal in self.signals:
+            if signal not in signals:
+                continue
+            for window in self.windows:
+                for stat, values in rolling_stats(signals[signal], window, self.stats, self.quantiles).items():
+                    names.append(f"{signal}.{stat}.w{window}")
+                    columns.append(values)
+        return Features(names, np.stack(columns, axis=2))
+
+    def append(self, signals: dict) -> Features:
+        """
+        增量追加新分钟的数据，只返回新分钟的特征（与整段 transform 的对应部分一致）
+        :param signals: 信号名 → (n_turbines, n_new_minutes) 矩阵，各次调用的信号集合须相同
+        """
+        signals = {name: np.atleast_2d(np.asarray(values, dtype=float)) for name, values in signals.items()}
+        n_new = next(iter(signals.values())).shape[1]
+        history = self._history or {name: values[:, :0] for name, values in signals.items()}
+        combined = {name: np.concatenate([history[name], values], axis=1) for name, values in signals.items()}
+        n_history = next(iter(history.values())).shape[1]
+
+        features = self.transform(combined)
+        keep = max(self.windows) - 1
+        self._history = {name: values[:, max(values.shape[1] - keep, 0):] for name, values in combined.items()}
+        result = Features(features.names, features.values[:, n_history:], minute_offset=self._minutes)
+        self._minutes += n_new
+        return result
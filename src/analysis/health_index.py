@@ -40,4 +40,194 @@ class HealthIndexCalculator:
         elif health_index > 0.5:
             return "警告"
         else:
-            return "故障"
\ No newline at end of file
+            return "故障"
+
+# 健康状态编码（与 HealthIndexCalculator.get_health_status 的阈值一致）
+HEALTH_STATUS_FAULT = 0
+HEALTH_STATUS_WARNING = 1
+HEALTH_STATUS_HEALTHY = 2
+HEALTH_STATUS_LABELS = ("故障", "警告", "健康")
+
+# 默认滚动窗口（分钟）：1小时、24小时、7天
+DEFAULT_WINDOWS = (60, 24 * 60, 7 * 24 * 60)
+
+
+def _health_from_means(power_mean, temp_mean, vib_mean, p_rated, critical_temp, critical_vibration):
+    """
+    由窗口均值计算健康指数（逐元素，支持任意形状广播）
+    健康指数 = 功率因子 - 温度因子 - 振动因子，限制在 [0, 1]
+    """
+    health_index = power_mean / p_rated - temp_mean / critical_temp - vib_mean / critical_vibration
+    return np.clip(health_index, 0.0, 1.0)
+
+
+def health_status_codes(health_index: np.ndarray) -> np.ndarray:
+    """
+    将健康指数数组映射为状态编码（0=故障, 1=警告, 2=健康）
+    :param health_index: 任意形状的健康指数数组
+    :return: 同形状的 uint8 状态编码数组，可用 HEALTH_STATUS_LABELS 查表得到中文描述
+    """
+    health_index = np.asarray(health_index)
+    codes = np.full(health_index.shape, HEALTH_STATUS_FAULT, dtype=np.uint8)
+    codes[health_index > 0.5] = HEALTH_STATUS_WARNING
+    codes[health_index > 0.8] = HEALTH_STATUS_HEALTHY
+    return codes
+
+
+def rolling_health_index(
+    power_data: np.ndarray,
+    temperature_data: np.ndarray,
+    vibration_data: np.ndarray,
+    p_rated,
+    windows=DEFAULT_WINDOWS,
+    critical_temp: float = 100.0,
+    critical_vibration: float = 5.0,
+) -> np.ndarray:
+    """
+    批量计算整个风机群（风机数 × 分钟数）矩阵的滚动健康指数。
+    使用沿时间轴的累积和求窗口均值，每个窗口的代价为 O(风机数 × 分钟数)。
+    窗口未填满时（序列开头）按已有样本数求均值。
+
+    :param power_data: 功率矩阵 (n_turbines, n_minutes)，单位 kW；一维数组视为单台风机
+    :param temperature_data: 轴承温度矩阵，单位 °C
+    :param vibration_data: 轴承振动矩阵，单位 mm/s
+    :param p_rated: 额定功率（kW），标量或长度为 n_turbines 的数组
+    :param windows: 滚动窗口长度（分钟）序列
+    :param critical_temp: 临界温度（°C）
+    :param critical_vibration: 临界振动值（mm/s）
+    :return: 健康指数数组 (n_windows, n_turbines, n_minutes)
+    """
+    signals = np.stack([
+        np.atleast_2d(np.asarray(power_data, dtype=float)),
+        np.atleast_2d(np.asarray(temperature_data, dtype=float)),
+        np.atleast_2d(np.asarray(vibration_data, dtype=float)),
+    ])
+    n_turbines, n_minutes = signals.shape[1:]
+    p_rated = np.broadcast_to(np.asarray(p_rated, dtype=float), (n_turbines,))[:, None]
+
+    # 前补一个 0，使 csum[..., t+1] - csum[..., t+1-w] 即为窗口和
+    csum = np.zeros(signals.shape[:2] + (n_minutes + 1,))
+    np.cumsum(signals, axis=2, out=csum[..., 1:])
+
+    t_end = np.arange(1, n_minutes + 1)
+    result = np.empty((len(windows), n_turbines, n_minutes))
+    for k, w in enumerate(windows):
+        t_start = np.maximum(t_end - w, 0)
+        means = (csum[..., t_end] - csum[..., t_start]) / (t_end - t_start)
+        result[k] = _health_from_means(means[0], means[1], means[2], p_rated,
+                                       critical_temp, critical_vibration)
+    return result
+
+
+class RollingHealthIndex:
+    """
+    风机群滚动健康指数（增量更新）
+
+    为每台风机维护一个环形缓冲区（长度为最大窗口）和各窗口的滑动和，
+    每追加一分钟数据只需对每个窗口做一次加、一次减，即每台风机 O(窗口数)，
+    与窗口长度无关。所有运算都在 (n_turbines,) 向量上进行，适合千台级风机群每分钟刷新。
+
+    为避免滑动和的浮点误差长期累积，环形缓冲区每绕回一圈时用缓冲区内容重新精确求和一次
+    （均摊后仍为 O(1)）。
+    """
+
+    def __init__(
+        self,
+        n_turbines: int,
+        p_rated,
+        windows=DEFAULT_WINDOWS,
+        critical_temp: float = 100.0,
+        critical_vibration: float = 5.0,
+    ):
+        """
+        :param n_turbines: 风机数量
+        :param p_rated: 额定功率（kW），标量或长度为 n_turbines 的数组
+        :param windows: 滚动窗口长度（分钟）序列，默认 1h/24h/7d
+        :param critical_temp: 临界温度（°C）
+        :param critical_vibration: 临界振动值（mm/s）
+        """
+        self.n_turbines = n_turbines
+        self.p_rated = np.broadcast_to(np.asarray(p_rated, dtype=float), (n_turbines,)).copy()
+        self.windows = tuple(int(w) for w in windows)
+        self.critical_temp = critical_temp
+        self.critical_vibration = critical_vibration
+
+        self.capacity = max(self.windows)
+        # 缓冲区布局：(信号[功率, 温度, 振动], 风机, 时间)
+        self._buffer = np.zeros((3, n_turbines, self.capacity))
+        # 各窗口的滑动和：(信号, 风机, 窗口)
+        self._sums = np.zeros((3, n_turbines, len(self.windows)))
+        self._pos = 0     # 下一个写入位置
+        self.count = 0    # 已追加的分钟数
+
+    def append(self, power, temperature, vibration):
+        """
+        追加一分钟的数据（每台风机一个值）
+        :param power: 功率 (n_turbines,)，单位 kW
+        :param temperature: 轴承温度 (n_turbines,)，单位 °C
+        :param vibration: 轴承振动 (n_turbines,)，单位 mm/s
+        """
+        values = np.stack([
+            np.broadcast_to(np.asarray(power, dtype=float), (self.n_turbines,)),
+            np.broadcast_to(np.asarray(temperature, dtype=float), (self.n_turbines,)),
+            np.broadcast_to(np.asarray(vibration, dtype=float), (self.n_turbines,)),
+        ])
+
+        for k, w in enumerate(self.windows):
+            # 超出窗口的那个样本离开滑动和
+            if self.count >= w:
+                self._sums[:, :, k] -= self._buffer[:, :, (self._pos - w) % self.capacity]
+        self._sums += values[:, :, None]
+        self._buffer[:, :, self._pos] = values
+
+        self._pos = (self._pos + 1) % self.capacity
+        self.count += 1
+        if self._pos == 0:
+            self._resync()
+
+    def extend(self, power, temperature, vibration):
+        """
+        批量追加多分钟数据（用于回填历史数据）
+        :param power: 功率矩阵 (n_turbines, n_minutes)
+        :param temperature: 轴承温度矩阵 (n_turbines, n_minutes)
+        :param vibration: 轴承振动矩阵 (n_turbines, n_minutes)
+        """
+        power = np.asarray(power, dtype=float).reshape(self.n_turbines, -1)
+        temperature = np.asarray(temperature, dtype=float).reshape(self.n_turbines, -1)
+        vibration = np.asarray(vibration, dtype=float).reshape(self.n_turbines, -1)
+        for t in range(power.shape[1]):
+            self.append(power[:, t], temperature[:, t], vibration[:, t])
+
+    def _resync(self):
+        """
+        用缓冲区内容重新精确计算各窗口滑动和，消除累积浮点误差
+        """
+        for k, w in enumerate(self.windows):
+            n = min(self.count, w)
+            idx = (self._pos - 1 - np.arange(n)) % self.capacity
+            self._sums[:, :, k] = self._buffer[:, :, idx].sum(axis=2)
+
+    def window_means(self) -> np.ndarray:
+        """
+        获取各窗口内的信号均值
+        :return: 均值数组 (3, n_turbines, n_windows)，第一维依次为功率、温度、振动
+        """
+        counts = np.minimum(self.count, np.asarray(self.windows))
+        counts = np.maximum(counts, 1)
+        return self._sums / counts
+
+    def health_index(self) -> np.ndarray:
+        """
+        计算当前各风机在各窗口上的健康指数
+        :return: 健康指数数组 (n_turbines, n_windows)
+        """
+        means = self.window_means()
+        return _health_from_means(means[0], means[1], means[2], self.p_rated[:, None],
+                                  self.critical_temp, self.critical_vibration)
+
+    def health_status(self) -> np.ndarray:
+        """
+        获取当前各风机在各窗口上的健康状态编码
+        :return: 状态编码数组 (n_turbines, n_windows)，0=故障, 1=警告, 2=健康
+        """
+        return health_status_codes(self.health_index())
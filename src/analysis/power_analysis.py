@@ -1,36 +1,53 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+# IEC 61400-12 推荐的风速分箱宽度（m/s），箱中心位于 0.5 m/s 的整数倍
+IEC_BIN_WIDTH = 0.5
+
+
 class PowerAnalysis:
     """
     风机功率分析类，用于分析风机的功率输出和性能指标。
     """
 
-    def __init__(self, power_data: np.ndarray, wind_speed_data: np.ndarray):
+    def __init__(self, power_data: np.ndarray, wind_speed_data: np.ndarray, rated_power: float = 2000.0):
         """
         初始化功率分析类
         :param power_data: 风机功率数据（单位：kW）
         :param wind_speed_data: 风速数据（单位：m/s）
+        :param rated_power: 额定功率（单位：kW）
         """
         self.power_data = power_data
         self.wind_speed_data = wind_speed_data
+        self.rated_power = rated_power
 
     def calculate_efficiency(self) -> np.ndarray:
         """
-        计算风机效率
+        计算风机效率（相对额定功率）
         :return: 风机效率数组
         """
-        # 假设额定功率为2000 kW
-        rated_power = 2000.0
-        efficiency = self.power_data / rated_power
+        efficiency = self.power_data / self.rated_power
         return efficiency
 
+    def binned_power_curve(self, bin_width: float = IEC_BIN_WIDTH) -> "BinnedPowerCurve":
+        """
+        按 IEC 分箱法计算功率曲线
+        :param bin_width: 风速分箱宽度（m/s）
+        :return: BinnedPowerCurve 实例
+        """
+        curve = BinnedPowerCurve(bin_width=bin_width)
+        curve.update(self.wind_speed_data, self.power_data)
+        return curve
+
     def plot_power_curve(self):
         """
-        绘制功率曲线图
+        绘制功率曲线图（分箱均值 ± 标准差）
         """
+        curve = self.binned_power_curve()
+        valid = curve.count[0] > 0
         plt.figure(figsize=(10, 6))
-        plt.scatter(self.wind_speed_data, self.power_data, color='blue', label='Power Output')
+        plt.errorbar(curve.bin_centers[valid], curve.mean[0][valid], yerr=curve.std[0][valid],
+                     color='blue', marker='o', capsize=3, label='Binned Power (mean ± std)')
         plt.title('Wind Turbine Power Curve')
         plt.xlabel('Wind Speed (m/s)')
         plt.ylabel('Power Output (kW)')
@@ -45,4 +62,185 @@ class PowerAnalysis:
         """
         efficiency = self.calculate_efficiency()
         print("风机效率:", efficiency)
-        self.plot_power_curve()
\ No newline at end of file
+        self.plot_power_curve()
+
+
+class BinnedPowerCurve:
+    """
+    IEC 61400-12 风格的分箱功率曲线（method of bins）
+
+    对每台风机、每个风速箱维护 (样本数, 均值, 离差平方和 M2)，
+    使用 np.bincount 一次性完成所有风机、所有箱的归约，不含 Python 层循环。
+    不同数据块（分块读取或并行计算）的统计量可以通过 merge 精确合并（Chan 并行方差公式），
+    因此可以对千万级数据分块增量计算。
+    """
+
+    def __init__(self, n_turbines: int = 1, bin_width: float = IEC_BIN_WIDTH, v_max: float = 40.0):
+        """
+        :param n_turbines: 风机数量
+        :param bin_width: 风速分箱宽度（m/s）
+        :param v_max: 统计的最大风速（m/s），超出的样本计入最后一个箱
+        """
+        self.n_turbines = n_turbines
+        self.bin_width = bin_width
+        self.v_max = v_max
+        self.n_bins = int(round(v_max / bin_width)) + 1
+        self.bin_centers = np.arange(self.n_bins) * bin_width
+
+        shape = (n_turbines, self.n_bins)
+        self.count = np.zeros(shape, dtype=np.int64)
+        self.mean = np.zeros(shape)
+        self._m2 = np.zeros(shape)
+        self.wind_mean = np.zeros(shape)
+
+    def bin_index(self, wind_speeds: np.ndarray) -> np.ndarray:
+        """
+        计算风速所属箱号（箱中心为 bin_width 的整数倍）
+        """
+        idx = np.floor(np.asarray(wind_speeds) / self.bin_width + 0.5).astype(np.int64)
+        return np.clip(idx, 0, self.n_bins - 1)
+
+    def _reduce(self, wind_speeds, power, turbine_ids):
+        """
+        将一块数据归约为 (count, mean, M2, wind_mean) 统计量
+        """
+        wind_speeds = np.asarray(wind_speeds, dtype=float).ravel()
+        power = np.asarray(power, dtype=float).ravel()
+        if turbine_ids is None:
+            turbine_ids = np.zeros(len(power), dtype=np.int64)
+        else:
+            turbine_ids = np.asarray(turbine_ids, dtype=np.int64).ravel()
+
+        valid = np.isfinite(wind_speeds) & np.isfinite(power)
+        if not valid.all():
+            wind_speeds, power, turbine_ids = wind_speeds[valid], power[valid], turbine_ids[valid]
+
+        flat = turbine_ids * self.n_bins + self.bin_index(wind_speeds)
+        size = self.n_turbines * self.n_bins
+
+        count = np.bincount(flat, minlength=size)
+        safe = np.maximum(count, 1)
+        mean = np.bincount(flat, weights=power, minlength=size) / safe
+        wind_mean = np.bincount(flat, weights=wind_speeds, minlength=size) / safe
+        m2 = np.bincount(flat, weights=(power - mean[flat]) ** 2, minlength=size)
+
+        shape = (self.n_turbines, self.n_bins)
+        return count.reshape(shape), mean.reshape(shape), m2.reshape(shape), wind_mean.reshape(shape)
+
+    def _combine(self, count, mean, m2, wind_mean):
+        """
+        按 Chan 并行公式合并另一组统计量
+        """
+        total = self.count + count
+        safe = np.maximum(total, 1)
+        delta = mean - self.mean
+        self._m2 = self._m2 + m2 + delta ** 2 * self.count * count / safe
+        self.mean = self.mean + delta * count / safe
+        self.wind_mean = self.wind_mean + (wind_mean - self.wind_mean) * count / safe
+        self.count = total
+
+    def update(self, wind_speeds: np.ndarray, power: np.ndarray, turbine_ids: np.ndarray | None = None):
+        """
+        累加一块数据
+        :param wind_speeds: 风速序列（m/s）
+        :param power: 功率序列（kW）
+        :param turbine_ids: 每个样本所属风机编号（0 ~ n_turbines-1），单台风机时可省略
+        :return: self，便于链式调用
+        """
+        self._combine(*self._reduce(wind_speeds, power, turbine_ids))
+        return self
+
+    def merge(self, other: "BinnedPowerCurve") -> "BinnedPowerCurve":
+        """
+        合并另一个分块/进程计算得到的分箱统计量（原地）
+        :param other: 分箱设置相同的 BinnedPowerCurve
+        :return: self
+        """
+        if (other.n_turbines, other.n_bins, other.bin_width) != (self.n_turbines, self.n_bins, self.bin_width):
+            raise ValueError("分箱设置不一致，无法合并")
+        self._combine(other.count, other.mean, other._m2, other.wind_mean)
+        return self
+
+    @property
+    def std(self) -> np.ndarray:
+        """
+        各箱功率的样本标准差（样本数不足 2 时为 0）
+        """
+        return np.sqrt(self._m2 / np.maximum(self.count - 1, 1))
+
+    def fleet(self) -> "BinnedPowerCurve":
+        """
+        将所有风机的统计量合并为一条全场功率曲线
+        :return: n_turbines=1 的 BinnedPowerCurve
+        """
+        result = BinnedPowerCurve(n_turbines=1, bin_width=self.bin_width, v_max=self.v_max)
+        for i in range(self.n_turbines):
+            result._combine(self.count[i:i + 1], self.mean[i:i + 1], self._m2[i:i + 1], self.wind_mean[i:i + 1])
+        return result
+
+    def expected_power(self, wind_speeds: np.ndarray, turbine_ids: np.ndarray | None = None) -> np.ndarray:
+        """
+        用分箱均值查表得到期望功率（空箱按 0 处理）
+        :param wind_speeds: 风速序列（m/s）
+        :param turbine_ids: 每个样本所属风机编号，单台风机时可省略
+        :return: 期望功率序列（kW）
+        """
+        idx = self.bin_index(wind_speeds)
+        if turbine_ids is None:
+            return self.mean[0][idx]
+        return self.mean[np.asarray(turbine_ids, dtype=np.int64), idx]
+
+
+def capacity_factor(power: np.ndarray, p_rated, axis: int = -1) -> np.ndarray:
+    """
+    容量系数 = 平均功率 / 额定功率
+    :param power: 功率序列或 (n_turbines, n_samples) 矩阵（kW）
+    :param p_rated: 额定功率（kW），标量或每台风机一个值
+    :param axis: 时间轴
+    """
+    return np.mean(power, axis=axis) / np.asarray(p_rated, dtype=float)
+
+
+def availability(power: np.ndarray, wind_speeds: np.ndarray, v_in: float, v_out: float, axis: int = -1) -> np.ndarray:
+    """
+    基于时间的可利用率：风速处于 [v_in, v_out) 的时段中，风机有功率输出的比例
+    :param power: 功率序列或矩阵（kW）
+    :param wind_speeds: 与 power 同形状的风速（m/s）
+    :param v_in: 切入风速（m/s）
+    :param v_out: 切出风速（m/s）
+    :param axis: 时间轴
+    :return: 可利用率（无可运行时段时为 1.0）
+    """
+    wind_speeds = np.asarray(wind_speeds)
+    operable = (wind_speeds >= v_in) & (wind_speeds < v_out)
+    running = operable & (np.asarray(power) > 0)
+    n_operable = operable.sum(axis=axis)
+    return np.where(n_operable > 0, running.sum(axis=axis) / np.maximum(n_operable, 1), 1.0)
+
+
+def energy_loss_attribution(
+    power: np.ndarray,
+    expected_power: np.ndarray,
+    dt_hours: float,
+    axis: int = -1,
+) -> dict:
+    """
+    能量损失归因：将期望发电量与实际发电量的差分解为停机损失和性能损失
+    - 停机损失：期望功率 > 0 但实际功率为 0 的时段
+    - 性能损失：运行中但实际功率低于期望功率的时段
+    :param power: 实际功率（kW）
+    :param expected_power: 期望功率（kW），如 BinnedPowerCurve.expected_power 或理论功率曲线
+    :param dt_hours: 采样间隔（小时）
+    :param axis: 时间轴
+    :return: 各项能量（kWh）的字典
+    """
+    power = np.asarray(power, dtype=float)
+    expected_power = np.asarray(expected_power, dtype=float)
+    down = (power <= 0) & (expected_power > 0)
+    deficit = np.maximum(expected_power - power, 0.0)
+    return {
+        "expected_energy": expected_power.sum(axis=axis) * dt_hours,
+        "actual_energy": power.sum(axis=axis) * dt_hours,
+        "downtime_loss": np.where(down, deficit, 0.0).sum(axis=axis) * dt_hours,
+        "performance_loss": np.where(down, 0.0, deficit).sum(axis=axis) * dt_hours,
+    }
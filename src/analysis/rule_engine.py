@@ -0,0 +1,786 @@
+"""
+运维规则引擎：将运维知识库中的告警判据写成声明式表达式，编译为沿时间轴的向量化窗口运算，
+对 (风机数 × 时间) 矩阵批量求值，或以数据块增量方式在线求值。
+增量求值时每个窗口运算保存滚动状态（环形缓冲区、滑动和、分块前缀/后缀最大值），
+每个样本的代价与窗口长度无关。窗口内含 NaN 样本时窗口和/均值/斜率为 NaN，最大/最小值忽略 NaN。
+
+表达式示例：
+    power = Signal("power")
+    rule = Rule("水力性能异常", (power < 0.8 * Signal("theoretical_power")) & (Signal("theoretical_power") > 0),
+                persist=10, clear_persist=10, long_term=24 * 60)
+
+告警状态带迟滞：条件连续成立 persist 个样本才置位告警，连续不成立 clear_persist 个样本才复位；
+告警连续保持 long_term 个样本视为“长期异常”。
+"""
+
+import numpy as np
+
+
+def _as_expr(value):
+    return value if isinstance(value, Expr) else Const(value)
+
+
+def _rolling_max(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    沿最后一维的滑动窗口最大值（van Herk/Gil-Werman 分块前缀/后缀算法），
+    代价与窗口长度无关。窗口未填满的位置为 NaN。
+    """
+    n_rows, n = x.shape
+    out = np.full((n_rows, n), np.nan)
+    if window <= 1:
+        return x.astype(float, copy=True)
+    if n < window:
+        return out
+    n_blocks = -(-n // window)
+    padded = np.full((n_rows, n_blocks * window), -np.inf)
+    padded[:, :n] = np.where(np.isnan(x), -np.inf, x)
+    blocks = padded.reshape(n_rows, n_blocks, window)
+    prefix = np.maximum.accumulate(blocks, axis=2).reshape(n_rows, -1)
+    suffix = np.maximum.accumulate(blocks[:, :, ::-1], axis=2)[:, :, ::-1].reshape(n_rows, -1)
+    out[:, window - 1:] = np.maximum(suffix[:, :n - window + 1], prefix[:, window - 1:n])
+    return out
+
+
+def _rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    沿最后一维的滑动窗口和（累积和实现），窗口未填满或含 NaN 的位置为 NaN
+    """
+    n_rows, n = x.shape
+    out = np.full((n_rows, n), np.nan)
+    if n < window:
+        return out
+    missing = np.isnan(x)
+    csum = np.zeros((n_rows, n + 1))
+    np.cumsum(np.where(missing, 0.0, x), axis=1, out=csum[:, 1:])
+    nan_count = np.zeros((n_rows, n + 1), dtype=np.int64)
+    np.cumsum(missing, axis=1, out=nan_count[:, 1:])
+    sums = csum[:, window:] - csum[:, :n - window + 1]
+    has_nan = nan_count[:, window:] - nan_count[:, :n - window + 1] > 0
+    out[:, window - 1:] = np.where(has_nan, np.nan, sums)
+    return out
+
+
+class _Ring:
+    """
+    定长环形缓冲区（每行一个单元）：push 一个数据块，返回每个新样本 size 步之前的值（尚无历史时为 fill）
+    """
+
+    def __init__(self, n_rows: int, size: int, fill: float = 0.0):
+        self.size = size
+        self.buffer = np.full((size, n_rows), fill)
+        self.pos = 0
+
+    def push(self, block: np.ndarray) -> np.ndarray:
+        n_rows, k = block.shape
+        size = self.size
+        if size == 0:
+            return block.copy()
+        out = np.empty((n_rows, k))
+        j = min(k, size)
+        out[:, :j] = self.buffer[(self.pos + np.arange(j)) % size].T
+        if k > size:
+            out[:, size:] = block[:, :k - size]
+        self.buffer[(self.pos + np.arange(k - j, k)) % size] = block[:, k - j:].T
+        self.pos = (self.pos + k) % size
+        return out
+
+    def chronological(self) -> np.ndarray:
+        """
+        缓冲区内容按时间从旧到新排列，(size, n_rows)
+        """
+        return np.roll(self.buffer, -self.pos, axis=0)
+
+
+class _WindowSums:
+    """
+    流式滑动窗口和（可选窗口内下标加权和 Σ i·x_i，i = 0..window-1），每个样本 O(1)。
+    窗口未填满或含 NaN 时为 NaN；每推进 window 个样本由环形缓冲区重算一次，避免累计舍入误差。
+    """
+
+    def __init__(self, n_rows: int, window: int, weighted: bool = False):
+        self.window = window
+        self.weighted = weighted
+        self.ring = _Ring(n_rows, window)
+        self.total = np.zeros(n_rows)
+        self.weighted_total = np.zeros(n_rows)
+        self.nan_count = np.zeros(n_rows, dtype=np.int64)
+        self.seen = 0
+
+    def _resync(self):
+        window = self.ring.chronological()
+        missing = np.isnan(window)
+        window = np.where(missing, 0.0, window)
+        self.total = window.sum(axis=0)
+        self.nan_count = missing.sum(axis=0)
+        if self.weighted:
+            self.weighted_total = np.arange(self.window, dtype=float) @ window
+
+    def push(self, x: np.ndarray):
+        """
+        :param x: 新数据块 (n_rows, k)
+        :return: (窗口和, 下标加权和或 None)，各为 (n_rows, k)
+        """
+        n_rows, k = x.shape
+        if k == 0:
+            return np.empty((n_rows, 0)), (np.empty((n_rows, 0)) if self.weighted else None)
+        w = self.window
+        outgoing = self.ring.push(x)
+        nan_in, nan_out = np.isnan(x), np.isnan(outgoing)
+        x_in = np.where(nan_in, 0.0, x)
+        x_out = np.where(nan_out, 0.0, outgoing)
+        sums = self.total[:, None] + np.cumsum(x_in - x_out, axis=1)
+        nan_count = self.nan_count[:, None] + np.cumsum(nan_in, axis=1) - np.cumsum(nan_out, axis=1)
+        weighted = None
+        if self.weighted:
+            # 窗口右移一步：保留的样本下标各减 1，移出样本下标为 0，新样本下标为 w - 1
+            before = np.concatenate([self.total[:, None], sums[:, :-1]], axis=1)
+            weighted = self.weighted_total[:, None] + np.cumsum((w - 1) * x_in - (before - x_out), axis=1)
+            self.weighted_total = weighted[:, -1].copy()
+        self.total = sums[:, -1].copy()
+        self.nan_count = nan_count[:, -1].copy()
+
+        invalid = (nan_count > 0) | (self.seen + np.arange(1, k + 1) < w)
+        self.seen += k
+        if (self.seen - k) // w != self.seen // w:
+            self._resync()
+        sums = np.where(invalid, np.nan, sums)
+        if weighted is not None:
+            weighted = np.where(invalid, np.nan, weighted)
+        return sums, weighted
+
+
+class _WindowMax:
+    """
+    流式滑动窗口最大值：与 _rolling_max 相同的分块前缀/后缀算法，按窗口长度分块，
+    每块结束时计算一次该块的后缀最大值，每个样本摊还 O(1)。NaN 视为 -inf，窗口未填满时为 NaN。
+    """
+
+    def __init__(self, n_rows: int, window: int):
+        self.window = window
+        self.block = np.full((window, n_rows), -np.inf)
+        # 上一块的后缀最大值，多一行 -inf 对应窗口恰好为当前整块的情况
+        self.suffix = np.full((window + 1, n_rows), -np.inf)
+        self.prefix = np.full(n_rows, -np.inf)
+        self.seen = 0
+
+    def push(self, x: np.ndarray) -> np.ndarray:
+        n_rows, k = x.shape
+        w = self.window
+        if w <= 1:
+            return x.astype(float, copy=True)
+        start = self.seen
+        x = np.where(np.isnan(x), -np.inf, x)
+        out = np.empty((n_rows, k))
+        i = 0
+        while i < k:
+            p = self.seen % w
+            m = min(k - i, w - p)
+            prefix = np.maximum.accumulate(x[:, i:i + m], axis=1)
+            np.maximum(prefix, self.prefix[:, None], out=prefix)
+            np.maximum(prefix, self.suffix[p + 1:p + m + 1].T, out=out[:, i:i + m])
+            self.block[p:p + m] = x[:, i:i + m].T
+            self.prefix = prefix[:, -1].copy()
+            self.seen += m
+            i += m
+            if p + m == w:
+                self._close_block()
+        out[:, start + np.arange(1, k + 1) < w] = np.nan
+        return out
+
+    def _close_block(self):
+        """
+        一块填满时计算其后缀最大值（O(窗口长度)，每 window 个样本一次）
+        """
+        self.suffix[:self.window] = np.maximum.accumulate(self.block[::-1], axis=0)[::-1]
+        self.prefix.fill(-np.inf)
+
+
+class Expr:
+    """
+    表达式基类。子类实现 _evaluate(signals, cache) 并给出 lookback（需要的历史样本数）。
+    """
+
+    lookback = 0
+
+    def evaluate(self, signals: dict, cache: dict | None = None) -> np.ndarray:
+        """
+        对 (n_turbines, n_samples) 信号矩阵求值，相同子表达式只计算一次
+        :param signals: 信号名 → 二维数组
+        :param cache: 子表达式结果缓存
+        """
+        if cache is None:
+            cache = {}
+        key = id(self)
+        if key not in cache:
+            cache[key] = self._evaluate(signals, cache)
+        return cache[key]
+
+    def _evaluate(self, signals, cache):
+        raise NotImplementedError
+
+    def update(self, signals: dict, states: dict, cache: dict) -> np.ndarray:
+        """
+        增量求值：只对新数据块求值，窗口运算的滚动状态按节点保存在 states 中
+        :param signals: 信号名 → 新数据块 (n_turbines, k)
+        :param states: 节点 → 滚动状态（跨数据块保留）
+        :param cache: 本数据块内的子表达式结果缓存，保证共享的子表达式只推进一次
+        """
+        key = id(self)
+        if key not in cache:
+            cache[key] = self._update(signals, states, cache)
+        return cache[key]
+
+    def _update(self, signals, states, cache):
+        # 无状态表达式：增量求值与批量求值相同
+        return self._evaluate(signals, cache)
+
+    def signals(self) -> set:
+        """
+        表达式依赖的信号名集合
+        """
+        return set()
+
+    def __add__(self, other):
+        return BinaryOp(np.add, self, other)
+
+    def __radd__(self, other):
+        return BinaryOp(np.add, other, self)
+
+    def __sub__(self, other):
+        return BinaryOp(np.subtract, self, other)
+
+    def __rsub__(self, other):
+        return BinaryOp(np.subtract, other, self)
+
+    def __mul__(self, other):
+        return BinaryOp(np.multiply, self, other)
+
+    def __rmul__(self, other):
+        return BinaryOp(np.multiply, other, self)
+
+    def __truediv__(self, other):
+        return BinaryOp(np.divide, self, other)
+
+    def __rtruediv__(self, other):
+        return BinaryOp(np.divide, other, self)
+
+    def __lt__(self, other):
+        return BinaryOp(np.less, self, other)
+
+    def __le__(self, other):
+        return BinaryOp(np.less_equal, self, other)
+
+    def __gt__(self, other):
+        return BinaryOp(np.greater, self, other)
+
+    def __ge__(self, other):
+        return BinaryOp(np.greater_equal, self, other)
+
+    def __and__(self, other):
+        return BinaryOp(np.logical_and, self, other)
+
+    def __or__(self, other):
+        return BinaryOp(np.logical_or, self, other)
+
+    def __invert__(self):
+        return UnaryOp(np.logical_not, self)
+
+    def __abs__(self):
+        return UnaryOp(np.abs, self)
+
+
+class Signal(Expr):
+    """
+    输入信号，如 "power"、"rpm"、"bearing_temp"
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def _evaluate(self, signals, cache):
+        try:
+            return np.atleast_2d(np.asarray(signals[self.name], dtype=float))
+        except KeyError:
+            raise KeyError(f"缺少规则所需的信号: {self.name}") from None
+
+    def signals(self):
+        return {self.name}
+
+    def __repr__(self):
+        return f"Signal({self.name!r})"
+
+
+class Const(Expr):
+    """
+    常量
+    """
+
+    def __init__(self, value: float):
+        self.value = value
+
+    def _evaluate(self, signals, cache):
+        return self.value
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+class UnaryOp(Expr):
+    def __init__(self, func, operand):
+        self.func = func
+        self.operand = _as_expr(operand)
+        self.lookback = self.operand.lookback
+
+    def _evaluate(self, signals, cache):
+        return self.func(self.operand.evaluate(signals, cache))
+
+    def _update(self, signals, states, cache):
+        return self.func(self.operand.update(signals, states, cache))
+
+    def signals(self):
+        return self.operand.signals()
+
+
+class BinaryOp(Expr):
+    def __init__(self, func, left, right):
+        self.func = func
+        self.left = _as_expr(left)
+        self.right = _as_expr(right)
+        self.lookback = max(self.left.lookback, self.right.lookback)
+
+    def _evaluate(self, signals, cache):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.func(self.left.evaluate(signals, cache), self.right.evaluate(signals, cache))
+
+    def _update(self, signals, states, cache):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.func(self.left.update(signals, states, cache), self.right.update(signals, states, cache))
+
+    def signals(self):
+        return self.left.signals() | self.right.signals()
+
+
+class WindowExpr(Expr):
+    """
+    滑动窗口表达式基类：窗口长度 window 个样本，窗口未填满时结果为 NaN（比较结果为 False）。
+    子类实现批量的 _window(x)，以及增量的 _stream_state(n_rows) / _stream(x, state)。
+    """
+
+    def __init__(self, operand, window: int):
+        self.operand = _as_expr(operand)
+        self.window = max(int(window), 1)
+        self.lookback = self.operand.lookback + self.window - 1
+
+    def _evaluate(self, signals, cache):
+        x = np.asarray(self.operand.evaluate(signals, cache), dtype=float)
+        return self._window(np.atleast_2d(x))
+
+    def _window(self, x):
+        raise NotImplementedError
+
+    def _update(self, signals, states, cache):
+        x = np.atleast_2d(np.asarray(self.operand.update(signals, states, cache), dtype=float))
+        key = id(self)
+        if key not in states:
+            states[key] = self._stream_state(x.shape[0])
+        return self._stream(x, states[key])
+
+    def _stream_state(self, n_rows):
+        raise NotImplementedError
+
+    def _stream(self, x, state):
+        raise NotImplementedError
+
+    def signals(self):
+        return self.operand.signals()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.operand!r}, {self.window})"
+
+
+class Mean(WindowExpr):
+    """
+    窗口均值
+    """
+
+    def _window(self, x):
+        return _rolling_sum(x, self.window) / self.window
+
+    def _stream_state(self, n_rows):
+        return _WindowSums(n_rows, self.window)
+
+    def _stream(self, x, state):
+        return state.push(x)[0] / self.window
+
+
+class Max(WindowExpr):
+    """
+    窗口最大值
+    """
+
+    def _window(self, x):
+        return _rolling_max(x, self.window)
+
+    def _stream_state(self, n_rows):
+        return _WindowMax(n_rows, self.window)
+
+    def _stream(self, x, state):
+        return state.push(x)
+
+
+class Min(WindowExpr):
+    """
+    窗口最小值
+    """
+
+    def _window(self, x):
+        return -_rolling_max(-x, self.window)
+
+    def _stream_state(self, n_rows):
+        return _WindowMax(n_rows, self.window)
+
+    def _stream(self, x, state):
+        return -state.push(-x)
+
+
+class Delta(WindowExpr):
+    """
+    窗口首尾差：x[t] - x[t - window + 1]
+    """
+
+    def _window(self, x):
+        out = np.full(x.shape, np.nan)
+        lag = self.window - 1
+        if x.shape[1] <= lag:
+            return out
+        out[:, lag:] = x[:, lag:] - x[:, :x.shape[1] - lag]
+        return out
+
+    def _stream_state(self, n_rows):
+        return _Ring(n_rows, self.window - 1, fill=np.nan)
+
+    def _stream(self, x, state):
+        return x - state.push(x)
+
+
+class RelativeRange(WindowExpr):
+    """
+    窗口内相对变化幅度：(max - min) / |mean|，用于判断“负荷、转速变化在 10% 以内”
+    """
+
+    def _window(self, x):
+        spread = _rolling_max(x, self.window) + _rolling_max(-x, self.window)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return spread / np.abs(_rolling_sum(x, self.window) / self.window)
+
+    def _stream_state(self, n_rows):
+        return _WindowMax(n_rows, self.window), _WindowMax(n_rows, self.window), _WindowSums(n_rows, self.window)
+
+    def _stream(self, x, state):
+        high, low, sums = state
+        spread = high.push(x) + low.push(-x)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return spread / np.abs(sums.push(x)[0] / self.window)
+
+
+class Slope(WindowExpr):
+    """
+    窗口内最小二乘线性斜率（单位：信号单位/样本），由累积和闭式计算
+    """
+
+    def _window(self, x):
+        w = self.window
+        t = np.arange(x.shape[1], dtype=float)
+        sum_x = _rolling_sum(x, w)
+        sum_tx = _rolling_sum(x * t, w)
+        # 窗口 [t-w+1, t] 内下标的均值与离差平方和
+        t_mean = t - (w - 1) / 2.0
+        s_tt = w * (w * w - 1) / 12.0
+        return (sum_tx - t_mean * sum_x) / s_tt if w > 1 else np.zeros(x.shape)
+
+    def _stream_state(self, n_rows):
+        return _WindowSums(n_rows, self.window, weighted=True)
+
+    def _stream(self, x, state):
+        w = self.window
+        sum_x, sum_ix = state.push(x)
+        if w == 1:
+            return np.zeros(x.shape)
+        # 窗口内下标 i = 0..w-1：Σ(i - ī)x = Σ i·x - ī Σ x
+        return (sum_ix - (w - 1) / 2.0 * sum_x) / (w * (w * w - 1) / 12.0)
+
+
+class Increasing(WindowExpr):
+    """
+    窗口内严格单调上升（相邻差全部为正），用于“持续上升”类判据
+    """
+
+    def _window(self, x):
+        rising = np.zeros(x.shape)
+        rising[:, 1:] = np.diff(x, axis=1) > 0
+        if self.window == 1:
+            return rising.astype(bool)
+        count = _rolling_sum(rising, self.window - 1)
+        return count >= self.window - 1
+
+    def _stream_state(self, n_rows):
+        count = _WindowSums(n_rows, self.window - 1) if self.window > 1 else None
+        return {"previous": np.full(n_rows, np.nan), "count": count}
+
+    def _stream(self, x, state):
+        previous = np.concatenate([state["previous"][:, None], x[:, :-1]], axis=1)
+        if x.shape[1]:
+            state["previous"] = x[:, -1].copy()
+        rising = (x - previous > 0).astype(float)
+        if state["count"] is None:
+            return rising.astype(bool)
+        return state["count"].push(rising)[0] >= self.window - 1
+
+
+class Rule:
+    """
+    运维告警规则
+    """
+
+    def __init__(
+        self,
+        name: str,
+        condition: Expr,
+        persist: int = 1,
+        clear_persist: int | None = None,
+        long_term: int | None = None,
+        description: str = "",
+        advice: str = "",
+    ):
+        """
+        :param name: 规则名称
+        :param condition: 布尔表达式
+        :param persist: 条件连续成立多少个样本后置位告警
+        :param clear_persist: 条件连续不成立多少个样本后复位告警（迟滞），默认等于 persist
+        :param long_term: 告警连续保持多少个样本视为“长期异常”，None 表示不判断
+        :param description: 判据说明
+        :param advice: 长期异常时的处置建议
+        """
+        self.name = name
+        self.condition = condition
+        self.persist = max(int(persist), 1)
+        self.clear_persist = max(int(clear_persist if clear_persist is not None else persist), 1)
+        self.long_term = long_term
+        self.description = description
+        self.advice = advice
+
+    def __repr__(self):
+        return f"Rule({self.name!r}, persist={self.persist}, clear_persist={self.clear_persist}, long_term={self.long_term})"
+
+
+class RuleResult:
+    """
+    单条规则的求值结果，各数组形状为 (n_turbines, n_samples)
+    """
+
+    def __init__(self, rule: Rule, condition: np.ndarray, alarm: np.ndarray, long_term: np.ndarray):
+        self.rule = rule
+        self.condition = condition
+        self.alarm = alarm
+        self.long_term = long_term
+
+    def __repr__(self):
+        return (f"RuleResult({self.rule.name!r}, alarm_turbines={int(self.alarm[:, -1].sum())}, "
+                f"long_term_turbines={int(self.long_term[:, -1].sum())})")
+
+
+def _run_length(flags: np.ndarray, initial: np.ndarray) -> np.ndarray:
+    """
+    计算每个位置结尾的连续 True 长度（向量化），initial 为数据块之前已有的连续长度
+    """
+    n = flags.shape[1]
+    t = np.arange(n)
+    last_false = np.maximum.accumulate(np.where(flags, -1, t), axis=1)
+    run = t - last_false
+    no_false = last_false < 0
+    return np.where(no_false, run + initial[:, None], run)
+
+
+def _last_event(events: np.ndarray) -> np.ndarray:
+    n = events.shape[1]
+    return np.maximum.accumulate(np.where(events, np.arange(n), -1), axis=1)
+
+
+class RuleState:
+    """
+    规则在数据块之间需要延续的状态（每台风机一组）
+    """
+
+    def __init__(self, n_turbines: int):
+        self.alarm = np.zeros(n_turbines, dtype=bool)
+        self.true_run = np.zeros(n_turbines, dtype=np.int64)
+        self.false_run = np.zeros(n_turbines, dtype=np.int64)
+        self.alarm_run = np.zeros(n_turbines, dtype=np.int64)
+
+
+def _apply_hysteresis(rule: Rule, condition: np.ndarray, state: RuleState):
+    """
+    在布尔条件矩阵上施加持续时间与迟滞，返回 (告警, 长期异常) 并更新 state
+    """
+    true_run = _run_length(condition, state.true_run)
+    false_run = _run_length(~condition, state.false_run)
+    last_set = _last_event(true_run >= rule.persist)
+    last_reset = _last_event(false_run >= rule.clear_persist)
+    no_event = (last_set < 0) & (last_reset < 0)
+    alarm = np.where(no_event, state.alarm[:, None], last_set > last_reset)
+
+    alarm_run = _run_length(alarm, state.alarm_run)
+    if rule.long_term is None:
+        long_term = np.zeros_like(alarm)
+    else:
+        long_term = alarm_run >= rule.long_term
+
+    state.alarm = alarm[:, -1].copy()
+    state.true_run = true_run[:, -1].copy()
+    state.false_run = false_run[:, -1].copy()
+    state.alarm_run = alarm_run[:, -1].copy()
+    return alarm, long_term
+
+
+class RuleEngine:
+    """
+    规则引擎：批量求值（evaluate）或增量流式求值（stream）
+    """
+
+    def __init__(self, rules):
+        """
+        :param rules: Rule 序列
+        """
+        self.rules = list(rules)
+        self.lookback = max((rule.condition.lookback for rule in self.rules), default=0)
+
+    def required_signals(self) -> set:
+        """
+        所有规则依赖的信号名
+        """
+        names = set()
+        for rule in self.rules:
+            names |= rule.condition.signals()
+        return names
+
+    def _conditions(self, signals: dict, n_turbines: int, n_samples: int) -> list:
+        cache = {}
+        conditions = []
+        for rule in self.rules:
+            cond = np.asarray(rule.condition.evaluate(signals, cache), dtype=bool)
+            conditions.append(np.broadcast_to(cond, (n_turbines, n_samples)))
+        return conditions
+
+    def evaluate(self, signals: dict) -> dict:
+        """
+        批量求值
+        :param signals: 信号名 → (n_turbines, n_samples) 数组（一维数组视为单台风机）
+        :return: 规则名 → RuleResult
+        """
+        signals = {name: np.atleast_2d(np.asarray(signals[name], dtype=float)) for name in self.required_signals()}
+        n_turbines, n_samples = next(iter(signals.values())).shape
+        results = {}
+        for rule, cond in zip(self.rules, self._conditions(signals, n_turbines, n_samples)):
+            alarm, long_term = _apply_hysteresis(rule, cond, RuleState(n_turbines))
+            results[rule.name] = RuleResult(rule, cond, alarm, long_term)
+        return results
+
+    def stream(self, n_turbines: int) -> "RuleStream":
+        """
+        创建增量求值器
+        :param n_turbines: 风机数量
+        """
+        return RuleStream(self, n_turbines)
+
+
+class RuleStream:
+    """
+    增量流式求值器：每次传入一个数据块（可以只有 1 个样本），
+    各窗口运算保存 O(窗口长度) 的滚动状态、每个样本 O(1) 推进，与批量求值结果逐样本一致。
+    """
+
+    def __init__(self, engine: RuleEngine, n_turbines: int):
+        self.engine = engine
+        self.n_turbines = n_turbines
+        self.signal_names = sorted(engine.required_signals())
+        self._window_states = {}
+        self._states = [RuleState(n_turbines) for _ in engine.rules]
+
+    def update(self, signals: dict) -> dict:
+        """
+        追加一个数据块并求值
+        :param signals: 信号名 → (n_turbines, k) 数组，或 (n_turbines,) 的单个样本
+        :return: 规则名 → RuleResult（仅包含新数据块的 k 个样本）
+        """
+        block = {}
+        for name in self.signal_names:
+            value = np.asarray(signals[name], dtype=float)
+            block[name] = value.reshape(self.n_turbines, -1)
+        k = block[self.signal_names[0]].shape[1]
+
+        cache = {}
+        results = {}
+        for rule, state in zip(self.engine.rules, self._states):
+            cond = np.asarray(rule.condition.update(block, self._window_states, cache), dtype=bool)
+            cond = np.ascontiguousarray(np.broadcast_to(cond, (self.n_turbines, k)))
+            alarm, long_term = _apply_hysteresis(rule, cond, state)
+            results[rule.name] = RuleResult(rule, cond, alarm, long_term)
+        return results
+
+
+def knowledge_base_rules(
+    dt_seconds: float = 60.0,
+    bearing_window_minutes: float = 30.0,
+    bearing_min_rise_per_minute: float = 0.02,
+    include_leak: bool = False,
+) -> list:
+    """
+    根据《水轮机泵设备运维知识库》构造告警规则
+    - 水力性能：实际发电量 < 80% 理论发电量 → 异常
+    - 轴承断裂风险：负荷与转速变化在 10% 以内，轴承温度持续升高 → 高风险
+    - 密封与泄漏：稳定运行状态下，泄漏变化速率 1 分钟内持续上升 → 异常（需要 leak_rate 信号）
+    各规则长期（24 小时）处于异常时建议派遣运维人员停机检查。
+
+    所需信号：power, theoretical_power, rpm, bearing_temp（以及可选的 leak_rate）
+
+    :param dt_seconds: 采样间隔（秒）
+    :param bearing_window_minutes: 轴承温升趋势的判断窗口（分钟）
+    :param bearing_min_rise_per_minute: 视为“持续升高”的最小温升速率（°C/分钟）
+    :param include_leak: 是否包含泄漏规则
+    :return: Rule 列表
+    """
+    per_minute = 60.0 / dt_seconds
+    minutes = lambda m: max(int(round(m * per_minute)), 1)  # noqa: E731
+    advice = "建议派遣运维人员停机检查"
+
+    power = Signal("power")
+    theoretical = Signal("theoretical_power")
+    rpm = Signal("rpm")
+    bearing_temp = Signal("bearing_temp")
+
+    w = minutes(bearing_window_minutes)
+    stable = (RelativeRange(power, w) < 0.1) & (RelativeRange(rpm, w) < 0.1)
+
+    rules = [
+        Rule(
+            "水力性能异常",
+            (theoretical > 0) & (power < 0.8 * theoretical),
+            persist=minutes(10), long_term=minutes(24 * 60),
+            description="当前实际发电量<80%理论发电量", advice=advice,
+        ),
+        Rule(
+            "轴承断裂高风险",
+            stable & (Slope(bearing_temp, w) * per_minute > bearing_min_rise_per_minute),
+            persist=minutes(5), clear_persist=minutes(15), long_term=minutes(24 * 60),
+            description="负荷与转速变化在10%以内，轴承温度持续升高", advice=advice,
+        ),
+    ]
+    if include_leak:
+        leak = Signal("leak_rate")
+        rules.append(Rule(
+            "密封泄漏异常",
+            (RelativeRange(rpm, minutes(1) + 1) < 0.1) & Increasing(leak, minutes(1) + 1),
+            persist=1, clear_persist=minutes(1), long_term=minutes(24 * 60),
+            description="稳定运行状态下，泄漏变化速率1分钟内持续上升", advice=advice,
+        ))
+    return rules
@@ -0,0 +1,222 @@
+"""
+公共随机数（CRN）场景对比：多个风机/轴承配置在完全相同的风速实现与噪声流下成对比较。
+
+所有实现（realization）的风速只生成一次：WindSpeedSimulator.advance 逐小时批量推进，每次实现一行，
+所有场景共用；环境温度按实现各生成一次。风机功率/转速噪声、轴承温度噪声、轴承振动噪声按阶段从同一个
+SeedSequence 派生，每个场景都从相同的种子重新创建生成器，因此各场景消耗的是逐个相同的随机数。
+风机与轴承阶段按 场景 × 实现 依次运行（各场景参数不同，不合并为一次批量计算）。
+场景间差值中的公共噪声相互抵消，成对差值的方差远小于独立抽样时的 Var(A) + Var(B)，
+达到同样的置信区间宽度所需的实现次数相应减少（减少倍数即 variance_reduction）。
+
+    comparison = compare_scenarios(
+        {"baseline": {}, "slow_ramp": {"turbine": {"max_ramp_rate": 20.0}}},
+        n_realizations=50, hours=24, seed=0,
+    )
+    comparison.paired_differences("baseline")["slow_ramp"]["energy_kwh"]
+    # {"mean": ..., "ci_low": ..., "ci_high": ..., "std_err": ..., "variance_reduction": ...}
+"""
+
+import numpy as np
+from scipy import stats
+
+from ..service.simulation_service import STAGES, SpecError, normalize_spec
+from ..simulations.bearing.bearing_temp_simulator import BearingTemperatureSimulator
+from ..simulations.bearing.bearing_vibration_simulator import BearingVibrationSimulator
+from ..simulations.environment.temperature_simulator import TemperatureSimulator
+from ..simulations.turbine.wind_turbine_power_simu import WindTurbinePowerSimulator
+from ..simulations.wind.wind_speed_simu import WindSpeedSimulator
+
+# 所有场景必须共用的阶段（外部输入）
+SHARED_STAGES = ("wind", "ambient")
+
+# 默认对比指标：每次实现的结果 → 标量
+DEFAULT_METRICS = {
+    "energy_kwh": lambda r: float(r["second"]["power_kw"].sum() / 3600.0),
+    "mean_rpm": lambda r: float(r["second"]["rpm"].mean()),
+    "mean_bearing_temp": lambda r: float(r["minute"]["bearing_temp"].mean()),
+    "max_bearing_temp": lambda r: float(r["minute"]["bearing_temp"].max()),
+    "mean_bearing_vibration": lambda r: float(r["minute"]["bearing_vibration"].mean()),
+}
+
+
+class ScenarioComparison:
+    """
+    场景对比结果：values[场景下标, 实现下标, 指标下标]
+    """
+
+    def __init__(self, scenario_names: list, metric_names: list, values: np.ndarray, common_random_numbers: bool):
+        self.scenario_names = list(scenario_names)
+        self.metric_names = list(metric_names)
+        self.values = values
+        self.common_random_numbers = common_random_numbers
+
+    @property
+    def n_realizations(self) -> int:
+        return self.values.shape[1]
+
+    def metric(self, scenario: str, metric: str) -> np.ndarray:
+        """
+        某场景某指标在各次实现中的取值
+        """
+        return self.values[self.scenario_names.index(scenario), :, self.metric_names.index(metric)]
+
+    def summary(self) -> dict:
+        """
+        各场景各指标的均值与标准差
+        :return: 场景 → 指标 → {"mean", "std"}
+        """
+        return {
+            scenario: {
+                metric: {"mean": float(self.values[i, :, j].mean()), "std": float(self.values[i, :, j].std(ddof=1))}
+                for j, metric in enumerate(self.metric_names)
+            }
+            for i, scenario in enumerate(self.scenario_names)
+        }
+
+    def paired_differences(self, baseline: str, confidence: float = 0.95) -> dict:
+        """
+        各场景相对基准场景的成对差值（场景 - 基准）及其 t 分布置信区间
+        :param baseline: 基准场景名
+        :param confidence: 置信水平
+        :return: 场景 → 指标 → {"mean", "std_err", "ci_low", "ci_high", "variance_reduction"}；
+                 variance_reduction = (Var(A) + Var(B)) / Var(A - B)，即相对独立抽样节省的实现次数倍数
+        """
+        n = self.n_realizations
+        if n < 2:
+            raise ValueError("成对差值的置信区间至少需要 2 次实现")
+        base = self.values[self.scenario_names.index(baseline)]
+        t = stats.t.ppf(0.5 + confidence / 2.0, df=n - 1)
+        result = {}
+        for i, scenario in enumerate(self.scenario_names):
+            if scenario == baseline:
+                continue
+            diff = self.values[i] - base
+            mean = diff.mean(axis=0)
+            var_diff = diff.var(axis=0, ddof=1)
+            std_err = np.sqrt(var_diff / n)
+            var_independent = self.values[i].var(axis=0, ddof=1) + base.var(axis=0, ddof=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                reduction = np.where(var_diff > 0, var_independent / var_diff, np.inf)
+            result[scenario] = {
+                metric: {
+                    "mean": float(mean[j]),
+                    "std_err": float(std_err[j]),
+                    "ci_low": float(mean[j] - t * std_err[j]),
+                    "ci_high": float(mean[j] + t * std_err[j]),
+                    "variance_reduction": float(reduction[j]),
+                }
+                for j, metric in enumerate(self.metric_names)
+            }
+        return result
+
+
+def _scenario_specs(base: dict, scenarios: dict) -> dict:
+    """
+    基础规格 + 各场景覆盖 → 规范化规格；场景不得改变共用阶段（风速、环境温度）
+    """
+    base_spec = normalize_spec(base)
+    specs = {}
+    for name, overrides in scenarios.items():
+        merged = {stage: {**(base.get(stage) or {}), **((overrides or {}).get(stage) or {})} for stage in STAGES}
+        unknown = set(overrides or {}) - set(STAGES)
+        if unknown:
+            raise SpecError(f"场景 {name} 含未知字段: {sorted(unknown)}")
+        spec = normalize_spec(merged)
+        for stage in SHARED_STAGES:
+            if spec[stage] != base_spec[stage]:
+                raise SpecError(f"场景 {name} 不能修改共用阶段 {stage}")
+        specs[name] = spec
+    return specs
+
+
+def _shared_wind(spec: dict, seed: np.random.SeedSequence, n_rows: int, hours: int):
+    """
+    批量生成 n_rows 个独立的秒级风速、风向实现（逐小时推进以限制临时数组大小）
+    :return: (风速, 风向)，各为 (n_rows, hours * 3600)
+    """
+    wind = WindSpeedSimulator(**spec["wind"], rng=np.random.default_rng(seed))
+    speeds, dirs = np.empty((n_rows, hours * 3600)), np.empty((n_rows, hours * 3600))
+    state = wind.init_state(n_rows)
+    for h in range(hours):
+        state, out = wind.advance(state, None, 3600)
+        speeds[:, h * 3600:(h + 1) * 3600] = out["wind_speed"]
+        dirs[:, h * 3600:(h + 1) * 3600] = out["wind_dir"]
+    return speeds, dirs
+
+
+def _ambient_minute(spec: dict, seeds: dict, hours: int) -> np.ndarray:
+    """
+    一次实现的分钟级环境温度
+    """
+    ambient = TemperatureSimulator(**spec["ambient"], rng=np.random.default_rng(seeds["ambient"]))
+    return np.repeat(ambient.simulate(hours), 60)
+
+
+def _run_scenario(spec: dict, speeds: np.ndarray, dirs: np.ndarray, ambient_minute: np.ndarray, seeds: dict) -> dict:
+    """
+    在给定风速/环境温度上运行一个场景的风机与轴承阶段
+    :param seeds: 阶段名 → SeedSequence（每次都新建生成器，保证各场景消耗相同的随机数）
+    """
+    turbine = WindTurbinePowerSimulator(**spec["turbine"], rng=np.random.default_rng(seeds["turbine"]))
+    rpm_kwargs = {"rpm_min": turbine.rpm_min, "rpm_rated": turbine.rpm_rated}
+    power, rpm = turbine.power_and_rpm_from_speed(speeds)
+    rpm_min = rpm.reshape(-1, 60).mean(axis=1)
+    bearing_temp = BearingTemperatureSimulator(**spec["bearing_temp"], **rpm_kwargs,
+                                               rng=np.random.default_rng(seeds["bearing_temp"]))
+    bearing_vibration = BearingVibrationSimulator(**spec["bearing_vibration"], **rpm_kwargs,
+                                                  rng=np.random.default_rng(seeds["bearing_vibration"]))
+    return {
+        "second": {"wind_speed": speeds, "wind_dir": dirs, "power_kw": power, "rpm": rpm},
+        "minute": {
+            "rpm": rpm_min,
+            "bearing_temp": bearing_temp.simulate(ambient_minute, rpm_min),
+            "bearing_vibration": bearing_vibration.simulate(rpm_min),
+        },
+    }
+
+
+def compare_scenarios(
+    scenarios: dict,
+    n_realizations: int = 30,
+    hours: int = 24,
+    seed: int = 0,
+    base: dict | None = None,
+    metrics: dict | None = None,
+    common_random_numbers: bool = True,
+) -> ScenarioComparison:
+    """
+    按公共随机数运行多个场景
+    :param scenarios: 场景名 → 对基础规格的阶段覆盖（如 {"turbine": {"max_ramp_rate": 20.0}}）
+    :param n_realizations: 实现次数
+    :param hours: 每次实现的时长（小时）
+    :param seed: 根种子
+    :param base: 基础规格（同 SimulationService 的规格，风速与环境温度阶段为所有场景共用）
+    :param metrics: 指标名 → 函数(单次实现结果) → 标量，默认 DEFAULT_METRICS
+    :param common_random_numbers: False 时每个场景使用独立的风速实现与噪声流（即各自独立运行，用于对照方差缩减效果）
+    :return: ScenarioComparison
+    """
+    base = base or {}
+    metrics = metrics or DEFAULT_METRICS
+    specs = _scenario_specs(base, scenarios)
+    shared = next(iter(specs.values()))
+    values = np.empty((len(specs), n_realizations, len(metrics)))
+
+    wind_seed, root = np.random.SeedSequence(seed).spawn(2)
+    n_wind = n_realizations if common_random_numbers else n_realizations * len(specs)
+    speeds, dirs = _shared_wind(shared, wind_seed, n_wind, hours)
+
+    for r, realization_seed in enumerate(root.spawn(n_realizations)):
+        if common_random_numbers:
+            stage_seeds = dict(zip(STAGES, realization_seed.spawn(len(STAGES))))
+            inputs = (speeds[r], dirs[r], _ambient_minute(shared, stage_seeds, hours))
+            scenario_runs = [(stage_seeds, inputs)] * len(specs)
+        else:
+            scenario_runs = []
+            for i, scenario_seed in enumerate(realization_seed.spawn(len(specs))):
+                stage_seeds = dict(zip(STAGES, scenario_seed.spawn(len(STAGES))))
+                row = r * len(specs) + i
+                scenario_runs.append((stage_seeds, (speeds[row], dirs[row], _ambient_minute(shared, stage_seeds, hours))))
+        for i, (spec, (seeds, inputs)) in enumerate(zip(specs.values(), scenario_runs)):
+            result = _run_scenario(spec, *inputs, seeds)
+            values[i, r] = [fn(result) for fn in metrics.values()]
+    return ScenarioComparison(list(specs), list(metrics), values, common_random_numbers)
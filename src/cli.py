@@ -0,0 +1,221 @@
+"""
+命令行入口：wind-sim <子命令> [参数]（或 python -m src.cli）
+
+    run      单台风机模拟，保存 csv / SQLite / DuckDB 结果并绘图
+    replay   用实测/历史风速文件回放驱动单台风机模拟
+    fleet    多进程模拟整个风场（共享内存结果缓冲区）
+    stream   Modbus-TCP SCADA 模拟器（逐秒推进的风机群）
+    bench    风机群逐秒推进与批量 advance 的耗时基准
+
+参数可写在 JSON 配置文件中（--config，键为参数名，如 {"hours": 48, "turbine_id": "001"}），
+命令行显式给出的参数优先于配置文件。本模块顶层只导入标准库，numpy/pandas/matplotlib
+等重型模块在子命令执行时才导入，因此 --help 无需加载它们。
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# 风机设备参数文件（位于项目根目录）
+FAN_BASIS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "fan_basis(1).json")
+PRECISIONS = ("float64", "float32")
+OUTPUT_BACKENDS = ("csv", "sqlite", "duckdb")
+
+
+def _add_single_turbine_args(parser: argparse.ArgumentParser):
+    parser.add_argument("--hours", type=int, default=24, help="模拟时长（小时）")
+    parser.add_argument("--turbine-id", default="002", help="设备参数文件中的风机编号（001/002/003）")
+    parser.add_argument("--precision", choices=PRECISIONS, default="float64", help="数值精度")
+    parser.add_argument("--output", choices=OUTPUT_BACKENDS, default="csv", help="结果输出后端")
+    parser.add_argument("--db-path", default="wind_turbine_sim.db", help="SQLite/DuckDB 数据库文件")
+    parser.add_argument("--wind-cache-dir", default=None, help="风速实现缓存目录（需同时给出 --wind-seed）")
+    parser.add_argument("--wind-seed", type=int, default=None, help="风速随机种子")
+    parser.add_argument("--rotor-model", action="store_true", help="使用 Cp(λ, β) 气动转子模型")
+    parser.add_argument("--controller", action="store_true",
+                        help="用变桨/转矩闭环控制器模拟功率与转速（较慢，单台风机每模拟小时约 10 秒）")
+    parser.add_argument("--control-hz", type=float, default=20.0, help="闭环控制器的控制回路频率 (Hz)")
+    parser.add_argument("--no-plot", action="store_true", help="不绘图")
+
+
+def build_parser() -> tuple[argparse.ArgumentParser, dict]:
+    """
+    :return: (主解析器, 子命令名 → 子解析器)
+    """
+    parser = argparse.ArgumentParser(prog="wind-sim", description="风机运维数据模拟")
+    subparsers = parser.add_subparsers(dest="command", required=True, metavar="<command>")
+    commands = {}
+
+    def add(name, help_text):
+        sub = subparsers.add_parser(name, help=help_text, description=help_text)
+        sub.add_argument("--config", default=None, help="JSON 配置文件（键为参数名，命令行参数优先）")
+        commands[name] = sub
+        return sub
+
+    run = add("run", "单台风机模拟")
+    _add_single_turbine_args(run)
+    run.add_argument("--wind-replay", default=None, help="风速回放文件，不给出时使用合成风速")
+
+    replay = add("replay", "用风速文件回放驱动单台风机模拟")
+    replay.add_argument("wind_replay", help="风速文件（.csv、.npy 或原始二进制，见 WindReplaySource）")
+    _add_single_turbine_args(replay)
+
+    fleet = add("fleet", "多进程模拟整个风场")
+    fleet.add_argument("--turbines", type=int, default=10, help="风机数量")
+    fleet.add_argument("--hours", type=int, default=24, help="模拟时长（小时）")
+    fleet.add_argument("--seed", type=int, default=0, help="第一台风机的随机种子（第 i 台为 seed + i）")
+    fleet.add_argument("--spec", default=None, help="各风机共用的模拟规格 JSON 文件（同模拟服务的规格）")
+    fleet.add_argument("--turbine-id", default=None,
+                       help="按设备参数文件中的风机编号设置风机参数（覆盖规格中的同名参数），默认使用规格/默认参数")
+    fleet.add_argument("--fan-basis", default=FAN_BASIS_PATH, help="设备参数文件")
+    fleet.add_argument("--workers", type=int, default=None, help="进程数，默认为 CPU 数")
+    fleet.add_argument("--buffer-backend", choices=("shm", "memmap"), default="shm", help="结果缓冲区后端")
+    fleet.add_argument("--directory", default=None, help="memmap 缓冲区目录")
+    fleet.add_argument("--precision", choices=PRECISIONS, default="float64", help="数值精度")
+
+    stream = add("stream", "Modbus-TCP SCADA 模拟器")
+    stream.add_argument("--units", type=int, default=10, help="虚拟风机数量（1~247）")
+    stream.add_argument("--host", default="127.0.0.1", help="监听地址")
+    stream.add_argument("--port", type=int, default=5020, help="监听端口")
+    stream.add_argument("--tick", type=float, default=1.0, help="寄存器刷新周期（秒）")
+    stream.add_argument("--duration", type=float, default=None, help="运行时长（秒），默认一直运行")
+    stream.add_argument("--seed", type=int, default=None, help="随机种子")
+
+    bench = add("bench", "风机群逐秒推进与批量 advance 的耗时基准")
+    bench.add_argument("--turbines", type=int, default=10_000, help="风机数量")
+    bench.add_argument("--ticks", type=int, default=1000, help="逐秒推进的 tick 数")
+    bench.add_argument("--backend", choices=("numpy", "numba"), default="numpy", help="批量 advance 的计算后端")
+    bench.add_argument("--background-noise", action="store_true", help="后台线程生成随机数")
+    bench.add_argument("--seed", type=int, default=0, help="随机种子")
+    return parser, commands
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    解析命令行；给出 --config 时以配置文件内容作为默认值重新解析（命令行显式参数优先）
+    """
+    parser, commands = build_parser()
+    args = parser.parse_args(argv)
+    if args.config:
+        with open(args.config, encoding="utf-8") as f:
+            config = json.load(f)
+        sub = commands[args.command]
+        known = {action.dest for action in sub._actions}
+        unknown = set(config) - known - {"command"}
+        if unknown:
+            sub.error(f"配置文件含未知参数: {sorted(unknown)}")
+        sub.set_defaults(**{key: value for key, value in config.items() if key != "command"})
+        args = parser.parse_args(argv)
+    return args
+
+
+def _run_single(args) -> int:
+    from .main import main as run_main
+
+    run_main(
+        hours=args.hours,
+        turbine_id=args.turbine_id,
+        precision=args.precision,
+        output=args.output,
+        db_path=args.db_path,
+        plot=not args.no_plot,
+        wind_replay=args.wind_replay,
+        wind_cache_dir=args.wind_cache_dir,
+        wind_seed=args.wind_seed,
+        use_rotor_model=args.rotor_model,
+        use_controller=args.controller,
+        control_hz=args.control_hz,
+    )
+    return 0
+
+
+def _run_fleet(args) -> int:
+    from .simulations.precision import get_precision
+    from .storage.shared_results import run_fleet_parallel
+
+    base = {}
+    if args.spec:
+        with open(args.spec, encoding="utf-8") as f:
+            base = json.load(f)
+    if args.turbine_id is not None:
+        from .configs.fleet_registry import load_fleet_parameters
+
+        config = load_fleet_parameters(args.fan_basis).turbine_config(args.turbine_id)
+        turbine = {name: float(value) for name, value in config.simulator_kwargs().items()}
+        base = {**base, "turbine": {**(base.get("turbine") or {}), **turbine}}
+    specs = [{**base, "seed": args.seed + i} for i in range(args.turbines)]
+    dtype = get_precision(args.precision).value
+    with run_fleet_parallel(specs, args.hours, max_workers=args.workers, backend=args.buffer_backend,
+                            directory=args.directory, dtype=dtype) as (buffers, _):
+        energy = buffers["second.power_kw"].sum(axis=1, dtype=float) / 3600.0
+        print(f"风机数: {args.turbines}，时长: {args.hours} h，结果缓冲区: {buffers.nbytes / 1e6:.1f} MB")
+        print(f"发电量 (kWh)：合计 {energy.sum():.1f}，单机平均 {energy.mean():.1f}，"
+              f"最小 {energy.min():.1f}，最大 {energy.max():.1f}")
+    return 0
+
+
+def _run_stream(args) -> int:
+    import asyncio
+
+    import numpy as np
+
+    from .scada.modbus_server import run_emulator
+    from .simulations.fleet_step_engine import FleetStepEngine
+
+    source = FleetStepEngine(args.units, rng=np.random.default_rng(args.seed))
+    print(f"Modbus-TCP 模拟器：{args.host}:{args.port}，单元号 1~{args.units}")
+    try:
+        asyncio.run(run_emulator(args.units, args.host, args.port, args.tick, source=source, duration=args.duration))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _run_bench(args) -> int:
+    import time
+
+    import numpy as np
+
+    from .simulations.backends import set_backend
+    from .simulations.fleet_step_engine import FleetStepEngine
+    from .simulations.wind.wind_speed_simu import WindSpeedSimulator
+
+    engine = FleetStepEngine(args.turbines, rng=np.random.default_rng(args.seed), background_noise=args.background_noise)
+    for _ in range(min(args.ticks, 50)):
+        engine.tick()
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        engine.tick()
+    per_tick = (time.perf_counter() - start) / max(args.ticks, 1)
+    engine.close()
+    print(f"fleet_step: {args.turbines} 台风机，{per_tick * 1e3:.3f} ms/tick")
+
+    backend = set_backend(args.backend)
+    wind = WindSpeedSimulator(dt=1.0, rng=np.random.default_rng(args.seed))
+    state = wind.init_state(args.turbines)
+    wind.advance(state, None, 1)
+    steps = max(1, min(args.ticks, 600))
+    start = time.perf_counter()
+    wind.advance(state, None, steps)
+    elapsed = time.perf_counter() - start
+    print(f"advance[{backend.name}]: 风速 {args.turbines} × {steps} 步，"
+          f"{elapsed / (args.turbines * steps) * 1e9:.1f} ns/(风机·步)")
+    return 0
+
+
+COMMANDS = {
+    "run": _run_single,
+    "replay": _run_single,
+    "fleet": _run_fleet,
+    "stream": _run_stream,
+    "bench": _run_bench,
+}
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    return COMMANDS[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
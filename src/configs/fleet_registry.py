@@ -0,0 +1,204 @@
+# 风机设备参数注册表：将 fan_basis JSON 中的设备记录编译为结构化数组（SoA）并缓存为二进制文件
+
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
+
+from .turbine_config import TurbineConfig
+
+# JSON 中文字段名 → 参数名
+FIELD_MAP = {
+    "启动风速": "v_in",
+    "额定风速": "v_rated",
+    "切出风速": "v_out",
+    "额定功率": "p_rated",
+    "启动转速": "rpm_min",
+    "额定转速": "rpm_rated",
+    "叶轮直径": "rotor_diameter",
+}
+
+# 各参数允许的单位及换算到内部单位（m/s, kW, rpm, m）的系数
+UNIT_FACTORS = {
+    "v_in": {"m/s": 1.0},
+    "v_rated": {"m/s": 1.0},
+    "v_out": {"m/s": 1.0},
+    "p_rated": {"w": 1e-3, "kw": 1.0, "mw": 1e3, "gw": 1e6},
+    "rpm_min": {"rpm": 1.0, "r/min": 1.0},
+    "rpm_rated": {"rpm": 1.0, "r/min": 1.0},
+    "rotor_diameter": {"m": 1.0, "cm": 1e-2, "mm": 1e-3},
+}
+
+PARAM_NAMES = tuple(UNIT_FACTORS)
+
+# 缓存格式版本，解析逻辑变化时递增以使旧缓存失效
+CACHE_VERSION = 1
+
+_QUANTITY_RE = re.compile(r"^\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*([A-Za-z/]*)\s*$")
+
+
+def parse_quantity(value, param: str) -> float:
+    """
+    解析带单位的数值字符串，如 "2.5MW"、"3.0m/s"、"17.25rpm"
+    :param value: 字符串或数值（数值视为已是内部单位）
+    :param param: 参数名，用于确定允许的单位
+    :return: 换算到内部单位后的数值
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    match = _QUANTITY_RE.match(str(value))
+    if match is None:
+        raise ValueError(f"无法解析参数 {param} 的取值: {value!r}")
+    number, unit = match.groups()
+    factors = UNIT_FACTORS[param]
+    if not unit:
+        return float(number)
+    factor = factors.get(unit.lower())
+    if factor is None:
+        raise ValueError(f"参数 {param} 不支持的单位: {unit!r}（允许: {', '.join(factors)}）")
+    return float(number) * factor
+
+
+class FleetParameters:
+    """
+    风机群参数（结构化数组）：每个参数一个 float64 数组，下标与 device_ids 一一对应，
+    可直接按下标取单台风机参数，或整体传入向量化的风机群模拟器。
+    """
+
+    def __init__(self, device_ids, names, n_blades, **params):
+        """
+        :param device_ids: 设备ID数组
+        :param names: 设备名称数组
+        :param n_blades: 叶片数量数组
+        :param params: PARAM_NAMES 中各参数的数组
+        """
+        self.device_ids = np.asarray(device_ids, dtype=str)
+        self.names = np.asarray(names, dtype=str)
+        self.n_blades = np.asarray(n_blades, dtype=np.int32)
+        for name in PARAM_NAMES:
+            setattr(self, name, np.asarray(params[name], dtype=np.float64))
+        self._index = {device_id: i for i, device_id in enumerate(self.device_ids)}
+
+    def __len__(self):
+        return len(self.device_ids)
+
+    def __repr__(self):
+        return f"FleetParameters(n={len(self)}, device_ids={self.device_ids[:5].tolist()}{'...' if len(self) > 5 else ''})"
+
+    def index_of(self, device_id: str) -> int:
+        """
+        根据设备ID获取下标
+        """
+        try:
+            return self._index[str(device_id)]
+        except KeyError:
+            raise KeyError(f"未找到设备ID: {device_id}") from None
+
+    def as_dict(self, device_id: str) -> dict:
+        """
+        获取单台风机的参数字典（内部单位）
+        """
+        i = self.index_of(device_id)
+        return {name: float(getattr(self, name)[i]) for name in PARAM_NAMES}
+
+    def turbine_config(self, device_id: str) -> TurbineConfig:
+        """
+        获取单台风机的 TurbineConfig
+        """
+        return TurbineConfig(**self.as_dict(device_id))
+
+    def validate(self):
+        """
+        校验参数的物理合理性，不合理时抛出 ValueError 并指出设备ID
+        """
+        checks = (
+            (np.isfinite(np.stack([getattr(self, n) for n in PARAM_NAMES])).all(axis=0), "存在缺失或非法数值"),
+            (self.v_in > 0, "启动风速必须为正"),
+            (self.v_in < self.v_rated, "启动风速必须小于额定风速"),
+            (self.v_rated < self.v_out, "额定风速必须小于切出风速"),
+            (self.p_rated > 0, "额定功率必须为正"),
+            (self.rpm_min > 0, "启动转速必须为正"),
+            (self.rpm_min < self.rpm_rated, "启动转速必须小于额定转速"),
+            (self.rotor_diameter > 0, "叶轮直径必须为正"),
+        )
+        for ok, message in checks:
+            bad = np.flatnonzero(~ok)
+            if bad.size:
+                raise ValueError(f"设备 {', '.join(self.device_ids[bad])}: {message}")
+
+    def _arrays(self) -> dict:
+        arrays = {name: getattr(self, name) for name in PARAM_NAMES}
+        arrays.update(device_ids=self.device_ids, names=self.names, n_blades=self.n_blades)
+        return arrays
+
+
+def parse_fleet_records(records) -> FleetParameters:
+    """
+    解析 fan_basis 格式的设备记录列表并校验
+    :param records: JSON 解析得到的字典列表
+    :return: FleetParameters
+    """
+    n = len(records)
+    values = {name: np.full(n, np.nan) for name in PARAM_NAMES}
+    device_ids, names, n_blades = [], [], np.zeros(n, dtype=np.int32)
+
+    for i, record in enumerate(records):
+        device_id = str(record.get("设备ID", i))
+        device_ids.append(device_id)
+        names.append(str(record.get("设备名称", "")))
+        n_blades[i] = int(record.get("叶片数量", 3))
+        for key, param in FIELD_MAP.items():
+            if key not in record:
+                raise ValueError(f"设备 {device_id}: 缺少字段 {key}")
+            values[param][i] = parse_quantity(record[key], param)
+
+    if len(set(device_ids)) != n:
+        raise ValueError("设备ID存在重复")
+
+    fleet = FleetParameters(device_ids, names, n_blades, **values)
+    fleet.validate()
+    return fleet
+
+
+def _file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def load_fleet_parameters(path: str, cache_dir: str | None = None, use_cache: bool = True) -> FleetParameters:
+    """
+    加载风机参数文件。首次加载时解析、校验 JSON 并以文件内容哈希为键写入二进制缓存（.npz），
+    文件内容不变时直接读取缓存，跳过 JSON 解析与单位换算。
+    :param path: fan_basis 格式的 JSON 文件路径
+    :param cache_dir: 缓存目录，默认为 JSON 所在目录下的 .fleet_cache
+    :param use_cache: 是否读写缓存
+    :return: FleetParameters
+    """
+    if not use_cache:
+        with open(path, encoding="utf-8") as f:
+            return parse_fleet_records(json.load(f))
+
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(path)), ".fleet_cache")
+    stem = os.path.splitext(os.path.basename(path))[0]
+    cache_path = os.path.join(cache_dir, f"{stem}-v{CACHE_VERSION}-{_file_digest(path)[:16]}.npz")
+
+    if os.path.exists(cache_path):
+        with np.load(cache_path, allow_pickle=False) as data:
+            arrays = {key: data[key] for key in data.files}
+        return FleetParameters(**arrays)
+
+    with open(path, encoding="utf-8") as f:
+        fleet = parse_fleet_records(json.load(f))
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = cache_path + f".{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **fleet._arrays())
+    os.replace(tmp_path, cache_path)
+    return fleet
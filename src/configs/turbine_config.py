@@ -4,7 +4,8 @@ class TurbineConfig:
     """
 
     def __init__(self, v_in=3.0, v_rated=12.0, v_out=25.0, p_rated=2000.0,
-                 noise_sigma=0.02, rpm_min=6.0, rpm_rated=15.0, rpm_noise_sigma=0.2):
+                 noise_sigma=0.02, rpm_min=6.0, rpm_rated=15.0, rpm_noise_sigma=0.2,
+                 rotor_diameter=None):
         """
         :param v_in: 切入风速 (m/s)
         :param v_rated: 额定风速 (m/s)
@@ -14,6 +15,7 @@ class TurbineConfig:
         :param rpm_min: 最低运行转速 (rpm)
         :param rpm_rated: 额定转速 (rpm)
         :param rpm_noise_sigma: 转速噪声 (rpm)
+        :param rotor_diameter: 叶轮直径 (m)，可选
         """
         self.v_in = v_in
         self.v_rated = v_rated
@@ -22,4 +24,20 @@ class TurbineConfig:
         self.noise_sigma = noise_sigma
         self.rpm_min = rpm_min
         self.rpm_rated = rpm_rated
-        self.rpm_noise_sigma = rpm_noise_sigma
\ No newline at end of file
+        self.rpm_noise_sigma = rpm_noise_sigma
+        self.rotor_diameter = rotor_diameter
+
+    def simulator_kwargs(self):
+        """
+        获取用于构造 WindTurbinePowerSimulator 的参数字典
+        """
+        return {
+            "v_in": self.v_in,
+            "v_rated": self.v_rated,
+            "v_out": self.v_out,
+            "p_rated": self.p_rated,
+            "noise_sigma": self.noise_sigma,
+            "rpm_min": self.rpm_min,
+            "rpm_rated": self.rpm_rated,
+            "rpm_noise_sigma": self.rpm_noise_sigma,
+        }
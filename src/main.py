@@ -1,86 +1,130 @@
+import os
 import numpy as np
-import matplotlib.pyplot as plt
-from simulations.wind.wind_field_manager import WindFieldManager
-from simulations.wind.wind_speed_simu import WindSpeedSimulator
-from simulations.environment.temperature_simulator import TemperatureSimulator
-from simulations.turbine.wind_turbine_power_simu import WindTurbinePowerSimulator
-from simulations.bearing.bearing_temp_simulator import BearingTemperatureSimulator
-from simulations.bearing.bearing_vibration_simulator import BearingVibrationSimulator
-
-def save_csv(wind_speeds, wind_dirs, wind_speeds_min_average, turbine_power_min, turbine_rpm_min, bearing_temperatures, bearing_vibrations, wind_speeds_hour_average, turbine_power_hour, turbine_rpm_hour, temperatures, turbine_power_sec, turbine_rpm_sec):
+from .configs.fleet_registry import load_fleet_parameters
+from .simulations.wind.wind_field_manager import WindFieldManager
+from .simulations.wind.wind_replay import WindReplaySource
+from .simulations.wind.wind_speed_simu import WindSpeedSimulator
+from .simulations.environment.temperature_simulator import TemperatureSimulator
+from .simulations.turbine.wind_turbine_power_simu import WindTurbinePowerSimulator
+from .simulations.turbine.rotor_aero import RotorModel
+from .simulations.bearing.bearing_temp_simulator import BearingTemperatureSimulator
+from .simulations.bearing.bearing_vibration_simulator import BearingVibrationSimulator
+from .simulations.precision import MemoryLedger, get_precision
+
+# 风机设备参数文件（位于项目根目录）
+FAN_BASIS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "fan_basis(1).json")
+# 风速回放文件（如实测 SCADA 风速或之前生成的 wind_second.csv），None 表示使用合成风速
+WIND_REPLAY_PATH = None
+# 风速实现缓存目录与随机种子：两者都设置时，相同风速参数与种子的风速直接从缓存读取，不重新模拟
+WIND_CACHE_DIR = None
+WIND_SEED = None
+# 是否使用 Cp(λ, β) 气动转子模型（需要设备参数中的叶轮直径），False 时使用通用三次功率曲线
+USE_ROTOR_MODEL = False
+# 是否用变桨/转矩闭环控制器（ControlledTurbineFleet）求秒级功率与转速，分钟/小时值与轴承模拟均由其结果求得；
+# 按控制回路频率逐步积分，单台风机每模拟小时约需 10 秒（20 Hz）
+USE_CONTROLLER = False
+CONTROL_HZ = 20.0
+
+# 数值精度："float64" 或 "float32"（信号 float32、序号 int32，内存与磁盘约减半）
+PRECISION = "float64"
+
+# 结果输出后端："csv"、"sqlite" 或 "duckdb"
+OUTPUT_BACKEND = "csv"
+OUTPUT_DB_PATH = "wind_turbine_sim.db"
+
+
+def build_output_tables(wind_speeds, wind_dirs, wind_speeds_min_average, turbine_power_min, turbine_rpm_min, bearing_temperatures, bearing_vibrations, wind_speeds_hour_average, turbine_power_hour, turbine_rpm_hour, temperatures, turbine_power_sec, turbine_rpm_sec, id_dtype=np.int64):
+    """
+    组织秒级、分钟级、小时级输出表
+    :param id_dtype: 序号列的数据类型
+    :return: 表名 → {列名: 数组}
+    """
+    return {
+        # ========== 秒级 ==========
+        "wind_second": {
+            "sec_id": np.arange(len(wind_speeds), dtype=id_dtype),
+            "wind_speed": wind_speeds,
+            "wind_dir": wind_dirs,
+            "power_kw": turbine_power_sec,
+            "rpm": turbine_rpm_sec,
+        },
+        # ========== 分钟级 ==========
+        "turbine_minute": {
+            "min_id": np.arange(len(wind_speeds_min_average), dtype=id_dtype),
+            "wind_speed_avg": wind_speeds_min_average,
+            "power_kw": turbine_power_min,
+            "rpm": turbine_rpm_min,
+            "bearing_temp": bearing_temperatures,
+            "bearing_vibration": bearing_vibrations,
+        },
+        # ========== 小时级 ==========
+        "hourly": {
+            "hour_id": np.arange(len(wind_speeds_hour_average), dtype=id_dtype),
+            "wind_speed_avg": wind_speeds_hour_average,
+            "power_kw": turbine_power_hour,
+            "rpm": turbine_rpm_hour,
+            "ambient_temp": temperatures,
+        },
+    }
+
+
+def save_csv(*args, id_dtype=np.int64):
     import pandas as pd
 
-    # ========== 秒级 ==========
-    df_sec = pd.DataFrame({
-        "sec_id": np.arange(len(wind_speeds)),
-        "wind_speed": wind_speeds,
-        "wind_dir": wind_dirs,
-        "power_kw": turbine_power_sec,
-        "rpm": turbine_rpm_sec,
-    })
-    df_sec.to_csv("wind_second.csv", index=False)
-
-    # ========== 分钟级 ==========
-    df_min = pd.DataFrame({
-        "min_id": np.arange(len(wind_speeds_min_average)),
-        "wind_speed_avg": wind_speeds_min_average,
-        "power_kw": turbine_power_min,
-        "rpm": turbine_rpm_min,
-        "bearing_temp": bearing_temperatures,
-        "bearing_vibration": bearing_vibrations,
-    })
-    df_min.to_csv("turbine_minute.csv", index=False)
-
-    # ========== 小时级 ==========
-    df_hour = pd.DataFrame({
-        "hour_id": np.arange(len(wind_speeds_hour_average)),
-        "wind_speed_avg": wind_speeds_hour_average,
-        "power_kw": turbine_power_hour,
-        "rpm": turbine_rpm_hour,
-        "ambient_temp": temperatures,
-    })
-    df_hour.to_csv("hourly.csv", index=False)
-
-
-def main():
-    # # 600W 风机模拟参数
-    # v_in = 2.0      # 切入风速 (m/s)
-    # v_rated = 13.0  # 额定风速 (m/s
-    # v_out = 50.0    # 切出风速 (m/s)
-    # p_rated = 0.6 # 额定功率 (kW）
-    # rpm_rated = 1200.0  # 额定转速 (rpm)
-    # rpm_min = 200.0     # 最低运行转速 (rpm)
-    
-    # #2.5MW 风机模拟参数
-    # v_in = 3.0      # 切入风速 (m/s)
-    # v_rated = 11.5  # 额定风速 (m/s
-    # v_out = 25.0    # 切出风速 (m/s)
-    # p_rated = 2500.0 # 额定功率 (kW)
-    # rpm_rated = 17.25  # 额定转速 (rpm)
-    # rpm_min = 4.5     # 最低运行转速 (rpm)
-
-    #5kW 风机模拟参数
-    v_in = 2.5      # 切入风速 (m/s)
-    v_rated = 10.0  # 额定风速 (m/s
-    v_out = 20.0    # 切出风速 (m/s)
-    p_rated = 5.0 # 额定功率 (kW)
-    rpm_rated = 300  # 额定转速 (rpm)
-    rpm_min = 75     # 最低运行转速 (rpm)
+    for table, columns in build_output_tables(*args, id_dtype=id_dtype).items():
+        pd.DataFrame(columns).to_csv(f"{table}.csv", index=False)
+
+
+def save_sql(*args, path=OUTPUT_DB_PATH, backend="sqlite", turbine_id="0", id_dtype=np.int64):
+    from .storage.sql_sink import save_tables
+
+    report = save_tables(path, build_output_tables(*args, id_dtype=id_dtype), turbine_id=turbine_id, backend=backend)
+    for stats in report.values():
+        print(stats)
+    return report
+
+
+def simulate(hours=24, turbine_id="002", precision=PRECISION, wind_replay=WIND_REPLAY_PATH, wind_cache_dir=WIND_CACHE_DIR,
+             wind_seed=WIND_SEED, use_rotor_model=USE_ROTOR_MODEL, fan_basis_path=FAN_BASIS_PATH,
+             use_controller=USE_CONTROLLER, control_hz=CONTROL_HZ):
+    """
+    单台风机模拟
+    :param hours: 模拟时长（小时）
+    :param turbine_id: 设备参数文件中的风机编号（001: 2.5MW, 002: 5kW, 003: 600W）
+    :param precision: 数值精度 "float64" 或 "float32"
+    :param wind_replay: 风速回放文件，None 表示使用合成风速
+    :param wind_cache_dir: 风速实现缓存目录（与 wind_seed 同时设置时生效）
+    :param wind_seed: 风速随机种子
+    :param use_rotor_model: 是否使用 Cp(λ, β) 气动转子模型
+    :param fan_basis_path: 风机设备参数文件
+    :param use_controller: 是否用闭环控制器模拟秒级功率与转速（需要 1 秒步长的风速，隐含使用气动转子模型）
+    :param control_hz: 闭环控制器的控制回路频率 (Hz)
+    :return: (build_output_tables 的位置参数元组, 秒级步长)
+    """
+    fleet = load_fleet_parameters(fan_basis_path)
+    turbine_config = fleet.turbine_config(turbine_id)
+    rpm_min = turbine_config.rpm_min
+    rpm_rated = turbine_config.rpm_rated
+    precision = get_precision(precision)
 
     # 风场模拟
-    wind_field_manager = WindFieldManager(wind_speed_simulator=WindSpeedSimulator(tau=5.0, sigma=2.0, dt=1.0, mean_wind=10.0,tau_dir=30.0, sigma_dir=5.0, mean_dir=0.0))
+    replay_source = WindReplaySource(wind_replay) if wind_replay else None
+    wind_cache = None
+    if wind_cache_dir and wind_seed is not None:
+        from .storage.wind_cache import WindRealizationCache
+        wind_cache = WindRealizationCache(wind_cache_dir)
+    wind_field_manager = WindFieldManager(wind_speed_simulator=WindSpeedSimulator(tau=5.0, sigma=2.0, dt=1.0, mean_wind=10.0,tau_dir=30.0, sigma_dir=5.0, mean_dir=0.0), replay_source=replay_source, dtype=precision.value, cache=wind_cache, seed=wind_seed if wind_cache else None)
     # wind_speeds 风速（秒）
     # wind_dirs 风向（秒）
-    wind_speeds, wind_dirs = wind_field_manager.simulate(steps=24*3600)
-    wind_speeds = np.zeros(24*3600)  # 测试用恒定风速0m/s
+    wind_speeds, wind_dirs = wind_field_manager.simulate(steps=hours*3600)
 
     # 求解1min均值风速，用于发布页面底部数据区域的有功功率（分钟）的计算
-    points_per_min = int(60 / wind_field_manager.wind_speed_simulator.dt)
+    points_per_min = int(60 / wind_field_manager.dt)
     num_mins = len(wind_speeds) // points_per_min
     wind_speeds_trimmed_min = wind_speeds[:num_mins * points_per_min]
     wind_speeds_min_average = wind_speeds_trimmed_min.reshape(num_mins, points_per_min).mean(axis=1)
     # 求解1h均值风速
-    points_per_hour = int(3600 / wind_field_manager.wind_speed_simulator.dt)
+    points_per_hour = int(3600 / wind_field_manager.dt)
     num_hours = len(wind_speeds) // points_per_hour
     # 只对完整小时计算平均值
     wind_speeds_trimmed_hour = wind_speeds[:num_hours * points_per_hour]
@@ -88,43 +132,53 @@ def main():
 
     # 环境温度模拟
     # temperatures 环境温度（小时）
-    temperature_simulator = TemperatureSimulator(tau=6.0, sigma=0.5, dt=1.0, mean_temp=20.0)
-    temperatures = temperature_simulator.simulate(hours=24)
+    temperature_simulator = TemperatureSimulator(tau=6.0, sigma=0.5, dt=1.0, mean_temp=20.0, dtype=precision.value)
+    temperatures = temperature_simulator.simulate(hours=hours)
     
     # 将小时级环境温度扩展到分钟级（每个小时60分钟）
     # 假设每个小时内温度线性变化
     temperatures_minute = np.repeat(temperatures, 60)[:num_mins]
 
     # 风机功率和转速模拟
-    turbine_simulator = WindTurbinePowerSimulator(
-        v_in=v_in,
-        v_rated=v_rated,
-        v_out=v_out,
-        p_rated=p_rated,
-        rpm_min=rpm_min,
-        rpm_rated=rpm_rated
-    )
-    # turbine_power_sec 有功功率 （秒）
-    # turbine_rpm_sec 转速 (秒)
-    # wind_speeds = np.asarray([10])
-    turbine_power_sec = turbine_simulator.power_from_speed(wind_speeds) #用于发布页面底部数据区域的有功功率（秒）
-    turbine_rpm_sec = turbine_simulator.rpm_from_power(turbine_power_sec) #用于发布页面底部数据区域的转速（秒）
-
-    # turbine_power_min 有功功率 （分钟）
-    # turbine_rpm_min 转速 (分钟)
-    turbine_power_min = turbine_simulator.power_from_speed(wind_speeds_min_average) #用于发布页面底部数据区域的有功功率（分钟）
-    turbine_rpm_min = turbine_simulator.rpm_from_power(turbine_power_min)
-    # turbine_power_hour 有功功率（小时）
-    # turbine_rpm_hour 转速（小时）
-    turbine_power_hour = turbine_simulator.power_from_speed(wind_speeds_hour_average) #用于发布页面右侧曲线功率的呈现
-    turbine_rpm_hour = turbine_simulator.rpm_from_power(wind_speeds_hour_average)
+    rotor_model = RotorModel.from_config(turbine_config) if use_rotor_model else None
+    turbine_simulator = WindTurbinePowerSimulator(**turbine_config.simulator_kwargs(), rotor_model=rotor_model, dtype=precision.value)
+    if use_controller:
+        # 闭环控制器：秒级功率/转速由转子动力学与变桨/转矩控制求得，分钟/小时值取其平均
+        if wind_field_manager.dt != 1.0:
+            raise ValueError(f"闭环控制器需要 1 秒步长的风速，当前步长为 {wind_field_manager.dt} 秒")
+        from .simulations.turbine.drivetrain_control import ControlledTurbineFleet
+
+        controller = ControlledTurbineFleet(rotor_model or RotorModel.from_config(turbine_config),
+                                            control_hz=control_hz, dtype=precision.value)
+        controlled = controller.simulate(wind_speeds)
+        turbine_power_sec, turbine_rpm_sec = controlled["power_kw"][0], controlled["rpm"][0]
+        turbine_power_min = turbine_power_sec[:num_mins * points_per_min].reshape(num_mins, points_per_min).mean(axis=1)
+        turbine_rpm_min = turbine_rpm_sec[:num_mins * points_per_min].reshape(num_mins, points_per_min).mean(axis=1)
+        turbine_power_hour = turbine_power_sec[:num_hours * points_per_hour].reshape(num_hours, points_per_hour).mean(axis=1)
+        turbine_rpm_hour = turbine_rpm_sec[:num_hours * points_per_hour].reshape(num_hours, points_per_hour).mean(axis=1)
+    else:
+        # turbine_power_sec 有功功率 （秒）
+        # turbine_rpm_sec 转速 (秒)
+        # wind_speeds = np.asarray([10])
+        # 用于发布页面底部数据区域的有功功率（秒）与转速（秒）
+        turbine_power_sec, turbine_rpm_sec = turbine_simulator.power_and_rpm_from_speed(wind_speeds)
+
+        # turbine_power_min 有功功率 （分钟）
+        # turbine_rpm_min 转速 (分钟)
+        turbine_power_min = turbine_simulator.power_from_speed(wind_speeds_min_average) #用于发布页面底部数据区域的有功功率（分钟）
+        turbine_rpm_min = turbine_simulator.rpm_from_power(turbine_power_min)
+        # turbine_power_hour 有功功率（小时）
+        # turbine_rpm_hour 转速（小时）
+        turbine_power_hour = turbine_simulator.power_from_speed(wind_speeds_hour_average) #用于发布页面右侧曲线功率的呈现
+        turbine_rpm_hour = turbine_simulator.rpm_from_power(wind_speeds_hour_average)
 
     # 风机轴承温度模拟
     # bearing_temperatures 轴承温度（分钟）
     # 传入分钟级的环境温度和转速，使温度与这两个因素相关
     bearing_temp_simulator = BearingTemperatureSimulator(
         rpm_min=rpm_min,
-        rpm_rated=rpm_rated
+        rpm_rated=rpm_rated,
+        dtype=precision.value,
     )
     bearing_temperatures = bearing_temp_simulator.simulate(temperatures_minute, turbine_rpm_min)
 
@@ -134,13 +188,20 @@ def main():
     bearing_vibration_simulator = BearingVibrationSimulator(
         rpm_min=rpm_min,
         rpm_rated=rpm_rated,
+        dtype=precision.value,
     )
     bearing_vibrations = bearing_vibration_simulator.simulate(turbine_rpm_min)
 
-    # 保存数据到csv
-    save_csv(wind_speeds, wind_dirs, wind_speeds_min_average, turbine_power_min, turbine_rpm_min, bearing_temperatures, bearing_vibrations, wind_speeds_hour_average, turbine_power_hour, turbine_rpm_hour, temperatures, turbine_power_sec, turbine_rpm_sec)
+    outputs = (wind_speeds, wind_dirs, wind_speeds_min_average, turbine_power_min, turbine_rpm_min, bearing_temperatures, bearing_vibrations, wind_speeds_hour_average, turbine_power_hour, turbine_rpm_hour, temperatures, turbine_power_sec, turbine_rpm_sec)
+    return outputs, wind_field_manager.dt
+
+
+def plot_results(wind_speeds, wind_dirs, wind_speeds_min_average, turbine_power_min, turbine_rpm_min, bearing_temperatures, bearing_vibrations, wind_speeds_hour_average, turbine_power_hour, turbine_rpm_hour, temperatures, turbine_power_sec, turbine_rpm_sec):
+    """
+    绘制模拟结果（matplotlib 在此处才导入）
+    """
+    import matplotlib.pyplot as plt
 
-    # 可视化结果
     plt.figure(figsize=(12, 8))
 
     plt.subplot(3, 2, 1)
@@ -216,5 +277,38 @@ def main():
     plt.tight_layout()
     plt.show()
 
+
+def main(hours=24, turbine_id="002", precision=PRECISION, output=OUTPUT_BACKEND, db_path=OUTPUT_DB_PATH, plot=True, **kwargs):
+    """
+    单台风机模拟 → 保存结果（csv 或 SQLite/DuckDB）→ 内存账本 → 可视化
+    :param output: 结果输出后端："csv"、"sqlite" 或 "duckdb"
+    :param plot: 是否绘图
+    :param kwargs: 传给 simulate 的其他参数
+    """
+    outputs, dt = simulate(hours=hours, turbine_id=turbine_id, precision=precision, **kwargs)
+    precision = get_precision(precision)
+
+    # 保存数据（csv 或 SQLite/DuckDB）
+    if output == "csv":
+        save_csv(*outputs, id_dtype=precision.index)
+    else:
+        save_sql(*outputs, path=db_path, backend=output, turbine_id=turbine_id, id_dtype=precision.index)
+
+    # 内存账本：输出数组占用的字节数（每台风机每秒）
+    ledger = MemoryLedger()
+    ledger.add_tables(build_output_tables(*outputs, id_dtype=precision.index))
+    print(ledger.report(n_turbines=1, seconds=len(outputs[0]) * dt))
+
+    # 可视化结果
+    if plot:
+        plot_results(*outputs)
+    return outputs
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # python -m src.main [参数] 等同于 python -m src.cli run [参数]
+    import sys
+
+    from .cli import main as cli_main
+
+    sys.exit(cli_main(["run", *sys.argv[1:]]))
@@ -0,0 +1,249 @@
+"""
+本地 Modbus-TCP SCADA 模拟器：为数据采集程序提供可轮询的虚拟风机。
+
+每台虚拟风机对应一个 Modbus 单元号（unit id，从 1 开始），寄存器映射（输入寄存器与保持寄存器相同）：
+
+    地址  信号                 单位   编码
+    0-1   wind_speed           m/s    float32 大端（高字在前）
+    2-3   wind_dir             度     float32
+    4-5   power_kw             kW     float32
+    6-7   rpm                  rpm    float32
+    8-9   bearing_temp         °C     float32
+    10-11 bearing_vibration    mm/s   float32
+
+所有风机的寄存器保存在一块预分配的 numpy 缓冲区中，模拟器原地刷新；
+应答时直接从缓冲区切片拷贝字节，不为每次请求构造寄存器对象。
+支持功能码 0x03（读保持寄存器）与 0x04（读输入寄存器）。
+"""
+
+import asyncio
+import struct
+
+import numpy as np
+
+from ..simulations.bearing.bearing_temp_simulator import BearingTemperatureSimulator
+from ..simulations.bearing.bearing_vibration_simulator import BearingVibrationSimulator
+from ..simulations.fleet_step_engine import FleetStepEngine
+from ..simulations.turbine.wind_turbine_power_simu import WindTurbinePowerSimulator
+from ..simulations.wind.wind_speed_simu import WindSpeedSimulator
+
+SIGNALS = ("wind_speed", "wind_dir", "power_kw", "rpm", "bearing_temp", "bearing_vibration")
+
+# Modbus 功能码与异常码
+READ_HOLDING_REGISTERS = 0x03
+READ_INPUT_REGISTERS = 0x04
+ILLEGAL_FUNCTION = 0x01
+ILLEGAL_DATA_ADDRESS = 0x02
+ILLEGAL_DATA_VALUE = 0x03
+GATEWAY_TARGET_FAILED = 0x0B
+
+MAX_READ_REGISTERS = 125
+_MBAP = struct.Struct(">HHHB")
+_READ_REQUEST = struct.Struct(">BHH")
+
+
+class RegisterBank:
+    """
+    风机群寄存器缓冲区：values 为 (n_units, n_signals) 的大端 float32 数组，
+    registers 为同一内存上的 (n_units, n_registers) 大端 uint16 视图。
+    """
+
+    def __init__(self, n_units: int):
+        """
+        :param n_units: 虚拟风机数量（Modbus 单元号 1 ~ n_units，最多 247）
+        """
+        if not 1 <= n_units <= 247:
+            raise ValueError("Modbus 单元号范围为 1~247")
+        self.n_units = n_units
+        self.values = np.zeros((n_units, len(SIGNALS)), dtype=">f4")
+        self.registers = self.values.view(">u2")
+        self.n_registers = self.registers.shape[1]
+        self._bytes = memoryview(self.values.reshape(-1).view(np.uint8))
+        self._row_bytes = self.n_registers * 2
+
+    def update(self, signals: dict):
+        """
+        原地刷新寄存器
+        :param signals: 信号名 → (n_units,) 数组，可只包含部分信号
+        """
+        for i, name in enumerate(SIGNALS):
+            if name in signals:
+                self.values[:, i] = signals[name]
+
+    def read_bytes(self, unit: int, address: int, count: int) -> memoryview:
+        """
+        获取某单元从 address 开始 count 个寄存器的原始字节（不拷贝）
+        """
+        start = (unit - 1) * self._row_bytes + address * 2
+        return self._bytes[start:start + count * 2]
+
+
+class ModbusTCPProtocol(asyncio.Protocol):
+    """
+    Modbus-TCP 连接处理：解析 MBAP 帧（支持粘包/半包），从 RegisterBank 直接应答
+    """
+
+    def __init__(self, bank: RegisterBank):
+        self.bank = bank
+        self.transport = None
+        self._buffer = bytearray()
+        self._out = bytearray(_MBAP.size + 2 + MAX_READ_REGISTERS * 2)
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        buffer = self._buffer
+        buffer.extend(data)
+        offset = 0
+        while len(buffer) - offset >= _MBAP.size:
+            tid, pid, length, unit = _MBAP.unpack_from(buffer, offset)
+            if length < 2:
+                self.transport.close()
+                return
+            frame_end = offset + 6 + length
+            if len(buffer) < frame_end:
+                break
+            pdu = memoryview(buffer)[offset + _MBAP.size:frame_end]
+            response = self._handle(tid, unit, pdu)
+            pdu.release()
+            if response is not None:
+                self.transport.write(response)
+            offset = frame_end
+        if offset:
+            del buffer[:offset]
+
+    def _exception(self, tid, unit, function, code):
+        return _MBAP.pack(tid, 0, 3, unit) + bytes((function | 0x80, code))
+
+    def _handle(self, tid, unit, pdu):
+        function = pdu[0]
+        if function not in (READ_HOLDING_REGISTERS, READ_INPUT_REGISTERS):
+            return self._exception(tid, unit, function, ILLEGAL_FUNCTION)
+        if len(pdu) != _READ_REQUEST.size:
+            return self._exception(tid, unit, function, ILLEGAL_DATA_VALUE)
+        _, address, count = _READ_REQUEST.unpack(pdu)
+        if not 1 <= count <= MAX_READ_REGISTERS:
+            return self._exception(tid, unit, function, ILLEGAL_DATA_VALUE)
+        if not 1 <= unit <= self.bank.n_units:
+            return self._exception(tid, unit, function, GATEWAY_TARGET_FAILED)
+        if address + count > self.bank.n_registers:
+            return self._exception(tid, unit, function, ILLEGAL_DATA_ADDRESS)
+
+        n_bytes = count * 2
+        out = self._out
+        _MBAP.pack_into(out, 0, tid, 0, 3 + n_bytes, unit)
+        out[7] = function
+        out[8] = n_bytes
+        out[9:9 + n_bytes] = self.bank.read_bytes(unit, address, count)
+        return bytes(out[:9 + n_bytes])
+
+
+class SimulatorFleetSource:
+    """
+    由现有模拟器驱动的虚拟风机群数据源：
+    风速/风向按秒推进，功率经一阶惯性与斜坡率限制，轴承温度/振动每分钟用分钟平均转速推进一次。
+    """
+
+    def __init__(
+        self,
+        n_units: int,
+        turbine_kwargs: dict | None = None,
+        wind_kwargs: dict | None = None,
+        ambient_temp: float = 20.0,
+        seed: int | None = None,
+    ):
+        """
+        :param n_units: 虚拟风机数量
+        :param turbine_kwargs: WindTurbinePowerSimulator 构造参数
+        :param wind_kwargs: WindSpeedSimulator 构造参数（dt 固定为 1 秒）
+        :param ambient_temp: 环境温度（°C）
+        :param seed: 随机种子（每台风机的各模拟器使用由其派生的独立随机流，不影响全局 np.random）
+        """
+        wind_kwargs = dict(wind_kwargs or {}, dt=1.0)
+        self.n_units = n_units
+        self.ambient_temp = ambient_temp
+        turbine_stream, *streams = np.random.SeedSequence(seed).spawn(n_units + 1)
+        self.turbine = WindTurbinePowerSimulator(**(turbine_kwargs or {}), rng=np.random.default_rng(turbine_stream))
+        rpm_kwargs = {"rpm_min": self.turbine.rpm_min, "rpm_rated": self.turbine.rpm_rated}
+        self.wind, self.bearing_temp, self.bearing_vib = [], [], []
+        for stream in streams:
+            wind_rng, temp_rng, vib_rng = (np.random.default_rng(s) for s in stream.spawn(3))
+            self.wind.append(WindSpeedSimulator(**wind_kwargs, rng=wind_rng))
+            self.bearing_temp.append(BearingTemperatureSimulator(**rpm_kwargs, base_temp=ambient_temp, rng=temp_rng))
+            self.bearing_vib.append(BearingVibrationSimulator(**rpm_kwargs, rng=vib_rng))
+
+        self.power = np.zeros(n_units)
+        self.temps = np.full(n_units, ambient_temp)
+        self.vibs = np.array([sim.current_rms for sim in self.bearing_vib])
+        self._rpm_sum = np.zeros(n_units)
+        self._ticks = 0
+
+    def tick(self) -> dict:
+        """
+        推进 1 秒
+        :return: 信号名 → (n_units,) 数组
+        """
+        state = np.array([sim.step() for sim in self.wind])
+        speeds, dirs = state[:, 0], state[:, 1]
+
+        ideal = self.turbine._power_curve_ideal_array(speeds)
+        alpha = 1.0 / (self.turbine.time_constant + 1.0)
+        target = self.power + (ideal - self.power) * alpha
+        delta = np.clip(target - self.power, -self.turbine.max_ramp_rate, self.turbine.max_ramp_rate)
+        self.power = np.maximum(self.power + delta, 0.0)
+        rpm = self.turbine.rpm_from_power(self.power)
+
+        self._rpm_sum += rpm
+        self._ticks += 1
+        if self._ticks % 60 == 0:
+            rpm_min = self._rpm_sum / 60.0
+            self._rpm_sum[:] = 0.0
+            self.temps = np.array([sim.step(self.ambient_temp, r) for sim, r in zip(self.bearing_temp, rpm_min)])
+            self.vibs = np.array([sim.step(r) for sim, r in zip(self.bearing_vib, rpm_min)])
+
+        return {
+            "wind_speed": speeds,
+            "wind_dir": dirs,
+            "power_kw": self.power,
+            "rpm": rpm,
+            "bearing_temp": self.temps,
+            "bearing_vibration": self.vibs,
+        }
+
+
+async def start_modbus_server(bank: RegisterBank, host: str = "127.0.0.1", port: int = 5020):
+    """
+    启动 Modbus-TCP 服务
+    :return: asyncio.Server（port=0 时可通过 server.sockets[0].getsockname() 获取实际端口）
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.create_server(lambda: ModbusTCPProtocol(bank), host, port)
+
+
+async def run_emulator(
+    n_units: int = 10,
+    host: str = "127.0.0.1",
+    port: int = 5020,
+    tick_seconds: float = 1.0,
+    source=None,
+    duration: float | None = None,
+):
+    """
+    运行 SCADA 模拟器：启动服务并按 tick_seconds 周期刷新寄存器
+    :param n_units: 虚拟风机数量
+    :param source: 数据源，需提供 tick() -> dict，默认为 FleetStepEngine（结构数组状态，逐 tick 向量化推进）
+    :param duration: 运行时长（秒），None 表示一直运行
+    """
+    bank = RegisterBank(n_units)
+    source = source or FleetStepEngine(n_units)
+    bank.update(source.tick())
+    server = await start_modbus_server(bank, host, port)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    async with server:
+        next_tick = start
+        while duration is None or loop.time() - start < duration:
+            next_tick += tick_seconds
+            await asyncio.sleep(max(next_tick - loop.time(), 0.0))
+            bank.update(source.tick())
@@ -0,0 +1,2 @@
+# 文件：/wind-turbine-om-sim/wind-turbine-om-sim/src/service/__init__.py
+# 该文件用于将service目录标记为一个Python包。
\ No newline at end of file
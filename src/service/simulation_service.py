@@ -0,0 +1,363 @@
+"""
+按需模拟 HTTP 服务：接收模拟规格（风机参数、时长、随机种子、分辨率），返回模拟结果，并按内容寻址缓存。
+
+- 规格去掉 duration_hours / resolutions 后与模型版本 MODEL_VERSION 一起规范化为 JSON，取 SHA-256 作为缓存键；
+  相同参数、不同时长的请求共享同一缓存条目，模拟器代码变化时递增 MODEL_VERSION 使旧条目失效。
+- 每个模拟阶段（风速、环境温度、风机功率/转速噪声、轴承温度、轴承振动）使用由种子派生的独立随机流，
+  并始终按整小时推进，因此“先算 24 小时再续算 24 小时”与“一次算 48 小时”的结果逐位一致。
+  缓存条目保存模拟器末尾状态，请求更长时长时从该状态续算，不从头重算；状态无法还原（如旧版本写入）时按未命中处理。
+- 缓存为磁盘 LRU：按条目最近访问时间淘汰，总大小不超过 max_bytes。
+
+HTTP 接口（仅依赖标准库 asyncio）：
+    POST /simulate   请求体为 JSON 规格，返回各分辨率的数据列
+    GET  /cache      缓存统计
+    GET  /health     健康检查
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import pickle
+import threading
+import time
+
+import numpy as np
+
+from ..simulations.bearing.bearing_temp_simulator import BearingTemperatureSimulator
+from ..simulations.bearing.bearing_vibration_simulator import BearingVibrationSimulator
+from ..simulations.environment.temperature_simulator import TemperatureSimulator
+from ..simulations.turbine.wind_turbine_power_simu import WindTurbinePowerSimulator
+from ..simulations.wind.wind_speed_simu import WindSpeedSimulator
+from ..storage.disk_cache import DiskLRUCache
+
+RESOLUTIONS = ("second", "minute", "hour")
+# 模拟模型版本：各模拟器的算法或续算状态的结构变化时递增，使旧缓存条目失效
+MODEL_VERSION = 1
+
+# 各模拟阶段对应的规格字段与模拟器
+STAGES = {
+    "wind": WindSpeedSimulator,
+    "ambient": TemperatureSimulator,
+    "turbine": WindTurbinePowerSimulator,
+    "bearing_temp": BearingTemperatureSimulator,
+    "bearing_vibration": BearingVibrationSimulator,
+}
+# 由服务统一设置、不允许在规格中覆盖的参数
+_FIXED_KWARGS = {
+    "wind": {"dt": 1.0},
+    "ambient": {"dt": 1.0},
+    "bearing_temp": {"dt": 1.0},
+    "bearing_vibration": {"dt": 1.0},
+}
+# 服务端默认值（TemperatureSimulator 的这些参数没有默认值）
+_SERVICE_DEFAULTS = {
+    "ambient": {"tau": 6.0, "sigma": 0.5, "mean_temp": 20.0},
+}
+# 不能由 JSON 规格表达的对象参数（随机数生成器、数据类型、气动转子模型）
+_EXCLUDED_KWARGS = {"rng", "dtype", "rotor_model"}
+# 由风机阶段传递、不在本阶段单独设置的参数（轴承模型的转速范围与风机一致）
+_DERIVED_KWARGS = {
+    "bearing_temp": {"rpm_min", "rpm_rated"},
+    "bearing_vibration": {"rpm_min", "rpm_rated"},
+}
+
+DEFAULT_CACHE_BYTES = 512 * 1024 * 1024
+MAX_DURATION_HOURS = 24 * 366
+
+
+class SpecError(ValueError):
+    """
+    模拟规格不合法
+    """
+
+
+def _stage_kwargs(stage: str, overrides: dict) -> dict:
+    """
+    补全某阶段模拟器的全部参数（默认值 + 规格覆盖 + 固定值），使缓存键不受“是否显式写出默认值”影响
+    """
+    cls = STAGES[stage]
+    params = {
+        name: p.default
+        for name, p in inspect.signature(cls.__init__).parameters.items()
+        if name != "self" and name not in _EXCLUDED_KWARGS and name not in _DERIVED_KWARGS.get(stage, ())
+    }
+    unknown = set(overrides) - set(params)
+    if unknown:
+        raise SpecError(f"{stage} 含未知参数: {sorted(unknown)}")
+    kwargs = {**params, **_SERVICE_DEFAULTS.get(stage, {}), **overrides, **_FIXED_KWARGS.get(stage, {})}
+    missing = [name for name, value in kwargs.items() if value is inspect.Parameter.empty]
+    if missing:
+        raise SpecError(f"{stage} 缺少参数: {missing}")
+    return kwargs
+
+
+def normalize_spec(spec: dict) -> dict:
+    """
+    校验并规范化模拟规格
+    :param spec: {"turbine": {...}, "wind": {...}, "ambient": {...}, "bearing_temp": {...},
+                  "bearing_vibration": {...}, "seed": 0, "duration_hours": 24, "resolutions": [...]}
+    :return: 补全默认值后的规格
+    """
+    unknown = set(spec) - set(STAGES) - {"seed", "duration_hours", "resolutions"}
+    if unknown:
+        raise SpecError(f"未知字段: {sorted(unknown)}")
+    seed = spec.get("seed", 0)
+    if not isinstance(seed, int) or seed < 0:
+        raise SpecError("seed 须为非负整数")
+    hours = spec.get("duration_hours", 24)
+    if not isinstance(hours, int) or not 1 <= hours <= MAX_DURATION_HOURS:
+        raise SpecError(f"duration_hours 须为 1~{MAX_DURATION_HOURS} 的整数")
+    resolutions = list(spec.get("resolutions", RESOLUTIONS))
+    if not resolutions or set(resolutions) - set(RESOLUTIONS):
+        raise SpecError(f"resolutions 须为 {RESOLUTIONS} 的非空子集")
+
+    normalized = {stage: _stage_kwargs(stage, dict(spec.get(stage) or {})) for stage in STAGES}
+    normalized.update(seed=seed, duration_hours=hours, resolutions=resolutions)
+    return normalized
+
+
+def spec_key(spec: dict) -> str:
+    """
+    缓存键：模型版本与规范化规格（去掉时长与分辨率）的 SHA-256
+    """
+    content = {k: v for k, v in spec.items() if k not in ("duration_hours", "resolutions")}
+    content["model_version"] = MODEL_VERSION
+    canonical = json.dumps(content, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class SimulationRun:
+    """
+    可续算的单机模拟：保存各模拟器与随机流的状态，按整小时推进
+    """
+
+    def __init__(self, spec: dict):
+        """
+        :param spec: normalize_spec 返回的规格
+        """
+        streams = np.random.SeedSequence(spec["seed"]).spawn(len(STAGES))
+        rngs = {stage: np.random.default_rng(s) for stage, s in zip(STAGES, streams)}
+        self.turbine = WindTurbinePowerSimulator(**spec["turbine"], rng=rngs["turbine"])
+        rpm_kwargs = {"rpm_min": self.turbine.rpm_min, "rpm_rated": self.turbine.rpm_rated}
+        self.wind = WindSpeedSimulator(**spec["wind"], rng=rngs["wind"])
+        self.ambient = TemperatureSimulator(**spec["ambient"], rng=rngs["ambient"])
+        self.bearing_temp = BearingTemperatureSimulator(**spec["bearing_temp"], **rpm_kwargs, rng=rngs["bearing_temp"])
+        self.bearing_vibration = BearingVibrationSimulator(**spec["bearing_vibration"], **rpm_kwargs,
+                                                           rng=rngs["bearing_vibration"])
+        self.hours = 0
+        self._power_state = None
+
+    def _advance_hour(self) -> dict:
+        speeds = np.empty(3600)
+        dirs = np.empty(3600)
+        for i in range(3600):
+            speeds[i], dirs[i] = self.wind.step()
+        ambient = self.ambient.step(float(self.hours))
+        power, self._power_state = self.turbine.power_from_speed(speeds, self._power_state, return_state=True)
+        rpm = self.turbine.rpm_from_power(power)
+
+        rpm_min = rpm.reshape(60, 60).mean(axis=1)
+        bearing_temp = self.bearing_temp.simulate(np.full(60, ambient), rpm_min)
+        bearing_vibration = self.bearing_vibration.simulate(rpm_min)
+        self.hours += 1
+        return {
+            "second": {"wind_speed": speeds, "wind_dir": dirs, "power_kw": power, "rpm": rpm},
+            "minute": {
+                "wind_speed_avg": speeds.reshape(60, 60).mean(axis=1),
+                "power_kw": power.reshape(60, 60).mean(axis=1),
+                "rpm": rpm_min,
+                "bearing_temp": bearing_temp,
+                "bearing_vibration": bearing_vibration,
+            },
+            "hour": {
+                "wind_speed_avg": np.array([speeds.mean()]),
+                "power_kw": np.array([power.mean()]),
+                "rpm": np.array([rpm.mean()]),
+                "ambient_temp": np.array([ambient]),
+            },
+        }
+
+    def iter_hours(self, hours: int):
+        """
+        逐小时推进 hours 小时
+        :return: 生成器，每小时产出 分辨率 → {列名: 数组}
+        """
+        for _ in range(hours):
+            yield self._advance_hour()
+
+    def advance(self, hours: int) -> dict:
+        """
+        推进 hours 小时
+        :return: 分辨率 → {列名: 数组}
+        """
+        chunks = list(self.iter_hours(hours))
+        return {
+            res: {col: np.concatenate([c[res][col] for c in chunks]) for col in chunks[0][res]}
+            for res in RESOLUTIONS
+        }
+
+
+class ResultCache(DiskLRUCache):
+    """
+    磁盘 LRU 结果缓存：每个条目一个目录，包含各列的 .npy、续算状态 state.pkl 与 meta.json（淘汰策略见 DiskLRUCache）
+    """
+
+    def __init__(self, root: str, max_bytes: int = DEFAULT_CACHE_BYTES):
+        super().__init__(root, max_bytes)
+
+    def load(self, key: str):
+        """
+        读取缓存条目
+        :return: (已缓存小时数, 结果表, 续算状态) 或 None；版本不符或续算状态无法还原的条目删除并返回 None
+        """
+        meta = self.read_meta(key)
+        if meta is None:
+            return None
+        try:
+            if meta.get("model_version") != MODEL_VERSION:
+                raise ValueError(f"缓存条目的模型版本 {meta.get('model_version')} 与当前版本 {MODEL_VERSION} 不符")
+            run = pickle.loads(self.read_file(key, "state.pkl"))
+        except (pickle.UnpicklingError, AttributeError, ImportError, EOFError, TypeError, ValueError):
+            self.remove(key)
+            return None
+        tables = {
+            res: {col: self.load_array(key, f"{res}.{col}") for col in cols}
+            for res, cols in meta["columns"].items()
+        }
+        return meta["hours"], tables, run
+
+    def store(self, key: str, spec: dict, tables: dict, run: SimulationRun):
+        """
+        写入（覆盖）缓存条目并按 LRU 淘汰
+        """
+        meta = {
+            "model_version": MODEL_VERSION,
+            "hours": run.hours,
+            "spec": {k: v for k, v in spec.items() if k not in ("duration_hours", "resolutions")},
+            "columns": {res: list(cols) for res, cols in tables.items()},
+        }
+        arrays = {f"{res}.{col}": values for res, cols in tables.items() for col, values in cols.items()}
+        self.write(key, meta, arrays, files={"state.pkl": pickle.dumps(run, protocol=pickle.HIGHEST_PROTOCOL)})
+
+
+class SimulationService:
+    """
+    模拟服务：命中缓存直接切片返回，缓存时长不足时从保存的末尾状态续算，否则从头计算
+    """
+
+    def __init__(self, cache_dir: str = ".sim_cache", max_cache_bytes: int = DEFAULT_CACHE_BYTES):
+        self.cache = ResultCache(cache_dir, max_cache_bytes)
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock(self, key: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def simulate(self, spec: dict) -> dict:
+        """
+        :param spec: 模拟规格（见 normalize_spec）
+        :return: {"key", "cache": "hit"|"extended"|"miss", "duration_hours", "elapsed_ms", 各分辨率数据列}
+        """
+        start = time.perf_counter()
+        spec = normalize_spec(spec)
+        key = spec_key(spec)
+        hours = spec["duration_hours"]
+        with self._lock(key):
+            cached = self.cache.load(key)
+            if cached is not None and cached[0] >= hours:
+                status, tables = "hit", cached[1]
+            else:
+                if cached is not None:
+                    status, (_, tables, run) = "extended", cached
+                    new = run.advance(hours - run.hours)
+                    tables = {res: {col: np.concatenate([tables[res][col], new[res][col]]) for col in new[res]}
+                              for res in RESOLUTIONS}
+                else:
+                    status, run = "miss", SimulationRun(spec)
+                    tables = run.advance(hours)
+                self.cache.store(key, spec, tables, run)
+
+        per_hour = {"second": 3600, "minute": 60, "hour": 1}
+        result = {"key": key, "cache": status, "duration_hours": hours}
+        for res in spec["resolutions"]:
+            result[res] = {col: np.array(values[:hours * per_hour[res]]) for col, values in tables[res].items()}
+        result["elapsed_ms"] = (time.perf_counter() - start) * 1e3
+        return result
+
+
+# ---------- HTTP ----------
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+def _json_default(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"无法序列化 {type(value).__name__}")
+
+
+def _response(status: int, payload: dict) -> bytes:
+    body = json.dumps(payload, ensure_ascii=False, default=_json_default).encode("utf-8")
+    head = (f"HTTP/1.1 {status} {_REASONS[status]}\r\nContent-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n")
+    return head.encode("ascii") + body
+
+
+async def _handle_request(service: SimulationService, reader, writer):
+    try:
+        request_line = await reader.readline()
+        method, path, _ = request_line.decode("latin-1").split(" ", 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+        if path == "/health":
+            response = _response(200, {"status": "ok"})
+        elif path == "/cache":
+            response = _response(200, service.cache.stats())
+        elif path == "/simulate":
+            if method != "POST":
+                response = _response(405, {"error": "请使用 POST"})
+            else:
+                spec = json.loads(body or b"{}")
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(None, service.simulate, spec)
+                response = _response(200, result)
+        else:
+            response = _response(404, {"error": f"未知路径: {path}"})
+    except (SpecError, TypeError, ValueError) as exc:
+        response = _response(400, {"error": str(exc)})
+    except Exception as exc:  # 返回错误信息而不是直接断开连接
+        response = _response(500, {"error": f"{type(exc).__name__}: {exc}"})
+    writer.write(response)
+    try:
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+async def start_simulation_server(service: SimulationService, host: str = "127.0.0.1", port: int = 8080):
+    """
+    启动 HTTP 服务
+    :return: asyncio.Server（port=0 时可通过 server.sockets[0].getsockname() 获取实际端口）
+    """
+    return await asyncio.start_server(lambda r, w: _handle_request(service, r, w), host, port)
+
+
+async def run_service(host: str = "127.0.0.1", port: int = 8080, cache_dir: str = ".sim_cache",
+                      max_cache_bytes: int = DEFAULT_CACHE_BYTES):
+    """
+    运行模拟服务直到被取消
+    """
+    server = await start_simulation_server(SimulationService(cache_dir, max_cache_bytes), host, port)
+    async with server:
+        await server.serve_forever()
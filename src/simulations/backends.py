@@ -0,0 +1,277 @@
+"""
+批量模拟的计算后端：各模拟器的 advance() 把逐步递推交给当前后端，后端可在 NumPy 与 numba JIT 间切换，
+调用方代码无需改动。
+
+- numpy：沿时间逐步推进、对所有单元（风机）向量化，任何环境可用；单元少、步数多时（如单条风速实现）
+  OU 递推改为逐单元沿时间分段求线性递推的闭式解，遇到截断/归一化/复位的步再从该步续算；
+- numba：对下面的纯 Python 逐元素循环做 nopython JIT 编译（首次使用时编译），需安装 numba。
+
+后端由 set_backend(name) 选择，未显式设置时读取环境变量 WIND_SIM_BACKEND（默认 "numpy"）。
+
+递推均为 (n_units, n) 数组上的 "上一步状态 → 本步" 形式：
+- ou_recurrence：OU 转移 x' = μ + a (x - μ) + s z，可选风向角归一化、下限截断与停机复位（与各 step() 的规则一致）；
+- first_order_filter：一阶惯性 y' = y + (x - y) α；
+- ramp_limit：斜坡率限制 y' = y + clip(x - y, -Δ, Δ)。
+初始状态为 NaN 的单元以首个输入作为起点（对应标量版本 initial=None 的行为）。
+"""
+
+import os
+
+import numpy as np
+
+BACKENDS = ("numpy", "numba")
+BACKEND_ENV = "WIND_SIM_BACKEND"
+
+# numpy 后端：单元数不超过 _ROW_MAX_UNITS 且步数不少于 _ROW_SEGMENT 时 OU 递推逐单元沿时间分段滤波
+_ROW_MAX_UNITS = 64
+_ROW_SEGMENT = 64
+
+_active = None
+
+
+def broadcast_input(value, n_units: int, n: int, dtype=float) -> np.ndarray:
+    """
+    批量输入规范化为 (n_units, n)：标量、(n,)（所有单元相同）或 (n_units, n)
+    """
+    return np.broadcast_to(np.asarray(value, dtype=dtype), (n_units, n))
+
+
+def last_column(values: np.ndarray, previous: np.ndarray) -> np.ndarray:
+    """
+    批量输出 (n_units, n) 的最后一步，n = 0 时沿用上一状态
+    """
+    return values[:, -1].copy() if values.shape[1] else np.array(previous, copy=True)
+
+
+def _wrap(x):
+    return (x + 180.0) % 360.0 - 180.0
+
+
+# ---- 逐元素参考循环（numba 后端编译这些函数） ----
+
+def _ou_loop(x0, mean, a, s, noise, lower, reset, reset_value, wrap, out):
+    m, n = mean.shape
+    for i in range(m):
+        x = x0[i]
+        for k in range(n):
+            if reset[i, k]:
+                x = reset_value[i, k]
+            else:
+                x = mean[i, k] + a * (x - mean[i, k]) + s * noise[i, k]
+                if wrap:
+                    x = (x + 180.0) % 360.0 - 180.0
+                if x < lower[i, k]:
+                    x = lower[i, k]
+            out[i, k] = x
+
+
+def _filter_loop(y0, x, alpha, out):
+    m, n = x.shape
+    for i in range(m):
+        y = y0[i]
+        if y != y:
+            y = x[i, 0]
+        for k in range(n):
+            y = y + (x[i, k] - y) * alpha
+            out[i, k] = y
+
+
+def _ramp_loop(y0, x, max_delta, out):
+    m, n = x.shape
+    for i in range(m):
+        y = y0[i]
+        if y != y:
+            y = x[i, 0]
+        for k in range(n):
+            delta = x[i, k] - y
+            if delta > max_delta:
+                delta = max_delta
+            elif delta < -max_delta:
+                delta = -max_delta
+            y = y + delta
+            out[i, k] = y
+
+
+class NumpyBackend:
+    """
+    纯 NumPy 后端：时间方向逐步，单元方向向量化
+    """
+
+    name = "numpy"
+
+    def ou_recurrence(self, x0, mean, a, s, noise, lower=None, reset=None, reset_value=None, wrap=False):
+        """
+        :param x0: 初始状态 (n_units,)
+        :param mean: 逐步回复目标 (n_units, n)
+        :param a: 转移系数（见 time_stepping.ou_coefficients）
+        :param s: 噪声系数
+        :param noise: 标准正态随机数 (n_units, n)
+        :param lower: 逐步下限 (n_units, n)，可选
+        :param reset: 逐步复位标志 (n_units, n)，为 True 的步直接取 reset_value（不消耗噪声），可选
+        :param reset_value: 复位值 (n_units, n)
+        :param wrap: 是否把结果归一化到 [-180, 180)（风向角）
+        :return: (n_units, n)
+        """
+        m, n = mean.shape
+        if m <= _ROW_MAX_UNITS and n >= _ROW_SEGMENT:
+            return self._ou_rows(x0, mean, a, s, noise, lower, reset, reset_value, wrap)
+        out = np.empty((m, n))
+        x = np.asarray(x0, dtype=float).copy()
+        for k in range(n):
+            x = mean[:, k] + a * (x - mean[:, k]) + s * noise[:, k]
+            if wrap:
+                x = _wrap(x)
+            if lower is not None:
+                x = np.maximum(x, lower[:, k])
+            if reset is not None:
+                x = np.where(reset[:, k], reset_value[:, k], x)
+            out[:, k] = x
+        return out
+
+    @staticmethod
+    def _ou_rows(x0, mean, a, s, noise, lower, reset, reset_value, wrap):
+        """
+        逐单元求解 OU 递推：x' = a x + u（u = (1 - a) μ + s z）在没有截断、归一化与复位的区段上是线性的，
+        长 L 的区段内 x_k = a^(k+1) x + Σ_{j≤k} a^(k-j) u_j，按 _ROW_SEGMENT 步分段用矩阵乘法一次求出；
+        区段内第一个需要特殊处理的步按逐步规则取值，再从下一步续算
+        """
+        m, n = mean.shape
+        out = np.empty((m, n))
+        drive = (1.0 - a) * mean + s * noise
+        lags = np.arange(_ROW_SEGMENT)
+        powers = float(a) ** (lags + 1)
+        # transfer[j, k] = a^(k-j)（j ≤ k），u_seg @ transfer 即区段内各步的受迫响应
+        transfer = np.triu(float(a) ** np.maximum(lags[None, :] - lags[:, None], 0))
+        for i in range(m):
+            x, k = float(x0[i]), 0
+            while k < n:
+                end = min(k + _ROW_SEGMENT, n)
+                seg = drive[i, k:end] @ transfer[:end - k, :end - k] + powers[:end - k] * x
+                special = np.zeros(end - k, dtype=bool)
+                if wrap:
+                    special |= (seg < -180.0) | (seg >= 180.0)
+                if lower is not None:
+                    special |= seg < lower[i, k:end]
+                if reset is not None:
+                    special |= reset[i, k:end]
+                j = int(np.argmax(special)) if special.any() else end - k
+                out[i, k:k + j] = seg[:j]
+                if j == end - k:
+                    x, k = seg[-1], end
+                    continue
+                p = k + j
+                if reset is not None and reset[i, p]:
+                    # 连续复位的步直接取复位值
+                    run = np.flatnonzero(~reset[i, p:])
+                    stop = p + (int(run[0]) if len(run) else n - p)
+                    out[i, p:stop] = reset_value[i, p:stop]
+                    x, k = out[i, stop - 1], stop
+                    continue
+                x = seg[j]
+                if wrap:
+                    x = _wrap(x)
+                if lower is not None and x < lower[i, p]:
+                    x = lower[i, p]
+                out[i, p] = x
+                k = p + 1
+        return out
+
+    def first_order_filter(self, y0, x, alpha):
+        m, n = x.shape
+        out = np.empty((m, n))
+        if n == 0:
+            return out
+        y = np.where(np.isnan(y0), x[:, 0], y0)
+        for k in range(n):
+            y = y + (x[:, k] - y) * alpha
+            out[:, k] = y
+        return out
+
+    def ramp_limit(self, y0, x, max_delta):
+        m, n = x.shape
+        out = np.empty((m, n))
+        if n == 0:
+            return out
+        y = np.where(np.isnan(y0), x[:, 0], y0)
+        for k in range(n):
+            y = y + np.clip(x[:, k] - y, -max_delta, max_delta)
+            out[:, k] = y
+        return out
+
+
+class NumbaBackend:
+    """
+    numba 后端：逐元素循环 JIT 编译为机器码
+    """
+
+    name = "numba"
+
+    def __init__(self):
+        try:
+            import numba
+        except ImportError as exc:
+            raise ImportError("使用 numba 后端需要先安装 numba：pip install numba") from exc
+        self._ou = numba.njit(cache=True)(_ou_loop)
+        self._filter = numba.njit(cache=True)(_filter_loop)
+        self._ramp = numba.njit(cache=True)(_ramp_loop)
+
+    def ou_recurrence(self, x0, mean, a, s, noise, lower=None, reset=None, reset_value=None, wrap=False):
+        mean = np.ascontiguousarray(mean, dtype=float)
+        shape = mean.shape
+        lower = np.full(shape, -np.inf) if lower is None else np.ascontiguousarray(lower, dtype=float)
+        if reset is None:
+            reset, reset_value = np.zeros(shape, dtype=bool), np.zeros(shape)
+        out = np.empty(shape)
+        self._ou(np.ascontiguousarray(x0, dtype=float), mean, float(a), float(s),
+                 np.ascontiguousarray(noise, dtype=float), lower, np.ascontiguousarray(reset),
+                 np.ascontiguousarray(reset_value, dtype=float), bool(wrap), out)
+        return out
+
+    def first_order_filter(self, y0, x, alpha):
+        x = np.ascontiguousarray(x, dtype=float)
+        out = np.empty(x.shape)
+        if x.shape[1]:
+            self._filter(np.ascontiguousarray(y0, dtype=float), x, float(alpha), out)
+        return out
+
+    def ramp_limit(self, y0, x, max_delta):
+        x = np.ascontiguousarray(x, dtype=float)
+        out = np.empty(x.shape)
+        if x.shape[1]:
+            self._ramp(np.ascontiguousarray(y0, dtype=float), x, float(max_delta), out)
+        return out
+
+
+def available_backends() -> list:
+    """
+    当前环境可用的后端名
+    """
+    names = ["numpy"]
+    try:
+        import numba  # noqa: F401
+        names.append("numba")
+    except ImportError:
+        pass
+    return names
+
+
+def set_backend(name: str):
+    """
+    切换全局计算后端
+    :param name: "numpy" 或 "numba"
+    :return: 后端实例
+    """
+    global _active
+    if name not in BACKENDS:
+        raise ValueError(f"不支持的计算后端: {name!r}（可选: {', '.join(BACKENDS)}）")
+    _active = NumbaBackend() if name == "numba" else NumpyBackend()
+    return _active
+
+
+def get_backend():
+    """
+    当前计算后端（首次调用时按环境变量 WIND_SIM_BACKEND 选择，默认 numpy）
+    """
+    if _active is None:
+        return set_backend(os.environ.get(BACKEND_ENV, "numpy"))
+    return _active
@@ -0,0 +1,211 @@
+import numpy as np
+
+# 每年的分钟数
+MINUTES_PER_YEAR = 365 * 24 * 60
+
+
+class BearingDegradationModel:
+    """
+    轴承累积损伤模型（基于 L10 寿命的 Palmgren-Miner 线性累积）
+
+    额定转速、额定载荷下连续运行 l10_hours 小时损伤累积到 1。
+    其它工况下的损伤速率按基本额定寿命公式 L ∝ (C/P)^p / n 折算：
+    dD/dt = (rpm / rpm_rated) * (load / rated_load)^p / L10
+    时间步长单位：分钟
+    """
+
+    def __init__(
+        self,
+        rpm_rated: float = 15.0,
+        l10_hours: float = 20000.0,
+        load_exponent: float = 3.0,
+        rated_load: float = 1.0,
+        dt: float = 1.0,
+    ):
+        """
+        :param rpm_rated: 额定转速（rpm）
+        :param l10_hours: 额定工况下的 L10 寿命（小时），可取 BearingConfig.bearing_life_hours
+        :param load_exponent: 寿命指数 p（球轴承 3，滚子轴承 10/3）
+        :param rated_load: 额定载荷（与 load 同单位，默认使用相对载荷 1.0）
+        :param dt: 时间步长（分钟）
+        """
+        self.rpm_rated = rpm_rated
+        self.l10_hours = l10_hours
+        self.load_exponent = load_exponent
+        self.rated_load = rated_load
+        self.dt = dt
+
+    @classmethod
+    def from_config(cls, bearing_config, rpm_rated: float, **kwargs) -> "BearingDegradationModel":
+        """
+        由 BearingConfig 创建损伤模型
+        :param bearing_config: BearingConfig 实例
+        :param rpm_rated: 额定转速（rpm）
+        """
+        return cls(rpm_rated=rpm_rated, l10_hours=bearing_config.bearing_life_hours, **kwargs)
+
+    def damage_rate(self, rpm: np.ndarray, load: np.ndarray) -> np.ndarray:
+        """
+        计算每个时间步的损伤增量
+        :param rpm: 转速序列（rpm），可为 (n_turbines, steps) 矩阵
+        :param load: 载荷序列（如 功率 / 额定功率），与 rpm 同形状或可广播
+        :return: 每步损伤增量
+        """
+        speed_ratio = np.maximum(np.asarray(rpm, dtype=float), 0.0) / self.rpm_rated
+        load_ratio = np.maximum(np.asarray(load, dtype=float), 0.0) / self.rated_load
+        return speed_ratio * load_ratio ** self.load_exponent * (self.dt / 60.0) / self.l10_hours
+
+    def cumulative_damage(self, rpm: np.ndarray, load: np.ndarray, initial_damage=0.0) -> np.ndarray:
+        """
+        计算累积损伤序列（沿最后一维累加）
+        :param rpm: 转速序列（rpm）
+        :param load: 载荷序列
+        :param initial_damage: 初始损伤（标量或每台风机一个值）
+        :return: 累积损伤序列，1.0 对应达到 L10 寿命
+        """
+        initial_damage = np.asarray(initial_damage, dtype=float)
+        if initial_damage.ndim:
+            initial_damage = initial_damage[..., None]
+        return initial_damage + np.cumsum(self.damage_rate(rpm, load), axis=-1)
+
+    def remaining_life_hours(self, damage, rpm_mean: float, load_mean: float):
+        """
+        按给定平均工况估算剩余寿命（小时）
+        :param damage: 当前累积损伤
+        :param rpm_mean: 未来平均转速（rpm）
+        :param load_mean: 未来平均载荷
+        """
+        rate_per_hour = self.damage_rate(rpm_mean, load_mean) * 60.0 / self.dt
+        with np.errstate(divide="ignore"):
+            return np.maximum(1.0 - np.asarray(damage, dtype=float), 0.0) / rate_per_hour
+
+
+class FaultEvent:
+    """
+    轴承故障事件：从 onset 步开始，温度均值与振动均值在 ramp 步内线性上升到 temp_shift / rms_shift 并保持。
+    """
+
+    __slots__ = ("onset", "ramp", "temp_shift", "rms_shift", "name", "turbine")
+
+    def __init__(self, onset: int, ramp: int, temp_shift: float, rms_shift: float, name: str = "", turbine: int = 0):
+        """
+        :param onset: 故障起始步（下标）
+        :param ramp: 故障发展到完全严重程度所需的步数
+        :param temp_shift: 完全发展后轴承目标温度的偏移（°C）
+        :param rms_shift: 完全发展后振动均值的偏移（mm/s）
+        :param name: 故障名称
+        :param turbine: 风机编号（风机群模拟时使用）
+        """
+        self.onset = int(onset)
+        self.ramp = max(int(ramp), 1)
+        self.temp_shift = temp_shift
+        self.rms_shift = rms_shift
+        self.name = name
+        self.turbine = int(turbine)
+
+    def __repr__(self):
+        return (f"FaultEvent(name={self.name!r}, turbine={self.turbine}, onset={self.onset}, "
+                f"ramp={self.ramp}, temp_shift={self.temp_shift}, rms_shift={self.rms_shift})")
+
+
+# 默认的损伤阈值触发故障：(损伤阈值, 名称, 温度偏移 °C, 振动偏移 mm/s)
+DEFAULT_DAMAGE_STAGES = (
+    (0.6, "早期磨损", 3.0, 0.5),
+    (1.0, "剥落", 10.0, 2.0),
+)
+
+
+class FaultScheduler:
+    """
+    轴承故障调度器：
+    - 累积损伤跨过 damage_stages 中的阈值时触发对应阶段的故障
+    - 另外按泊松过程注入随机故障（如润滑失效），年发生率为 random_rate_per_year
+    生成的故障事件通过 build_offsets 转换为逐步的温度/振动偏移数组，
+    直接作为参数序列传入轴承模拟器，模拟循环内部不做任何故障分支判断。
+    """
+
+    def __init__(
+        self,
+        damage_stages=DEFAULT_DAMAGE_STAGES,
+        ramp_steps: int = 7 * 24 * 60,
+        random_rate_per_year: float = 0.0,
+        random_temp_shift: float = 5.0,
+        random_rms_shift: float = 1.0,
+        dt: float = 1.0,
+        rng=None,
+    ):
+        """
+        :param damage_stages: (损伤阈值, 名称, 温度偏移, 振动偏移) 序列
+        :param ramp_steps: 故障从发生到完全发展的步数（默认 7 天，dt=1 分钟）
+        :param random_rate_per_year: 随机故障年发生率（次/台/年）
+        :param random_temp_shift: 随机故障的温度偏移均值（°C），实际值按指数分布抽样
+        :param random_rms_shift: 随机故障的振动偏移均值（mm/s），实际值按指数分布抽样
+        :param dt: 时间步长（分钟）
+        :param rng: numpy 随机数生成器，默认使用全局 np.random
+        """
+        self.damage_stages = tuple(damage_stages)
+        self.ramp_steps = ramp_steps
+        self.random_rate_per_year = random_rate_per_year
+        self.random_temp_shift = random_temp_shift
+        self.random_rms_shift = random_rms_shift
+        self.dt = dt
+        self.rng = rng if rng is not None else np.random
+
+    def schedule(self, damage: np.ndarray) -> list:
+        """
+        根据累积损伤序列生成故障事件
+        :param damage: 累积损伤序列 (steps,) 或 (n_turbines, steps)
+        :return: FaultEvent 列表
+        """
+        damage = np.atleast_2d(damage)
+        n_turbines, steps = damage.shape
+        events = []
+
+        for threshold, name, temp_shift, rms_shift in self.damage_stages:
+            crossed = damage >= threshold
+            reached = crossed.any(axis=1)
+            onsets = crossed.argmax(axis=1)
+            for turbine in np.flatnonzero(reached):
+                events.append(FaultEvent(onsets[turbine], self.ramp_steps, temp_shift, rms_shift, name, turbine))
+
+        if self.random_rate_per_year > 0:
+            years = steps * self.dt / MINUTES_PER_YEAR
+            counts = self.rng.poisson(self.random_rate_per_year * years, size=n_turbines)
+            turbines = np.repeat(np.arange(n_turbines), counts)
+            onsets = self.rng.uniform(0, steps, size=len(turbines)).astype(np.int64)
+            temp_shifts = self.rng.exponential(self.random_temp_shift, size=len(turbines))
+            rms_shifts = self.rng.exponential(self.random_rms_shift, size=len(turbines))
+            for turbine, onset, temp_shift, rms_shift in zip(turbines, onsets, temp_shifts, rms_shifts):
+                events.append(FaultEvent(onset, self.ramp_steps, temp_shift, rms_shift, "随机故障", turbine))
+
+        return sorted(events, key=lambda e: (e.turbine, e.onset))
+
+    @staticmethod
+    def build_offsets(events, steps: int, n_turbines: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        将故障事件转换为逐步的温度偏移与振动偏移数组（分段线性），
+        用二阶差分数组 + 两次累积和实现，代价为 O(steps + 事件数)。
+        :param events: FaultEvent 序列
+        :param steps: 模拟步数
+        :param n_turbines: 风机数量；为 None 时返回一维数组（单台风机）
+        :return: (温度偏移, 振动偏移)，形状 (steps,) 或 (n_turbines, steps)
+        """
+        rows = 1 if n_turbines is None else n_turbines
+        slope_delta = np.zeros((2, rows, steps + 1))
+
+        events = [e for e in events if e.onset < steps]
+        if events:
+            turbine = np.array([0 if n_turbines is None else e.turbine for e in events])
+            onset = np.array([e.onset for e in events])
+            ramp = np.array([e.ramp for e in events])
+            shifts = np.array([[e.temp_shift for e in events], [e.rms_shift for e in events]])
+            rate = shifts / ramp
+            end = np.minimum(onset + ramp, steps)
+            for k in range(2):
+                np.add.at(slope_delta[k], (turbine, onset), rate[k])
+                np.add.at(slope_delta[k], (turbine, end), -rate[k])
+
+        offsets = np.cumsum(np.cumsum(slope_delta[..., :steps], axis=-1), axis=-1)
+        if n_turbines is None:
+            return offsets[0, 0], offsets[1, 0]
+        return offsets[0], offsets[1]
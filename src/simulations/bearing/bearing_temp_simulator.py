@@ -1,4 +1,6 @@
 import numpy as np
+from ..backends import broadcast_input, get_backend, last_column
+from ..time_stepping import OUCoefficientCache, adaptive_segments, check_ou_method, ou_coefficients, segment_means
 
 class BearingTemperatureSimulator:
     """
@@ -18,6 +20,9 @@ class BearingTemperatureSimulator:
         dt: float = 1.0,
         temp_rise_at_rated: float = 15.0,
         convection_coeff: float = 0.5,
+        method: str = "euler",
+        rng=None,
+        dtype=np.float64,
     ):
         """
         :param tau: 温度向均值回复的时间常数（分钟），模拟热惯性
@@ -28,6 +33,9 @@ class BearingTemperatureSimulator:
         :param rpm_rated: 额定运行转速（rpm）
         :param temp_rise_at_rated: 额定转速下相对环境温度的温升（°C）
         :param convection_coeff: 冷却系数（越大散热越快），范围通常 0.3~1.0
+        :param method: OU 离散化方法，"euler"（Euler–Maruyama）或 "exact"（精确转移，任意 dt 均准确）
+        :param rng: numpy 随机数生成器（如 np.random.default_rng(seed)），默认使用全局 np.random
+        :param dtype: 输出数组的数据类型（float32 可使内存减半，见 simulations.precision）
         """
         self.tau = tau
         self.sigma = sigma
@@ -37,6 +45,10 @@ class BearingTemperatureSimulator:
         self.rpm_rated = rpm_rated
         self.temp_rise_at_rated = temp_rise_at_rated
         self.convection_coeff = convection_coeff
+        self.method = check_ou_method(method)
+        self.rng = rng if rng is not None else np.random
+        self.dtype = np.dtype(dtype)
+        self._ou = OUCoefficientCache()
         
         self.current_temp = base_temp
         
@@ -59,7 +71,14 @@ class BearingTemperatureSimulator:
         temp_rise = self.temp_rise_at_rated * (x ** 2)
         return temp_rise
 
-    def step(self, ambient_temp: float, rpm: float) -> float:
+    def _get_friction_heat_rise_array(self, rpm: np.ndarray) -> np.ndarray:
+        """
+        _get_friction_heat_rise 的数组版本
+        """
+        x = np.clip((np.asarray(rpm, dtype=float) - self.rpm_min) / (self.rpm_rated - self.rpm_min), 0.0, 1.0)
+        return self.temp_rise_at_rated * x ** 2
+
+    def step(self, ambient_temp: float, rpm: float, temp_offset: float = 0.0) -> float:
         """
         模拟下一个时间步的轴承温度。
         物理模型：
@@ -72,6 +91,7 @@ class BearingTemperatureSimulator:
         
         :param ambient_temp: 环境温度（°C）
         :param rpm: 当前转速（rpm）
+        :param temp_offset: 故障导致的目标温度偏移（°C），见 FaultScheduler.build_offsets
         :return: 当前轴承温度（°C）
         """
         # 当转速为0时，强制温度等于环境温度（无负荷运行，无摩擦热）
@@ -81,14 +101,11 @@ class BearingTemperatureSimulator:
         
         # 计算目标温度 = 环境温度 + 摩擦生热温升
         friction_rise = self._get_friction_heat_rise(rpm)
-        target_temp = ambient_temp + friction_rise
+        target_temp = ambient_temp + friction_rise + temp_offset
         
         # Ornstein-Uhlenbeck 过程：温度向目标温度回复
-        dW = np.random.normal(0.0, np.sqrt(self.dt))
-        drift = (target_temp - self.current_temp) / self.tau * self.dt
-        diffusion = self.sigma * dW
-        
-        self.current_temp += drift + diffusion
+        a, s = self._ou(self.tau, self.sigma, self.dt, self.method)
+        self.current_temp = target_temp + a * (self.current_temp - target_temp) + s * self.rng.normal()
         
         # 施加物理约束：温度不能低于环境温度
         if self.current_temp < ambient_temp:
@@ -101,6 +118,7 @@ class BearingTemperatureSimulator:
         ambient_temps: np.ndarray,
         rpm_sequence: np.ndarray,
         minutes: int | None = None,
+        temp_offsets: np.ndarray | None = None,
     ) -> np.ndarray:
         """
         模拟轴承温度随时间变化。
@@ -108,6 +126,7 @@ class BearingTemperatureSimulator:
         :param ambient_temps: 环境温度序列（°C），长度为 steps 或 标量
         :param rpm_sequence: 转速序列（rpm），长度为 steps 或 标量
         :param minutes: 如果传入标量，指定模拟分钟数（向后兼容）
+        :param temp_offsets: 逐步的目标温度偏移序列（°C），用于注入故障，默认无偏移
         :return: 温度时间序列（numpy 数组）
         """
         ambient_temps = np.asarray(ambient_temps)
@@ -125,10 +144,14 @@ class BearingTemperatureSimulator:
             rpm_sequence = np.full(len(ambient_temps), rpm_sequence.item())
         
         steps = len(ambient_temps)
-        temps = np.zeros(steps)
+        temps = np.zeros(steps, dtype=self.dtype)
+        if temp_offsets is None:
+            temp_offsets = np.zeros(steps)
         
-        for i in range(steps):
-            temps[i] = self.step(ambient_temps[i], rpm_sequence[i])
+        # 逐步循环使用 Python float（比逐个取 numpy 标量快）
+        inputs = zip(ambient_temps.tolist(), rpm_sequence.tolist(), np.asarray(temp_offsets, dtype=float).tolist())
+        for i, (ambient_temp, rpm, temp_offset) in enumerate(inputs):
+            temps[i] = self.step(ambient_temp, rpm, temp_offset)
         
         return temps
 
@@ -149,3 +172,80 @@ class BearingTemperatureSimulator:
         ambient_temps = np.full(minutes, ambient_temp)
         rpm_sequence = np.full(minutes, rpm)
         return self.simulate(ambient_temps, rpm_sequence)
+
+    def simulate_adaptive(
+        self,
+        ambient_temps: np.ndarray,
+        rpm_sequence: np.ndarray,
+        rpm_tol: float = 0.05,
+        temp_tol: float = 0.5,
+        temp_offsets: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        自适应步长模拟（适用于长周期寿命研究）。
+        停机段与工况平稳段合并为一个粗步长，用 OU 精确转移一次推进整段；
+        转速/环境温度快速变化的瞬态段则逐步推进。粗步长的统计特性与逐步模拟一致。
+        输入应为平滑或分段平稳的工况序列，带噪声的转速几乎每步一段（见 adaptive_segments）。
+
+        :param ambient_temps: 环境温度序列（°C）
+        :param rpm_sequence: 转速序列（rpm）
+        :param rpm_tol: 段内允许的转速变化（相对 rpm_rated - rpm_min 的比例）
+        :param temp_tol: 段内允许的环境温度变化（°C）
+        :param temp_offsets: 逐步的目标温度偏移序列（°C），可选
+        :return: (各段末尾的步下标, 对应时刻的轴承温度)
+        """
+        ambient_temps = np.asarray(ambient_temps, dtype=float)
+        rpm_sequence = np.asarray(rpm_sequence, dtype=float)
+        n = len(rpm_sequence)
+        if temp_offsets is None:
+            temp_offsets = np.zeros(n)
+
+        idle = rpm_sequence <= self.rpm_min
+        rpm_scaled = (rpm_sequence - self.rpm_min) / (self.rpm_rated - self.rpm_min)
+        starts = adaptive_segments([rpm_scaled, ambient_temps + temp_offsets], [rpm_tol, temp_tol], idle)
+        ends = np.append(starts[1:], n) - 1
+        lengths = ends - starts + 1
+
+        ambient_mean = segment_means(ambient_temps, starts)
+        targets = (ambient_mean + self._get_friction_heat_rise_array(segment_means(rpm_sequence, starts))
+                   + segment_means(temp_offsets, starts))
+        a, s = ou_coefficients(self.tau, self.sigma, lengths * self.dt, "exact")
+        noise = self.rng.normal(size=len(starts))
+        seg_idle = idle[starts]
+        ambient_end = ambient_temps[ends]
+
+        temps = np.empty(len(starts), dtype=self.dtype)
+        current = self.current_temp
+        for k in range(len(starts)):
+            if seg_idle[k]:
+                current = ambient_end[k]
+            else:
+                current = targets[k] + a[k] * (current - targets[k]) + s[k] * noise[k]
+                current = max(current, ambient_end[k])
+            temps[k] = current
+        self.current_temp = current
+        return ends, temps
+
+    def init_state(self, n_units: int) -> dict:
+        """
+        批量状态：n_units 个轴承，都从当前温度开始
+        """
+        return {"temp": np.full(n_units, float(self.current_temp))}
+
+    def advance(self, state: dict, inputs: dict, n: int = 1) -> tuple[dict, dict]:
+        """
+        批量推进 n 步（由当前计算后端执行，见 simulations.backends），规则与 step() 相同
+        :param state: init_state 返回的状态
+        :param inputs: {"ambient_temp", "rpm"[, "temp_offset"]}，各为 (n_units, n)、(n,) 或标量
+        :param n: 步数
+        :return: (新状态, {"bearing_temp": (n_units, n)})
+        """
+        m = len(state["temp"])
+        ambient = broadcast_input(inputs["ambient_temp"], m, n)
+        rpm = broadcast_input(inputs["rpm"], m, n)
+        targets = ambient + self._get_friction_heat_rise_array(rpm) + broadcast_input(inputs.get("temp_offset", 0.0), m, n)
+        a, s = ou_coefficients(self.tau, self.sigma, self.dt, self.method)
+        temps = get_backend().ou_recurrence(state["temp"], targets, a, s, self.rng.normal(size=(m, n)),
+                                            lower=ambient, reset=rpm <= self.rpm_min, reset_value=ambient)
+        return {"temp": last_column(temps, state["temp"])}, {"bearing_temp": temps.astype(self.dtype, copy=False)}
+
@@ -1,4 +1,6 @@
 import numpy as np
+from ..backends import broadcast_input, get_backend, last_column
+from ..time_stepping import OUCoefficientCache, adaptive_segments, check_ou_method, ou_coefficients, segment_means
 
 class BearingVibrationSimulator:
     """
@@ -15,6 +17,9 @@ class BearingVibrationSimulator:
         sigma: float = 0.2,
         dt: float = 1.0,
         initial_rms: float | None = None,
+        method: str = "euler",
+        rng=None,
+        dtype=np.float64,
     ):
         """
         :param base_rms: 基础振动 RMS（最小转速时的值）（mm/s）
@@ -25,6 +30,9 @@ class BearingVibrationSimulator:
         :param sigma: 随机扰动强度（mm/s / sqrt(min)），值越大，波动越大
         :param dt: 时间步长（分钟）
         :param initial_rms: 初始 RMS 值（mm/s），默认等于 base_rms
+        :param method: OU 离散化方法，"euler"（Euler–Maruyama）或 "exact"（精确转移，任意 dt 均准确）
+        :param rng: numpy 随机数生成器（如 np.random.default_rng(seed)），默认使用全局 np.random
+        :param dtype: 输出数组的数据类型（float32 可使内存减半，见 simulations.precision）
         """
         self.base_rms = base_rms
         self.rpm_min = rpm_min
@@ -33,6 +41,10 @@ class BearingVibrationSimulator:
         self.tau = tau
         self.sigma = sigma
         self.dt = dt
+        self.method = check_ou_method(method)
+        self.rng = rng if rng is not None else np.random
+        self.dtype = np.dtype(dtype)
+        self._ou = OUCoefficientCache()
         self.current_rms = initial_rms if initial_rms is not None else base_rms
         
         # 计算转速-振动的映射系数
@@ -58,7 +70,14 @@ class BearingVibrationSimulator:
         mean_rms = self.base_rms + self.rms_range * (x ** 2)
         return mean_rms
 
-    def step(self, rpm: float) -> float:
+    def _get_mean_rms_from_rpm_array(self, rpm: np.ndarray) -> np.ndarray:
+        """
+        _get_mean_rms_from_rpm 的数组版本
+        """
+        x = np.clip((np.asarray(rpm, dtype=float) - self.rpm_min) / self.rpm_range, 0.0, 1.0)
+        return self.base_rms + self.rms_range * x ** 2
+
+    def step(self, rpm: float, rms_offset: float = 0.0) -> float:
         """
         模拟下一个时间步（dt 分钟）的振动速度 RMS（mm/s）。
         采用 Ornstein–Uhlenbeck 类型过程，但均值随转速动态变化：
@@ -66,6 +85,7 @@ class BearingVibrationSimulator:
         当转速为0时，振动应为0（无运行，无振动）
         
         :param rpm: 当前时刻的转速（rpm）
+        :param rms_offset: 故障导致的振动均值偏移（mm/s），见 FaultScheduler.build_offsets
         :return: 当前振动速度 RMS（mm/s）
         """
         # 当转速为0时，振动RMS应为0（无运行，无振动）
@@ -74,13 +94,10 @@ class BearingVibrationSimulator:
             return self.current_rms
         
         # 根据实时转速获取均值
-        mean_rms = self._get_mean_rms_from_rpm(rpm)
+        mean_rms = self._get_mean_rms_from_rpm(rpm) + rms_offset
         
-        dW = np.random.normal(0.0, np.sqrt(self.dt))
-        drift = -(self.current_rms - mean_rms) / self.tau * self.dt
-        diffusion = self.sigma * dW
-
-        self.current_rms += drift + diffusion
+        a, s = self._ou(self.tau, self.sigma, self.dt, self.method)
+        self.current_rms = mean_rms + a * (self.current_rms - mean_rms) + s * self.rng.normal()
 
         # RMS 理论上非负，做一个下限截断，避免数值跑到负值
         if self.current_rms < 0.0:
@@ -88,19 +105,24 @@ class BearingVibrationSimulator:
 
         return self.current_rms
 
-    def simulate(self, rpm_sequence: np.ndarray) -> np.ndarray:
+    def simulate(self, rpm_sequence: np.ndarray, rms_offsets: np.ndarray | None = None) -> np.ndarray:
         """
         模拟多步振动速度 RMS，考虑实时的转速变化。
         
         :param rpm_sequence: 转速序列（分钟级），长度为模拟步数
+        :param rms_offsets: 逐步的振动均值偏移序列（mm/s），用于注入故障，默认无偏移
         :return: 振动速度 RMS 时间序列（mm/s）
         """
         rpm_sequence = np.asarray(rpm_sequence)
         steps = len(rpm_sequence)
-        vibrations_rms = np.zeros(steps)
+        vibrations_rms = np.zeros(steps, dtype=self.dtype)
+        if rms_offsets is None:
+            rms_offsets = np.zeros(steps)
         
-        for i in range(steps):
-            vibrations_rms[i] = self.step(rpm_sequence[i])
+        # 逐步循环使用 Python float（比逐个取 numpy 标量快）
+        inputs = zip(np.asarray(rpm_sequence, dtype=float).tolist(), np.asarray(rms_offsets, dtype=float).tolist())
+        for i, (rpm, rms_offset) in enumerate(inputs):
+            vibrations_rms[i] = self.step(rpm, rms_offset)
         
         return vibrations_rms
 
@@ -113,4 +135,72 @@ class BearingVibrationSimulator:
         :return: 振动速度 RMS 时间序列（mm/s）
         """
         rpm_sequence = np.full(steps, rpm)
-        return self.simulate(rpm_sequence)
\ No newline at end of file
+        return self.simulate(rpm_sequence)
+
+    def simulate_adaptive(
+        self,
+        rpm_sequence: np.ndarray,
+        rpm_tol: float = 0.05,
+        rms_offsets: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        自适应步长模拟（适用于长周期寿命研究）。
+        停机段与转速平稳段合并为一个粗步长，用 OU 精确转移一次推进整段；瞬态段逐步推进。
+        转速噪声超过 rpm_tol 时分段退化为逐步推进（见 adaptive_segments）。
+
+        :param rpm_sequence: 转速序列（rpm）
+        :param rpm_tol: 段内允许的转速变化（相对 rpm_rated - rpm_min 的比例）
+        :param rms_offsets: 逐步的振动均值偏移序列（mm/s），可选
+        :return: (各段末尾的步下标, 对应时刻的振动 RMS)
+        """
+        rpm_sequence = np.asarray(rpm_sequence, dtype=float)
+        n = len(rpm_sequence)
+        if rms_offsets is None:
+            rms_offsets = np.zeros(n)
+
+        idle = rpm_sequence <= self.rpm_min
+        starts = adaptive_segments([(rpm_sequence - self.rpm_min) / self.rpm_range, rms_offsets],
+                                   [rpm_tol, 0.05 * max(self.rms_range, 1e-6)], idle)
+        ends = np.append(starts[1:], n) - 1
+        lengths = ends - starts + 1
+
+        targets = (self._get_mean_rms_from_rpm_array(segment_means(rpm_sequence, starts))
+                   + segment_means(rms_offsets, starts))
+        a, s = ou_coefficients(self.tau, self.sigma, lengths * self.dt, "exact")
+        noise = self.rng.normal(size=len(starts))
+        seg_idle = idle[starts]
+
+        values = np.empty(len(starts), dtype=self.dtype)
+        current = self.current_rms
+        for k in range(len(starts)):
+            if seg_idle[k]:
+                current = self.base_rms * 0.1
+            else:
+                current = max(targets[k] + a[k] * (current - targets[k]) + s[k] * noise[k], 0.0)
+            values[k] = current
+        self.current_rms = current
+        return ends, values
+
+    def init_state(self, n_units: int) -> dict:
+        """
+        批量状态：n_units 个轴承，都从当前振动 RMS 开始
+        """
+        return {"rms": np.full(n_units, float(self.current_rms))}
+
+    def advance(self, state: dict, inputs: dict, n: int = 1) -> tuple[dict, dict]:
+        """
+        批量推进 n 步（由当前计算后端执行，见 simulations.backends），规则与 step() 相同
+        :param state: init_state 返回的状态
+        :param inputs: {"rpm"[, "rms_offset"]}，各为 (n_units, n)、(n,) 或标量
+        :param n: 步数
+        :return: (新状态, {"bearing_vibration": (n_units, n)})
+        """
+        m = len(state["rms"])
+        rpm = broadcast_input(inputs["rpm"], m, n)
+        targets = self._get_mean_rms_from_rpm_array(rpm) + broadcast_input(inputs.get("rms_offset", 0.0), m, n)
+        a, s = ou_coefficients(self.tau, self.sigma, self.dt, self.method)
+        rms = get_backend().ou_recurrence(state["rms"], targets, a, s, self.rng.normal(size=(m, n)),
+                                          lower=np.zeros((m, n)), reset=rpm <= self.rpm_min,
+                                          reset_value=np.full((m, n), self.base_rms * 0.1))
+        return {"rms": last_column(rms, state["rms"])}, {"bearing_vibration": rms.astype(self.dtype, copy=False)}
+
@@ -1,5 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from ..backends import get_backend, last_column
+from ..time_stepping import OUCoefficientCache, check_ou_method, ou_coefficients
 
 class TemperatureSimulator:
     """
@@ -14,6 +16,9 @@ class TemperatureSimulator:
         mean_temp: float,
         daily_amp: float = 5.0,
         daily_phase: float = -3.0,
+        method: str = "euler",
+        rng=None,
+        dtype=np.float64,
     ):
         """
         :param tau: 温度向长期均值回复的时间常数（小时），越大越平缓
@@ -22,6 +27,9 @@ class TemperatureSimulator:
         :param mean_temp: 日平均温度（摄氏度）
         :param daily_amp: 日变化振幅（白天/夜间温差的一半，摄氏度）
         :param daily_phase: 日变化相位（小时偏移，用于控制高温出现在一天中的大致时间）
+        :param method: OU 离散化方法，"euler"（Euler–Maruyama）或 "exact"（精确转移，任意 dt 均准确）
+        :param rng: numpy 随机数生成器（如 np.random.default_rng(seed)），默认使用全局 np.random
+        :param dtype: 输出数组的数据类型（float32 可使内存减半，见 simulations.precision）
         """
         self.tau = tau
         self.sigma = sigma
@@ -29,6 +37,10 @@ class TemperatureSimulator:
         self.mean_temp = mean_temp
         self.daily_amp = daily_amp
         self.daily_phase = daily_phase
+        self.method = check_ou_method(method)
+        self.rng = rng if rng is not None else np.random
+        self.dtype = np.dtype(dtype)
+        self._ou = OUCoefficientCache()
 
         # 初始化当前温度为均值
         self.current_temp = mean_temp
@@ -49,11 +61,8 @@ class TemperatureSimulator:
         """
         target_temp = self.mean_temp + self._daily_cycle(t_hour)
 
-        dW = np.random.normal(0.0, np.sqrt(self.dt))
-        drift = -(self.current_temp - target_temp) / self.tau * self.dt
-        diffusion = self.sigma * dW
-
-        self.current_temp += drift + diffusion
+        a, s = self._ou(self.tau, self.sigma, self.dt, self.method)
+        self.current_temp = target_temp + a * (self.current_temp - target_temp) + s * self.rng.normal()
         return self.current_temp
 
     def simulate(self, hours: int) -> np.ndarray:
@@ -62,8 +71,30 @@ class TemperatureSimulator:
         :param hours: 总模拟时长（单位：小时，整数）
         :return: 温度时间序列（numpy 数组，长度为 hours）
         """
-        temps = np.zeros(hours)
+        temps = np.zeros(hours, dtype=self.dtype)
         for i in range(hours):
             t_hour = i * self.dt
             temps[i] = self.step(t_hour)
-        return temps
\ No newline at end of file
+        return temps
+
+    def init_state(self, n_units: int) -> dict:
+        """
+        批量状态：n_units 个独立的环境温度过程，从当前温度、第 0 小时开始
+        """
+        return {"temp": np.full(n_units, float(self.current_temp)), "t_hour": np.zeros(n_units)}
+
+    def advance(self, state: dict, inputs: dict | None = None, n: int = 1) -> tuple[dict, dict]:
+        """
+        批量推进 n 步（由当前计算后端执行，见 simulations.backends）
+        :param state: init_state 返回的状态（t_hour 为已模拟的小时数，用于日变化）
+        :param inputs: 无需输入（保留参数以符合批量接口）
+        :param n: 步数
+        :return: (新状态, {"ambient_temp": (n_units, n)})
+        """
+        t_hour = state["t_hour"][:, None] + np.arange(n)[None, :] * self.dt
+        targets = self.mean_temp + self._daily_cycle(t_hour)
+        a, s = ou_coefficients(self.tau, self.sigma, self.dt, self.method)
+        temps = get_backend().ou_recurrence(state["temp"], targets, a, s, self.rng.normal(size=targets.shape))
+        new_state = {"temp": last_column(temps, state["temp"]), "t_hour": state["t_hour"] + n * self.dt}
+        return new_state, {"ambient_temp": temps.astype(self.dtype, copy=False)}
+
@@ -0,0 +1,351 @@
+"""
+逐秒（live/step 模式）风机群推进引擎：所有风机的状态按结构数组（SoA）存放在连续的 (n_turbines,) 数组中，
+每个 tick 对整个风机群做一次向量化更新，代替每台风机各自的 WindSpeedSimulator / BearingTemperatureSimulator /
+BearingVibrationSimulator 对象与逐个标量 step()。
+
+- 模型与各模拟器的 step() 相同：风速/风向 OU 过程（dt = 1 秒）、功率理想曲线 → 一阶惯性 → 斜坡率限制 → 噪声、
+  转速由功率求得；切出滞环按风速逐秒置位/复位；轴承温度/振动每 60 个 tick 用分钟平均转速推进一次；
+- 参数取自传入的模拟器实例（只读取参数，不使用其状态），OU 转移系数在构造时求出；
+- 随机数由 NoiseBuffer 按块预先生成（每块若干个 tick），每个 tick 只取一个切片，不为标量调用随机数生成器；
+- 更新尽量使用 out= 写入预分配数组，tick() 返回的数组在下一次 tick() 时被原地覆盖。
+
+耗时（wind-sim bench 测量）：每台风机每 tick 需要 4 个正态随机数，随机数生成占 tick 的大部分。
+单核机器上 10,000 台风机约 1.1 ms/tick（其中随机数约 0.7 ms），达不到 1 ms 的目标；
+多核机器上 background_noise=True 把随机数生成移到后台线程，tick 本身只剩向量更新（约 0.4 ms）。
+
+可直接作为 scada.modbus_server.run_emulator 的数据源：
+
+    engine = FleetStepEngine(10_000, rng=np.random.default_rng(0))
+    signals = engine.tick()      # 信号名 → (10000,) 数组
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .bearing.bearing_temp_simulator import BearingTemperatureSimulator
+from .bearing.bearing_vibration_simulator import BearingVibrationSimulator
+from .time_stepping import ou_coefficients
+from .turbine.wind_turbine_power_simu import WindTurbinePowerSimulator
+from .wind.wind_speed_simu import WindSpeedSimulator
+
+SIGNALS = ("wind_speed", "wind_dir", "power_kw", "rpm", "bearing_temp", "bearing_vibration")
+# 随机数缓冲区的默认大小（元素数，约 8 MB），块的 tick 数按风机数换算
+DEFAULT_NOISE_ELEMENTS = 1 << 20
+
+
+class NoiseBuffer:
+    """
+    预生成的标准正态随机数块：buffer[tick, stream, unit]，用完后整块重新生成。
+    background=True 时双缓冲：消耗一块的同时由后台线程生成另一块（NumPy 的 Generator 生成时释放 GIL），
+    多核机器上 tick 不再承担随机数生成的开销；生成顺序不变，结果与同步模式一致。
+    """
+
+    __slots__ = ("rng", "block", "buffers", "position", "_executor", "_pending")
+
+    def __init__(self, rng, n_streams: int, n_units: int, block: int | None = None, background: bool = False):
+        """
+        :param rng: numpy 随机数生成器（或 np.random 模块；后台生成要求 np.random.Generator）
+        :param n_streams: 每个 tick 需要的随机数流数量
+        :param n_units: 每个流的长度（风机数）
+        :param block: 每次生成的 tick 数，默认按 DEFAULT_NOISE_ELEMENTS 换算
+        :param background: 是否由后台线程双缓冲生成
+        """
+        if block is None:
+            block = max(1, DEFAULT_NOISE_ELEMENTS // max(n_streams * n_units, 1))
+        if background and not isinstance(rng, np.random.Generator):
+            raise ValueError("后台生成随机数需要 np.random.Generator（如 np.random.default_rng(seed)）")
+        self.rng = rng
+        self.block = block
+        self.buffers = [np.empty((block, n_streams, n_units)) for _ in range(2 if background else 1)]
+        self.position = block
+        self._executor = ThreadPoolExecutor(max_workers=1) if background else None
+        self._pending = None
+
+    def _fill(self, buffer: np.ndarray):
+        if isinstance(self.rng, np.random.Generator):
+            self.rng.standard_normal(out=buffer)
+        else:
+            buffer[...] = self.rng.standard_normal(buffer.shape)
+
+    def next(self) -> np.ndarray:
+        """
+        :return: (n_streams, n_units) 视图，该块被重新生成时被覆盖
+        """
+        if self.position == self.block:
+            if self._executor is None:
+                self._fill(self.buffers[0])
+            else:
+                if self._pending is None:
+                    self._fill(self.buffers[1])
+                else:
+                    self._pending.result()
+                self.buffers.reverse()
+                self._pending = self._executor.submit(self._fill, self.buffers[1])
+            self.position = 0
+        values = self.buffers[0][self.position]
+        self.position += 1
+        return values
+
+    def close(self):
+        """
+        停止后台生成线程
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._pending = None
+
+
+class FleetStepEngine:
+    """
+    风机群逐秒推进引擎（结构数组状态）
+    """
+
+    __slots__ = (
+        "n_turbines", "ambient_temp", "dtype", "ticks",
+        # 参数与预计算系数
+        "mean_wind", "wind_a", "wind_s", "mean_dir", "dir_a", "dir_s",
+        "v_in", "v_rated", "v_out", "v_restart", "p_rated", "alpha", "max_delta", "power_noise", "rpm_noise",
+        "rpm_min", "rpm_rated", "temp_rise", "temp_a", "temp_s", "rms_base", "rms_range", "rms_idle", "rms_a", "rms_s",
+        # 状态（SoA）
+        "wind_speed", "wind_dir", "dir_diff", "cut_out", "power_filtered", "power_limited", "power", "rpm",
+        "rpm_sum", "bearing_temp", "bearing_vibration",
+        # 预分配的临时数组与随机数缓冲区
+        "_x", "_ideal", "_tmp", "_mask", "_noise", "_minute_noise",
+    )
+
+    def __init__(
+        self,
+        n_turbines: int,
+        wind: WindSpeedSimulator | None = None,
+        turbine: WindTurbinePowerSimulator | None = None,
+        bearing_temp: BearingTemperatureSimulator | None = None,
+        bearing_vibration: BearingVibrationSimulator | None = None,
+        ambient_temp=20.0,
+        rng=None,
+        noise_block: int | None = None,
+        background_noise: bool = False,
+        dtype=np.float64,
+    ):
+        """
+        :param n_turbines: 风机数量
+        :param wind: 提供风速/风向参数的模拟器（dt 固定为 1 秒），默认参数
+        :param turbine: 提供功率/转速参数的风机模拟器（使用理想功率曲线），默认参数
+        :param bearing_temp: 提供轴承温度参数的模拟器（步长为 1 分钟），默认按风机转速范围创建
+        :param bearing_vibration: 提供轴承振动参数的模拟器（步长为 1 分钟），默认按风机转速范围创建
+        :param ambient_temp: 环境温度（°C），标量或 (n_turbines,)，运行中可直接修改 engine.ambient_temp
+        :param rng: numpy 随机数生成器，默认使用全局 np.random
+        :param noise_block: 随机数块的 tick 数，默认按 DEFAULT_NOISE_ELEMENTS 换算
+        :param background_noise: 由后台线程双缓冲生成逐秒随机数（需要 np.random.Generator），
+                                 分钟级随机数改用由 rng 派生的独立生成器，保证结果可复现
+        :param dtype: tick() 输出的数据类型（内部状态始终为 float64）
+        """
+        wind = wind or WindSpeedSimulator(dt=1.0)
+        turbine = turbine or WindTurbinePowerSimulator()
+        rpm_kwargs = {"rpm_min": turbine.rpm_min, "rpm_rated": turbine.rpm_rated}
+        bearing_temp = bearing_temp or BearingTemperatureSimulator(**rpm_kwargs)
+        bearing_vibration = bearing_vibration or BearingVibrationSimulator(**rpm_kwargs)
+        rng = rng if rng is not None else np.random
+        n = n_turbines
+
+        self.n_turbines = n
+        self.ambient_temp = ambient_temp
+        self.dtype = np.dtype(dtype)
+        self.ticks = 0
+
+        self.mean_wind = wind.mean_wind
+        self.wind_a, self.wind_s = ou_coefficients(wind.tau, wind.sigma, 1.0, wind.method)
+        self.mean_dir = wind.mean_dir
+        self.dir_a, self.dir_s = ou_coefficients(wind.tau_dir, wind.sigma_dir, 1.0, wind.method)
+
+        self.v_in, self.v_rated, self.v_out = turbine.v_in, turbine.v_rated, turbine.v_out
+        self.v_restart = turbine.v_restart
+        self.p_rated = turbine.p_rated
+        self.alpha = 1.0 / (turbine.time_constant + 1.0)
+        self.max_delta = turbine.max_ramp_rate
+        self.power_noise = turbine.noise_sigma * turbine.p_rated
+        self.rpm_noise = turbine.rpm_noise_sigma
+        self.rpm_min, self.rpm_rated = turbine.rpm_min, turbine.rpm_rated
+
+        self.temp_rise = bearing_temp.temp_rise_at_rated
+        self.temp_a, self.temp_s = ou_coefficients(bearing_temp.tau, bearing_temp.sigma, bearing_temp.dt, bearing_temp.method)
+        self.rms_base = bearing_vibration.base_rms
+        self.rms_range = bearing_vibration.rms_range
+        self.rms_idle = 0.1 * bearing_vibration.base_rms
+        self.rms_a, self.rms_s = ou_coefficients(bearing_vibration.tau, bearing_vibration.sigma, bearing_vibration.dt,
+                                                 bearing_vibration.method)
+
+        self.wind_speed = np.full(n, float(wind.wind_speed))
+        self.dir_diff = np.full(n, float(wind.wind_dir - wind.mean_dir))
+        self.wind_dir = np.full(n, float(wind.wind_dir))
+        self.cut_out = np.zeros(n, dtype=bool)
+        self.power_filtered = np.full(n, np.nan)
+        self.power_limited = np.full(n, np.nan)
+        self.power = np.zeros(n)
+        self.rpm = np.full(n, float(self.rpm_min))
+        self.rpm_sum = np.zeros(n)
+        self.bearing_temp = np.broadcast_to(np.asarray(ambient_temp, dtype=float), (n,)).copy()
+        self.bearing_vibration = np.full(n, float(bearing_vibration.current_rms))
+
+        self._x = np.empty(n)
+        self._ideal = np.empty(n)
+        self._tmp = np.empty(n)
+        self._mask = np.empty(n, dtype=bool)
+        self._noise = NoiseBuffer(rng, 4, n, noise_block, background=background_noise)
+        minute_rng = np.random.default_rng(rng.integers(2 ** 63)) if background_noise else rng
+        self._minute_noise = NoiseBuffer(minute_rng, 2, n, None if noise_block is None else max(1, noise_block // 60))
+
+    def _ideal_power(self):
+        """
+        理想功率曲线写入 self._ideal（切出状态下为 0）
+        """
+        v, x, ideal, mask = self.wind_speed, self._x, self._ideal, self._mask
+        np.subtract(v, self.v_in, out=x)
+        x *= 1.0 / (self.v_rated - self.v_in)
+        np.clip(x, 0.0, 1.0, out=x)
+        # (3 - 2x) x² P_rated
+        np.multiply(x, -2.0, out=ideal)
+        ideal += 3.0
+        ideal *= x
+        ideal *= x
+        ideal *= self.p_rated
+        np.less(v, self.v_in, out=mask)
+        mask |= self.cut_out
+        ideal[mask] = 0.0
+
+    def _wrap(self, angle: np.ndarray):
+        """
+        原地归一化到 [-180, 180)：angle -= 360 floor((angle + 180) / 360)（比 np.mod 快）
+        """
+        tmp = self._x
+        np.add(angle, 180.0, out=tmp)
+        tmp *= 1.0 / 360.0
+        np.floor(tmp, out=tmp)
+        tmp *= 360.0
+        angle -= tmp
+
+    def _update_cut_out(self):
+        v = self.wind_speed
+        if self.v_restart is None:
+            np.greater_equal(v, self.v_out, out=self.cut_out)
+        else:
+            self.cut_out |= v >= self.v_out
+            self.cut_out &= v >= self.v_restart
+
+    def _minute_update(self):
+        """
+        用分钟平均转速推进轴承温度与振动一步（规则同各自的 step()）
+        """
+        noise = self._minute_noise.next()
+        rpm = self.rpm_sum / 60.0
+        self.rpm_sum[:] = 0.0
+        x2 = np.clip((rpm - self.rpm_min) / (self.rpm_rated - self.rpm_min), 0.0, 1.0) ** 2
+        idle = rpm <= self.rpm_min
+        ambient = np.broadcast_to(np.asarray(self.ambient_temp, dtype=float), (self.n_turbines,))
+
+        target = ambient + self.temp_rise * x2
+        temp = target + self.temp_a * (self.bearing_temp - target) + self.temp_s * noise[0]
+        np.maximum(temp, ambient, out=temp)
+        self.bearing_temp = np.where(idle, ambient, temp)
+
+        target = self.rms_base + self.rms_range * x2
+        rms = target + self.rms_a * (self.bearing_vibration - target) + self.rms_s * noise[1]
+        np.maximum(rms, 0.0, out=rms)
+        self.bearing_vibration = np.where(idle, self.rms_idle, rms)
+
+    def tick(self) -> dict:
+        """
+        所有风机推进 1 秒
+        :return: 信号名 → (n_turbines,) 数组（下一次 tick 时被覆盖）
+        """
+        noise = self._noise.next()
+        tmp = self._tmp
+
+        # 风速：OU 转移并截断为非负
+        v = self.wind_speed
+        v -= self.mean_wind
+        v *= self.wind_a
+        v += self.mean_wind
+        np.multiply(noise[0], self.wind_s, out=tmp)
+        v += tmp
+        np.maximum(v, 0.0, out=v)
+
+        # 风向：相对主风向的角度差做 OU 转移，归一化到 [-180, 180)
+        d = self.dir_diff
+        d *= self.dir_a
+        np.multiply(noise[1], self.dir_s, out=tmp)
+        d += tmp
+        self._wrap(d)
+        np.add(d, self.mean_dir, out=self.wind_dir)
+        self._wrap(self.wind_dir)
+
+        # 功率：理想曲线 → 一阶惯性 → 斜坡率限制 → 噪声
+        self._update_cut_out()
+        self._ideal_power()
+        ideal = self._ideal
+        if self.ticks == 0:
+            np.copyto(self.power_filtered, ideal)
+            np.copyto(self.power_limited, ideal)
+        else:
+            f = self.power_filtered
+            np.subtract(ideal, f, out=tmp)
+            tmp *= self.alpha
+            f += tmp
+            lim = self.power_limited
+            np.subtract(f, lim, out=tmp)
+            np.clip(tmp, -self.max_delta, self.max_delta, out=tmp)
+            lim += tmp
+        p = self.power
+        np.multiply(noise[2], self.power_noise, out=p)
+        np.greater(ideal, 0.0, out=self._mask)
+        p *= self._mask
+        p += self.power_limited
+        np.maximum(p, 0.0, out=p)
+
+        # 转速：按功率比例，运行时加噪声
+        r = self.rpm
+        np.multiply(p, self.rpm_rated / self.p_rated, out=r)
+        np.clip(r, self.rpm_min, self.rpm_rated, out=r)
+        np.multiply(noise[3], self.rpm_noise, out=tmp)
+        np.greater(p, 0.0, out=self._mask)
+        tmp *= self._mask
+        r += tmp
+        np.clip(r, self.rpm_min, self.rpm_rated, out=r)
+
+        self.rpm_sum += r
+        self.ticks += 1
+        if self.ticks % 60 == 0:
+            self._minute_update()
+        return self.signals()
+
+    def signals(self) -> dict:
+        """
+        当前各信号（dtype 为 float64 时不拷贝）
+        """
+        values = {
+            "wind_speed": self.wind_speed,
+            "wind_dir": self.wind_dir,
+            "power_kw": self.power,
+            "rpm": self.rpm,
+            "bearing_temp": self.bearing_temp,
+            "bearing_vibration": self.bearing_vibration,
+        }
+        return {name: array.astype(self.dtype, copy=False) for name, array in values.items()}
+
+    def close(self):
+        """
+        停止后台随机数生成线程（background_noise=True 时）
+        """
+        self._noise.close()
+
+    def run(self, seconds: int) -> dict:
+        """
+        连续推进 seconds 秒并记录各信号
+        :return: 信号名 → (n_turbines, seconds) 数组
+        """
+        out = {name: np.empty((self.n_turbines, seconds), dtype=self.dtype) for name in SIGNALS}
+        for k in range(seconds):
+            for name, values in self.tick().items():
+                out[name][:, k] = values
+        return out
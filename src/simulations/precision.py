@@ -0,0 +1,109 @@
+"""
+数值精度模式与内存账本。
+
+风速、功率、转速、温度、振动等信号的有效精度远低于 float64，大规模（风场 × 年）模拟可选用 float32：
+各模拟器通过 dtype 参数分配输出数组，序号列使用 int32，内存与磁盘占用约减半。
+状态标志（如 ControlledTurbineFleet 的并网标志）本身就是 1 字节的 bool，两种模式相同。
+
+    precision = get_precision("float32")
+    simulator = WindTurbinePowerSimulator(dtype=precision.value)
+    ledger = MemoryLedger()
+    ledger.add_tables(tables)
+    print(ledger.report(n_turbines=1, seconds=86400))
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Precision:
+    """
+    精度模式：信号数组与序号列的数据类型
+    """
+    name: str
+    value: type
+    index: type
+
+
+PRECISIONS = {
+    "float64": Precision("float64", np.float64, np.int64),
+    "float32": Precision("float32", np.float32, np.int32),
+}
+
+
+def get_precision(name: str) -> Precision:
+    """
+    按名称取精度模式
+    """
+    if name not in PRECISIONS:
+        raise ValueError(f"不支持的精度模式: {name!r}（可选: {', '.join(PRECISIONS)}）")
+    return PRECISIONS[name]
+
+
+def _flatten(tables: dict) -> dict:
+    """
+    {表名: {列名: 数组}} → {"表名.列名": 数组}
+    """
+    return {f"{table}.{column}": np.asarray(values) for table, columns in tables.items()
+            for column, values in columns.items()}
+
+
+class MemoryLedger:
+    """
+    内存账本：登记模拟输出数组的字节数，换算为每台风机每秒的字节数
+    """
+
+    def __init__(self):
+        self.entries = {}
+
+    def add(self, name: str, array):
+        """
+        登记一个数组（同名覆盖）
+        """
+        array = np.asarray(array)
+        self.entries[name] = (array.dtype.str, array.size, array.nbytes)
+
+    def add_tables(self, tables: dict):
+        """
+        登记 {表名: {列名: 数组}} 中的全部列
+        """
+        for name, array in _flatten(tables).items():
+            self.add(name, array)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(nbytes for _, _, nbytes in self.entries.values())
+
+    def bytes_per_turbine_second(self, n_turbines: int, seconds: float) -> float:
+        """
+        :param n_turbines: 登记的数组覆盖的风机数
+        :param seconds: 模拟时长（秒）
+        """
+        return self.total_bytes / (n_turbines * seconds)
+
+    def report(self, n_turbines: int, seconds: float) -> str:
+        lines = [f"{name:<36} {dtype:>5} {size:>10} {nbytes:>12,d} B"
+                 for name, (dtype, size, nbytes) in self.entries.items()]
+        lines.append(f"合计 {self.total_bytes:,d} B，"
+                     f"{self.bytes_per_turbine_second(n_turbines, seconds):.2f} B/(风机·秒)")
+        return "\n".join(lines)
+
+
+def accuracy_report(reference: dict, candidate: dict) -> dict:
+    """
+    比较两种精度下的同一组输出（相同随机种子）
+    :param reference: float64 结果 {表名: {列名: 数组}}
+    :param candidate: 低精度结果，结构相同
+    :return: "表名.列名" → {"max_abs": 最大绝对误差, "max_rel": 最大绝对误差 / 参考信号极差}
+    """
+    reference, candidate = _flatten(reference), _flatten(candidate)
+    report = {}
+    for name, ref in reference.items():
+        ref = ref.astype(np.float64)
+        diff = np.abs(candidate[name].astype(np.float64) - ref)
+        max_abs = float(np.nanmax(diff)) if diff.size else 0.0
+        span = float(np.nanmax(ref) - np.nanmin(ref)) if ref.size else 0.0
+        report[name] = {"max_abs": max_abs, "max_rel": max_abs / span if span > 0 else max_abs}
+    return report
@@ -0,0 +1,3 @@
+# 文件：/wind-turbine-om-sim/wind-turbine-om-sim/src/simulations/thermal/__init__.py
+
+# 该文件用于将thermal目录标记为一个Python包。
\ No newline at end of file
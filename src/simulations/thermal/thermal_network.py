@@ -0,0 +1,251 @@
+"""
+传动链集总参数热网络：主轴承、齿轮箱高速轴轴承、发电机绕组、机舱等节点相互耦合的 N 节点 RC 网络。
+
+每个节点 i 有热容 C_i (kJ/K)，节点间热导 G_ij 与对环境热导 G_i,amb (kW/K)，热源由转速与功率给出：
+    C_i dT_i/dt = Σ_j G_ij (T_j - T_i) + G_i,amb (T_amb - T_i) + Q_i(rpm, P) + 噪声
+    Q_i = q_rpm_i · x² + q_power_i · (P / P_rated)²，x = clip((rpm - rpm_min) / (rpm_rated - rpm_min), 0, 1)
+即 dT/dt = A T + B u，u = [T_amb, Q]。输入在一个步长内保持不变（零阶保持）时，离散更新是精确的：
+    T' = A_d T + B_d u，A_d = exp(A dt)，B_d = ∫₀^dt exp(A s) ds · B
+A_d、B_d 与过程噪声协方差（Van Loan 方法）在构造时由矩阵指数一次求出；
+所有风机的状态存放在 (n_turbines, N) 数组中，每一步只做一次矩阵乘法 [T, u] @ M^T，M = [A_d | B_d]。
+
+单节点、G_amb = 1、C = 60 τ、q_rpm = temp_rise_at_rated 时即为 BearingTemperatureSimulator 的模型
+（精确 OU 转移），见 ThermalNetwork.from_bearing_simulator。时间步长单位：分钟。
+"""
+
+import numpy as np
+from scipy.linalg import expm
+
+from ..bearing.bearing_temp_simulator import BearingTemperatureSimulator
+
+# 默认传动链网络的节点
+DRIVETRAIN_NODES = ("main_bearing", "hss_bearing", "generator_winding", "nacelle")
+
+
+def _discretize(a: np.ndarray, b: np.ndarray, noise_cov: np.ndarray, dt: float):
+    """
+    连续系统 dT = (A T + B u) dt + dW（Cov(dW) = noise_cov dt）的精确离散化
+    :return: (A_d, B_d, 过程噪声协方差 Q_d)
+    """
+    n, m = b.shape
+    augmented = np.zeros((n + m, n + m))
+    augmented[:n, :n] = a
+    augmented[:n, n:] = b
+    phi = expm(augmented * dt)
+    a_d, b_d = phi[:n, :n], phi[:n, n:]
+
+    # Van Loan：exp([[-A, Σ], [0, Aᵀ]] dt) = [[·, F12], [0, F22]]，Q_d = F22ᵀ F12
+    van_loan = np.zeros((2 * n, 2 * n))
+    van_loan[:n, :n] = -a
+    van_loan[:n, n:] = noise_cov
+    van_loan[n:, n:] = a.T
+    f = expm(van_loan * dt)
+    q_d = f[n:, n:].T @ f[:n, n:]
+    return a_d, b_d, 0.5 * (q_d + q_d.T)
+
+
+class ThermalNetwork:
+    """
+    批量（多台风机）RC 热网络
+
+        network = ThermalNetwork.drivetrain(rpm_min=6.0, rpm_rated=15.0, rated_power=2000.0)
+        temps = network.simulate(ambient, rpm, power)     # (n_turbines, steps, N)
+        temps[..., network.node_index("generator_winding")]
+    """
+
+    def __init__(
+        self,
+        nodes,
+        capacity,
+        conductance,
+        ambient_conductance,
+        rpm_heat=None,
+        power_heat=None,
+        rpm_min: float = 6.0,
+        rpm_rated: float = 15.0,
+        rated_power: float = 2000.0,
+        sigma=0.0,
+        dt: float = 1.0,
+        clamp_nodes=(),
+        rng=None,
+        dtype=np.float64,
+    ):
+        """
+        :param nodes: 节点名列表（N 个）
+        :param capacity: 各节点热容 C (kJ/K)，长度 N
+        :param conductance: 节点间热导矩阵 G (kW/K)，N×N 对称、对角为 0
+        :param ambient_conductance: 各节点对环境的热导 (kW/K)，长度 N
+        :param rpm_heat: 额定转速下各节点的摩擦生热 q_rpm (kW)，默认 0
+        :param power_heat: 额定功率下各节点的损耗发热 q_power (kW)，默认 0
+        :param rpm_min: 最小运行转速（rpm）
+        :param rpm_rated: 额定运行转速（rpm）
+        :param rated_power: 额定功率 (kW)
+        :param sigma: 各节点随机扰动强度（°C/√分钟），标量或长度 N
+        :param dt: 时间步长（分钟）
+        :param clamp_nodes: 与 BearingTemperatureSimulator 相同处理的节点名：转速不高于 rpm_min 时等于环境温度，
+                            且不低于环境温度
+        :param rng: numpy 随机数生成器，默认使用全局 np.random
+        :param dtype: 输出数组的数据类型（内部状态始终为 float64）
+        """
+        self.nodes = tuple(nodes)
+        n = len(self.nodes)
+        self.capacity = np.asarray(capacity, dtype=float)
+        self.conductance = np.asarray(conductance, dtype=float)
+        self.ambient_conductance = np.asarray(ambient_conductance, dtype=float)
+        self.rpm_heat = np.zeros(n) if rpm_heat is None else np.asarray(rpm_heat, dtype=float)
+        self.power_heat = np.zeros(n) if power_heat is None else np.asarray(power_heat, dtype=float)
+        if self.conductance.shape != (n, n) or not np.allclose(self.conductance, self.conductance.T):
+            raise ValueError("conductance 必须为 N×N 对称矩阵")
+        for name, values in (("capacity", self.capacity), ("ambient_conductance", self.ambient_conductance),
+                             ("rpm_heat", self.rpm_heat), ("power_heat", self.power_heat)):
+            if values.shape != (n,):
+                raise ValueError(f"{name} 的长度必须等于节点数 {n}")
+        if np.any(self.capacity <= 0):
+            raise ValueError("热容必须为正")
+        unknown = set(clamp_nodes) - set(self.nodes)
+        if unknown:
+            raise ValueError(f"未知节点: {sorted(unknown)}")
+
+        self.rpm_min = rpm_min
+        self.rpm_rated = rpm_rated
+        self.rated_power = rated_power
+        self.sigma = np.broadcast_to(np.asarray(sigma, dtype=float), (n,)).copy()
+        self.dt = dt
+        self.clamp = np.isin(self.nodes, list(clamp_nodes))
+        self.rng = rng if rng is not None else np.random
+        self.dtype = np.dtype(dtype)
+
+        # dT/dt（每分钟）= A T + B [T_amb, Q]
+        g = self.conductance.copy()
+        np.fill_diagonal(g, 0.0)
+        laplacian = np.diag(g.sum(axis=1) + self.ambient_conductance) - g
+        per_minute = 60.0 / self.capacity[:, None]
+        a = -per_minute * laplacian
+        b = per_minute * np.column_stack([self.ambient_conductance, np.eye(n)])
+        self.a_d, self.b_d, noise_cov = _discretize(a, b, np.diag(self.sigma ** 2), dt)
+        self.transition = np.hstack([self.a_d, self.b_d])          # M = [A_d | B_d]，(N, 2N + 1)
+        self.noise_chol = np.linalg.cholesky(noise_cov + 1e-15 * np.eye(n)) if np.any(self.sigma > 0) else None
+
+    @classmethod
+    def drivetrain(cls, rpm_min: float = 6.0, rpm_rated: float = 15.0, rated_power: float = 2000.0, **kwargs):
+        """
+        默认四节点传动链网络（主轴承、高速轴轴承、发电机绕组、机舱），额定工况下的稳态温升约为
+        主轴承 20 K、高速轴轴承 50 K、发电机绕组 70 K、机舱 16 K（相对环境温度）
+        """
+        #                      main   hss   gen   nacelle
+        conductance = np.array([[0.0, 0.0, 0.0, 0.2],
+                                [0.0, 0.0, 0.02, 0.15],
+                                [0.0, 0.02, 0.0, 1.0],
+                                [0.2, 0.15, 1.0, 0.0]])
+        params = {
+            "capacity": [600.0, 150.0, 1500.0, 2000.0],
+            "conductance": conductance,
+            "ambient_conductance": [0.2, 0.0, 0.0, 4.0],
+            "rpm_heat": [5.0, 4.0, 0.0, 0.0],
+            "power_heat": [0.0, 1.0, 55.0, 2.0],
+            "sigma": [0.3, 0.5, 0.5, 0.2],
+        }
+        params.update(kwargs)
+        return cls(DRIVETRAIN_NODES, rpm_min=rpm_min, rpm_rated=rpm_rated, rated_power=rated_power, **params)
+
+    @classmethod
+    def from_bearing_simulator(cls, simulator: BearingTemperatureSimulator, rng=None):
+        """
+        与 BearingTemperatureSimulator（method="exact"）等价的单节点网络
+        """
+        return cls(
+            ("bearing",),
+            capacity=[60.0 * simulator.tau],
+            conductance=[[0.0]],
+            ambient_conductance=[1.0],
+            rpm_heat=[simulator.temp_rise_at_rated],
+            rpm_min=simulator.rpm_min,
+            rpm_rated=simulator.rpm_rated,
+            sigma=simulator.sigma,
+            dt=simulator.dt,
+            clamp_nodes=("bearing",),
+            rng=rng if rng is not None else simulator.rng,
+            dtype=simulator.dtype,
+        )
+
+    def node_index(self, name: str) -> int:
+        return self.nodes.index(name)
+
+    def heat_inputs(self, rpm, power=None) -> np.ndarray:
+        """
+        各节点热源 Q (kW)
+        :param rpm: 转速 (n_turbines,)
+        :param power: 功率 (kW) (n_turbines,)，None 视为 0
+        :return: (n_turbines, N)
+        """
+        x = np.clip((np.asarray(rpm, dtype=float) - self.rpm_min) / (self.rpm_rated - self.rpm_min), 0.0, 1.0)
+        heat = (x ** 2)[:, None] * self.rpm_heat[None, :]
+        if power is not None:
+            load = np.maximum(np.asarray(power, dtype=float), 0.0) / self.rated_power
+            heat += (load ** 2)[:, None] * self.power_heat[None, :]
+        return heat
+
+    def steady_state(self, ambient, rpm, power=None) -> np.ndarray:
+        """
+        恒定工况下的稳态温度 T* = -A⁻¹ B u
+        :return: (n_turbines, N)
+        """
+        rpm = np.atleast_1d(np.asarray(rpm, dtype=float))
+        ambient = np.broadcast_to(np.asarray(ambient, dtype=float), rpm.shape)
+        power = None if power is None else np.broadcast_to(np.asarray(power, dtype=float), rpm.shape)
+        u = np.column_stack([ambient, self.heat_inputs(rpm, power)])
+        n = len(self.nodes)
+        return np.linalg.solve(np.eye(n) - self.a_d, self.b_d @ u.T).T
+
+    def init_state(self, n_turbines: int, ambient=None) -> np.ndarray:
+        """
+        初始状态：所有节点等于环境温度（默认 BearingTemperatureSimulator 的 base_temp 40 °C）
+        :return: (n_turbines, N)
+        """
+        ambient = 40.0 if ambient is None else ambient
+        return np.repeat(np.broadcast_to(np.asarray(ambient, dtype=float), (n_turbines,))[:, None],
+                         len(self.nodes), axis=1)
+
+    def step(self, state: np.ndarray, ambient, rpm, power=None) -> np.ndarray:
+        """
+        所有风机推进一步
+        :param state: (n_turbines, N) 当前节点温度
+        :param ambient: 环境温度 (n_turbines,) 或标量
+        :param rpm: 转速 (n_turbines,)
+        :param power: 功率 (kW) (n_turbines,)，可选
+        :return: 新状态 (n_turbines, N)
+        """
+        n_turbines = state.shape[0]
+        ambient = np.broadcast_to(np.asarray(ambient, dtype=float), (n_turbines,))
+        rpm = np.broadcast_to(np.asarray(rpm, dtype=float), (n_turbines,))
+        if power is not None:
+            power = np.broadcast_to(np.asarray(power, dtype=float), (n_turbines,))
+        z = np.concatenate([state, ambient[:, None], self.heat_inputs(rpm, power)], axis=1)
+        new = z @ self.transition.T
+        if self.noise_chol is not None:
+            new += self.rng.normal(size=state.shape) @ self.noise_chol.T
+        if self.clamp.any():
+            amb = ambient[:, None]
+            idle = (rpm <= self.rpm_min)[:, None]
+            new = np.where(self.clamp, np.where(idle, amb, np.maximum(new, amb)), new)
+        return new
+
+    def simulate(self, ambient_temps, rpm, power=None, initial=None) -> np.ndarray:
+        """
+        :param ambient_temps: 环境温度 (n_turbines, steps)、(steps,) 或标量
+        :param rpm: 转速 (n_turbines, steps) 或 (steps,)
+        :param power: 功率 (kW)，形状同 rpm，可选
+        :param initial: 初始状态 (n_turbines, N)，默认全部等于首步环境温度
+        :return: 节点温度 (n_turbines, steps, N)
+        """
+        rpm = np.atleast_2d(np.asarray(rpm, dtype=float))
+        n_turbines, steps = rpm.shape
+        ambient = np.broadcast_to(np.asarray(ambient_temps, dtype=float), (n_turbines, steps))
+        if power is not None:
+            power = np.broadcast_to(np.asarray(power, dtype=float), (n_turbines, steps))
+        state = self.init_state(n_turbines, ambient[:, 0] if steps else None) if initial is None else initial
+        temps = np.empty((n_turbines, steps, len(self.nodes)), dtype=self.dtype)
+        for k in range(steps):
+            state = self.step(state, ambient[:, k], rpm[:, k], None if power is None else power[:, k])
+            temps[:, k] = state
+        return temps
@@ -0,0 +1,105 @@
+import numpy as np
+
+# 支持的 OU 过程离散化方法
+OU_METHODS = ("euler", "exact")
+
+
+def check_ou_method(method: str) -> str:
+    """
+    校验 OU 离散化方法名
+    """
+    if method not in OU_METHODS:
+        raise ValueError(f"不支持的离散化方法: {method!r}（可选: {', '.join(OU_METHODS)}）")
+    return method
+
+
+def ou_coefficients(tau, sigma, dt, method: str = "euler"):
+    """
+    计算 OU 过程 dX = -(X - μ)/τ dt + σ dW 单步转移 X' = μ + a (X - μ) + s N(0,1) 的系数
+
+    - euler：Euler–Maruyama，a = 1 - dt/τ，s = σ√dt，仅在 dt << τ 时准确
+    - exact：精确转移分布，a = exp(-dt/τ)，s = σ √(τ/2 · (1 - a²))，任意 dt 下统计特性都正确
+
+    :param tau: 时间常数（与 dt 同单位），标量或数组
+    :param sigma: 随机扰动强度
+    :param dt: 时间步长，标量或数组（自适应步长时每段不同）
+    :param method: "euler" 或 "exact"
+    :return: (a, s)
+    """
+    if method == "exact":
+        a = np.exp(-np.asarray(dt, dtype=float) / tau)
+        s = sigma * np.sqrt(0.5 * tau * (1.0 - a * a))
+        return a, s
+    check_ou_method(method)
+    return 1.0 - np.asarray(dt, dtype=float) / tau, sigma * np.sqrt(dt)
+
+
+class OUCoefficientCache:
+    """
+    逐步模拟用的 OU 单步系数缓存：(tau, sigma, dt, method) 不变时直接返回上次算出的 (a, s)（Python float），
+    避免 step() 每步重复调用 ou_coefficients；参数被修改时自动重算
+    """
+
+    __slots__ = ("key", "a", "s")
+
+    def __init__(self):
+        self.key = None
+        self.a = self.s = 0.0
+
+    def __call__(self, tau, sigma, dt, method: str = "euler") -> tuple[float, float]:
+        key = (tau, sigma, dt, method)
+        if key != self.key:
+            a, s = ou_coefficients(tau, sigma, dt, method)
+            self.a, self.s, self.key = float(a), float(s), key
+        return self.a, self.s
+
+
+def ou_step(x, mean, tau, sigma, dt, noise, method: str = "euler"):
+    """
+    OU 过程单步更新
+    :param x: 当前值
+    :param mean: 均值（回复目标）
+    :param noise: 标准正态随机数
+    :return: 下一步的值
+    """
+    a, s = ou_coefficients(tau, sigma, dt, method)
+    return mean + a * (x - mean) + s * noise
+
+
+def adaptive_segments(signals, tolerances, idle_mask=None) -> np.ndarray:
+    """
+    自适应步长划分：将输入序列划分为若干段，段内各输入信号的变化不超过对应容差，
+    停机状态（idle_mask）不变。稳态或停机时段合并为一个粗步长，瞬态时段退化为逐步推进。
+    划分完全向量化：信号按容差量化，任一量化值或停机状态改变处即为新段起点。
+    量化分档没有迟滞：输入噪声接近或超过容差时（如未经平滑的实测转速），信号会反复跨越档位边界，
+    几乎每步都成为新段，得不到加速。这类输入应先平滑或降采样，或放宽容差。
+
+    :param signals: 输入信号序列列表（如 转速、环境温度），每个长度为 n
+    :param tolerances: 各信号的容差（与信号同单位）
+    :param idle_mask: 停机状态布尔序列，可选
+    :return: 各段起始下标（升序，第一个为 0）
+    """
+    signals = [np.asarray(sig, dtype=float) for sig in signals]
+    n = len(signals[0])
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    changed = np.zeros(n - 1, dtype=bool)
+    for sig, tol in zip(signals, tolerances):
+        levels = np.floor(sig / tol)
+        changed |= levels[1:] != levels[:-1]
+    if idle_mask is not None:
+        idle_mask = np.asarray(idle_mask, dtype=bool)
+        changed |= idle_mask[1:] != idle_mask[:-1]
+    return np.concatenate(([0], np.flatnonzero(changed) + 1))
+
+
+def segment_means(values, starts) -> np.ndarray:
+    """
+    计算各段内的均值
+    :param values: 序列
+    :param starts: adaptive_segments 返回的段起始下标
+    """
+    values = np.asarray(values, dtype=float)
+    lengths = np.diff(np.append(starts, len(values)))
+    return np.add.reduceat(values, starts) / lengths
@@ -0,0 +1,191 @@
+"""
+传动链 + 控制器闭环模拟：以控制回路频率（10~50 Hz）对整个风机群做定步长向量化积分。
+
+每台风机的状态为 (转子角速度 ω, 桨距角 β, 变桨 PI 积分量, 并网标志, 滤波风速)，全部存放在 (n_turbines,) 数组中：
+- 转子动力学：J dω/dt = T_aero - T_gen（- 停机时的制动力矩），T_aero 由 Cp(λ, β) 查找表求得；
+- 区域 2 转矩控制：T_gen = k ω²，k = ½ρπR⁵·Cp_max/λ*³，使转子跟踪最优叶尖速比；
+  低于最低转速时转矩线性退出，额定转速附近（区域 2.5）线性过渡到额定转矩；
+- 区域 3：T_gen = P_rated/ω 恒功率，变桨 PI 控制器将转速稳定在额定转速，带积分抗饱和与变桨速率限制；
+- 切入/切出滞环：按滤波风速判断，v_in 之下再低 cut_in_hysteresis 才停机，切出后风速降到 v_restart 以下才重新并网；
+  停机时叶片顺桨、发电机转矩为零：风速允许运行时转子空转在 ω_min（Heier 公式在 λ→0 时 Cp≈0，
+  无法自行起转），并且转速达到 ω_min 后才并网；风速过低或切出时施加制动力矩。
+
+输出按秒求平均（与 WindTurbinePowerSimulator 的秒级序列对齐），转速可直接接入轴承温度/振动模拟；
+单台风机模拟中由 main.simulate(use_controller=True)（命令行 --controller）选用。
+"""
+
+import numpy as np
+
+from .rotor_aero import RotorModel
+
+
+class ControlledTurbineFleet:
+    """
+    闭环控制的风机群（同一型号）
+
+        fleet = ControlledTurbineFleet(RotorModel.from_config(config), n_turbines=200, control_hz=20)
+        result = fleet.simulate(wind_speeds)   # wind_speeds: (200, seconds)，1 Hz
+    """
+
+    def __init__(
+        self,
+        rotor_model: RotorModel,
+        n_turbines: int = 1,
+        control_hz: float = 20.0,
+        inertia_constant: float = 4.0,
+        kp: float = 60.0,
+        ki: float = 20.0,
+        pitch_rate: float = 8.0,
+        pitch_max: float = 45.0,
+        cut_in_hysteresis: float = 0.5,
+        v_restart: float | None = None,
+        wind_filter_tau: float = 30.0,
+        brake_fraction: float = 0.5,
+        dtype=np.float64,
+    ):
+        """
+        :param rotor_model: 气动转子模型（提供叶轮半径、Cp 查找表、转速与功率限值）
+        :param n_turbines: 风机数量
+        :param control_hz: 控制回路频率 (Hz)
+        :param inertia_constant: 惯性常数 H (s)，转动惯量 J = 2·H·P_rated/ω_rated²
+        :param kp: 变桨 PI 比例增益（度 / 相对转速误差）
+        :param ki: 变桨 PI 积分增益（度/秒 / 相对转速误差）
+        :param pitch_rate: 最大变桨速率 (度/秒)
+        :param pitch_max: 顺桨角 (度)
+        :param cut_in_hysteresis: 切入滞环宽度 (m/s)
+        :param v_restart: 切出后重新并网的风速 (m/s)，默认 v_out - 3
+        :param wind_filter_tau: 判断切入/切出所用风速的一阶滤波时间常数 (s)
+        :param brake_fraction: 停机制动力矩（相对额定转矩）
+        :param dtype: 输出数组的数据类型（内部状态始终为 float64）
+        """
+        self.rotor = rotor_model
+        self.n_turbines = n_turbines
+        self.control_hz = control_hz
+        self.dt = 1.0 / control_hz
+        self.kp = kp
+        self.ki = ki
+        self.pitch_rate = pitch_rate
+        self.pitch_max = pitch_max
+        self.v_cut_in = rotor_model.v_in
+        self.v_cut_out = rotor_model.v_out
+        self.cut_in_hysteresis = cut_in_hysteresis
+        self.v_restart = v_restart if v_restart is not None else rotor_model.v_out - 3.0
+        self.wind_filter_alpha = 1.0 / (wind_filter_tau + 1.0)
+        self.brake_fraction = brake_fraction
+        self.dtype = np.dtype(dtype)
+
+        r = rotor_model.radius
+        to_omega = 2.0 * np.pi / 60.0
+        self.omega_min = rotor_model.rpm_min * to_omega
+        self.omega_rated = rotor_model.rpm_rated * to_omega
+        self.omega_25 = 0.95 * self.omega_rated
+        self.efficiency = rotor_model.efficiency
+        self.p_mech_rated = rotor_model.p_rated * 1000.0 / rotor_model.efficiency   # W
+        self.torque_rated = self.p_mech_rated / self.omega_rated
+        self.inertia = 2.0 * inertia_constant * self.p_mech_rated / self.omega_rated ** 2
+        self.aero_coeff = 0.5 * rotor_model.air_density * np.pi * r ** 2
+        self.k_opt = 0.5 * rotor_model.air_density * np.pi * r ** 5 * rotor_model.cp_max / rotor_model.lambda_opt ** 3
+        self.torque_25_start = min(self.k_opt * self.omega_25 ** 2, self.torque_rated)
+
+        self.reset()
+
+    def reset(self):
+        """
+        所有风机回到停机顺桨状态
+        """
+        n = self.n_turbines
+        self.omega = np.zeros(n)
+        self.pitch = np.full(n, self.pitch_max)
+        self.integral = np.full(n, self.pitch_max / self.ki)
+        self.online = np.zeros(n, dtype=bool)
+        self.cut_out = np.zeros(n, dtype=bool)
+        self.idle = np.zeros(n, dtype=bool)
+        self.wind_filtered = None
+
+    def generator_torque(self, omega: np.ndarray) -> np.ndarray:
+        """
+        转矩控制律（转子侧，N·m）
+        """
+        region2 = self.k_opt * omega ** 2 * np.clip((omega - self.omega_min) / (0.1 * self.omega_min), 0.0, 1.0)
+        frac = np.clip((omega - self.omega_25) / (self.omega_rated - self.omega_25), 0.0, 1.0)
+        region25 = self.torque_25_start + (self.torque_rated - self.torque_25_start) * frac
+        region3 = self.p_mech_rated / np.maximum(omega, 1e-6)
+        torque = np.where(omega < self.omega_25, np.minimum(region2, self.torque_rated),
+                          np.where(omega < self.omega_rated, region25, region3))
+        return torque
+
+    def _update_online(self, wind: np.ndarray):
+        """
+        按滤波风速更新并网状态（每秒一次）
+        """
+        if self.wind_filtered is None:
+            self.wind_filtered = wind.astype(float).copy()
+        else:
+            self.wind_filtered += (wind - self.wind_filtered) * self.wind_filter_alpha
+        v = self.wind_filtered
+        self.cut_out |= v >= self.v_cut_out
+        self.cut_out &= ~(v < self.v_restart)
+        self.idle = (v >= self.v_cut_in - self.cut_in_hysteresis) & ~self.cut_out
+        start = ~self.online & (v >= self.v_cut_in) & ~self.cut_out & (self.omega >= 0.95 * self.omega_min)
+        stop = self.online & ((v < self.v_cut_in - self.cut_in_hysteresis) | self.cut_out)
+        self.online = (self.online | start) & ~stop
+
+    def simulate(self, wind_speeds) -> dict:
+        """
+        以 1 Hz 风速驱动闭环模拟，控制回路内对风速线性插值（状态跨调用连续，可分块调用）
+        :param wind_speeds: (n_turbines, n_seconds) 或 (n_seconds,)（所有风机相同风速）
+        :return: {"power_kw", "rpm", "pitch_deg", "torque_knm", "online"}，各为 (n_turbines, n_seconds) 秒平均值
+        """
+        wind = np.asarray(wind_speeds, dtype=float)
+        wind = np.broadcast_to(wind if wind.ndim == 2 else wind[None, :], (self.n_turbines, wind.shape[-1]))
+        n_seconds = wind.shape[1]
+        sub = int(round(self.control_hz))
+        weights = np.arange(sub) / sub
+        out = {name: np.zeros((self.n_turbines, n_seconds), dtype=self.dtype) for name in ("power_kw", "rpm", "pitch_deg", "torque_knm")}
+        out["online"] = np.zeros((self.n_turbines, n_seconds), dtype=bool)
+
+        cp = self.rotor.cp
+        dt, r = self.dt, self.rotor.radius
+        pitch_step = self.pitch_rate * dt
+        brake_step = self.torque_rated * self.brake_fraction / self.inertia * dt
+        for k in range(n_seconds):
+            v0 = wind[:, k]
+            v1 = wind[:, k + 1] if k + 1 < n_seconds else v0
+            self._update_online(v0)
+            online = self.online
+            offline_target = np.where(self.idle, self.omega_min, 0.0)
+            power_sum = np.zeros(self.n_turbines)
+            rpm_sum = np.zeros(self.n_turbines)
+            pitch_sum = np.zeros(self.n_turbines)
+            torque_sum = np.zeros(self.n_turbines)
+            for w in weights:
+                v = v0 + (v1 - v0) * w
+                omega = self.omega
+                lam = omega * r / np.maximum(v, 0.1)
+                aero_torque = self.aero_coeff * v ** 3 * cp(lam, self.pitch) / np.maximum(omega, 0.05 * self.omega_min)
+                gen_torque = np.where(online, self.generator_torque(omega), 0.0)
+
+                # 变桨 PI（相对转速误差），积分抗饱和：命令饱和时不再向饱和方向积分
+                error = (omega - self.omega_rated) / self.omega_rated
+                command = self.kp * error + self.ki * self.integral
+                saturated = ((command <= 0.0) & (error < 0)) | ((command >= self.pitch_max) & (error > 0))
+                self.integral = np.where(saturated, self.integral, self.integral + error * dt)
+                command = np.where(online, np.clip(command, 0.0, self.pitch_max), self.pitch_max)
+                self.pitch = self.pitch + np.clip(command - self.pitch, -pitch_step, pitch_step)
+                self.integral = np.where(online, self.integral, self.pitch_max / self.ki)
+
+                # 并网：转子动力学欧拉积分；停机：以制动/起转加速度趋向空转转速（或 0）
+                omega_online = omega + (aero_torque - gen_torque) / self.inertia * dt
+                omega_offline = omega + np.clip(offline_target - omega, -brake_step, brake_step)
+                self.omega = np.maximum(np.where(online, omega_online, omega_offline), 0.0)
+
+                power_sum += gen_torque * omega
+                rpm_sum += omega
+                pitch_sum += self.pitch
+                torque_sum += gen_torque
+            out["power_kw"][:, k] = power_sum / sub * self.efficiency / 1000.0
+            out["rpm"][:, k] = rpm_sum / sub * 60.0 / (2.0 * np.pi)
+            out["pitch_deg"][:, k] = pitch_sum / sub
+            out["torque_knm"][:, k] = torque_sum / sub / 1000.0
+            out["online"][:, k] = online
+        return out
@@ -0,0 +1,195 @@
+"""
+气动转子模型：基于 Cp(λ, β) 曲面由风速同时求出功率与转速。
+
+- Cp 曲面采用 Heier 经验公式，预先在 (λ, β) 网格上制成查找表，运行时对整段数组做双线性插值；
+- 额定风速以上通过桨距角 β 限制功率，所需 β 由预先制成的反查表 β(λ, Cp) 插值得到；
+- 查找表与网格参数一一对应并由 lru_cache 缓存，所有风机（无论型号）共享同一份表；
+  同一型号的 RotorModel 实例可通过 RotorModel.shared 复用。
+
+运行区域（准稳态控制）：
+- v < v_in 或 v ≥ v_out：停机，功率 0，转速为 rpm_min；
+- 区域 2：转速跟踪最优叶尖速比 λ*，受 [rpm_min, rpm_rated] 限制，β = 0；
+- 区域 3：转速为 rpm_rated，变桨使气动功率等于额定功率。
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+# Heier 经验公式系数 (c1..c6)
+HEIER_COEFFS = (0.5176, 116.0, 0.4, 5.0, 21.0, 0.0068)
+AIR_DENSITY = 1.225  # kg/m³
+
+
+def heier_cp(tip_speed_ratio, pitch_deg, coeffs=HEIER_COEFFS) -> np.ndarray:
+    """
+    Heier 经验公式：
+    1/λi = 1/(λ + 0.08β) - 0.035/(β³ + 1)
+    Cp = c1 (c2/λi - c3 β - c4) exp(-c5/λi) + c6 λ
+    :param tip_speed_ratio: 叶尖速比 λ
+    :param pitch_deg: 桨距角 β（度）
+    :return: 风能利用系数 Cp（截断为非负）
+    """
+    c1, c2, c3, c4, c5, c6 = coeffs
+    lam = np.asarray(tip_speed_ratio, dtype=float)
+    beta = np.asarray(pitch_deg, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inv_lambda_i = 1.0 / (lam + 0.08 * beta) - 0.035 / (beta ** 3 + 1.0)
+        cp = c1 * (c2 * inv_lambda_i - c3 * beta - c4) * np.exp(-c5 * inv_lambda_i) + c6 * lam
+    return np.where(lam > 0, np.maximum(np.nan_to_num(cp), 0.0), 0.0)
+
+
+class LookupTable2D:
+    """
+    规则网格上的二维查找表，对整段数组做双线性插值（超出网格时取边界值）
+    """
+
+    def __init__(self, x_grid: np.ndarray, y_grid: np.ndarray, values: np.ndarray):
+        """
+        :param x_grid: 等间距的第一维网格
+        :param y_grid: 等间距的第二维网格
+        :param values: (len(x_grid), len(y_grid)) 表值
+        """
+        self.x0, self.dx, self.nx = float(x_grid[0]), float(x_grid[1] - x_grid[0]), len(x_grid)
+        self.y0, self.dy, self.ny = float(y_grid[0]), float(y_grid[1] - y_grid[0]), len(y_grid)
+        self.values = np.ascontiguousarray(values, dtype=float)
+        self.values.setflags(write=False)
+        self._flat = self.values.ravel()
+
+    def __call__(self, x, y) -> np.ndarray:
+        fx = np.clip((np.asarray(x, dtype=float) - self.x0) / self.dx, 0.0, self.nx - 1.0)
+        fy = np.clip((np.asarray(y, dtype=float) - self.y0) / self.dy, 0.0, self.ny - 1.0)
+        ix = np.minimum(fx.astype(np.intp), self.nx - 2)
+        iy = np.minimum(fy.astype(np.intp), self.ny - 2)
+        tx, ty = fx - ix, fy - iy
+        base = ix * self.ny + iy
+        v00, v01 = self._flat[base], self._flat[base + 1]
+        v10, v11 = self._flat[base + self.ny], self._flat[base + self.ny + 1]
+        return (v00 + (v10 - v00) * tx) * (1.0 - ty) + (v01 + (v11 - v01) * tx) * ty
+
+
+@lru_cache(maxsize=None)
+def cp_table(lambda_max: float = 16.0, beta_max: float = 45.0, n_lambda: int = 321, n_beta: int = 451) -> LookupTable2D:
+    """
+    Cp(λ, β) 查找表（按网格参数缓存，全局共享）
+    """
+    lam = np.linspace(0.0, lambda_max, n_lambda)
+    beta = np.linspace(0.0, beta_max, n_beta)
+    return LookupTable2D(lam, beta, heier_cp(lam[:, None], beta[None, :]))
+
+
+@lru_cache(maxsize=None)
+def pitch_table(lambda_max: float = 16.0, beta_max: float = 45.0, n_lambda: int = 321, n_beta: int = 451,
+                n_cp: int = 241) -> LookupTable2D:
+    """
+    反查表 β(λ, Cp)：给定叶尖速比与目标 Cp，求所需的最小桨距角（按网格参数缓存，全局共享）
+    """
+    lam = np.linspace(0.0, lambda_max, n_lambda)
+    beta = np.linspace(0.0, beta_max, n_beta)
+    cp_max = 0.6
+    cp_grid = np.linspace(0.0, cp_max, n_cp)
+    # 沿 β 取单调不增包络，保证反查唯一
+    surface = np.minimum.accumulate(heier_cp(lam[:, None], beta[None, :]), axis=1)
+    values = np.empty((n_lambda, n_cp))
+    for i in range(n_lambda):
+        values[i] = np.interp(cp_grid, surface[i, ::-1], beta[::-1], left=beta_max, right=0.0)
+    return LookupTable2D(lam, cp_grid, values)
+
+
+class RotorModel:
+    """
+    气动转子模型：由风速得到同一气动状态下的功率、转速、λ、β 与 Cp
+    """
+
+    def __init__(
+        self,
+        rotor_diameter: float,
+        p_rated: float,
+        rpm_min: float,
+        rpm_rated: float,
+        v_in: float = 3.0,
+        v_out: float = 25.0,
+        efficiency: float = 0.94,
+        air_density: float = AIR_DENSITY,
+    ):
+        """
+        :param rotor_diameter: 叶轮直径 (m)
+        :param p_rated: 额定电功率 (kW)
+        :param rpm_min: 最低运行转速 (rpm)
+        :param rpm_rated: 额定转速 (rpm)
+        :param v_in: 切入风速 (m/s)
+        :param v_out: 切出风速 (m/s)
+        :param efficiency: 传动链与发电机总效率
+        :param air_density: 空气密度 (kg/m³)
+        """
+        self.radius = rotor_diameter / 2.0
+        self.p_rated = p_rated
+        self.rpm_min = rpm_min
+        self.rpm_rated = rpm_rated
+        self.v_in = v_in
+        self.v_out = v_out
+        self.efficiency = efficiency
+        self.air_density = air_density
+
+        self.cp = cp_table()
+        self.pitch = pitch_table()
+        lam = np.linspace(0.0, 16.0, 1601)
+        cp0 = heier_cp(lam, 0.0)
+        self.lambda_opt = float(lam[np.argmax(cp0)])
+        self.cp_max = float(cp0.max())
+        # 单位换算：转速 (rpm) → 角速度 (rad/s)；功率系数 0.5ρA·η，单位 kW/(m/s)³
+        self._rpm_to_omega = 2.0 * np.pi / 60.0
+        self._power_coeff = 0.5 * air_density * np.pi * self.radius ** 2 * efficiency / 1000.0
+
+    @classmethod
+    def from_config(cls, config, **kwargs) -> "RotorModel":
+        """
+        由 TurbineConfig（需包含 rotor_diameter）创建，同型号共享实例
+        """
+        if config.rotor_diameter is None:
+            raise ValueError("风机配置缺少叶轮直径，无法创建气动转子模型")
+        return cls.shared(config.rotor_diameter, config.p_rated, config.rpm_min, config.rpm_rated,
+                          config.v_in, config.v_out, **kwargs)
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def shared(cls, *args, **kwargs) -> "RotorModel":
+        """
+        按参数缓存的共享实例（同一型号的多台风机复用同一个模型）
+        """
+        return cls(*args, **kwargs)
+
+    def operating_point(self, wind_speeds) -> dict:
+        """
+        计算准稳态运行点
+        :param wind_speeds: 风速数组 (m/s)
+        :return: {"power_kw", "rpm", "tip_speed_ratio", "pitch_deg", "cp"}，形状与输入相同
+        """
+        v = np.asarray(wind_speeds, dtype=float)
+        running = (v >= self.v_in) & (v < self.v_out)
+        v_safe = np.where(running, v, 1.0)
+        available = self._power_coeff * v_safe ** 3
+
+        # 区域 2：跟踪最优叶尖速比，转速限幅
+        omega = np.clip(self.lambda_opt * v_safe / self.radius,
+                        self.rpm_min * self._rpm_to_omega, self.rpm_rated * self._rpm_to_omega)
+        lam = omega * self.radius / v_safe
+        cp = self.cp(lam, 0.0)
+        pitch = np.zeros_like(v_safe)
+
+        # 区域 3：气动功率超过额定时变桨
+        above = available * cp > self.p_rated
+        if above.any():
+            cp_required = self.p_rated / available[above]
+            pitch[above] = self.pitch(lam[above], cp_required)
+            cp[above] = self.cp(lam[above], pitch[above])
+
+        power = np.minimum(available * cp, self.p_rated)
+        rpm = omega / self._rpm_to_omega
+        return {
+            "power_kw": np.where(running, power, 0.0),
+            "rpm": np.where(running, rpm, self.rpm_min),
+            "tip_speed_ratio": np.where(running, lam, 0.0),
+            "pitch_deg": np.where(running, pitch, 0.0),
+            "cp": np.where(running, cp, 0.0),
+        }
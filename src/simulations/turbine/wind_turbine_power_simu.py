@@ -1,5 +1,7 @@
 import numpy as np
 
+from ..backends import broadcast_input, get_backend, last_column
+
 class WindTurbinePowerSimulator:
     """
     风机功率和转速模拟器
@@ -9,6 +11,7 @@ class WindTurbinePowerSimulator:
     - v_in ~ v_rated  : P 按三次多项式平滑上升到额定功率
     - v_rated ~ v_out : P = P_rated
     - v > v_out       : P = 0
+    设置 v_restart 时带切出滞环：风速达到 v_out 切出后，须降到 v_restart 以下才重新并网
     """
     def __init__(
         self,
@@ -24,6 +27,10 @@ class WindTurbinePowerSimulator:
         # 转动惯性参数
         time_constant: float = 10.0,  # 时间常数 (s) 越小惯性越小，越大惯性越大
         max_ramp_rate: float = 50.0,  # 最大斜坡率 (kW/s) 功率变化率限制
+        rng=None,  # numpy 随机数生成器（如 np.random.default_rng(seed)），默认使用全局 np.random
+        rotor_model=None,  # 气动转子模型（RotorModel），传入时功率曲线与转速由 Cp(λ, β) 求得
+        dtype=np.float64,  # 输出数组的数据类型（float32 可使内存减半，见 simulations.precision）
+        v_restart: float | None = None,  # 切出后重新并网的风速 (m/s)，None 表示无滞环（风速回落到 v_out 以下即并网）
     ):
         self.v_in = v_in
         self.v_rated = v_rated
@@ -38,6 +45,10 @@ class WindTurbinePowerSimulator:
         # 转动惯性参数
         self.time_constant = time_constant
         self.max_ramp_rate = max_ramp_rate
+        self.rng = rng if rng is not None else np.random
+        self.rotor_model = rotor_model
+        self.dtype = np.dtype(dtype)
+        self.v_restart = v_restart
 
     def _power_curve_ideal(self, v: float) -> float:
         """
@@ -54,65 +65,120 @@ class WindTurbinePowerSimulator:
             return y * self.p_rated
         return self.p_rated
 
-    def power_from_speed(self, wind_speeds: np.ndarray) -> np.ndarray:
+    def _power_curve_ideal_array(self, v: np.ndarray) -> np.ndarray:
+        """
+        _power_curve_ideal 的数组版本（逐元素，无 Python 循环）；配置了气动转子模型时使用其功率曲线
+        """
+        if self.rotor_model is not None:
+            return self.rotor_model.operating_point(v)["power_kw"]
+        v = np.asarray(v, dtype=float)
+        x = np.clip((v - self.v_in) / (self.v_rated - self.v_in), 0.0, 1.0)
+        power = (3 * x**2 - 2 * x**3) * self.p_rated
+        return np.where((v < self.v_in) | (v >= self.v_out), 0.0, power)
+
+    def _cut_out_latch(self, wind_speeds: np.ndarray, initial: bool = False) -> np.ndarray:
+        """
+        切出滞环状态（向量化，沿最后一维）：达到 v_out 时置位，低于 v_restart 时复位
+        :param initial: 上一段末尾是否处于切出状态（二维输入时可为每行一个）
+        :return: 逐点的切出状态（布尔数组）
+        """
+        v = np.asarray(wind_speeds)
+        if self.v_restart is None:
+            return v >= self.v_out
+        index = np.arange(v.shape[-1])
+        last_set = np.maximum.accumulate(np.where(v >= self.v_out, index, -1), axis=-1)
+        last_reset = np.maximum.accumulate(np.where(v < self.v_restart, index, -1), axis=-1)
+        initial = np.asarray(initial, dtype=bool)
+        if initial.ndim:
+            initial = initial[..., None]
+        return (last_set > last_reset) | (initial & (last_reset < 0))
+
+    def power_from_speed(self, wind_speeds: np.ndarray, initial_state: tuple | None = None,
+                         return_state: bool = False):
         """
         根据风速序列计算功率序列（带转动惯性和斜坡率限制）
         :param wind_speeds: numpy 数组，单位 m/s
-        :return: 功率序列，单位 kW
+        :param initial_state: 上一段末尾的 (惯性滤波输出, 斜坡限制输出[, 切出状态])，用于分段连续模拟；默认从首个理想功率起步
+        :param return_state: 为 True 时同时返回本段末尾状态，可作为下一段的 initial_state
+        :return: 功率序列，单位 kW；return_state=True 时为 (功率序列, 末尾状态)
         """
         wind_speeds = np.asarray(wind_speeds)
+        cut_out_init = bool(initial_state[2]) if initial_state is not None and len(initial_state) > 2 else False
+        cut_out = self._cut_out_latch(wind_speeds, cut_out_init)
         # 计算理想功率
-        ideal_power = np.vectorize(self._power_curve_ideal)(wind_speeds)
+        ideal_power = np.where(cut_out, 0.0, self._power_curve_ideal_array(wind_speeds))
+        result = self._dynamic_power(ideal_power, initial_state, return_state)
+        if return_state:
+            power, state = result
+            if state is not None:
+                state = (*state[:2], bool(cut_out[-1]) if len(cut_out) else cut_out_init)
+            return power, state
+        return result
 
+    def _dynamic_power(self, ideal_power: np.ndarray, initial_state=None, return_state: bool = False):
+        """
+        理想功率 → 惯性滤波 → 斜坡率限制 → 噪声
+        """
         # 应用转动惯性滤波（一阶延迟系统）
         # P(n) = P(n-1) + (P_ideal(n) - P(n-1)) * (dt / (tau + dt))
         # 当 dt << tau 时，功率变化缓慢；当 dt >> tau 时，立即响应
-        power_filtered = self._apply_inertia_filter(ideal_power)
+        filter_init, ramp_init = initial_state[:2] if initial_state is not None else (None, None)
+        power_filtered = self._apply_inertia_filter(ideal_power, filter_init)
 
         # 应用斜坡率限制（防止功率变化过快）
-        power_limited = self._apply_ramp_rate_limit(power_filtered)
+        power_limited = self._apply_ramp_rate_limit(power_filtered, ramp_init)
 
         # 添加相对较小的噪声（在平滑后），但仅当有实际功率时
         # 风速不足时（功率=0）不应添加噪声，避免虚假功率
-        noise = np.random.normal(0, self.noise_sigma * self.p_rated, size=power_limited.shape)
+        noise = self.rng.normal(0, self.noise_sigma * self.p_rated, size=power_limited.shape)
         # 只对理想功率大于0的点添加噪声，否则保持0
         noise = np.where(ideal_power > 0, noise, 0)
         power = power_limited + noise
         
         # 功率不能为负，确保物理意义
-        return np.maximum(0.0, power)
+        power = np.maximum(0.0, power).astype(self.dtype, copy=False)
+        if return_state:
+            state = (float(power_filtered[-1]), float(power_limited[-1])) if len(power) else initial_state
+            return power, state
+        return power
 
-    def _apply_inertia_filter(self, ideal_power: np.ndarray) -> np.ndarray:
+    def _apply_inertia_filter(self, ideal_power: np.ndarray, initial: float | None = None) -> np.ndarray:
         """
         应用一阶低通滤波器模拟风机的转动惯性
         使用递推公式：y(n) = y(n-1) + (x(n) - y(n-1)) * alpha
         其中 alpha = dt / (tau + dt), tau 为时间常数
         
         假设采样间隔 dt = 1 秒
+        :param initial: 上一时刻的滤波输出，默认以首个输入作为起点
         """
         dt = 1.0  # 假设秒级采样
         alpha = dt / (self.time_constant + dt)
         
-        filtered = np.zeros_like(ideal_power)
-        filtered[0] = ideal_power[0]
+        filtered = np.zeros_like(ideal_power, dtype=self.dtype)
+        if len(ideal_power) == 0:
+            return filtered
+        filtered[0] = ideal_power[0] if initial is None else initial + (ideal_power[0] - initial) * alpha
         
         for i in range(1, len(ideal_power)):
             filtered[i] = filtered[i-1] + (ideal_power[i] - filtered[i-1]) * alpha
         
         return filtered
 
-    def _apply_ramp_rate_limit(self, power: np.ndarray) -> np.ndarray:
+    def _apply_ramp_rate_limit(self, power: np.ndarray, initial: float | None = None) -> np.ndarray:
         """
         应用功率变化率限制（斜坡率限制）
         防止功率在相邻时刻变化超过最大斜坡率
         
         假设采样间隔 dt = 1 秒
+        :param initial: 上一时刻的限制后功率，默认以首个输入作为起点
         """
         dt = 1.0  # 秒级采样
         max_delta = self.max_ramp_rate * dt  # 单步最大变化量
         
-        limited = np.zeros_like(power)
-        limited[0] = power[0]
+        limited = np.zeros_like(power, dtype=self.dtype)
+        if len(power) == 0:
+            return limited
+        limited[0] = power[0] if initial is None else initial + np.clip(power[0] - initial, -max_delta, max_delta)
         
         for i in range(1, len(power)):
             delta = power[i] - limited[i-1]
@@ -132,10 +198,82 @@ class WindTurbinePowerSimulator:
         ideal_rpm = np.clip((power / self.p_rated) * self.rpm_rated, self.rpm_min, self.rpm_rated)
         
         # 生成噪声，但仅在有功率输出时才应用
-        noise = np.random.normal(0, self.rpm_noise_sigma, size=ideal_rpm.shape)
+        noise = self.rng.normal(0, self.rpm_noise_sigma, size=ideal_rpm.shape)
         # 只有当功率 > 0 时才添加噪声，否则转速应直接降至最小值
         noise = np.where(power > 0, noise, 0)
         rpm = ideal_rpm + noise
         
         # 转速必须在有效范围内
-        return np.clip(rpm, self.rpm_min, self.rpm_rated)
\ No newline at end of file
+        return np.clip(rpm, self.rpm_min, self.rpm_rated).astype(self.dtype, copy=False)
+
+    def power_and_rpm_from_speed(self, wind_speeds: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        根据风速序列计算功率与转速序列
+        配置了气动转子模型时，功率与转速来自同一气动运行点，转速经一阶惯性滤波模拟转子惯量；
+        否则等价于 power_from_speed 后接 rpm_from_power。
+        :param wind_speeds: numpy 数组，单位 m/s
+        :return: (功率序列 kW, 转速序列 rpm)
+        """
+        if self.rotor_model is None:
+            power = self.power_from_speed(wind_speeds)
+            return power, self.rpm_from_power(power)
+
+        point = self.rotor_model.operating_point(wind_speeds)
+        cut_out = self._cut_out_latch(wind_speeds)
+        ideal_power = np.where(cut_out, 0.0, point["power_kw"])
+        power = self._dynamic_power(ideal_power)
+        rpm = self._apply_inertia_filter(np.where(cut_out, self.rpm_min, point["rpm"]))
+        noise = self.rng.normal(0, self.rpm_noise_sigma, size=rpm.shape)
+        noise = np.where(ideal_power > 0, noise, 0)
+        return power, np.clip(rpm + noise, self.rpm_min, self.rpm_rated).astype(self.dtype, copy=False)
+
+    def init_state(self, n_units: int) -> dict:
+        """
+        批量状态：惯性滤波输出、斜坡限制输出、转速滤波输出（NaN 表示以首个输入起步）与切出状态
+        """
+        return {
+            "filtered": np.full(n_units, np.nan),
+            "limited": np.full(n_units, np.nan),
+            "rpm_filtered": np.full(n_units, np.nan),
+            "cut_out": np.zeros(n_units, dtype=bool),
+        }
+
+    def advance(self, state: dict, inputs: dict, n: int = 1) -> tuple[dict, dict]:
+        """
+        批量推进 n 秒（惯性滤波与斜坡率限制由当前计算后端执行，见 simulations.backends），
+        规则与 power_and_rpm_from_speed 相同，状态跨调用连续
+        :param state: init_state 返回的状态
+        :param inputs: {"wind_speed": (n_units, n) 或 (n,)}
+        :param n: 步数（秒）
+        :return: (新状态, {"power_kw", "rpm"}，各为 (n_units, n))
+        """
+        backend = get_backend()
+        m = len(state["cut_out"])
+        v = broadcast_input(inputs["wind_speed"], m, n)
+        cut_out = self._cut_out_latch(v, state["cut_out"])
+        point = self.rotor_model.operating_point(v) if self.rotor_model is not None else None
+        ideal_power = np.where(cut_out, 0.0, point["power_kw"] if point is not None else self._power_curve_ideal_array(v))
+
+        filtered = backend.first_order_filter(state["filtered"], ideal_power, 1.0 / (self.time_constant + 1.0))
+        limited = backend.ramp_limit(state["limited"], filtered, self.max_ramp_rate)
+        noise = np.where(ideal_power > 0, self.rng.normal(0, self.noise_sigma * self.p_rated, size=(m, n)), 0.0)
+        power = np.maximum(limited + noise, 0.0)
+
+        if point is not None:
+            rpm_filtered = backend.first_order_filter(state["rpm_filtered"], np.where(cut_out, self.rpm_min, point["rpm"]),
+                                                      1.0 / (self.time_constant + 1.0))
+            running = ideal_power > 0
+        else:
+            rpm_filtered = np.clip(power / self.p_rated * self.rpm_rated, self.rpm_min, self.rpm_rated)
+            running = power > 0
+        rpm_noise = np.where(running, self.rng.normal(0, self.rpm_noise_sigma, size=(m, n)), 0.0)
+        rpm = np.clip(rpm_filtered + rpm_noise, self.rpm_min, self.rpm_rated)
+
+        new_state = {
+            "filtered": last_column(filtered, state["filtered"]),
+            "limited": last_column(limited, state["limited"]),
+            "rpm_filtered": last_column(rpm_filtered, state["rpm_filtered"]) if point is not None else state["rpm_filtered"].copy(),
+            "cut_out": last_column(cut_out, state["cut_out"]),
+        }
+        return new_state, {"power_kw": power.astype(self.dtype, copy=False), "rpm": rpm.astype(self.dtype, copy=False)}
+
@@ -0,0 +1,169 @@
+"""
+IEC 61400-1 极端风况事件库：极端运行阵风 EOG、极端风向变化 EDC、带风向变化的极端相干阵风 ECD。
+
+OU 风速过程不会产生这类相干的极端事件。这里按泊松过程安排事件发生时刻，再把各事件的时间模板
+一次性叠加到整段风速/风向数组上（np.add.at），不进入逐步模拟循环，开销只与事件数 × 模板长度有关。
+事件幅值按 IEC 公式由事件开始时的风速 V_hub 计算：
+
+- 纵向湍流标准差 σ1 = I_ref (0.75 V_hub + 5.6)，湍流尺度 Λ1 = 0.7 z_hub（z_hub < 60 m）或 42 m；
+- EOG：V_gust = min(1.35 (V_e1 - V_hub), 3.3 σ1 / (1 + 0.1 D/Λ1))，V_e1 = 0.8 × 1.4 V_ref，
+  V(t) = V_hub - 0.37 V_gust sin(3πt/T) (1 - cos(2πt/T))，T = 10.5 s；
+- EDC：θ_e = ±4 arctan(σ1 / (V_hub (1 + 0.1 D/Λ1)))，θ(t) = 0.5 θ_e (1 - cos(πt/T))，T = 6 s；
+- ECD：V_cg = 15 m/s，V(t) = V_hub + 0.5 V_cg (1 - cos(πt/T))，同时风向变化 θ_cg = 720/V_hub 度
+  （V_hub < 4 m/s 时为 180°），T = 10 s。
+
+IEC 中 EDC/ECD 变化后保持不变；连续模拟中改为保持 hold 秒后按同样的余弦过渡恢复，模板因此有限长。
+分块调用时，跨越块边界的事件尾部会叠加到下一块的开头。
+"""
+
+import numpy as np
+
+EVENT_TYPES = ("eog", "edc", "ecd")
+# IEC 风机等级 → 参考风速 V_ref (m/s)；湍流等级 → I_ref
+IEC_V_REF = {"I": 50.0, "II": 42.5, "III": 37.5}
+IEC_I_REF = {"A+": 0.18, "A": 0.16, "B": 0.14, "C": 0.12}
+SECONDS_PER_YEAR = 365.0 * 24.0 * 3600.0
+
+# 默认年发生次数
+DEFAULT_RATES = {"eog": 50.0, "edc": 20.0, "ecd": 5.0}
+
+
+def _cosine_step(t: np.ndarray, period: float, hold: float) -> np.ndarray:
+    """
+    0 → 1（半余弦，period 秒）→ 保持 hold 秒 → 1 → 0（半余弦）
+    """
+    rise = 0.5 * (1.0 - np.cos(np.pi * np.clip(t / period, 0.0, 1.0)))
+    fall = 0.5 * (1.0 - np.cos(np.pi * np.clip((t - period - hold) / period, 0.0, 1.0)))
+    return rise - fall
+
+
+class ExtremeEventGenerator:
+    """
+    极端风况事件发生器
+
+        events = ExtremeEventGenerator(dt=1.0, rng=np.random.default_rng(0))
+        speeds, dirs = events.apply(speeds, dirs)     # 返回叠加事件后的新数组
+        events.last_events                            # 本次叠加的事件（类型、起始步、幅值）
+    """
+
+    def __init__(
+        self,
+        dt: float = 1.0,
+        rates: dict | None = None,
+        turbine_class: str = "II",
+        turbulence_class: str = "B",
+        rotor_diameter: float = 0.0,
+        hub_height: float | None = None,
+        hold: float = 60.0,
+        rng=None,
+    ):
+        """
+        :param dt: 风速序列的时间步长（秒）
+        :param rates: 事件类型 → 年发生次数（泊松过程强度），默认 DEFAULT_RATES
+        :param turbine_class: IEC 风机等级 "I"/"II"/"III"（决定 V_ref）
+        :param turbulence_class: IEC 湍流等级 "A+"/"A"/"B"/"C"（决定 I_ref）
+        :param rotor_diameter: 叶轮直径 D (m)，0 表示忽略 D/Λ1 修正
+        :param hub_height: 轮毂高度 (m)，None 视为不低于 60 m
+        :param hold: EDC/ECD 变化后的保持时间（秒）
+        :param rng: numpy 随机数生成器，默认使用全局 np.random
+        """
+        rates = DEFAULT_RATES if rates is None else rates
+        unknown = set(rates) - set(EVENT_TYPES)
+        if unknown:
+            raise ValueError(f"不支持的事件类型: {sorted(unknown)}（可选: {', '.join(EVENT_TYPES)}）")
+        if turbine_class not in IEC_V_REF or turbulence_class not in IEC_I_REF:
+            raise ValueError(f"不支持的 IEC 等级: {turbine_class}{turbulence_class}")
+        self.dt = dt
+        self.rates = dict(rates)
+        self.v_ref = IEC_V_REF[turbine_class]
+        self.i_ref = IEC_I_REF[turbulence_class]
+        self.v_e1 = 0.8 * 1.4 * self.v_ref
+        scale = 42.0 if hub_height is None or hub_height >= 60.0 else 0.7 * hub_height
+        self.size_factor = 1.0 + 0.1 * rotor_diameter / scale
+        self.hold = hold
+        self.rng = rng if rng is not None else np.random
+
+        # 单位幅值的时间模板（按 dt 采样）
+        t_eog = np.arange(0.0, 10.5, dt)
+        t_edc = np.arange(0.0, 2 * 6.0 + hold + dt, dt)
+        t_ecd = np.arange(0.0, 2 * 10.0 + hold + dt, dt)
+        self.templates = {
+            "eog": -0.37 * np.sin(3 * np.pi * t_eog / 10.5) * (1 - np.cos(2 * np.pi * t_eog / 10.5)),
+            "edc": _cosine_step(t_edc, 6.0, hold),
+            "ecd": _cosine_step(t_ecd, 10.0, hold),
+        }
+        self.max_length = max(len(t) for t in self.templates.values())
+        self._carry = (np.zeros(0), np.zeros(0))
+        self.last_events = []
+
+    def sigma1(self, v_hub):
+        """
+        正常湍流模型下的纵向湍流标准差
+        """
+        return self.i_ref * (0.75 * np.asarray(v_hub, dtype=float) + 5.6)
+
+    def amplitudes(self, event_type: str, v_hub: np.ndarray, sign: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        各事件的 (风速幅值, 风向幅值[度])，与对应的单位模板相乘
+        """
+        v_hub = np.maximum(np.asarray(v_hub, dtype=float), 0.1)
+        sigma1 = self.sigma1(v_hub)
+        zeros = np.zeros_like(v_hub)
+        if event_type == "eog":
+            v_gust = np.minimum(1.35 * np.maximum(self.v_e1 - v_hub, 0.0), 3.3 * sigma1 / self.size_factor)
+            return v_gust, zeros
+        if event_type == "edc":
+            theta = np.minimum(np.rad2deg(4.0 * np.arctan(sigma1 / (v_hub * self.size_factor))), 180.0)
+            return zeros, sign * theta
+        theta = np.where(v_hub < 4.0, 180.0, 720.0 / v_hub)
+        return np.full_like(v_hub, 15.0), sign * theta
+
+    def schedule(self, n_steps: int) -> list[tuple[str, np.ndarray]]:
+        """
+        按泊松过程安排 n_steps 步内的事件
+        :return: [(事件类型, 起始步下标数组)]
+        """
+        duration = n_steps * self.dt
+        schedule = []
+        for event_type in EVENT_TYPES:
+            rate = self.rates.get(event_type, 0.0)
+            count = self.rng.poisson(rate * duration / SECONDS_PER_YEAR) if rate > 0 else 0
+            starts = np.sort((self.rng.random(count) * n_steps).astype(np.intp))
+            schedule.append((event_type, starts))
+        return schedule
+
+    def apply(self, wind_speeds, wind_dirs) -> tuple[np.ndarray, np.ndarray]:
+        """
+        在一段风速/风向序列上叠加本段发生的事件（以及上一段跨界事件的尾部）
+        :param wind_speeds: 风速序列 (m/s)
+        :param wind_dirs: 风向序列（度）
+        :return: (叠加后的风速, 叠加后的风向)，风速截断为非负，风向归一化到 [-180, 180)
+        """
+        speeds = np.asarray(wind_speeds)
+        dirs = np.asarray(wind_dirs)
+        if speeds.dtype.kind != "f":
+            speeds, dirs = speeds.astype(float), dirs.astype(float)
+        n = len(speeds)
+        speed_overlay = np.zeros(n + self.max_length)
+        dir_overlay = np.zeros(n + self.max_length)
+        carry_speed, carry_dir = self._carry
+        speed_overlay[:len(carry_speed)] += carry_speed
+        dir_overlay[:len(carry_dir)] += carry_dir
+
+        self.last_events = []
+        for event_type, starts in self.schedule(n):
+            if len(starts) == 0:
+                continue
+            template = self.templates[event_type]
+            sign = np.where(self.rng.random(len(starts)) < 0.5, -1.0, 1.0)
+            speed_amp, dir_amp = self.amplitudes(event_type, speeds[starts], sign)
+            index = starts[:, None] + np.arange(len(template))[None, :]
+            np.add.at(speed_overlay, index, speed_amp[:, None] * template[None, :])
+            np.add.at(dir_overlay, index, dir_amp[:, None] * template[None, :])
+            self.last_events.extend(zip([event_type] * len(starts), starts.tolist(), speed_amp.tolist(), dir_amp.tolist()))
+        self.last_events.sort(key=lambda e: e[1])
+        self._carry = (speed_overlay[n:], dir_overlay[n:])
+
+        out_speeds = np.maximum(speeds + speed_overlay[:n], 0.0).astype(speeds.dtype, copy=False)
+        out_dirs = ((dirs + dir_overlay[:n] + 180.0) % 360.0 - 180.0).astype(dirs.dtype, copy=False)
+        return out_speeds, out_dirs
@@ -2,12 +2,35 @@ import numpy as np
 from .wind_speed_simu import WindSpeedSimulator
 
 class WindFieldManager:
-    def __init__(self, wind_speed_simulator: WindSpeedSimulator | None = None):
+    def __init__(self, wind_speed_simulator: WindSpeedSimulator | None = None, replay_source=None, dtype=np.float64,
+                 cache=None, seed: int | None = None, events=None):
         """
         初始化风场管理器
         :param wind_speed_simulator: 风速+风向模拟器实例，不传则使用默认参数创建
+        :param replay_source: 风速回放数据源（如 WindReplaySource），传入时用回放数据代替合成风速
+        :param dtype: 输出数组的数据类型（float32 可使内存减半，见 simulations.precision）
+        :param cache: 风速实现缓存（WindRealizationCache），与 seed 同时传入时从缓存读取/续算风速，不逐步模拟
+        :param seed: 风速实现的随机种子（使用缓存时必填）
+        :param events: 极端风况事件发生器（ExtremeEventGenerator），传入时在每段风速上叠加 EOG/EDC/ECD 事件
         """
+        if cache is not None and seed is None:
+            raise ValueError("使用风速缓存时必须指定随机种子")
         self.wind_speed_simulator = wind_speed_simulator or WindSpeedSimulator()
+        self.replay_source = replay_source
+        self.dtype = np.dtype(dtype)
+        self.cache = cache
+        self.seed = seed
+        self.events = events
+        self.cache_status = None
+        self._cached_steps = 0
+
+    @property
+    def dt(self) -> float:
+        """
+        风速序列的时间步长（秒）
+        """
+        source = self.replay_source or self.wind_speed_simulator
+        return source.dt
 
     def simulate(self, steps: int) -> tuple[np.ndarray, np.ndarray]:
         """
@@ -15,8 +38,24 @@ class WindFieldManager:
         :param steps: 模拟步数
         :return: (风速时间序列, 风向角时间序列)
         """
-        wind_speeds = np.zeros(steps)
-        wind_dirs = np.zeros(steps)
+        wind_speeds, wind_dirs = self._simulate_base(steps)
+        if self.events is not None:
+            wind_speeds, wind_dirs = self.events.apply(wind_speeds, wind_dirs)
+        return wind_speeds, wind_dirs
+
+    def _simulate_base(self, steps: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        回放、缓存或逐步模拟得到的风速和风向角（未叠加极端事件）
+        """
+        if self.replay_source is not None:
+            speeds, dirs = self.replay_source.simulate(steps)
+            return speeds.astype(self.dtype, copy=False), dirs.astype(self.dtype, copy=False)
+
+        if self.cache is not None:
+            return self._simulate_cached(steps)
+
+        wind_speeds = np.zeros(steps, dtype=self.dtype)
+        wind_dirs = np.zeros(steps, dtype=self.dtype)
 
         for i in range(steps):
             speed, direction = self.wind_speed_simulator.step()
@@ -25,9 +64,24 @@ class WindFieldManager:
 
         return wind_speeds, wind_dirs
 
+    def _simulate_cached(self, steps: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        从缓存取出接下来 steps 步（多次调用依次衔接），并同步模拟器的当前状态
+        """
+        end = self._cached_steps + steps
+        speeds, dirs, self.cache_status = self.cache.get(self.wind_speed_simulator, self.seed, end)
+        speeds, dirs = speeds[self._cached_steps:end], dirs[self._cached_steps:end]
+        self._cached_steps = end
+        if steps:
+            self.wind_speed_simulator.wind_speed = float(speeds[-1])
+            self.wind_speed_simulator.wind_dir = float(dirs[-1])
+        return speeds.astype(self.dtype, copy=False), dirs.astype(self.dtype, copy=False)
+
     def get_current_conditions(self) -> tuple[float, float]:
         """
         获取当前风速和风向角
         :return: (当前风速, 当前风向角)
         """
+        if self.replay_source is not None:
+            return self.replay_source.wind_speed, self.replay_source.wind_dir
         return self.wind_speed_simulator.wind_speed, self.wind_speed_simulator.wind_dir
\ No newline at end of file
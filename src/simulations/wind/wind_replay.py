@@ -0,0 +1,247 @@
+"""
+风速回放：用实测 SCADA 风速或之前生成的 wind_second.csv 代替合成风速，驱动风机功率与轴承模型。
+
+- CSV 按块解析（pandas chunksize），.npy 与原始二进制文件用内存映射按块读取，内存占用与文件长度无关；
+- 不规则采样、乱序或重复时间戳统一重采样到模型步长 dt：风速线性插值，
+  风向在单位向量上插值后还原角度，避免 359° → 1° 之间插出 180°；
+- 超过 max_gap 秒的缺测区间按 gap_fill 填充（保持前值或 NaN）。
+"""
+
+import os
+
+import numpy as np
+
+GAP_FILLS = ("hold", "nan", "interp")
+
+
+class WindReplaySource:
+    """
+    风速回放数据源，接口与 WindFieldManager.simulate 一致：
+
+        source = WindReplaySource("wind_second.csv")
+        wind_speeds, wind_dirs = source.simulate(steps=24 * 3600)
+
+    也可用 iter_chunks() 按块遍历整个文件。
+    """
+
+    def __init__(
+        self,
+        path: str,
+        dt: float = 1.0,
+        time_column: str | int | None = "sec_id",
+        speed_column: str | int = "wind_speed",
+        dir_column: str | int | None = "wind_dir",
+        time_scale: float = 1.0,
+        max_gap: float | None = None,
+        gap_fill: str = "hold",
+        chunk_rows: int = 200_000,
+        binary_dtype=np.float64,
+    ):
+        """
+        :param path: 数据文件（.csv、.npy，或其他扩展名视为按行排列的原始二进制）
+        :param dt: 模型时间步长（秒）
+        :param time_column: 时间列（CSV 列名、结构化 npy 字段名或二维数组列号）；
+                            None 表示无时间列，按行号 × time_scale 计时。时间列为字符串时按日期时间解析
+        :param speed_column: 风速列
+        :param dir_column: 风向列（度），None 表示无风向，输出 0
+        :param time_scale: 数值时间列的单位换算（秒/单位）
+        :param max_gap: 相邻有效样本间隔超过该值（秒）视为缺测，None 表示始终插值
+        :param gap_fill: 缺测区间的填充方式："hold"（保持缺测前的值）、"nan" 或 "interp"（照常插值）
+        :param chunk_rows: 每次读取的原始行数
+        :param binary_dtype: 原始二进制文件的数值类型（每行依次为 时间、风速、风向，无时间列时为 风速、风向）
+        """
+        if gap_fill not in GAP_FILLS:
+            raise ValueError(f"不支持的缺测填充方式: {gap_fill!r}（可选: {', '.join(GAP_FILLS)}）")
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        self.path = path
+        self.dt = dt
+        self.time_column = time_column
+        self.speed_column = speed_column
+        self.dir_column = dir_column
+        self.time_scale = time_scale
+        self.max_gap = max_gap
+        self.gap_fill = gap_fill
+        self.chunk_rows = chunk_rows
+        self.binary_dtype = np.dtype(binary_dtype)
+
+        self.wind_speed = np.nan
+        self.wind_dir = np.nan
+        self.gap_steps = 0
+        self._stream = None
+        self._pending = (np.zeros(0), np.zeros(0))
+
+    # ---------- 原始数据读取 ----------
+
+    def _to_seconds(self, column) -> np.ndarray:
+        column = np.asarray(column)
+        if column.dtype.kind in "OUSM":
+            import pandas as pd
+            return pd.to_datetime(column).to_numpy("datetime64[ns]").astype(np.int64) / 1e9
+        return column.astype(np.float64) * self.time_scale
+
+    def _columns(self, block, row0: int, columns: tuple):
+        """
+        从一块原始数据中取出 (时间[秒], 风速, 风向)
+        :param columns: (时间列, 风速列, 风向列)
+        """
+        time_column, speed_column, dir_column = columns
+        speed = np.asarray(block[speed_column], dtype=np.float64)
+        if time_column is None:
+            t = (row0 + np.arange(len(speed))) * self.time_scale
+        else:
+            t = self._to_seconds(block[time_column])
+        if dir_column is None:
+            direction = np.zeros(len(speed))
+        else:
+            direction = np.asarray(block[dir_column], dtype=np.float64)
+        return t, speed, direction
+
+    def _raw_chunks(self):
+        ext = os.path.splitext(self.path)[1].lower()
+        columns = (self.time_column, self.speed_column, self.dir_column)
+        if ext == ".csv":
+            import pandas as pd
+            usecols = [c for c in (self.time_column, self.speed_column, self.dir_column) if c is not None]
+            row0 = 0
+            for frame in pd.read_csv(self.path, usecols=usecols, chunksize=self.chunk_rows):
+                yield self._columns(frame, row0, columns)
+                row0 += len(frame)
+            return
+
+        if ext == ".npy":
+            data = np.load(self.path, mmap_mode="r")
+        else:
+            n_cols = 2 + (self.time_column is not None)
+            data = np.memmap(self.path, dtype=self.binary_dtype, mode="r").reshape(-1, n_cols)
+            columns = (None, 0, 1) if self.time_column is None else (0, 1, 2)
+        for row0 in range(0, len(data), self.chunk_rows):
+            block = np.array(data[row0:row0 + self.chunk_rows])
+            if block.dtype.names is None:
+                block = block.T
+            yield self._columns(block, row0, columns)
+
+    # ---------- 重采样 ----------
+
+    def _resampled_chunks(self):
+        """
+        将原始数据流重采样到 t0 + k·dt 网格，逐块产出 (风速, 风向)
+        """
+        prev = None         # 上一块最后一个有效样本 (t, speed, cos, sin)
+        t0 = None
+        k_next = 0
+        for t, speed, direction in self._raw_chunks():
+            valid = np.isfinite(t) & np.isfinite(speed)
+            t, speed, direction = t[valid], speed[valid], np.nan_to_num(direction[valid])
+            rad = np.deg2rad(direction)
+            c, s = np.cos(rad), np.sin(rad)
+            if prev is not None:
+                t, speed, c, s = (np.concatenate(([p], x)) for p, x in zip(prev, (t, speed, c, s)))
+            if len(t) == 0:
+                continue
+            # 只保留时间严格递增的样本（丢弃乱序与重复时间戳）
+            running_max = np.maximum.accumulate(t)
+            keep = np.concatenate(([True], t[1:] > running_max[:-1]))
+            t, speed, c, s = t[keep], speed[keep], c[keep], s[keep]
+            prev = (t[-1], speed[-1], c[-1], s[-1])
+            if t0 is None:
+                t0 = t[0]
+
+            k_end = int(np.floor((t[-1] - t0) / self.dt + 1e-9))
+            if k_end < k_next:
+                continue
+            grid = t0 + self.dt * np.arange(k_next, k_end + 1)
+            k_next = k_end + 1
+
+            out_speed = np.interp(grid, t, speed)
+            out_c = np.interp(grid, t, c)
+            out_s = np.interp(grid, t, s)
+            out_dir = (np.rad2deg(np.arctan2(out_s, out_c)) + 180.0) % 360.0 - 180.0
+
+            if self.max_gap is not None and self.gap_fill != "interp" and len(t) > 1:
+                right = np.clip(np.searchsorted(t, grid, side="left"), 1, len(t) - 1)
+                left = right - 1
+                in_gap = (t[right] - t[left] > self.max_gap) & (grid > t[left]) & (grid < t[right])
+                if in_gap.any():
+                    self.gap_steps += int(in_gap.sum())
+                    if self.gap_fill == "hold":
+                        out_speed[in_gap] = speed[left[in_gap]]
+                        out_dir[in_gap] = np.rad2deg(np.arctan2(s[left[in_gap]], c[left[in_gap]]))
+                    else:
+                        out_speed[in_gap] = np.nan
+                        out_dir[in_gap] = np.nan
+            yield out_speed, out_dir
+
+    def iter_chunks(self, chunk_steps: int = 3600):
+        """
+        按固定步数遍历剩余数据（最后一块可能不足 chunk_steps）
+        :return: 生成器，产出 (风速序列, 风向序列)
+        """
+        while True:
+            speeds, dirs = self.simulate(chunk_steps)
+            if len(speeds) == 0:
+                return
+            yield speeds, dirs
+
+    def simulate(self, steps: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        读取接下来 steps 个模型步长的风速和风向角（数据耗尽时返回的序列短于 steps）
+        :param steps: 步数
+        :return: (风速时间序列, 风向角时间序列)
+        """
+        if self._stream is None:
+            self._stream = self._resampled_chunks()
+        speeds, dirs = [self._pending[0]], [self._pending[1]]
+        have = len(self._pending[0])
+        while have < steps:
+            try:
+                block = next(self._stream)
+            except StopIteration:
+                break
+            speeds.append(block[0])
+            dirs.append(block[1])
+            have += len(block[0])
+        speeds, dirs = np.concatenate(speeds), np.concatenate(dirs)
+        self._pending = (speeds[steps:], dirs[steps:])
+        speeds, dirs = speeds[:steps], dirs[:steps]
+        if len(speeds):
+            self.wind_speed, self.wind_dir = float(speeds[-1]), float(dirs[-1])
+        return speeds, dirs
+
+
+def replay_chunks(source, turbine_simulator, bearing_temp_simulator=None, bearing_vibration_simulator=None,
+                  ambient_temp=20.0, chunk_minutes: int = 60):
+    """
+    逐块回放：风速 → 风机功率/转速（秒级，惯性与斜坡率状态跨块连续）→ 分钟平均转速 → 轴承温度/振动
+    要求 source.dt = 1 秒。
+    :param source: WindReplaySource（或任何提供 simulate(steps) 的风速源）
+    :param turbine_simulator: WindTurbinePowerSimulator
+    :param ambient_temp: 环境温度（°C），标量
+    :param chunk_minutes: 每块分钟数
+    :return: 生成器，每块产出 {"second": {...}, "minute": {...}}
+    """
+    if getattr(source, "dt", 1.0) != 1.0:
+        raise ValueError("回放驱动风机模型时要求 dt = 1 秒")
+    state = None
+    while True:
+        speeds, dirs = source.simulate(chunk_minutes * 60)
+        n_minutes = len(speeds) // 60
+        if n_minutes == 0:
+            return
+        speeds, dirs = speeds[:n_minutes * 60], dirs[:n_minutes * 60]
+        power, state = turbine_simulator.power_from_speed(speeds, state, return_state=True)
+        rpm = turbine_simulator.rpm_from_power(power)
+        rpm_min = rpm.reshape(n_minutes, 60).mean(axis=1)
+        minute = {
+            "wind_speed_avg": speeds.reshape(n_minutes, 60).mean(axis=1),
+            "power_kw": power.reshape(n_minutes, 60).mean(axis=1),
+            "rpm": rpm_min,
+        }
+        if bearing_temp_simulator is not None:
+            minute["bearing_temp"] = bearing_temp_simulator.simulate(np.full(n_minutes, ambient_temp), rpm_min)
+        if bearing_vibration_simulator is not None:
+            minute["bearing_vibration"] = bearing_vibration_simulator.simulate(rpm_min)
+        yield {
+            "second": {"wind_speed": speeds, "wind_dir": dirs, "power_kw": power, "rpm": rpm},
+            "minute": minute,
+        }
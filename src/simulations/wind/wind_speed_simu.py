@@ -1,8 +1,10 @@
 import numpy as np
+from ..backends import get_backend, last_column
+from ..time_stepping import OUCoefficientCache, check_ou_method, ou_coefficients
 
 class WindSpeedSimulator:
     def __init__(self, tau=5.0, sigma=2.0, dt=0.1, mean_wind=10.0,
-                 tau_dir=30.0, sigma_dir=5.0, mean_dir=0.0):
+                 tau_dir=30.0, sigma_dir=5.0, mean_dir=0.0, method="euler", rng=None):
         """
         初始化风速模拟器
         :param tau: 一阶惯性时间常数（风速）
@@ -12,6 +14,8 @@ class WindSpeedSimulator:
         :param tau_dir: 一阶惯性时间常数（风向角）
         :param sigma_dir: 随机扰动强度（风向角，单位：度）
         :param mean_dir: 平均风向角（单位：度，可理解为主风向）
+        :param method: OU 离散化方法，"euler"（Euler–Maruyama）或 "exact"（精确转移，任意 dt 均准确）
+        :param rng: numpy 随机数生成器（如 np.random.default_rng(seed)），默认使用全局 np.random
         """
         self.tau = tau
         self.sigma = sigma
@@ -22,6 +26,10 @@ class WindSpeedSimulator:
         self.tau_dir = tau_dir
         self.sigma_dir = sigma_dir
         self.mean_dir = mean_dir
+        self.method = check_ou_method(method)
+        self.rng = rng if rng is not None else np.random
+        self._ou_speed = OUCoefficientCache()
+        self._ou_dir = OUCoefficientCache()
 
         # 状态初始化
         self.wind_speed = mean_wind
@@ -32,11 +40,10 @@ class WindSpeedSimulator:
         模拟单步风速（Ornstein–Uhlenbeck 过程）
         dW = -(W - μ)/τ × dt + σ × √dt × N(0,1)
         """
-        dw = - (self.wind_speed - self.mean_wind) / self.tau * self.dt
-        dw += self.sigma * np.sqrt(self.dt) * np.random.normal()
-        self.wind_speed += dw
+        a, s = self._ou_speed(self.tau, self.sigma, self.dt, self.method)
+        speed = self.mean_wind + a * (self.wind_speed - self.mean_wind) + s * self.rng.normal()
         # 风速不能为负，确保物理意义
-        self.wind_speed = max(0.0, self.wind_speed)
+        self.wind_speed = speed if speed > 0.0 else 0.0
         return self.wind_speed
 
     def _wrap_angle(self, angle_deg):
@@ -54,8 +61,8 @@ class WindSpeedSimulator:
         # 差值按最小角度差来算（考虑绕圈）
         diff = self._wrap_angle(self.wind_dir - self.mean_dir)
 
-        dtheta = - diff / self.tau_dir * self.dt
-        dtheta += self.sigma_dir * np.sqrt(self.dt) * np.random.normal()
+        a, s = self._ou_dir(self.tau_dir, self.sigma_dir, self.dt, self.method)
+        dtheta = a * diff + s * self.rng.normal() - diff
 
         self.wind_dir += dtheta
         self.wind_dir = self._wrap_angle(self.wind_dir)
@@ -82,4 +89,33 @@ class WindSpeedSimulator:
             speed, direction = self.step()
             wind_speeds.append(speed)
             wind_dirs.append(direction)
-        return wind_speeds, wind_dirs
\ No newline at end of file
+        return wind_speeds, wind_dirs
+
+    def init_state(self, n_units: int) -> dict:
+        """
+        批量状态：n_units 个独立的风速/风向过程，都从当前风速、风向开始
+        """
+        return {"wind_speed": np.full(n_units, float(self.wind_speed)),
+                "wind_dir": np.full(n_units, float(self.wind_dir))}
+
+    def advance(self, state: dict, inputs: dict | None = None, n: int = 1) -> tuple[dict, dict]:
+        """
+        批量推进 n 步（由当前计算后端执行，见 simulations.backends）
+        :param state: init_state 返回的状态
+        :param inputs: 无需输入（保留参数以符合批量接口）
+        :param n: 步数
+        :return: (新状态, {"wind_speed", "wind_dir"}，各为 (n_units, n))
+        """
+        backend = get_backend()
+        m = len(state["wind_speed"])
+        a, s = ou_coefficients(self.tau, self.sigma, self.dt, self.method)
+        speeds = backend.ou_recurrence(state["wind_speed"], np.full((m, n), float(self.mean_wind)), a, s,
+                                       self.rng.normal(size=(m, n)), lower=np.zeros((m, n)))
+        # 风向：对相对主风向的角度差做 OU 转移，每步归一化
+        a, s = ou_coefficients(self.tau_dir, self.sigma_dir, self.dt, self.method)
+        diffs = backend.ou_recurrence(self._wrap_angle(state["wind_dir"] - self.mean_dir), np.zeros((m, n)), a, s,
+                                      self.rng.normal(size=(m, n)), wrap=True)
+        dirs = self._wrap_angle(self.mean_dir + diffs)
+        new_state = {"wind_speed": last_column(speeds, state["wind_speed"]),
+                     "wind_dir": last_column(dirs, state["wind_dir"])}
+        return new_state, {"wind_speed": speeds, "wind_dir": dirs}
@@ -0,0 +1,2 @@
+# 文件：/wind-turbine-om-sim/wind-turbine-om-sim/src/storage/__init__.py
+# 该文件用于将storage目录标记为一个Python包。
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""
+磁盘 LRU 目录缓存：模拟服务的结果缓存与风速实现缓存共用的条目存储与淘汰逻辑。
+
+- 每个条目一个目录，包含若干 .npy 数组、可选的其他文件与 meta.json；
+- 写入先落到临时目录，再用 os.replace 原子替换，读取方不会看到写了一半的条目；
+- 访问时刷新 meta.json 的修改时间，写入后按修改时间从旧到新淘汰，直到总大小不超过 max_bytes。
+"""
+
+import json
+import os
+import shutil
+import threading
+
+import numpy as np
+
+META_FILE = "meta.json"
+
+
+class DiskLRUCache:
+    """
+    磁盘 LRU 目录缓存（子类在其上实现具体的条目内容）
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        """
+        :param root: 缓存根目录
+        :param max_bytes: 缓存总字节数上限
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        os.makedirs(root, exist_ok=True)
+
+    def _dir(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def read_meta(self, key: str) -> dict | None:
+        """
+        读取条目的 meta.json 并刷新其访问时间
+        :return: 元数据，条目不存在时返回 None
+        """
+        meta_path = os.path.join(self._dir(key), META_FILE)
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        os.utime(meta_path)
+        return meta
+
+    def load_array(self, key: str, name: str) -> np.ndarray:
+        """
+        :return: 条目中名为 name 的数组（只读内存映射）
+        """
+        return np.load(os.path.join(self._dir(key), f"{name}.npy"), mmap_mode="r")
+
+    def read_file(self, key: str, name: str) -> bytes:
+        with open(os.path.join(self._dir(key), name), "rb") as f:
+            return f.read()
+
+    def write(self, key: str, meta: dict, arrays: dict, files: dict | None = None):
+        """
+        写入（覆盖）条目并按 LRU 淘汰
+        :param meta: 写入 meta.json 的元数据
+        :param arrays: 名称 → 数组，保存为 <名称>.npy
+        :param files: 文件名 → 字节串
+        """
+        tmp_dir = self._dir(key) + f".tmp{os.getpid()}-{threading.get_ident()}"
+        os.makedirs(tmp_dir)
+        for name, values in arrays.items():
+            np.save(os.path.join(tmp_dir, f"{name}.npy"), np.asarray(values))
+        for name, content in (files or {}).items():
+            with open(os.path.join(tmp_dir, name), "wb") as f:
+                f.write(content)
+        with open(os.path.join(tmp_dir, META_FILE), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        shutil.rmtree(self._dir(key), ignore_errors=True)
+        os.replace(tmp_dir, self._dir(key))
+        self.evict(keep=key)
+
+    def remove(self, key: str):
+        shutil.rmtree(self._dir(key), ignore_errors=True)
+
+    def entries(self) -> list[tuple[str, float, int]]:
+        """
+        :return: [(键, 最近访问时间, 字节数)]，按访问时间从旧到新排序
+        """
+        entries = []
+        for key in os.listdir(self.root):
+            meta_path = os.path.join(self._dir(key), META_FILE)
+            if not os.path.exists(meta_path):
+                continue
+            size = sum(entry.stat().st_size for entry in os.scandir(self._dir(key)))
+            entries.append((key, os.path.getmtime(meta_path), size))
+        return sorted(entries, key=lambda e: e[1])
+
+    def evict(self, keep: str | None = None):
+        """
+        淘汰最久未访问的条目，直到总大小不超过 max_bytes（keep 指定的条目不淘汰）
+        """
+        entries = self.entries()
+        total = sum(size for _, _, size in entries)
+        for key, _, size in entries:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self.remove(key)
+            total -= size
+
+    def stats(self) -> dict:
+        entries = self.entries()
+        return {"entries": len(entries), "bytes": sum(e[2] for e in entries), "max_bytes": self.max_bytes}
@@ -0,0 +1,215 @@
+"""
+并行模拟的零拷贝结果交换：父进程预先分配 (风机数 × 时间) 的共享数组，工作进程直接写入自己的那一行。
+
+- 后端 "shm" 使用 multiprocessing.shared_memory（每个信号一块共享内存），
+  后端 "memmap" 使用目录下的内存映射文件（可超出物理内存，结束后文件即为结果）；
+- 传给工作进程的只有可 pickle 的 SharedResultHandle（块名/文件路径、形状、dtype），
+  工作进程返回的也只是少量元数据，大数组不经过 pickle，也不在父进程中复制一份；
+- 父进程通过 buffers.tables(row) 取得某台风机各分辨率的行视图，可直接交给聚合、
+  SqlSink、TilePyramidStore 等下游，不产生拷贝。
+
+    specs = [{"seed": i, "turbine": fleet.turbine_config(d).simulator_kwargs()} for i, d in enumerate(ids)]
+    with run_fleet_parallel(specs, hours=24, max_workers=8) as (buffers, metadata):
+        power = buffers["second.power_kw"]          # (n_turbines, 24 * 3600)，共享内存视图
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from ..service.simulation_service import RESOLUTIONS, SimulationRun, normalize_spec
+
+BACKENDS = ("shm", "memmap")
+
+# SimulationRun 各分辨率输出的列，以及每小时的步数
+RESULT_COLUMNS = {
+    "second": ("wind_speed", "wind_dir", "power_kw", "rpm"),
+    "minute": ("wind_speed_avg", "power_kw", "rpm", "bearing_temp", "bearing_vibration"),
+    "hour": ("wind_speed_avg", "power_kw", "rpm", "ambient_temp"),
+}
+STEPS_PER_HOUR = {"second": 3600, "minute": 60, "hour": 1}
+
+
+@dataclass(frozen=True)
+class SharedResultHandle:
+    """
+    共享结果缓冲区的句柄（可 pickle，只含元数据）
+    """
+    backend: str
+    n_turbines: int
+    dtype: str
+    signals: tuple          # ((信号名, 时间步数, 块名或文件路径), ...)
+
+    def attach(self) -> "SharedResultBuffers":
+        """
+        在工作进程中打开缓冲区（不拥有，close 时不释放）
+        """
+        return SharedResultBuffers._attach(self)
+
+
+class SharedResultBuffers:
+    """
+    父进程拥有的 (风机数 × 时间) 结果数组集合，按信号名索引：
+
+        buffers = SharedResultBuffers(n_turbines=100, signals={"second.power_kw": 86400})
+        buffers["second.power_kw"][row, :] = ...
+    """
+
+    def __init__(self, n_turbines: int, signals: dict, dtype=np.float64, backend: str = "shm",
+                 directory: str | None = None):
+        """
+        :param n_turbines: 风机数（行数）
+        :param signals: 信号名 → 时间步数（列数）
+        :param dtype: 数组类型
+        :param backend: "shm"（共享内存）或 "memmap"（内存映射文件）
+        :param directory: memmap 后端的文件目录
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"不支持的共享结果后端: {backend!r}（可选: {', '.join(BACKENDS)}）")
+        if backend == "memmap" and directory is None:
+            raise ValueError("memmap 后端需要指定目录")
+        dtype = np.dtype(dtype)
+        self.owner = True
+        self._segments = []
+        self.arrays = {}
+        entries = []
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        for name, steps in signals.items():
+            shape = (n_turbines, int(steps))
+            if backend == "shm":
+                segment = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+                self._segments.append(segment)
+                self.arrays[name] = np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+                self.arrays[name].fill(np.nan)
+                location = segment.name
+            else:
+                location = os.path.join(directory, f"{name}.bin")
+                self.arrays[name] = np.memmap(location, dtype=dtype, mode="w+", shape=shape)
+                self.arrays[name].fill(np.nan)
+            entries.append((name, shape[1], location))
+        self.handle = SharedResultHandle(backend, n_turbines, dtype.str, tuple(entries))
+
+    @classmethod
+    def _attach(cls, handle: SharedResultHandle) -> "SharedResultBuffers":
+        self = cls.__new__(cls)
+        self.owner = False
+        self.handle = handle
+        self._segments = []
+        self.arrays = {}
+        for name, steps, location in handle.signals:
+            shape = (handle.n_turbines, steps)
+            if handle.backend == "shm":
+                segment = shared_memory.SharedMemory(name=location)
+                self._segments.append(segment)
+                self.arrays[name] = np.ndarray(shape, dtype=handle.dtype, buffer=segment.buf)
+            else:
+                self.arrays[name] = np.memmap(location, dtype=handle.dtype, mode="r+", shape=shape)
+        return self
+
+    @classmethod
+    def for_simulation(cls, n_turbines: int, hours: int, resolutions=RESOLUTIONS, **kwargs) -> "SharedResultBuffers":
+        """
+        按 SimulationRun 的输出布局分配缓冲区，信号名为 "分辨率.列名"
+        """
+        signals = {f"{res}.{col}": hours * STEPS_PER_HOUR[res] for res in resolutions for col in RESULT_COLUMNS[res]}
+        return cls(n_turbines, signals, **kwargs)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.arrays[name]
+
+    def tables(self, row: int) -> dict:
+        """
+        某台风机的结果视图（不拷贝）
+        :return: 分辨率 → {列名: 一维视图}
+        """
+        tables = {}
+        for name, array in self.arrays.items():
+            resolution, _, column = name.partition(".")
+            tables.setdefault(resolution, {})[column] = array[row]
+        return tables
+
+    @property
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in self.arrays.values())
+
+    def close(self):
+        """
+        释放映射；拥有者同时删除共享内存块。外部仍持有视图时，内存在最后一个视图释放后回收
+        """
+        for array in self.arrays.values():
+            if isinstance(array, np.memmap):
+                array.flush()
+        self.arrays = {}
+        for segment in self._segments:
+            if self.owner:
+                segment.unlink()
+            try:
+                segment.close()
+            except BufferError:
+                pass
+        self._segments = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _simulate_into(handle: SharedResultHandle, row: int, spec: dict, hours: int) -> dict:
+    """
+    工作进程：逐小时模拟一台风机并写入共享缓冲区的第 row 行
+    :return: 元数据（行号、耗时、进程号）
+    """
+    start = time.perf_counter()
+    buffers = handle.attach()
+    try:
+        run = SimulationRun(spec)
+        for hour, tables in enumerate(run.iter_hours(hours)):
+            for name in buffers.arrays:
+                resolution, _, column = name.partition(".")
+                steps = STEPS_PER_HOUR[resolution]
+                buffers[name][row, hour * steps:(hour + 1) * steps] = tables[resolution][column]
+    finally:
+        buffers.close()
+    return {"row": row, "hours": hours, "elapsed": time.perf_counter() - start, "pid": os.getpid()}
+
+
+class FleetRunResult(tuple):
+    """
+    run_fleet_parallel 的返回值：(buffers, metadata)，可作为上下文管理器在退出时释放缓冲区
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self[0].close()
+
+
+def run_fleet_parallel(specs: list, hours: int, max_workers: int | None = None, resolutions=RESOLUTIONS,
+                       backend: str = "shm", directory: str | None = None, dtype=np.float64) -> FleetRunResult:
+    """
+    多进程模拟整个风场，各风机结果直接写入父进程的共享缓冲区
+    :param specs: 每台风机的模拟规格（同 SimulationService），行号即列表下标
+    :param hours: 模拟时长（小时）
+    :param max_workers: 进程数，None 为 CPU 数
+    :param resolutions: 需要的分辨率
+    :return: FleetRunResult((SharedResultBuffers, [每台风机的元数据]))
+    """
+    specs = [normalize_spec(spec) for spec in specs]
+    buffers = SharedResultBuffers.for_simulation(len(specs), hours, resolutions, dtype=dtype, backend=backend,
+                                                 directory=directory)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_simulate_into, buffers.handle, row, spec, hours) for row, spec in enumerate(specs)]
+            metadata = [future.result() for future in futures]
+    except BaseException:
+        buffers.close()
+        raise
+    return FleetRunResult((buffers, metadata))
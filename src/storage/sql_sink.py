@@ -0,0 +1,207 @@
+"""
+模拟结果的 SQL 输出：将秒级、分钟级、小时级表批量写入本地 SQLite（WAL 模式）或 DuckDB 文件。
+
+写入策略：
+- 所有数据在一个事务内用大批量 executemany（SQLite）或整表追加（DuckDB）写入；
+- turbine_id + 时间下标的索引在数据装载完成后再创建，避免边写边维护索引；
+- 默认每张表首次写入某台风机前先删除该风机已有的行，重复运行同一风机的模拟时覆盖旧结果而不是重复追加；
+- 每张表记录写入行数与耗时，report() 给出持续写入速率（行/秒）。
+"""
+
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+# 各表的时间下标列名
+TIME_COLUMNS = {"wind_second": "sec_id", "turbine_minute": "min_id", "hourly": "hour_id"}
+
+BACKENDS = ("sqlite", "duckdb")
+
+
+def _sql_type(array: np.ndarray) -> str:
+    if np.issubdtype(array.dtype, np.integer) or array.dtype == np.bool_:
+        return "INTEGER"
+    if np.issubdtype(array.dtype, np.floating):
+        return "REAL" if array.dtype.itemsize <= 4 else "DOUBLE"
+    return "TEXT"
+
+
+class TableLoadStats:
+    """
+    单张表的写入统计
+    """
+
+    def __init__(self, table: str):
+        self.table = table
+        self.rows = 0
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float("inf")
+
+    def __repr__(self):
+        return f"TableLoadStats({self.table!r}, rows={self.rows}, rows_per_second={self.rows_per_second:,.0f})"
+
+
+class SqlSink:
+    """
+    SQL 批量写入器，用法：
+
+        with SqlSink("sim.db") as sink:
+            sink.write_table("wind_second", {"sec_id": ..., "wind_speed": ...}, turbine_id="001")
+        print(sink.report())
+
+    退出 with 块时提交事务并创建索引。
+    """
+
+    def __init__(self, path: str, backend: str = "sqlite", batch_size: int = 200_000, replace: bool = True):
+        """
+        :param path: 数据库文件路径
+        :param backend: "sqlite" 或 "duckdb"（需安装 duckdb）
+        :param batch_size: 每批写入的行数
+        :param replace: 是否在本次首次写入某表某风机前删除该风机已有的行（False 时追加）
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"不支持的数据库后端: {backend!r}（可选: {', '.join(BACKENDS)}）")
+        self.path = path
+        self.backend = backend
+        self.batch_size = batch_size
+        self.replace = replace
+        self.stats = {}
+        self.index_seconds = 0.0
+        self._columns = {}
+        self._written = set()
+        self._conn = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._conn.rollback()
+            self._conn.close()
+            self._conn = None
+
+    def open(self):
+        """
+        打开数据库并开始事务
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        if self.backend == "sqlite":
+            self._conn = sqlite3.connect(self.path, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute("PRAGMA cache_size=-262144")
+        else:
+            try:
+                import duckdb
+            except ImportError as exc:
+                raise ImportError("使用 DuckDB 后端需要先安装 duckdb：pip install duckdb") from exc
+            self._conn = duckdb.connect(self.path)
+        self._conn.execute("BEGIN")
+
+    def _ensure_table(self, table: str, columns: dict):
+        names = list(columns)
+        if table in self._columns:
+            if self._columns[table] != names:
+                raise ValueError(f"表 {table} 的列与之前写入的不一致: {names}")
+            return
+        column_sql = ", ".join(f"{name} {_sql_type(array)}" for name, array in columns.items())
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({column_sql})")
+        self._columns[table] = names
+
+    def write_table(self, table: str, columns: dict, turbine_id: str = "0") -> int:
+        """
+        追加写入一张表的数据（replace=True 时，本次首次写入该风机前先删除其已有的行）
+        :param table: 表名（如 wind_second / turbine_minute / hourly）
+        :param columns: 列名 → 等长一维数组
+        :param turbine_id: 风机编号（设备参数文件中的编号，如 "001"），按原样作为第一列（TEXT）写入
+        :return: 写入行数
+        """
+        turbine_id = str(turbine_id)
+        arrays = {name: np.asarray(values) for name, values in columns.items()}
+        n_rows = len(next(iter(arrays.values())))
+        arrays = {"turbine_id": np.full(n_rows, turbine_id, dtype=object), **arrays}
+        self._ensure_table(table, arrays)
+
+        start = time.perf_counter()
+        if self.replace and (table, turbine_id) not in self._written:
+            self._conn.execute(f"DELETE FROM {table} WHERE turbine_id = ?", [turbine_id])
+        self._written.add((table, turbine_id))
+        placeholders = ", ".join("?" for _ in arrays)
+        insert_sql = f"INSERT INTO {table} VALUES ({placeholders})"
+        for lo in range(0, n_rows, self.batch_size):
+            batch = [values[lo:lo + self.batch_size] for values in arrays.values()]
+            if self.backend == "sqlite":
+                # tolist() 一次性转换为 Python 标量，比逐元素访问 numpy 标量快得多
+                self._conn.executemany(insert_sql, zip(*(col.tolist() for col in batch)))
+            else:
+                import pandas as pd
+                frame = pd.DataFrame(dict(zip(arrays, batch)))
+                self._conn.register("_sink_batch", frame)
+                self._conn.execute(f"INSERT INTO {table} SELECT * FROM _sink_batch")
+                self._conn.unregister("_sink_batch")
+
+        stats = self.stats.setdefault(table, TableLoadStats(table))
+        stats.rows += n_rows
+        stats.seconds += time.perf_counter() - start
+        return n_rows
+
+    def create_indexes(self):
+        """
+        为已写入的表创建 (turbine_id, 时间下标) 索引
+        """
+        for table, names in self._columns.items():
+            time_column = TIME_COLUMNS.get(table, names[1])
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_turbine_time ON {table} (turbine_id, {time_column})"
+            )
+
+    def close(self):
+        """
+        提交事务、创建索引并关闭数据库
+        """
+        if self._conn is None:
+            return
+        self._conn.execute("COMMIT")
+        start = time.perf_counter()
+        self.create_indexes()
+        if self.backend == "sqlite":
+            self._conn.execute("ANALYZE")
+        self.index_seconds = time.perf_counter() - start
+        self._conn.close()
+        self._conn = None
+
+    def report(self) -> dict:
+        """
+        写入速率报告
+        :return: 表名 → TableLoadStats，另含 "total"
+        """
+        total = TableLoadStats("total")
+        for stats in self.stats.values():
+            total.rows += stats.rows
+            total.seconds += stats.seconds
+        return {**self.stats, "total": total}
+
+
+def save_tables(path: str, tables: dict, turbine_id: str = "0", backend: str = "sqlite") -> dict:
+    """
+    将一台风机的多张结果表写入数据库
+    :param path: 数据库文件路径
+    :param tables: 表名 → {列名: 数组}
+    :param turbine_id: 风机编号
+    :param backend: "sqlite" 或 "duckdb"
+    :return: 写入速率报告
+    """
+    with SqlSink(path, backend=backend) as sink:
+        for table, columns in tables.items():
+            sink.write_table(table, columns, turbine_id=turbine_id)
+    return sink.report()
@@ -0,0 +1,204 @@
+"""
+多分辨率瓦片金字塔存储：为看板的任意时间范围、任意缩放级别提供快速查询。
+
+每台风机、每个信号、每个层级（默认 1s、10s、1min、10min、1h、1d）各一个内存映射文件，
+记录为定长结构 (min, max, sum, count)。第 k 个桶在文件中的偏移即 k × 记录长度，
+index.json 记录各风机已写入的样本数（即各层级的桶数），查询时按偏移直接切片，不扫描原始数据。
+
+追加数据时只更新受影响的桶：每个层级最后一个未满的桶与新数据合并，其余桶用 reduceat 一次算出。
+NaN 视为缺测：不计入 sum/count，也不影响 min/max。
+"""
+
+import json
+import os
+
+import numpy as np
+
+# 默认层级（每个桶包含的秒数）
+DEFAULT_LEVELS = (1, 10, 60, 600, 3600, 86400)
+DEFAULT_MAX_POINTS = 2000
+
+TILE_DTYPE = np.dtype([("min", "<f4"), ("max", "<f4"), ("sum", "<f8"), ("count", "<u4")])
+INDEX_FILE = "index.json"
+
+
+def _reduce_buckets(values: np.ndarray, bucket_ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    按桶聚合一段数据
+    :param values: 一维数据（可含 NaN）
+    :param bucket_ids: 每个样本所属的桶号（非降序）
+    :return: (桶号, 聚合记录)
+    """
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(bucket_ids)) + 1))
+    valid = np.isfinite(values)
+    records = np.empty(len(starts), dtype=TILE_DTYPE)
+    records["min"] = np.fmin.reduceat(values, starts)
+    records["max"] = np.fmax.reduceat(values, starts)
+    records["sum"] = np.add.reduceat(np.where(valid, values, 0.0), starts)
+    records["count"] = np.add.reduceat(valid.astype(np.uint32), starts)
+    return bucket_ids[starts], records
+
+
+class TilePyramidStore:
+    """
+    瓦片金字塔存储
+
+        store = TilePyramidStore("tiles", signals=("power_kw", "rpm"))
+        store.append("002", {"power_kw": power_chunk, "rpm": rpm_chunk})
+        result = store.query("002", "power_kw", t0=0, t1=30 * 86400)
+    """
+
+    def __init__(self, root: str, signals=None, levels=DEFAULT_LEVELS, dt: float = 1.0):
+        """
+        :param root: 存储目录；已存在 index.json 时按其中的配置打开
+        :param signals: 信号名列表（新建时必填）
+        :param levels: 各层级桶宽（以基础采样点数计，第一个须为 1）
+        :param dt: 基础采样间隔（秒）
+        """
+        self.root = root
+        index_path = os.path.join(root, INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            self.signals = tuple(index["signals"])
+            self.levels = tuple(index["levels"])
+            self.dt = index["dt"]
+            self.turbines = index["turbines"]
+        else:
+            if not signals:
+                raise ValueError("新建存储时需要指定信号列表")
+            if levels[0] != 1 or list(levels) != sorted(levels):
+                raise ValueError("层级须从 1 开始且递增")
+            self.signals = tuple(signals)
+            self.levels = tuple(int(w) for w in levels)
+            self.dt = float(dt)
+            self.turbines = {}
+            os.makedirs(root, exist_ok=True)
+            self._write_index()
+        self._maps = {}
+
+    # ---------- 文件与索引 ----------
+
+    def _path(self, turbine: str, signal: str, width: int) -> str:
+        return os.path.join(self.root, turbine, f"{signal}_L{width}.tile")
+
+    def _write_index(self):
+        index = {"signals": list(self.signals), "levels": list(self.levels), "dt": self.dt, "turbines": self.turbines}
+        tmp_path = os.path.join(self.root, INDEX_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, os.path.join(self.root, INDEX_FILE))
+
+    def _tiles(self, turbine: str, signal: str, width: int, n_buckets: int = 0) -> np.memmap:
+        """
+        获取某层级的内存映射，容量不足 n_buckets 时按倍数扩容
+        """
+        key = (turbine, signal, width)
+        tiles = self._maps.get(key)
+        if tiles is not None and len(tiles) >= n_buckets:
+            return tiles
+        path = self._path(turbine, signal, width)
+        size = os.path.getsize(path) // TILE_DTYPE.itemsize if os.path.exists(path) else 0
+        if size < n_buckets:
+            size = max(n_buckets, 2 * size, 1024)
+            if tiles is not None:
+                tiles.flush()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "ab") as f:
+                f.truncate(size * TILE_DTYPE.itemsize)
+        if size == 0:
+            return np.zeros(0, dtype=TILE_DTYPE)
+        tiles = np.memmap(path, dtype=TILE_DTYPE, mode="r+", shape=(size,))
+        self._maps[key] = tiles
+        return tiles
+
+    def n_samples(self, turbine: str) -> int:
+        """
+        某台风机已写入的基础采样点数
+        """
+        return self.turbines.get(str(turbine), {}).get("n_samples", 0)
+
+    # ---------- 写入 ----------
+
+    def append(self, turbine, chunk: dict):
+        """
+        追加一段基础采样数据并增量更新各层级
+        :param turbine: 风机编号
+        :param chunk: 信号名 → 等长一维数组（须包含全部信号）
+        """
+        turbine = str(turbine)
+        missing = set(self.signals) - set(chunk)
+        if missing:
+            raise KeyError(f"缺少信号: {sorted(missing)}")
+        lengths = {len(chunk[name]) for name in self.signals}
+        if len(lengths) != 1:
+            raise ValueError("各信号长度须一致")
+        k = lengths.pop()
+        if k == 0:
+            return
+        n = self.n_samples(turbine)
+        positions = np.arange(n, n + k)
+
+        for signal in self.signals:
+            values = np.asarray(chunk[signal], dtype=np.float64)
+            for width in self.levels:
+                ids, records = _reduce_buckets(values, positions // width)
+                tiles = self._tiles(turbine, signal, width, int(ids[-1]) + 1)
+                if n % width:
+                    # 与上次写入留下的未满桶合并
+                    head = tiles[ids[0]]
+                    records["min"][0] = np.fmin(head["min"], records["min"][0])
+                    records["max"][0] = np.fmax(head["max"], records["max"][0])
+                    records["sum"][0] += head["sum"]
+                    records["count"][0] += head["count"]
+                tiles[ids[0]:ids[-1] + 1] = records
+
+        self.turbines[turbine] = {"n_samples": n + k}
+        self.flush()
+
+    def flush(self):
+        """
+        将内存映射与索引写回磁盘
+        """
+        for tiles in self._maps.values():
+            tiles.flush()
+        self._write_index()
+
+    # ---------- 查询 ----------
+
+    def choose_level(self, t0: float, t1: float, max_points: int = DEFAULT_MAX_POINTS) -> int:
+        """
+        选择返回点数不超过 max_points 的最细层级
+        :return: 桶宽（基础采样点数）
+        """
+        span = max((t1 - t0) / self.dt, 1.0)
+        for width in self.levels:
+            if np.ceil(span / width) + 1 <= max_points:
+                return width
+        return self.levels[-1]
+
+    def query(self, turbine, signal: str, t0: float, t1: float, max_points: int = DEFAULT_MAX_POINTS) -> dict:
+        """
+        查询时间范围 [t0, t1)（秒，从第一个采样点起算）内的降采样数据
+        :return: {"level": 桶宽秒数, "time": 桶起始时刻, "min", "max", "mean", "count"}
+        """
+        turbine = str(turbine)
+        if signal not in self.signals:
+            raise KeyError(f"未知信号: {signal}")
+        width = self.choose_level(t0, t1, max_points)
+        n = self.n_samples(turbine)
+        n_buckets = -(-n // width)
+        first = min(max(int(np.floor(t0 / self.dt / width)), 0), n_buckets)
+        last = min(max(int(np.ceil(t1 / self.dt / width)), first), n_buckets)
+        tiles = self._tiles(turbine, signal, width)[first:last] if n else np.zeros(0, dtype=TILE_DTYPE)
+        count = tiles["count"].astype(np.int64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(count > 0, tiles["sum"] / count, np.nan)
+        return {
+            "level": width * self.dt,
+            "time": np.arange(first, last) * width * self.dt,
+            "min": np.array(tiles["min"]),
+            "max": np.array(tiles["max"]),
+            "mean": mean,
+            "count": count,
+        }
@@ -0,0 +1,132 @@
+"""
+风速实现的内容寻址磁盘缓存：风场是最耗时、也最常被复用的阶段，只改风机或轴承参数的实验无需重新生成风速。
+
+- 缓存键为 (缓存格式版本, WindSpeedSimulator 参数, 随机种子) 规范化 JSON 的 SHA-256，不含时长；
+  模型或存储格式变化时递增 WIND_CACHE_VERSION，旧条目不再命中；
+- 风速由批量 advance() 按定长块（BLOCK_STEPS 步）生成，块边界固定在第 BLOCK_STEPS 的整数倍步，
+  因此同一种子的实现与请求的时长、先后顺序无关：较短的请求直接切片已有实现，较长的请求从保存的末尾状态逐块续算；
+- 每个条目一个目录：speeds.npy、dirs.npy 与 meta.json；续算状态（末尾风速、风向与随机数生成器状态）
+  以普通数值存于 meta.json，不序列化模拟器对象；
+- 条目存储与 LRU 淘汰见 DiskLRUCache。
+
+    cache = WindRealizationCache(".wind_cache")
+    speeds, dirs, status = cache.get(WindSpeedSimulator(dt=1.0), seed=42, steps=24 * 3600)
+"""
+
+import hashlib
+import json
+import threading
+
+import numpy as np
+
+from ..simulations.wind.wind_speed_simu import WindSpeedSimulator
+from .disk_cache import DiskLRUCache
+
+# 缓存格式版本，风速模型或条目格式变化时递增以使旧缓存失效
+WIND_CACHE_VERSION = 2
+# 决定风速实现的模拟器参数
+WIND_PARAMS = ("tau", "sigma", "dt", "mean_wind", "tau_dir", "sigma_dir", "mean_dir", "method")
+# 每次 advance() 生成的步数
+BLOCK_STEPS = 3600
+DEFAULT_CACHE_BYTES = 1024 * 1024 * 1024
+
+
+def wind_params(simulator: WindSpeedSimulator) -> dict:
+    """
+    提取决定风速实现的模拟器参数
+    """
+    return {name: getattr(simulator, name) for name in WIND_PARAMS}
+
+
+def wind_key(params: dict, seed: int) -> str:
+    """
+    缓存键：缓存格式版本、模拟器参数与种子的规范化 JSON 的 SHA-256
+    """
+    content = {"version": WIND_CACHE_VERSION, "params": {name: params[name] for name in WIND_PARAMS}, "seed": seed}
+    canonical = json.dumps(content, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def generate_blocks(params: dict, rng: np.random.Generator, state: dict, n_blocks: int):
+    """
+    用批量 advance() 逐块生成风速实现
+    :param params: 风速模拟器参数（见 WIND_PARAMS）
+    :param rng: 随机数生成器（原地推进）
+    :param state: 末尾状态 {"wind_speed", "wind_dir"}（标量）
+    :param n_blocks: 块数
+    :return: (风速, 风向, 新的末尾状态)，各 n_blocks × BLOCK_STEPS 步
+    """
+    simulator = WindSpeedSimulator(**params, rng=rng)
+    batch = {name: np.array([float(state[name])]) for name in ("wind_speed", "wind_dir")}
+    speeds, dirs = [], []
+    for _ in range(n_blocks):
+        batch, out = simulator.advance(batch, None, BLOCK_STEPS)
+        speeds.append(out["wind_speed"][0])
+        dirs.append(out["wind_dir"][0])
+    state = {name: float(values[0]) for name, values in batch.items()}
+    empty = np.empty(0)
+    return np.concatenate(speeds or [empty]), np.concatenate(dirs or [empty]), state
+
+
+class WindRealizationCache(DiskLRUCache):
+    """
+    风速实现的磁盘 LRU 缓存
+    """
+
+    def __init__(self, root: str = ".wind_cache", max_bytes: int = DEFAULT_CACHE_BYTES):
+        super().__init__(root, max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self.extensions = 0
+        self._lock = threading.Lock()
+
+    def _load(self, key: str):
+        """
+        :return: (元数据, 风速, 风向) 或 None；数组为只读内存映射
+        """
+        meta = self.read_meta(key)
+        if meta is None:
+            return None
+        return meta, self.load_array(key, "speeds"), self.load_array(key, "dirs")
+
+    def get(self, simulator: WindSpeedSimulator, seed: int, steps: int) -> tuple[np.ndarray, np.ndarray, str]:
+        """
+        取得由 simulator 的参数与 seed 决定的风速实现的前 steps 步
+        :param simulator: 提供参数的风速模拟器（其自身状态与随机数生成器不被使用）
+        :param seed: 随机种子（np.random.default_rng(seed)）
+        :param steps: 步数
+        :return: (风速, 风向, 状态)，状态为 "hit"（直接切片）、"extended"（续算）或 "miss"（新生成）；
+                 数组为只读内存映射
+        """
+        params = wind_params(simulator)
+        key = wind_key(params, seed)
+        with self._lock:
+            cached = self._load(key)
+            if cached is not None and cached[0]["steps"] >= steps:
+                self.hits += 1
+                return cached[1][:steps], cached[2][:steps], "hit"
+
+            if cached is None:
+                self.misses += 1
+                status = "miss"
+                rng = np.random.default_rng(seed)
+                state = {"wind_speed": params["mean_wind"], "wind_dir": params["mean_dir"]}
+                done, old_speeds, old_dirs = 0, np.empty(0), np.empty(0)
+            else:
+                self.extensions += 1
+                status = "extended"
+                meta, old_speeds, old_dirs = cached
+                rng = np.random.default_rng()
+                rng.bit_generator.state = meta["rng_state"]
+                state, done = meta["state"], meta["steps"]
+            n_blocks = -(-(steps - done) // BLOCK_STEPS)
+            speeds, dirs, state = generate_blocks(params, rng, state, n_blocks)
+            meta = {"version": WIND_CACHE_VERSION, "steps": done + len(speeds), "params": params, "seed": seed,
+                    "state": state, "rng_state": rng.bit_generator.state}
+            self.write(key, meta, {"speeds": np.concatenate([old_speeds, speeds]),
+                                   "dirs": np.concatenate([old_dirs, dirs])})
+            _, speeds, dirs = self._load(key)
+        return speeds[:steps], dirs[:steps], status
+
+    def stats(self) -> dict:
+        return {**super().stats(), "hits": self.hits, "misses": self.misses, "extensions": self.extensions}
@@ -1,33 +1,58 @@
 from typing import Protocol, Tuple
 
-class WindSpeedSimulatorInterface(Protocol):
+import numpy as np
+
+
+class BatchSimulator(Protocol):
+    """
+    批量（向量化）模拟接口：状态为每个单元（风机/轴承）一个元素的数组字典，
+    advance 一次推进 n 步，逐步递推由 simulations.backends 的当前计算后端执行。
+    """
+
+    def init_state(self, n_units: int) -> dict:
+        ...
+
+    def advance(self, state: dict, inputs: dict, n: int) -> Tuple[dict, dict]:
+        """
+        :param state: init_state 或上一次 advance 返回的状态
+        :param inputs: 输入名 → (n_units, n) 数组（也可为 (n,) 或标量）
+        :param n: 步数
+        :return: (新状态, 输出名 → (n_units, n) 数组)
+        """
+        ...
+
+
+class WindSpeedSimulatorInterface(BatchSimulator, Protocol):
     def step(self) -> Tuple[float, float]:
         ...
 
     def simulate(self, steps: int) -> Tuple[list, list]:
         ...
 
-class TemperatureSimulatorInterface(Protocol):
+class TemperatureSimulatorInterface(BatchSimulator, Protocol):
     def step(self, t_hour: float) -> float:
         ...
 
-    def simulate(self, hours: int) -> list:
+    def simulate(self, hours: int) -> np.ndarray:
         ...
 
-class WindTurbinePowerSimulatorInterface(Protocol):
-    def power_from_speed(self, wind_speeds: list) -> list:
+class WindTurbinePowerSimulatorInterface(BatchSimulator, Protocol):
+    def power_from_speed(self, wind_speeds: np.ndarray) -> np.ndarray:
         ...
 
-class BearingTemperatureSimulatorInterface(Protocol):
-    def step(self) -> float:
+    def power_and_rpm_from_speed(self, wind_speeds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         ...
 
-    def simulate(self, hours: int) -> list:
+class BearingTemperatureSimulatorInterface(BatchSimulator, Protocol):
+    def step(self, ambient_temp: float, rpm: float, temp_offset: float = 0.0) -> float:
         ...
 
-class BearingVibrationSimulatorInterface(Protocol):
-    def step(self) -> float:
+    def simulate(self, ambient_temps: np.ndarray, rpm_sequence: np.ndarray) -> np.ndarray:
         ...
 
-    def simulate(self, hours: int) -> list:
-        ...
\ No newline at end of file
+class BearingVibrationSimulatorInterface(BatchSimulator, Protocol):
+    def step(self, rpm: float, rms_offset: float = 0.0) -> float:
+        ...
+
+    def simulate(self, rpm_sequence: np.ndarray) -> np.ndarray:
+        ...
@@ -0,0 +1,158 @@
+import numpy as np
+import pytest
+
+from src.simulations import backends
+from src.simulations.backends import NumpyBackend, available_backends, get_backend, set_backend
+from src.simulations.bearing.bearing_temp_simulator import BearingTemperatureSimulator
+from src.simulations.bearing.bearing_vibration_simulator import BearingVibrationSimulator
+from src.simulations.environment.temperature_simulator import TemperatureSimulator
+from src.simulations.turbine.wind_turbine_power_simu import WindTurbinePowerSimulator
+from src.simulations.wind.wind_speed_simu import WindSpeedSimulator
+
+
+class _ZeroNoise:
+    """
+    返回全零噪声的随机数生成器，使批量与逐步结果可逐点比较
+    """
+
+    def normal(self, loc=0.0, scale=1.0, size=None):
+        return np.zeros(size) if size is not None else 0.0
+
+
+class TestNumpyBackend:
+    def test_matches_reference_loops(self):
+        rng = np.random.default_rng(0)
+        backend = NumpyBackend()
+        m, n = 4, 50
+        x0 = np.array([0.0, 170.0, -170.0, 20.0])
+        mean = rng.normal(size=(m, n))
+        noise = rng.normal(size=(m, n)) * 30.0
+        lower = np.full((m, n), -100.0)
+        reset = rng.random((m, n)) < 0.1
+        reset_value = rng.normal(size=(m, n))
+        expected = np.empty((m, n))
+        backends._ou_loop(x0, mean, 0.9, 1.0, noise, lower, reset, reset_value, True, expected)
+        np.testing.assert_allclose(backend.ou_recurrence(x0, mean, 0.9, 1.0, noise, lower, reset, reset_value, True),
+                                   expected)
+
+        y0 = np.array([np.nan, 1.0, 5.0, np.nan])
+        x = rng.uniform(0, 100, size=(m, n))
+        expected = np.empty((m, n))
+        backends._filter_loop(y0, x, 0.1, expected)
+        np.testing.assert_allclose(backend.first_order_filter(y0, x, 0.1), expected)
+        backends._ramp_loop(y0, x, 3.0, expected)
+        np.testing.assert_allclose(backend.ramp_limit(y0, x, 3.0), expected)
+
+    @pytest.mark.parametrize("m, n", [(2, 3000), (3, 64)])
+    def test_row_segments_match_reference_loop(self, m, n):
+        # 单元少、步数多时按单元分段求闭式解，截断、归一化与复位的步须与逐步规则一致
+        rng = np.random.default_rng(1)
+        x0 = np.array([175.0, -10.0, 0.0])[:m]
+        mean = np.full((m, n), 5.0)
+        noise = rng.normal(size=(m, n)) * 20.0
+        lower = np.full((m, n), -60.0)
+        reset = np.zeros((m, n), dtype=bool)
+        reset[:, 100:140] = True
+        reset_value = rng.normal(size=(m, n))
+        for wrap in (False, True):
+            expected = np.empty((m, n))
+            backends._ou_loop(x0, mean, 0.95, 1.0, noise, lower, reset, reset_value, wrap, expected)
+            result = NumpyBackend().ou_recurrence(x0, mean, 0.95, 1.0, noise, lower, reset, reset_value, wrap)
+            np.testing.assert_allclose(result, expected, rtol=1e-10, atol=1e-9)
+
+    def test_set_backend(self, monkeypatch):
+        with pytest.raises(ValueError):
+            set_backend("fortran")
+        monkeypatch.setattr(backends, "_active", None)
+        monkeypatch.setenv(backends.BACKEND_ENV, "numpy")
+        assert get_backend().name == "numpy"
+        assert "numpy" in available_backends()
+
+    @pytest.mark.skipif("numba" in available_backends(), reason="numba 已安装")
+    def test_numba_missing(self, monkeypatch):
+        monkeypatch.setattr(backends, "_active", None)
+        with pytest.raises(ImportError):
+            set_backend("numba")
+
+
+class TestNumbaBackend:
+    @pytest.mark.parametrize("m, n", [(5, 40), (2, 500)])
+    def test_matches_numpy_backend(self, m, n):
+        pytest.importorskip("numba")
+        rng = np.random.default_rng(2)
+        numba_backend, numpy_backend = backends.NumbaBackend(), NumpyBackend()
+        x0 = rng.uniform(-170.0, 170.0, size=m)
+        mean = rng.normal(size=(m, n))
+        noise = rng.normal(size=(m, n)) * 30.0
+        lower = np.full((m, n), -100.0)
+        reset = rng.random((m, n)) < 0.1
+        reset_value = rng.normal(size=(m, n))
+        for args in ((x0, mean, 0.9, 1.0, noise, lower, reset, reset_value, True), (x0, mean, 0.8, 2.0, noise)):
+            np.testing.assert_allclose(numba_backend.ou_recurrence(*args), numpy_backend.ou_recurrence(*args),
+                                       rtol=1e-10, atol=1e-9)
+
+        y0 = np.where(rng.random(m) < 0.5, np.nan, rng.uniform(0, 100, size=m))
+        x = rng.uniform(0, 100, size=(m, n))
+        np.testing.assert_allclose(numba_backend.first_order_filter(y0, x, 0.1), numpy_backend.first_order_filter(y0, x, 0.1))
+        np.testing.assert_allclose(numba_backend.ramp_limit(y0, x, 3.0), numpy_backend.ramp_limit(y0, x, 3.0))
+        assert numba_backend.ramp_limit(y0, x[:, :0], 3.0).shape == (m, 0)
+
+    def test_simulator_advance_matches_numpy_backend(self, monkeypatch):
+        pytest.importorskip("numba")
+        wind = np.concatenate([np.linspace(2, 28, 200), np.linspace(28, 5, 200)])
+        outputs = {}
+        for name in ("numpy", "numba"):
+            monkeypatch.setattr(backends, "_active", None)
+            set_backend(name)
+            sim = WindTurbinePowerSimulator(rng=np.random.default_rng(3), v_restart=20.0)
+            state, first = sim.advance(sim.init_state(3), {"wind_speed": wind[:150]}, 150)
+            _, second = sim.advance(state, {"wind_speed": wind[150:]}, 250)
+            outputs[name] = {key: np.concatenate([first[key], second[key]], axis=1) for key in first}
+            wind_sim = WindSpeedSimulator(dt=1.0, rng=np.random.default_rng(4))
+            outputs[name].update(wind_sim.advance(wind_sim.init_state(3), None, 300)[1])
+        for key, values in outputs["numpy"].items():
+            np.testing.assert_allclose(outputs["numba"][key], values, err_msg=key)
+
+
+class TestBatchSimulators:
+    def test_bearing_temperature_matches_step(self):
+        rpm = np.concatenate([np.full(10, 3.0), np.linspace(7, 16, 80), np.full(10, 0.0)])
+        ambient = 10.0 + np.sin(np.arange(len(rpm)) / 10.0)
+        scalar = BearingTemperatureSimulator(rng=_ZeroNoise()).simulate(ambient, rpm)
+        batch = BearingTemperatureSimulator(rng=_ZeroNoise())
+        state = batch.init_state(3)
+        state, first = batch.advance(state, {"ambient_temp": ambient[:40], "rpm": rpm[:40]}, 40)
+        state, second = batch.advance(state, {"ambient_temp": ambient[40:], "rpm": rpm[40:]}, len(rpm) - 40)
+        np.testing.assert_allclose(np.concatenate([first["bearing_temp"], second["bearing_temp"]], axis=1)[1], scalar)
+
+    def test_vibration_matches_step(self):
+        rpm = np.concatenate([np.linspace(7, 16, 50), np.full(10, 2.0)])
+        scalar = BearingVibrationSimulator(rng=_ZeroNoise()).simulate(rpm)
+        batch = BearingVibrationSimulator(rng=_ZeroNoise())
+        _, out = batch.advance(batch.init_state(2), {"rpm": rpm}, len(rpm))
+        np.testing.assert_allclose(out["bearing_vibration"][0], scalar)
+
+    def test_turbine_matches_sequence_api(self):
+        wind = np.concatenate([np.linspace(2, 28, 200), np.linspace(28, 5, 200)])
+        sim = WindTurbinePowerSimulator(rng=_ZeroNoise(), v_restart=20.0)
+        power, rpm = sim.power_and_rpm_from_speed(wind)
+        state = sim.init_state(2)
+        state, first = sim.advance(state, {"wind_speed": wind[:150]}, 150)
+        state, second = sim.advance(state, {"wind_speed": wind[150:]}, 250)
+        np.testing.assert_allclose(np.concatenate([first["power_kw"], second["power_kw"]], axis=1)[0], power)
+        np.testing.assert_allclose(np.concatenate([first["rpm"], second["rpm"]], axis=1)[1], rpm)
+
+    def test_wind_and_ambient_statistics(self):
+        wind = WindSpeedSimulator(dt=1.0, method="exact", rng=np.random.default_rng(1))
+        state, out = wind.advance(wind.init_state(200), None, 2000)
+        assert out["wind_speed"].shape == (200, 2000)
+        assert out["wind_speed"].min() >= 0.0
+        assert np.abs(out["wind_dir"]).max() <= 180.0
+        assert out["wind_speed"][:, 500:].mean() == pytest.approx(10.0, abs=0.2)
+        np.testing.assert_array_equal(state["wind_speed"], out["wind_speed"][:, -1])
+
+        ambient = TemperatureSimulator(tau=2.0, sigma=0.0, dt=1.0, mean_temp=15.0)
+        state, first = ambient.advance(ambient.init_state(1), None, 10)
+        _, second = ambient.advance(state, None, 14)
+        reference = TemperatureSimulator(tau=2.0, sigma=0.0, dt=1.0, mean_temp=15.0).simulate(24)
+        np.testing.assert_allclose(np.concatenate([first["ambient_temp"], second["ambient_temp"]], axis=1)[0], reference)
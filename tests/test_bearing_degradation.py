@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from src.configs.bearing_config import BearingConfig
+from src.simulations.bearing.bearing_degradation import (
+    BearingDegradationModel,
+    FaultEvent,
+    FaultScheduler,
+)
+from src.simulations.bearing.bearing_temp_simulator import BearingTemperatureSimulator
+from src.simulations.bearing.bearing_vibration_simulator import BearingVibrationSimulator
+
+
+def test_damage_reaches_one_at_l10_under_rated_conditions():
+    model = BearingDegradationModel.from_config(BearingConfig(bearing_life_hours=100), rpm_rated=15.0)
+    minutes = 100 * 60
+    damage = model.cumulative_damage(np.full(minutes, 15.0), np.ones(minutes))
+    assert damage[-1] == pytest.approx(1.0)
+    # 半载时寿命按 (1/0.5)^3 延长
+    half = model.cumulative_damage(np.full(minutes, 15.0), np.full(minutes, 0.5))
+    assert half[-1] == pytest.approx(1.0 / 8)
+
+
+def test_schedule_onsets_follow_damage_thresholds():
+    damage = np.array([np.linspace(0, 1.2, 1000), np.linspace(0, 0.3, 1000)])
+    events = FaultScheduler(ramp_steps=10).schedule(damage)
+    assert [(e.turbine, e.name) for e in events] == [(0, "早期磨损"), (0, "剥落")]
+    assert events[0].onset == np.argmax(damage[0] >= 0.6)
+
+
+def test_build_offsets_is_piecewise_linear():
+    events = [FaultEvent(onset=10, ramp=5, temp_shift=5.0, rms_shift=1.0),
+              FaultEvent(onset=12, ramp=1, temp_shift=2.0, rms_shift=0.0)]
+    temp_offsets, rms_offsets = FaultScheduler.build_offsets(events, steps=30)
+    assert temp_offsets[9] == 0.0
+    np.testing.assert_allclose(temp_offsets[10:15], [1.0, 2.0, 5.0, 6.0, 7.0])
+    assert temp_offsets[-1] == pytest.approx(7.0)
+    assert rms_offsets[-1] == pytest.approx(1.0)
+
+    fleet_temp, _ = FaultScheduler.build_offsets([FaultEvent(5, 2, 4.0, 0.0, turbine=1)], steps=10, n_turbines=2)
+    assert fleet_temp[0].sum() == 0.0
+    assert fleet_temp[1, -1] == pytest.approx(4.0)
+
+
+def test_offsets_shift_simulated_levels():
+    np.random.seed(0)
+    steps = 600
+    offsets = np.full(steps, 8.0)
+    temp_sim = BearingTemperatureSimulator(sigma=0.0)
+    temps = temp_sim.simulate(np.full(steps, 20.0), np.full(steps, 15.0), temp_offsets=offsets)
+    assert temps[-1] == pytest.approx(20.0 + 15.0 + 8.0, abs=0.1)
+
+    vib_sim = BearingVibrationSimulator(sigma=0.0)
+    vibs = vib_sim.simulate(np.full(steps, 15.0), rms_offsets=np.full(steps, 1.0))
+    assert vibs[-1] == pytest.approx(2.5 + 1.0, abs=0.05)
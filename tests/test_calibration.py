@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from src.analysis.calibration import (
+    calibrate_ambient,
+    calibrate_bearing_temp,
+    calibrate_bearing_vibration,
+    calibrate_wind,
+    fit_ar1,
+    load_calibrated_parameters,
+    save_calibrated_parameters,
+)
+from src.simulations.bearing.bearing_temp_simulator import BearingTemperatureSimulator
+from src.simulations.bearing.bearing_vibration_simulator import BearingVibrationSimulator
+from src.simulations.environment.temperature_simulator import TemperatureSimulator
+from src.simulations.time_stepping import ou_coefficients
+from src.simulations.wind.wind_speed_simu import WindSpeedSimulator
+
+
+def _ou_paths(n, steps, tau, sigma, mean, dt, method, rng):
+    a, s = ou_coefficients(np.asarray(tau)[:, None], np.asarray(sigma)[:, None], dt, method)
+    x = np.empty((n, steps))
+    x[:, 0] = mean
+    noise = rng.standard_normal((n, steps))
+    for k in range(1, steps):
+        x[:, k] = mean + a[:, 0] * (x[:, k - 1] - mean) + s[:, 0] * noise[:, k]
+    return x
+
+
+@pytest.mark.parametrize("method", ["exact", "euler"])
+def test_fit_ar1_recovers_parameters_per_series(method):
+    rng = np.random.default_rng(0)
+    tau = np.array([5.0, 20.0, 60.0])
+    paths = _ou_paths(3, 100_000, tau, np.array([2.0, 1.0, 0.5]), 10.0, 1.0, method, rng)
+    paths[1, 500:600] = np.nan
+    fit = fit_ar1(paths, dt=1.0, method=method)
+    np.testing.assert_allclose(fit["tau"], tau, rtol=0.1)
+    np.testing.assert_allclose(fit["sigma"], [2.0, 1.0, 0.5], rtol=0.05)
+    np.testing.assert_allclose(fit["mean"], 10.0, atol=0.5)
+
+
+def test_wind_and_ambient_from_simulators():
+    wind = WindSpeedSimulator(tau=8.0, sigma=1.5, dt=1.0, mean_wind=9.0, tau_dir=40.0, sigma_dir=4.0,
+                              mean_dir=170.0, method="exact", rng=np.random.default_rng(1))
+    speeds, dirs = wind.simulate(40_000)
+    params = calibrate_wind(speeds, dirs, dt=1.0)
+    assert params["tau"][0] == pytest.approx(8.0, rel=0.15)
+    assert params["mean_wind"][0] == pytest.approx(9.0, abs=0.5)
+    assert params["tau_dir"][0] == pytest.approx(40.0, rel=0.3)
+    assert abs((params["mean_dir"][0] - 170.0 + 180) % 360 - 180) < 10
+
+    ambient = TemperatureSimulator(tau=6.0, sigma=0.5, dt=1.0, mean_temp=15.0, daily_amp=5.0, daily_phase=-3.0,
+                                   method="exact", rng=np.random.default_rng(2))
+    params = calibrate_ambient(ambient.simulate(24 * 365), dt=1.0)
+    assert params["mean_temp"][0] == pytest.approx(15.0, abs=0.5)
+    assert params["daily_amp"][0] == pytest.approx(5.0, rel=0.1)
+    assert params["daily_phase"][0] == pytest.approx(-3.0, abs=0.5)
+
+
+def test_bearing_models_from_simulators():
+    rng = np.random.default_rng(3)
+    rpm = np.repeat(rng.uniform(0, 15, 2000), 20)
+    ambient = 20 + 5 * np.sin(np.arange(len(rpm)) / 600)
+
+    temp_sim = BearingTemperatureSimulator(tau=10.0, sigma=1.0, temp_rise_at_rated=18.0, method="exact",
+                                           rng=np.random.default_rng(4))
+    params = calibrate_bearing_temp(temp_sim.simulate(ambient, rpm), ambient, rpm)
+    assert params["temp_rise_at_rated"][0] == pytest.approx(18.0, rel=0.1)
+    assert params["tau"][0] == pytest.approx(10.0, rel=0.2)
+
+    vib_sim = BearingVibrationSimulator(tau=30.0, sigma=0.2, base_rms=1.2, rms_at_rated=3.0, method="exact",
+                                        rng=np.random.default_rng(5))
+    params = calibrate_bearing_vibration(vib_sim.simulate(rpm), rpm)
+    assert params["base_rms"][0] == pytest.approx(1.2, abs=0.3)
+    assert params["rms_at_rated"][0] == pytest.approx(3.0, abs=0.3)
+
+
+def test_parameter_file_roundtrip(tmp_path):
+    path = str(tmp_path / "calibration.json")
+    stages = {"wind": {"tau": np.array([5.0, 6.0]), "sigma": np.array([2.0, 1.0]), "mean_wind": np.array([9.0, 8.0])}}
+    save_calibrated_parameters(path, ["001", "002"], stages, dt={"wind": 1.0})
+    params = load_calibrated_parameters(path, "002")
+    simulator = WindSpeedSimulator(**params["wind"])
+    assert (simulator.tau, simulator.mean_wind, simulator.dt, simulator.method) == (6.0, 8.0, 1.0, "exact")
+    with pytest.raises(KeyError):
+        load_calibrated_parameters(path, "003")
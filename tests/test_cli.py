@@ -0,0 +1,96 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.cli import main, parse_args
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HELP_PROBE = """
+import sys, time
+start = time.perf_counter()
+from src.cli import main
+try:
+    main(["--help"])
+except SystemExit:
+    pass
+print(time.perf_counter() - start)
+print(sorted(name for name in ("numpy", "pandas", "matplotlib", "scipy") if name in sys.modules))
+"""
+
+
+class TestStartup:
+    def test_help_does_not_import_heavy_modules(self):
+        result = subprocess.run([sys.executable, "-c", HELP_PROBE], cwd=ROOT, capture_output=True, text=True,
+                                check=True)
+        elapsed, loaded = result.stdout.strip().splitlines()[-2:]
+        assert loaded == "[]"
+        assert float(elapsed) < 0.1
+
+    def test_subcommands_listed(self, capsys):
+        with pytest.raises(SystemExit):
+            main(["--help"])
+        out = capsys.readouterr().out
+        for command in ("run", "replay", "fleet", "stream", "bench"):
+            assert command in out
+
+
+class TestArguments:
+    def test_defaults(self):
+        args = parse_args(["run"])
+        assert args.hours == 24
+        assert args.turbine_id == "002"
+        assert args.wind_replay is None
+        assert not args.controller and args.control_hz == 20.0
+        assert parse_args(["run", "--controller", "--control-hz", "10"]).control_hz == 10.0
+
+    def test_replay_path_positional(self):
+        args = parse_args(["replay", "wind.csv", "--hours", "2"])
+        assert args.command == "replay"
+        assert args.wind_replay == "wind.csv"
+        assert args.hours == 2
+
+    def test_config_then_flags(self, tmp_path):
+        config = tmp_path / "fleet.json"
+        config.write_text(json.dumps({"turbines": 7, "hours": 3, "buffer_backend": "memmap"}))
+        args = parse_args(["fleet", "--config", str(config), "--hours", "5"])
+        assert args.turbines == 7
+        assert args.buffer_backend == "memmap"
+        assert args.hours == 5
+
+    def test_unknown_config_key(self, tmp_path):
+        config = tmp_path / "run.json"
+        config.write_text(json.dumps({"hourz": 3}))
+        with pytest.raises(SystemExit):
+            parse_args(["run", "--config", str(config)])
+
+
+class TestCommands:
+    def test_bench(self, capsys):
+        assert main(["bench", "--turbines", "50", "--ticks", "5"]) == 0
+        out = capsys.readouterr().out
+        assert "ms/tick" in out
+        assert "advance[numpy]" in out
+
+    def test_fleet(self, capsys):
+        assert main(["fleet", "--turbines", "2", "--hours", "1", "--workers", "1"]) == 0
+        assert "发电量" in capsys.readouterr().out
+
+    def test_fleet_turbine_selection(self, capsys):
+        assert main(["fleet", "--turbines", "1", "--hours", "1", "--workers", "1", "--turbine-id", "003"]) == 0
+        small = capsys.readouterr().out
+        assert main(["fleet", "--turbines", "1", "--hours", "1", "--workers", "1"]) == 0
+        default = capsys.readouterr().out
+
+        def energy(out):
+            return float(out.split("合计 ")[1].split("，")[0])
+
+        assert energy(small) < energy(default) / 100
+
+    def test_main_module_delegates_to_run(self):
+        result = subprocess.run([sys.executable, "-m", "src.main", "--help"], cwd=ROOT, capture_output=True, text=True)
+        assert result.returncode == 0
+        assert "--turbine-id" in result.stdout
@@ -0,0 +1,85 @@
+import os
+
+import numpy as np
+import pytest
+
+from src.configs.fleet_registry import load_fleet_parameters
+from src.simulations.turbine.drivetrain_control import ControlledTurbineFleet
+from src.simulations.turbine.rotor_aero import RotorModel
+
+FAN_BASIS = os.path.join(os.path.dirname(__file__), "..", "fan_basis(1).json")
+
+
+@pytest.fixture(scope="module")
+def fleet(tmp_path_factory):
+    return load_fleet_parameters(FAN_BASIS, cache_dir=str(tmp_path_factory.mktemp("cache")))
+
+
+@pytest.mark.parametrize("device_id", ["001", "002"])
+def test_steady_wind_converges_to_operating_point(fleet, device_id):
+    config = fleet.turbine_config(device_id)
+    model = RotorModel.from_config(config)
+    speeds = np.array([6.0, 9.0, config.v_rated + 3.0, config.v_out - 2.0])
+    controlled = ControlledTurbineFleet(model, n_turbines=len(speeds), control_hz=20)
+    result = controlled.simulate(np.repeat(speeds[:, None], 600, axis=1))
+    steady = model.operating_point(speeds)
+
+    # 区域 2 跟踪最优叶尖速比，区域 3 稳定在额定转速与额定功率
+    np.testing.assert_allclose(result["power_kw"][:, -30:].mean(axis=1), steady["power_kw"], rtol=0.01)
+    np.testing.assert_allclose(result["rpm"][:, -30:].mean(axis=1), steady["rpm"], rtol=0.01)
+    np.testing.assert_allclose(result["pitch_deg"][2:, -30:].mean(axis=1), steady["pitch_deg"][2:], atol=0.5)
+    assert result["online"][:, -1].all()
+
+
+def test_turbulent_wind_stays_bounded(fleet):
+    config = fleet.turbine_config("001")
+    rng = np.random.default_rng(0)
+    wind = 14.0 + np.cumsum(rng.normal(0, 0.3, (50, 300)), axis=1) * 0.3
+    result = ControlledTurbineFleet(RotorModel.from_config(config), n_turbines=50, control_hz=20).simulate(wind)
+    assert result["power_kw"].max() <= config.p_rated * 1.001
+    assert result["rpm"].max() < config.rpm_rated * 1.25
+    assert np.all((result["pitch_deg"] >= 0) & (result["pitch_deg"] <= 45))
+
+
+def test_cut_in_and_cut_out_hysteresis(fleet):
+    config = fleet.turbine_config("001")
+    controlled = ControlledTurbineFleet(RotorModel.from_config(config), n_turbines=1, control_hz=10,
+                                        wind_filter_tau=1.0)
+    # 切入附近小幅波动：并网后不因短暂低于 v_in 而停机
+    around_cut_in = config.v_in + 0.3 * np.sin(np.arange(600) / 20.0) + 0.2
+    result = controlled.simulate(around_cut_in)
+    assert result["online"][0, 120:].all()
+
+    # 切出后风速回落到 v_restart 之上不重新并网，降到其下才重新并网
+    wind = np.concatenate([np.full(300, 20.0), np.full(300, config.v_out + 2.0),
+                           np.full(300, controlled.v_restart + 1.0), np.full(300, controlled.v_restart - 2.0)])
+    result = controlled.simulate(wind)
+    online, rpm = result["online"][0], result["rpm"][0]
+    assert online[250:300].all()
+    assert not online[320:900].any() and result["power_kw"][0, 320:900].max() == 0
+    assert rpm[590] < 0.05 * config.rpm_rated
+    assert online[-100:].all()
+
+
+def test_broadcast_shared_wind(fleet):
+    controlled = ControlledTurbineFleet(RotorModel.from_config(fleet.turbine_config("001")), n_turbines=3)
+    result = controlled.simulate(np.full(120, 9.0))
+    assert result["power_kw"].shape == (3, 120)
+    np.testing.assert_array_equal(result["power_kw"][0], result["power_kw"][2])
+
+
+def test_controller_stage_feeds_rpm_and_bearing_outputs(fleet):
+    from src.main import simulate
+
+    outputs, dt = simulate(hours=1, turbine_id="001", wind_seed=None, use_controller=True, control_hz=5.0,
+                           fan_basis_path=FAN_BASIS)
+    (_, _, _, power_min, rpm_min, bearing_temp, bearing_vibration, _, power_hour, rpm_hour, _,
+     power_sec, rpm_sec) = outputs
+    assert dt == 1.0 and len(rpm_sec) == 3600
+    # 分钟/小时转速与功率均为闭环控制器秒级结果的平均，轴承模拟使用该分钟转速
+    np.testing.assert_allclose(rpm_min, rpm_sec.reshape(60, 60).mean(axis=1))
+    np.testing.assert_allclose(power_hour, [power_sec.mean()])
+    np.testing.assert_allclose(rpm_hour, [rpm_sec.mean()])
+    assert 0 < power_sec.max() <= fleet.turbine_config("001").p_rated * 1.001
+    assert len(bearing_temp) == len(bearing_vibration) == 60
+    assert np.isfinite(bearing_temp).all() and np.isfinite(bearing_vibration).all()
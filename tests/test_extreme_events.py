@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from src.simulations.turbine.wind_turbine_power_simu import WindTurbinePowerSimulator
+from src.simulations.wind.extreme_events import ExtremeEventGenerator
+from src.simulations.wind.wind_field_manager import WindFieldManager
+from src.simulations.wind.wind_speed_simu import WindSpeedSimulator
+
+
+def fixed_schedule(events_by_call):
+    calls = iter(events_by_call)
+
+    def schedule(n_steps):
+        return [(event_type, np.array(starts, dtype=np.intp)) for event_type, starts in next(calls)]
+    return schedule
+
+
+def test_iec_amplitudes():
+    generator = ExtremeEventGenerator(turbine_class="II", turbulence_class="B", rng=np.random.default_rng(0))
+    sigma1 = 0.14 * (0.75 * 10.0 + 5.6)
+    v_gust, _ = generator.amplitudes("eog", np.array([10.0, 45.0]), np.ones(2))
+    assert v_gust[0] == pytest.approx(3.3 * sigma1)
+    assert v_gust[1] == pytest.approx(1.35 * (0.8 * 1.4 * 42.5 - 45.0))
+    _, theta = generator.amplitudes("edc", np.array([10.0]), -np.ones(1))
+    assert theta[0] == pytest.approx(-np.rad2deg(4 * np.arctan(sigma1 / 10.0)))
+    speed, theta = generator.amplitudes("ecd", np.array([2.0, 12.0]), np.ones(2))
+    np.testing.assert_allclose(speed, 15.0)
+    np.testing.assert_allclose(theta, [180.0, 60.0])
+
+
+def test_ecd_overlay_spans_chunks_and_returns_to_baseline():
+    generator = ExtremeEventGenerator(hold=30.0, rng=np.random.default_rng(0))
+    generator.schedule = fixed_schedule([[("ecd", [95])], [], []])
+    base = np.full(100, 12.0)
+    first, first_dirs = generator.apply(base, np.zeros(100))
+    second, second_dirs = generator.apply(base, np.zeros(100))
+    third, _ = generator.apply(base, np.zeros(100))
+    speeds = np.concatenate([first, second, third])
+    dirs = np.concatenate([first_dirs, second_dirs])
+    # 10 s 余弦上升到 +15 m/s，保持 30 s，再 10 s 恢复
+    assert speeds[95] == 12.0 and speeds[105:136].min() == pytest.approx(27.0)
+    assert abs(dirs[120]) == pytest.approx(60.0)
+    np.testing.assert_allclose(speeds[146:], 12.0)
+    assert generator.last_events == []
+
+
+def test_poisson_rates_and_direction_wrap():
+    day = 24 * 3600
+    generator = ExtremeEventGenerator(rates={"eog": 365.0 * 200, "edc": 365.0 * 50}, rng=np.random.default_rng(1))
+    speeds, dirs = generator.apply(np.full(day, 8.0), np.full(day, 170.0))
+    counts = {t: sum(1 for e in generator.last_events if e[0] == t) for t in ("eog", "edc", "ecd")}
+    assert 150 < counts["eog"] < 250 and 25 < counts["edc"] < 80 and counts["ecd"] == 0
+    assert speeds.min() < 8.0 < speeds.max() and speeds.min() >= 0
+    assert np.all((dirs >= -180) & (dirs < 180))
+
+
+def test_manager_applies_events_to_synthetic_wind():
+    events = ExtremeEventGenerator(rates={"ecd": 365.0 * 24 * 10}, rng=np.random.default_rng(2))
+    manager = WindFieldManager(WindSpeedSimulator(dt=1.0, sigma=0.0, sigma_dir=0.0), events=events)
+    speeds, _ = manager.simulate(3600)
+    assert len(events.last_events) > 0 and speeds.max() > 20.0
+
+
+def test_cut_out_restart_hysteresis_across_chunks():
+    simulator = WindTurbinePowerSimulator(noise_sigma=0.0, max_ramp_rate=1e9, time_constant=0.0, v_restart=20.0)
+    wind = np.array([15.0, 24.0, 26.0, 24.0, 21.0, 19.0, 24.0])
+    power = simulator.power_from_speed(wind)
+    np.testing.assert_array_equal(power[2:5], 0.0)
+    assert power[1] == power[5] == power[6] == 2000.0
+
+    first, state = simulator.power_from_speed(wind[:4], return_state=True)
+    second = simulator.power_from_speed(wind[4:], state)
+    np.testing.assert_array_equal(np.concatenate([first, second]), power)
+
+    # 未设置 v_restart 时保持原行为
+    legacy = WindTurbinePowerSimulator(noise_sigma=0.0, max_ramp_rate=1e9, time_constant=0.0)
+    assert legacy.power_from_speed(wind)[3] == 2000.0
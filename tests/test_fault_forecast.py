@@ -0,0 +1,58 @@
+import numpy as np
+from src.analysis.fault_forecast import RISK_HIGH, RISK_LOW, BearingFaultForecaster
+from src.simulations.bearing.bearing_temp_simulator import BearingTemperatureSimulator
+
+
+def test_degrading_turbine_has_higher_risk():
+    np.random.seed(0)
+    minutes = 24 * 60
+    ambient = np.full(minutes, 20.0)
+    rpm = np.full(minutes, 15.0)
+
+    healthy = BearingTemperatureSimulator().simulate(ambient, rpm)
+    # 温度以 1.5°C/小时的速率持续偏离模型
+    degrading = BearingTemperatureSimulator().simulate(ambient, rpm, temp_offsets=np.arange(minutes) / 40.0)
+
+    forecaster = BearingFaultForecaster(n_samples=100, temp_limit=70.0, rng=np.random.default_rng(0))
+    result = forecaster.forecast(
+        temp_history=np.stack([healthy, degrading]),
+        vib_history=np.full((2, minutes), 2.5),
+        ambient_history=np.stack([ambient, ambient]),
+        rpm_history=np.stack([rpm, rpm]),
+    )
+    assert result.temp_mean.shape == (2, 24)
+    assert result.temp_quantiles.shape == (2, 3, 24)
+    assert result.temp_trend[1] > 1.0
+    assert list(result.risk_level()) == [RISK_LOW, RISK_HIGH]
+
+
+def test_idle_turbine_follows_ambient():
+    forecaster = BearingFaultForecaster(n_samples=20, horizon_minutes=120, rng=np.random.default_rng(1))
+    result = forecaster.forecast(
+        temp_history=np.full((1, 120), 25.0),
+        vib_history=np.full((1, 120), 0.15),
+        ambient_history=np.full((1, 120), 25.0),
+        rpm_history=np.zeros((1, 120)),
+    )
+    np.testing.assert_allclose(result.temp_mean, 25.0)
+    assert result.risk_probability[0] == 0.0
+
+
+def test_idle_gap_excluded_from_trend():
+    minutes = 24 * 60
+    ambient = np.full((1, minutes), 20.0)
+    rpm = np.full((1, minutes), 15.0)
+    rpm[:, :minutes // 2] = 0.0
+    forecaster = BearingFaultForecaster(n_samples=50, temp_limit=70.0, rng=np.random.default_rng(2))
+    expected, _, idle = forecaster._expected(ambient, rpm)
+    # 运行时段残差恒为 +5°C；停机时段温度等于环境温度
+    temp = np.where(idle, ambient, expected + 5.0)
+    result = forecaster.forecast(
+        temp_history=temp,
+        vib_history=np.full((1, minutes), 2.5),
+        ambient_history=ambient,
+        rpm_history=rpm,
+    )
+    assert abs(result.temp_trend[0]) < 1e-9
+    assert result.temp_exceed_prob[0] == 0.0
+    np.testing.assert_allclose(result.temp_mean[0, -1], expected[0, -1] + 5.0, atol=0.5)
@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from src.analysis.feature_engine import FeatureEngine, rolling_stats
+from src.simulations.bearing.bearing_temp_simulator import BearingTemperatureSimulator
+from src.simulations.bearing.bearing_vibration_simulator import BearingVibrationSimulator
+
+
+def _naive(x, window, fn):
+    out = np.full(x.shape, np.nan)
+    for i in range(x.shape[0]):
+        for e in range(window - 1, x.shape[1]):
+            out[i, e] = fn(x[i, e - window + 1:e + 1])
+    return out
+
+
+def _slope(w):
+    t = np.arange(len(w))
+    return np.polyfit(t, w, 1)[0]
+
+
+class TestRollingStats:
+    def test_matches_naive(self):
+        rng = np.random.default_rng(0)
+        x = rng.normal(50.0, 5.0, size=(3, 200)) + np.linspace(0, 20, 200)
+        stats = rolling_stats(x, 15)
+        np.testing.assert_allclose(stats["mean"], _naive(x, 15, np.mean), equal_nan=True)
+        np.testing.assert_allclose(stats["std"], _naive(x, 15, np.std), atol=1e-8, equal_nan=True)
+        np.testing.assert_allclose(stats["slope"], _naive(x, 15, _slope), atol=1e-8, equal_nan=True)
+        np.testing.assert_allclose(stats["min"], _naive(x, 15, np.min), equal_nan=True)
+        np.testing.assert_allclose(stats["max"], _naive(x, 15, np.max), equal_nan=True)
+        np.testing.assert_allclose(stats["q90"], _naive(x, 15, lambda w: np.quantile(w, 0.9)), equal_nan=True)
+        assert np.isnan(stats["mean"][:, :14]).all()
+
+    def test_gap_only_affects_windows_containing_it(self):
+        rng = np.random.default_rng(2)
+        x = rng.normal(50.0, 5.0, size=(2, 100))
+        x[0, 40] = np.nan
+        x[1, 60:75] = np.nan
+        stats = rolling_stats(x, 10)
+        for name in ("mean", "std", "slope"):
+            assert np.isnan(stats[name][0, 40:50]).all(), name
+            assert np.isfinite(stats[name][0, 50:]).all(), name
+            np.testing.assert_allclose(stats[name][0, 50:], rolling_stats(x[:, 41:], 10)[name][0, 9:], atol=1e-8)
+        np.testing.assert_allclose(stats["max"][0, 40:50], _naive(x[:1], 10, np.nanmax)[0, 40:50])
+        np.testing.assert_allclose(stats["q50"][0, 40:50], _naive(x[:1], 10, np.nanmedian)[0, 40:50])
+        # 窗口内全部缺失
+        assert np.isnan(stats["min"][1, 69:75]).all() and np.isnan(stats["q10"][1, 69:75]).all()
+        assert np.isfinite(stats["min"][1, 75:]).all()
+
+    def test_short_series_all_nan(self):
+        stats = rolling_stats(np.ones((2, 5)), 10)
+        assert all(np.isnan(v).all() for v in stats.values())
+
+
+class TestFeatureEngine:
+    def _signals(self, n_turbines=4, n_minutes=300, seed=1):
+        rng = np.random.default_rng(seed)
+        rpm = rng.uniform(8.0, 16.0, size=(n_turbines, n_minutes))
+        ambient = np.full((n_turbines, n_minutes), 15.0)
+        return {
+            "power_kw": rng.uniform(0, 2000, size=(n_turbines, n_minutes)),
+            "rpm": rpm,
+            "bearing_temp": ambient + 20.0 + rng.normal(0, 0.5, size=rpm.shape),
+            "bearing_vibration": rng.uniform(1.0, 3.0, size=rpm.shape),
+            "ambient_temp": ambient,
+        }
+
+    def test_residual_removes_expected_temperature(self):
+        model = BearingTemperatureSimulator(rpm_min=8.0, rpm_rated=16.0)
+        signals = self._signals()
+        signals["bearing_temp"] = signals["ambient_temp"] + model._get_friction_heat_rise_array(signals["rpm"])
+        engine = FeatureEngine(bearing_temp_model=model)
+        residual = engine.residuals(signals)["bearing_temp_residual"]
+        np.testing.assert_allclose(residual, 0.0, atol=1e-9)
+
+    def test_feature_matrix_shape(self):
+        engine = FeatureEngine(
+            windows=(10, 60),
+            bearing_temp_model=BearingTemperatureSimulator(rpm_min=8.0, rpm_rated=16.0),
+            bearing_vibration_model=BearingVibrationSimulator(rpm_min=8.0, rpm_rated=16.0),
+        )
+        features = engine.transform(self._signals())
+        # 6 个信号 × 2 个窗口 × (5 个统计 + 3 个分位数)
+        assert len(features.names) == 6 * 2 * 8
+        assert "bearing_temp_residual.mean.w60" in features.names
+        X, index = features.to_matrix()
+        assert X.shape == (4 * (300 - 59), len(features.names))
+        assert not np.isnan(X).any()
+        assert index[0].tolist() == [0, 59]
+
+    def test_append_matches_batch(self):
+        engine = FeatureEngine(windows=(5, 30), bearing_temp_model=BearingTemperatureSimulator(rpm_min=8.0, rpm_rated=16.0))
+        signals = self._signals()
+        batch = engine.transform(signals)
+        live = FeatureEngine(windows=(5, 30), bearing_temp_model=BearingTemperatureSimulator(rpm_min=8.0, rpm_rated=16.0))
+        parts = []
+        for start, stop in [(0, 7), (7, 100), (100, 101), (101, 300)]:
+            chunk = live.append({name: values[:, start:stop] for name, values in signals.items()})
+            assert chunk.minute_offset == start
+            parts.append(chunk.values)
+        np.testing.assert_allclose(np.concatenate(parts, axis=1), batch.values, rtol=1e-9, atol=1e-9, equal_nan=True)
+
+    def test_append_matches_batch_with_gap(self):
+        signals = self._signals()
+        signals["bearing_temp"][1, 50:53] = np.nan
+        signals["rpm"][2, 120] = np.nan
+        batch = FeatureEngine(windows=(5, 30)).transform(signals)
+        live = FeatureEngine(windows=(5, 30))
+        parts = [live.append({name: values[:, start:start + 20] for name, values in signals.items()}).values
+                 for start in range(0, 300, 20)]
+        live_values = np.concatenate(parts, axis=1)
+        np.testing.assert_array_equal(np.isnan(live_values), np.isnan(batch.values))
+        np.testing.assert_allclose(live_values, batch.values, rtol=1e-9, atol=1e-9, equal_nan=True)
+        mean = batch["bearing_temp.mean.w30"]
+        assert np.isnan(mean[1, 50:82]).all() and np.isfinite(mean[1, 82:]).all()
+
+    def test_unknown_stat(self):
+        with pytest.raises(ValueError):
+            FeatureEngine(stats=("mean", "kurtosis"))
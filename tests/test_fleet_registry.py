@@ -0,0 +1,41 @@
+import json
+import os
+import shutil
+
+import numpy as np
+import pytest
+from src.configs.fleet_registry import load_fleet_parameters, parse_quantity
+
+FAN_BASIS = os.path.join(os.path.dirname(__file__), "..", "fan_basis(1).json")
+
+
+def test_parse_quantity_units():
+    assert parse_quantity("2.5MW", "p_rated") == 2500.0
+    assert parse_quantity("600W", "p_rated") == pytest.approx(0.6)
+    assert parse_quantity("3.0m/s", "v_in") == 3.0
+    assert parse_quantity("17.25rpm", "rpm_rated") == 17.25
+    with pytest.raises(ValueError):
+        parse_quantity("3.0rpm", "v_in")
+
+
+def test_load_fan_basis_and_cache(tmp_path):
+    fleet = load_fleet_parameters(FAN_BASIS, cache_dir=str(tmp_path))
+    assert list(fleet.device_ids) == ["001", "002", "003"]
+    np.testing.assert_allclose(fleet.p_rated, [2500.0, 5.0, 0.6])
+    np.testing.assert_allclose(fleet.rotor_diameter, [96.0, 5.0, 1.4])
+    assert len(os.listdir(tmp_path)) == 1
+
+    cached = load_fleet_parameters(FAN_BASIS, cache_dir=str(tmp_path))
+    np.testing.assert_array_equal(cached.rpm_rated, fleet.rpm_rated)
+    config = cached.turbine_config("001")
+    assert (config.v_in, config.v_rated, config.v_out) == (3.0, 11.5, 25.0)
+
+
+def test_invalid_record_is_rejected(tmp_path):
+    with open(FAN_BASIS, encoding="utf-8") as f:
+        records = json.load(f)
+    records[1]["额定风速"] = "30m/s"
+    path = tmp_path / "bad.json"
+    path.write_text(json.dumps(records, ensure_ascii=False), encoding="utf-8")
+    with pytest.raises(ValueError, match="002"):
+        load_fleet_parameters(str(path), use_cache=False)
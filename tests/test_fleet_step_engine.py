@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from src.simulations.bearing.bearing_temp_simulator import BearingTemperatureSimulator
+from src.simulations.fleet_step_engine import SIGNALS, FleetStepEngine, NoiseBuffer
+from src.simulations.turbine.wind_turbine_power_simu import WindTurbinePowerSimulator
+from src.simulations.wind.wind_speed_simu import WindSpeedSimulator
+
+
+class TestNoiseBuffer:
+    def test_blocks_follow_generator_sequence(self):
+        buffer = NoiseBuffer(np.random.default_rng(0), n_streams=2, n_units=3, block=4)
+        draws = np.stack([buffer.next().copy() for _ in range(8)])
+        expected = np.random.default_rng(0).standard_normal((8, 2, 3))
+        np.testing.assert_array_equal(draws, expected)
+
+    def test_background_matches_synchronous(self):
+        sync = NoiseBuffer(np.random.default_rng(1), 1, 5, block=3)
+        background = NoiseBuffer(np.random.default_rng(1), 1, 5, block=3, background=True)
+        for _ in range(10):
+            np.testing.assert_array_equal(sync.next(), background.next())
+        background.close()
+
+    def test_background_requires_generator(self):
+        with pytest.raises(ValueError):
+            NoiseBuffer(np.random, 1, 5, background=True)
+
+
+class TestFleetStepEngine:
+    def test_state_has_no_instance_dict(self):
+        engine = FleetStepEngine(4, rng=np.random.default_rng(0))
+        assert not hasattr(engine, "__dict__")
+
+    def test_run_shapes_and_ranges(self):
+        turbine = WindTurbinePowerSimulator(rpm_min=6.0, rpm_rated=15.0)
+        engine = FleetStepEngine(20, turbine=turbine, rng=np.random.default_rng(0))
+        out = engine.run(600)
+        assert set(out) == set(SIGNALS)
+        assert out["power_kw"].shape == (20, 600)
+        assert out["wind_speed"].min() >= 0.0
+        assert np.abs(out["wind_dir"]).max() <= 180.0
+        assert out["rpm"].min() >= 6.0 and out["rpm"].max() <= 15.0
+        assert out["bearing_temp"].min() >= 20.0
+        # 轴承信号每分钟更新一次
+        assert np.all(out["bearing_temp"][:, 60:119] == out["bearing_temp"][:, 60:61])
+
+    def test_noise_free_wind_matches_scalar_step(self):
+        wind = WindSpeedSimulator(dt=1.0, sigma=0.0, sigma_dir=0.0, mean_wind=8.0)
+        wind.wind_speed, wind.wind_dir = 15.0, 40.0
+        engine = FleetStepEngine(3, wind=wind, rng=np.random.default_rng(0))
+        expected = [wind.step() for _ in range(50)]
+        got = [(engine.tick()["wind_speed"][0], engine.wind_dir[0]) for _ in range(50)]
+        np.testing.assert_allclose(got, expected)
+
+    def test_noise_free_power_matches_sequence_api(self):
+        wind = WindSpeedSimulator(dt=1.0, sigma=0.0, sigma_dir=0.0, mean_wind=11.0)
+        wind.wind_speed = 4.0
+        turbine = WindTurbinePowerSimulator(noise_sigma=0.0, rpm_noise_sigma=0.0, v_restart=20.0)
+        engine = FleetStepEngine(2, wind=wind, turbine=turbine, rng=np.random.default_rng(0))
+        out = engine.run(120)
+        np.testing.assert_allclose(out["power_kw"][0], turbine.power_from_speed(out["wind_speed"][0]))
+
+    def test_bearing_minute_update_matches_step(self):
+        turbine = WindTurbinePowerSimulator(noise_sigma=0.0, rpm_noise_sigma=0.0)
+        bearing = BearingTemperatureSimulator(sigma=0.0, base_temp=20.0)
+        wind = WindSpeedSimulator(dt=1.0, sigma=0.0, sigma_dir=0.0, mean_wind=14.0)
+        wind.wind_speed = 14.0
+        engine = FleetStepEngine(1, wind=wind, turbine=turbine, bearing_temp=bearing, rng=np.random.default_rng(0))
+        out = engine.run(600)
+        rpm_minute = out["rpm"][0].reshape(-1, 60).mean(axis=1)
+        expected = [bearing.step(20.0, r) for r in rpm_minute]
+        np.testing.assert_allclose(out["bearing_temp"][0, 59::60], expected)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from src.analysis.health_index import (
+    HEALTH_STATUS_FAULT,
+    HEALTH_STATUS_HEALTHY,
+    HEALTH_STATUS_WARNING,
+    RollingHealthIndex,
+    health_status_codes,
+    rolling_health_index,
+)
+
+
+@pytest.fixture
+def fleet_data():
+    rng = np.random.default_rng(0)
+    n_turbines, n_minutes = 4, 300
+    power = rng.uniform(0, 2000, size=(n_turbines, n_minutes))
+    temps = rng.uniform(20, 60, size=(n_turbines, n_minutes))
+    vibs = rng.uniform(0, 3, size=(n_turbines, n_minutes))
+    return power, temps, vibs
+
+
+def test_rolling_matches_direct_window_mean(fleet_data):
+    power, temps, vibs = fleet_data
+    result = rolling_health_index(power, temps, vibs, p_rated=2000.0, windows=(10, 60))
+    assert result.shape == (2, 4, 300)
+
+    t = 150
+    expected = power[:, t - 59:t + 1].mean(axis=1) / 2000.0 \
+        - temps[:, t - 59:t + 1].mean(axis=1) / 100.0 \
+        - vibs[:, t - 59:t + 1].mean(axis=1) / 5.0
+    np.testing.assert_allclose(result[1, :, t], np.clip(expected, 0, 1))
+
+
+def test_incremental_matches_batch(fleet_data):
+    power, temps, vibs = fleet_data
+    windows = (10, 60, 120)
+    tracker = RollingHealthIndex(n_turbines=4, p_rated=2000.0, windows=windows)
+    batch = rolling_health_index(power, temps, vibs, p_rated=2000.0, windows=windows)
+
+    # 追加次数超过缓冲区长度，覆盖环形缓冲区绕回的情况
+    for t in range(power.shape[1]):
+        tracker.append(power[:, t], temps[:, t], vibs[:, t])
+        if t in (5, 119, 120, 299):
+            np.testing.assert_allclose(tracker.health_index(), batch[:, :, t].T, atol=1e-12)
+
+
+def test_health_status_codes():
+    codes = health_status_codes(np.array([0.9, 0.6, 0.2]))
+    assert codes.dtype == np.uint8
+    assert list(codes) == [HEALTH_STATUS_HEALTHY, HEALTH_STATUS_WARNING, HEALTH_STATUS_FAULT]
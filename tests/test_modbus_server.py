@@ -0,0 +1,66 @@
+import asyncio
+import struct
+
+import numpy as np
+from src.scada.modbus_server import RegisterBank, SimulatorFleetSource, start_modbus_server
+
+
+async def _request(reader, writer, tid, unit, function, address, count):
+    writer.write(struct.pack(">HHHBBHH", tid, 0, 6, unit, function, address, count))
+    await writer.drain()
+    header = await reader.readexactly(7)
+    _, _, length, _ = struct.unpack(">HHHB", header)
+    return header, await reader.readexactly(length - 1)
+
+
+def test_read_registers_over_tcp():
+    async def scenario():
+        bank = RegisterBank(3)
+        bank.update({"wind_speed": [5.0, 7.5, 9.0], "power_kw": [100.0, 250.5, 800.0]})
+        server = await start_modbus_server(bank, port=0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        header, body = await _request(reader, writer, 7, 2, 0x04, 0, 6)
+        assert struct.unpack(">H", header[:2])[0] == 7
+        assert body[0] == 0x04 and body[1] == 12
+        wind, _, power = struct.unpack(">fff", body[2:])
+        assert (wind, power) == (7.5, 250.5)
+
+        # 越界地址与未知单元返回异常应答
+        _, body = await _request(reader, writer, 8, 1, 0x03, 10, 4)
+        assert tuple(body) == (0x83, 0x02)
+        _, body = await _request(reader, writer, 9, 200, 0x03, 0, 2)
+        assert tuple(body) == (0x83, 0x0B)
+
+        writer.close()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(scenario())
+
+
+def test_fleet_source_tick():
+    source = SimulatorFleetSource(4, turbine_kwargs={"p_rated": 5.0, "v_in": 2.5, "v_rated": 10.0, "v_out": 20.0,
+                                                      "rpm_min": 75.0, "rpm_rated": 300.0}, seed=0)
+    for _ in range(120):
+        signals = source.tick()
+    bank = RegisterBank(4)
+    bank.update(signals)
+    np.testing.assert_allclose(bank.values[:, 2], signals["power_kw"], rtol=1e-6)
+    assert np.all(signals["bearing_temp"] >= 20.0)
+
+
+def test_fleet_source_seed_is_local():
+    kwargs = {"p_rated": 5.0, "v_in": 2.5, "v_rated": 10.0, "v_out": 20.0, "rpm_min": 75.0, "rpm_rated": 300.0}
+    np.random.seed(123)
+    expected = np.random.random()
+    np.random.seed(123)
+    runs = []
+    for _ in range(2):
+        source = SimulatorFleetSource(3, turbine_kwargs=kwargs, seed=7)
+        runs.append(np.array([source.tick()["wind_speed"].copy() for _ in range(60)]))
+    # 构造与推进都不触碰全局随机状态，相同种子结果一致，各风机的风速互不相同
+    assert np.random.random() == expected
+    np.testing.assert_array_equal(runs[0], runs[1])
+    assert not np.allclose(runs[0][:, 0], runs[0][:, 1])
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from src.analysis.power_analysis import (
+    BinnedPowerCurve,
+    PowerAnalysis,
+    availability,
+    capacity_factor,
+    energy_loss_attribution,
+)
+
+
+@pytest.fixture
+def scada():
+    rng = np.random.default_rng(1)
+    wind = rng.uniform(0, 20, size=20000)
+    power = np.clip((wind - 3) / 9, 0, 1) ** 3 * 2000 + rng.normal(0, 10, size=wind.shape)
+    turbine_ids = rng.integers(0, 3, size=wind.shape)
+    return wind, power, turbine_ids
+
+
+def test_bin_statistics_match_direct_computation(scada):
+    wind, power, turbine_ids = scada
+    curve = BinnedPowerCurve(n_turbines=3).update(wind, power, turbine_ids)
+
+    sel = (turbine_ids == 1) & (np.floor(wind / 0.5 + 0.5) == 20)
+    assert curve.count[1, 20] == sel.sum()
+    assert curve.mean[1, 20] == pytest.approx(power[sel].mean())
+    assert curve.std[1, 20] == pytest.approx(power[sel].std(ddof=1))
+
+
+def test_chunked_merge_equals_single_pass(scada):
+    wind, power, turbine_ids = scada
+    full = BinnedPowerCurve(n_turbines=3).update(wind, power, turbine_ids)
+
+    merged = BinnedPowerCurve(n_turbines=3)
+    for chunk in np.array_split(np.arange(len(wind)), 7):
+        part = BinnedPowerCurve(n_turbines=3).update(wind[chunk], power[chunk], turbine_ids[chunk])
+        merged.merge(part)
+
+    np.testing.assert_array_equal(merged.count, full.count)
+    np.testing.assert_allclose(merged.mean, full.mean)
+    np.testing.assert_allclose(merged.std, full.std)
+    assert merged.fleet().count.sum() == len(wind)
+
+
+def test_performance_metrics():
+    wind = np.array([2.0, 5.0, 8.0, 10.0, 30.0])
+    power = np.array([0.0, 100.0, 0.0, 800.0, 0.0])
+    expected = np.array([0.0, 150.0, 500.0, 900.0, 0.0])
+
+    assert capacity_factor(power, 1000.0) == pytest.approx(0.18)
+    assert availability(power, wind, v_in=3.0, v_out=25.0) == pytest.approx(2 / 3)
+
+    losses = energy_loss_attribution(power, expected, dt_hours=1.0)
+    assert losses["downtime_loss"] == pytest.approx(500.0)
+    assert losses["performance_loss"] == pytest.approx(150.0)
+
+
+def test_efficiency_uses_rated_power():
+    analysis = PowerAnalysis(np.array([250.0, 500.0]), np.array([5.0, 8.0]), rated_power=500.0)
+    np.testing.assert_allclose(analysis.calculate_efficiency(), [0.5, 1.0])
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from src.simulations.bearing.bearing_temp_simulator import BearingTemperatureSimulator
+from src.simulations.bearing.bearing_vibration_simulator import BearingVibrationSimulator
+from src.simulations.environment.temperature_simulator import TemperatureSimulator
+from src.simulations.precision import MemoryLedger, accuracy_report, get_precision
+from src.simulations.turbine.wind_turbine_power_simu import WindTurbinePowerSimulator
+from src.simulations.wind.wind_field_manager import WindFieldManager
+from src.simulations.wind.wind_speed_simu import WindSpeedSimulator
+
+
+def run_pipeline(precision_name: str, seed: int = 3, hours: int = 6) -> dict:
+    precision = get_precision(precision_name)
+    rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(5)]
+    dtype = precision.value
+    wind = WindFieldManager(WindSpeedSimulator(dt=1.0, mean_wind=9.0, rng=rngs[0]), dtype=dtype)
+    speeds, dirs = wind.simulate(hours * 3600)
+    ambient = TemperatureSimulator(tau=6.0, sigma=0.5, dt=1.0, mean_temp=20.0, rng=rngs[1], dtype=dtype).simulate(hours)
+    turbine = WindTurbinePowerSimulator(rng=rngs[2], dtype=dtype)
+    power, rpm = turbine.power_and_rpm_from_speed(speeds)
+    rpm_min = rpm.reshape(-1, 60).mean(axis=1)
+    bearing_temp = BearingTemperatureSimulator(rng=rngs[3], dtype=dtype).simulate(np.repeat(ambient, 60), rpm_min)
+    vibration = BearingVibrationSimulator(rng=rngs[4], dtype=dtype).simulate(rpm_min)
+    return {
+        "second": {"sec_id": np.arange(len(speeds), dtype=precision.index), "wind_speed": speeds,
+                   "wind_dir": dirs, "power_kw": power, "rpm": rpm},
+        "minute": {"rpm": rpm_min, "bearing_temp": bearing_temp, "bearing_vibration": vibration},
+        "hour": {"ambient_temp": ambient},
+    }
+
+
+def test_float32_outputs_match_float64_within_signal_precision():
+    reference, compact = run_pipeline("float64"), run_pipeline("float32")
+    for table in compact.values():
+        for name, values in table.items():
+            assert values.dtype == (np.int32 if name.endswith("_id") else np.float32), name
+    report = accuracy_report(reference, compact)
+    # 误差相对信号极差在 1e-5 量级，远低于模拟噪声
+    assert max(entry["max_rel"] for entry in report.values()) < 1e-4, report
+    assert report["second.power_kw"]["max_abs"] < 0.05
+
+
+def test_memory_ledger_halves_bytes_per_turbine_second():
+    ledgers = {}
+    for name in ("float64", "float32"):
+        ledgers[name] = MemoryLedger()
+        ledgers[name].add_tables(run_pipeline(name, hours=1))
+    full = ledgers["float64"].bytes_per_turbine_second(1, 3600)
+    compact = ledgers["float32"].bytes_per_turbine_second(1, 3600)
+    assert compact == pytest.approx(full / 2)
+    assert "B/(风机·秒)" in ledgers["float32"].report(1, 3600)
+
+
+def test_unknown_precision():
+    with pytest.raises(ValueError):
+        get_precision("float16")
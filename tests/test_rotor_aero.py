@@ -0,0 +1,78 @@
+import os
+
+import numpy as np
+import pytest
+
+from src.configs.fleet_registry import load_fleet_parameters
+from src.simulations.turbine.rotor_aero import RotorModel, cp_table, heier_cp, pitch_table
+from src.simulations.turbine.wind_turbine_power_simu import WindTurbinePowerSimulator
+
+FAN_BASIS = os.path.join(os.path.dirname(__file__), "..", "fan_basis(1).json")
+
+
+@pytest.fixture(scope="module")
+def fleet(tmp_path_factory):
+    return load_fleet_parameters(FAN_BASIS, cache_dir=str(tmp_path_factory.mktemp("cache")))
+
+
+def test_table_interpolation_matches_formula():
+    rng = np.random.default_rng(0)
+    lam, beta = rng.uniform(2, 14, 5000), rng.uniform(0, 25, 5000)
+    # Cp 截断为 0 的折点附近插值误差最大
+    np.testing.assert_allclose(cp_table()(lam, beta), heier_cp(lam, beta), atol=6e-3)
+    assert cp_table() is cp_table() and pitch_table() is pitch_table()
+
+
+@pytest.mark.parametrize("device_id", ["001", "002", "003"])
+def test_pitch_table_holds_rated_power(fleet, device_id):
+    config = fleet.turbine_config(device_id)
+    model = RotorModel.from_config(config)
+    v = np.linspace(config.v_in, config.v_out - 0.01, 2000)
+    point = model.operating_point(v)
+    # 用原始公式复核反查得到的桨距角：气动功率与模型输出一致，且不超过额定功率
+    exact = model._power_coeff * v ** 3 * heier_cp(point["tip_speed_ratio"], point["pitch_deg"])
+    np.testing.assert_allclose(exact, point["power_kw"], atol=0.005 * config.p_rated)
+
+
+def test_operating_point_regions(fleet):
+    model = RotorModel.from_config(fleet.turbine_config("001"))
+    assert model is RotorModel.from_config(fleet.turbine_config("001"))
+    point = model.operating_point(np.array([2.0, 6.0, 9.0, 15.0, 24.0, 26.0]))
+    power, rpm, pitch = point["power_kw"], point["rpm"], point["pitch_deg"]
+    assert power[0] == 0 and power[-1] == 0
+    assert np.all(np.diff(power[1:4]) > 0)
+    np.testing.assert_allclose(power[3:5], 2500.0, rtol=1e-3)
+    np.testing.assert_allclose(rpm[3:5], 17.25)
+    assert pitch[1] == 0 and 0 < pitch[3] < pitch[4]
+    # 区域 2 中段跟踪最优叶尖速比
+    assert point["tip_speed_ratio"][1] == pytest.approx(model.lambda_opt, rel=1e-6)
+    assert point["cp"][1] == pytest.approx(model.cp_max, abs=2e-3)
+
+
+def test_simulator_power_and_rpm_share_state(fleet):
+    config = fleet.turbine_config("002")
+    model = RotorModel.from_config(config)
+    simulator = WindTurbinePowerSimulator(**config.simulator_kwargs(), rotor_model=model,
+                                          rng=np.random.default_rng(1))
+    wind = np.full(600, 6.0)
+    power, rpm = simulator.power_and_rpm_from_speed(wind)
+    steady = model.operating_point(6.0)
+    assert power[-100:].mean() == pytest.approx(float(steady["power_kw"]), rel=0.05)
+    assert rpm[-100:].mean() == pytest.approx(float(steady["rpm"]), rel=0.01)
+
+    plain = WindTurbinePowerSimulator(rng=np.random.default_rng(1))
+    reference = WindTurbinePowerSimulator(rng=np.random.default_rng(1))
+    p, r = plain.power_and_rpm_from_speed(wind)
+    p_ref = reference.power_from_speed(wind)
+    np.testing.assert_array_equal(p, p_ref)
+    np.testing.assert_array_equal(r, reference.rpm_from_power(p_ref))
+
+
+def test_vectorized_curve_on_large_input(fleet):
+    config = fleet.turbine_config("001")
+    aero = WindTurbinePowerSimulator(**config.simulator_kwargs(), rotor_model=RotorModel.from_config(config))
+    wind = np.random.default_rng(2).uniform(0, 30, 1_000_000)
+    power = aero._power_curve_ideal_array(wind)
+    assert power.shape == wind.shape
+    assert np.all((power >= 0) & (power <= config.p_rated * (1 + 1e-9)))
+    assert np.all(power[(wind < config.v_in) | (wind > config.v_out)] == 0)
@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+from src.analysis import rule_engine
+from src.analysis.rule_engine import (
+    Delta,
+    Increasing,
+    Max,
+    Mean,
+    Min,
+    RelativeRange,
+    Rule,
+    RuleEngine,
+    Signal,
+    Slope,
+    knowledge_base_rules,
+)
+
+
+def test_window_primitives():
+    x = np.array([[1.0, 3.0, 2.0, 5.0, 4.0, 6.0]])
+    np.testing.assert_array_equal(Max(Signal("x"), 3).evaluate({"x": x})[0, 2:], [3, 5, 5, 6])
+    np.testing.assert_allclose(Slope(Signal("x"), 6).evaluate({"x": x})[0, -1], np.polyfit(np.arange(6), x[0], 1)[0])
+    assert list(Increasing(Signal("x"), 2).evaluate({"x": x})[0, 1:]) == [True, False, True, False, True]
+    rr = RelativeRange(Signal("x"), 2).evaluate({"x": x})
+    assert rr[0, 1] == pytest.approx(2.0 / 2.0)
+
+
+def test_persistence_and_hysteresis():
+    cond = np.array([[0, 1, 1, 1, 0, 1, 0, 0, 0, 1]], dtype=float)
+    engine = RuleEngine([Rule("r", Signal("c") > 0, persist=2, clear_persist=3, long_term=4)])
+    result = engine.evaluate({"c": cond})["r"]
+    assert list(result.alarm[0].astype(int)) == [0, 0, 1, 1, 1, 1, 1, 1, 0, 0]
+    assert list(result.long_term[0].astype(int)) == [0, 0, 0, 0, 0, 1, 1, 1, 0, 0]
+
+
+def test_stream_matches_batch():
+    rng = np.random.default_rng(3)
+    n_turbines, n = 5, 400
+    rpm = np.full((n_turbines, n), 12.0) + rng.normal(0, 0.1, (n_turbines, n))
+    power = np.full((n_turbines, n), 1000.0) + rng.normal(0, 20, (n_turbines, n))
+    bearing_temp = 40 + np.cumsum(rng.normal(0.05, 0.1, (n_turbines, n)), axis=1)
+    signals = {
+        "rpm": rpm,
+        "power": power,
+        "theoretical_power": np.full((n_turbines, n), 1300.0),
+        "bearing_temp": bearing_temp,
+        "leak_rate": np.cumsum(rng.normal(0, 1, (n_turbines, n)), axis=1),
+    }
+    engine = RuleEngine(knowledge_base_rules(dt_seconds=60.0, include_leak=True))
+    batch = engine.evaluate(signals)
+    assert batch["水力性能异常"].alarm[:, -1].all()
+    assert batch["轴承断裂高风险"].alarm[:, -1].any()
+
+    stream = engine.stream(n_turbines)
+    chunks = {name: [] for name in batch}
+    for start in range(0, n, 37):
+        out = stream.update({k: v[:, start:start + 37] for k, v in signals.items()})
+        for name, res in out.items():
+            chunks[name].append(res.alarm)
+    for name, res in batch.items():
+        np.testing.assert_array_equal(np.concatenate(chunks[name], axis=1), res.alarm)
+
+
+def test_stream_window_primitives_with_gap():
+    rng = np.random.default_rng(5)
+    x = 50 + np.cumsum(rng.normal(size=(3, 300)), axis=1)
+    x[1, 40] = np.nan
+    x[2, 120:125] = np.nan
+    for cls in (Mean, Max, Min, Delta, RelativeRange, Slope, Increasing):
+        for window in (1, 6, 45):
+            expr = cls(Signal("x"), window)
+            states, parts, start = {}, [], 0
+            for size in [1] * 50 + [17, 3, 60] * 10:
+                parts.append(np.asarray(expr.update({"x": x[:, start:start + size]}, states, {}), dtype=float))
+                start += size
+            np.testing.assert_allclose(np.concatenate(parts, axis=1), np.asarray(expr.evaluate({"x": x}), dtype=float),
+                                       rtol=1e-9, atol=1e-9, err_msg=f"{cls.__name__}({window})")
+    # 含 NaN 的窗口：和/均值为 NaN，窗口移过缺失样本后恢复
+    mean = Mean(Signal("x"), 6).evaluate({"x": x})
+    assert np.isnan(mean[1, 40:46]).all() and np.isfinite(mean[1, 46:]).all()
+
+
+def test_stream_single_sample_work_independent_of_window(monkeypatch):
+    # 逐样本推进时只有每 window 个样本一次的 O(window) 重算，摊还到每个样本的元素数与窗口长度无关
+    touched = {"elements": 0}
+    resync, close_block = rule_engine._WindowSums._resync, rule_engine._WindowMax._close_block
+
+    def counting_resync(self):
+        touched["elements"] += self.window
+        resync(self)
+
+    def counting_close_block(self):
+        touched["elements"] += self.window
+        close_block(self)
+
+    def no_rescan(*args):
+        raise AssertionError("流式推进不应重新扫描窗口历史")
+
+    monkeypatch.setattr(rule_engine._WindowSums, "_resync", counting_resync)
+    monkeypatch.setattr(rule_engine._WindowMax, "_close_block", counting_close_block)
+    monkeypatch.setattr(rule_engine, "_rolling_sum", no_rescan)
+    monkeypatch.setattr(rule_engine, "_rolling_max", no_rescan)
+
+    rng = np.random.default_rng(0)
+    per_sample = []
+    for window in (10, 200):
+        x = Signal("x")
+        exprs = [Mean(x, window), Max(x, window), Min(x, window), Delta(x, window), RelativeRange(x, window),
+                 Slope(x, window), Increasing(x, window)]
+        engine = RuleEngine([Rule(f"r{i}", expr > 0) for i, expr in enumerate(exprs)])
+        stream = engine.stream(4)
+        stream.update({"x": rng.normal(size=(4, 3 * window))})
+        touched["elements"] = 0
+        samples = 4 * window
+        for value in rng.normal(size=(samples, 4)):
+            stream.update({"x": value})
+        per_sample.append(touched["elements"] / samples)
+    # 7 个窗口运算共 8 个需要重算的滚动状态（RelativeRange 含 3 个，Delta 为纯环形缓冲区），各摊还约 1 个元素/样本
+    assert per_sample[0] == pytest.approx(8.0, abs=0.2)
+    assert per_sample[1] == pytest.approx(8.0, abs=0.2)
\ No newline at end of file
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from src.analysis.scenario_comparison import compare_scenarios
+from src.service.simulation_service import SpecError
+
+SCENARIOS = {
+    "baseline": {},
+    "slow_ramp": {"turbine": {"max_ramp_rate": 5.0}},
+    "baseline_copy": {"turbine": {"max_ramp_rate": 50.0}},
+}
+
+
+@pytest.fixture(scope="module")
+def comparisons():
+    kwargs = dict(n_realizations=16, hours=1, seed=11, base={"wind": {"mean_wind": 9.0}})
+    return (compare_scenarios(SCENARIOS, **kwargs),
+            compare_scenarios(SCENARIOS, common_random_numbers=False, **kwargs))
+
+
+def test_identical_scenarios_have_zero_paired_difference(comparisons):
+    crn, _ = comparisons
+    np.testing.assert_array_equal(crn.values[0], crn.values[2])
+    diff = crn.paired_differences("baseline")["baseline_copy"]["energy_kwh"]
+    assert diff["mean"] == 0 and diff["ci_low"] == diff["ci_high"] == 0
+
+
+def test_common_random_numbers_narrow_confidence_intervals(comparisons):
+    crn, independent = comparisons
+    paired = crn.paired_differences("baseline")["slow_ramp"]
+    unpaired = independent.paired_differences("baseline")["slow_ramp"]
+    # 方差缩减倍数本身是 16 次实现的样本估计：能量/转速约 5~10 倍，轴承温度数十倍以上
+    for metric, reduction in (("energy_kwh", 4), ("mean_rpm", 4), ("mean_bearing_temp", 20)):
+        assert paired[metric]["variance_reduction"] > reduction, metric
+        assert paired[metric]["std_err"] < unpaired[metric]["std_err"] / 1.5, metric
+    # 共用风速实现，两组对比的场景均值接近，但 CRN 的置信区间足以判断差异方向
+    energy = paired["energy_kwh"]
+    assert energy["ci_low"] <= energy["mean"] <= energy["ci_high"]
+    assert set(crn.summary()) == set(SCENARIOS)
+
+
+def test_scenarios_cannot_change_shared_wind():
+    with pytest.raises(SpecError):
+        compare_scenarios({"a": {}, "b": {"wind": {"mean_wind": 12.0}}}, n_realizations=2, hours=1)
+
+
+def test_compare_turbine_classes():
+    scenarios = {
+        "2.5MW": {"turbine": {"v_in": 3.0, "v_rated": 12.0, "v_out": 25.0, "p_rated": 2500.0,
+                              "rpm_rated": 14.0, "rpm_min": 6.0}},
+        "5kW": {"turbine": {"v_in": 2.5, "v_rated": 10.0, "v_out": 20.0, "p_rated": 5.0,
+                            "rpm_rated": 300.0, "rpm_min": 75.0}},
+    }
+    comparison = compare_scenarios(scenarios, n_realizations=3, hours=1, seed=2)
+    summary = comparison.summary()
+    assert summary["2.5MW"]["energy_kwh"]["mean"] > 100 * summary["5kW"]["energy_kwh"]["mean"]
+    assert summary["5kW"]["mean_rpm"]["mean"] > 10 * summary["2.5MW"]["mean_rpm"]["mean"]
+    diff = comparison.paired_differences("2.5MW")["5kW"]["energy_kwh"]
+    assert diff["ci_high"] < 0
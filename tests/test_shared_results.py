@@ -0,0 +1,41 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from src.service.simulation_service import SimulationRun, normalize_spec
+from src.storage.shared_results import SharedResultBuffers, run_fleet_parallel
+
+
+@pytest.mark.parametrize("backend", ["shm", "memmap"])
+def test_parallel_fleet_matches_serial_runs(tmp_path, backend):
+    specs = [{"seed": seed, "wind": {"mean_wind": 6.0 + seed}} for seed in range(3)]
+    with run_fleet_parallel(specs, hours=2, max_workers=2, backend=backend, directory=str(tmp_path)) as (buffers, metadata):
+        assert [m["row"] for m in metadata] == [0, 1, 2]
+        assert buffers["second.power_kw"].shape == (3, 2 * 3600)
+        for row, spec in enumerate(specs):
+            expected = SimulationRun(normalize_spec(spec)).advance(2)
+            tables = buffers.tables(row)
+            for resolution, columns in expected.items():
+                for column, values in columns.items():
+                    np.testing.assert_array_equal(tables[resolution][column], values)
+            # 行视图直接指向共享缓冲区
+            assert np.shares_memory(tables["second"]["power_kw"], buffers["second.power_kw"])
+
+
+def test_handle_is_small_and_workers_write_in_place():
+    with SharedResultBuffers(n_turbines=4, signals={"second.rpm": 86400}) as buffers:
+        payload = pickle.dumps(buffers.handle)
+        assert len(payload) < 1024 < buffers.nbytes
+        attached = pickle.loads(payload).attach()
+        attached["second.rpm"][2] = 7.0
+        attached.close()
+        assert np.all(buffers["second.rpm"][2] == 7.0)
+        assert np.isnan(buffers["second.rpm"][1]).all()
+
+
+def test_invalid_backend():
+    with pytest.raises(ValueError):
+        SharedResultBuffers(1, {"a": 1}, backend="pickle")
+    with pytest.raises(ValueError):
+        SharedResultBuffers(1, {"a": 1}, backend="memmap")
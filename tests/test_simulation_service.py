@@ -0,0 +1,124 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from src.service.simulation_service import (
+    SimulationService,
+    SpecError,
+    normalize_spec,
+    spec_key,
+    start_simulation_server,
+)
+
+
+def test_spec_key_ignores_duration_and_explicit_defaults():
+    a = normalize_spec({"seed": 1, "duration_hours": 2})
+    b = normalize_spec({"seed": 1, "duration_hours": 5, "turbine": {"p_rated": 2000.0}, "resolutions": ["hour"]})
+    c = normalize_spec({"seed": 2})
+    assert spec_key(a) == spec_key(b) != spec_key(c)
+    with pytest.raises(SpecError):
+        normalize_spec({"turbine": {"no_such_param": 1}})
+    with pytest.raises(SpecError):
+        normalize_spec({"duration_hours": 0})
+
+
+def test_object_parameters_rejected_in_spec():
+    assert "rotor_model" not in normalize_spec({})["turbine"]
+    for turbine in ({"rotor_model": "x"}, {"rng": 1}, {"dtype": "float32"}):
+        with pytest.raises(SpecError):
+            normalize_spec({"turbine": turbine})
+
+
+def test_turbine_rpm_range_passed_to_bearings(tmp_path):
+    turbine = {"v_in": 2.5, "v_rated": 10.0, "v_out": 20.0, "p_rated": 5.0, "rpm_min": 75.0, "rpm_rated": 300.0}
+    spec = normalize_spec({"turbine": turbine})
+    assert spec["turbine"]["rpm_rated"] == 300.0
+    assert "rpm_rated" not in spec["bearing_temp"]
+    with pytest.raises(SpecError):
+        normalize_spec({"bearing_vibration": {"rpm_rated": 300.0}})
+
+    result = SimulationService(str(tmp_path)).simulate({"turbine": turbine, "seed": 3, "duration_hours": 1})
+    rpm = result["second"]["rpm"]
+    assert rpm.max() > 100.0
+    assert result["second"]["power_kw"].max() <= 5.0 * 1.2
+    assert np.isfinite(result["minute"]["bearing_temp"]).all()
+
+
+def test_cache_hit_and_incremental_extension_match_fresh_run(tmp_path):
+    spec = {"seed": 7, "wind": {"mean_wind": 9.0}, "duration_hours": 1}
+    service = SimulationService(str(tmp_path / "a"))
+    first = service.simulate(spec)
+    assert first["cache"] == "miss"
+    assert service.simulate(spec)["cache"] == "hit"
+    extended = service.simulate({**spec, "duration_hours": 3})
+    assert extended["cache"] == "extended"
+    assert len(extended["second"]["power_kw"]) == 3 * 3600
+    assert len(extended["minute"]["bearing_temp"]) == 3 * 60
+
+    fresh = SimulationService(str(tmp_path / "b")).simulate({**spec, "duration_hours": 3})
+    for res in ("second", "minute", "hour"):
+        for col, values in fresh[res].items():
+            np.testing.assert_array_equal(extended[res][col], values)
+    np.testing.assert_array_equal(first["second"]["wind_speed"], fresh["second"]["wind_speed"][:3600])
+
+    shorter = service.simulate({**spec, "duration_hours": 2, "resolutions": ["hour"]})
+    assert shorter["cache"] == "hit" and set(shorter) >= {"hour"} and "second" not in shorter
+    np.testing.assert_array_equal(shorter["hour"]["power_kw"], fresh["hour"]["power_kw"][:2])
+
+
+def test_model_version_and_unreadable_state_invalidate_entry(tmp_path, monkeypatch):
+    spec = {"seed": 4, "duration_hours": 1}
+    service = SimulationService(str(tmp_path))
+    first = service.simulate(spec)
+    with open(tmp_path / first["key"] / "state.pkl", "wb") as f:
+        f.write(b"not a pickle")
+    again = service.simulate({**spec, "duration_hours": 2})
+    assert again["cache"] == "miss"
+    np.testing.assert_array_equal(again["second"]["power_kw"][:3600], first["second"]["power_kw"])
+
+    monkeypatch.setattr("src.service.simulation_service.MODEL_VERSION", 2)
+    assert spec_key(normalize_spec(spec)) != first["key"]
+    # 旧版本写入的条目即使键相同也不会被复用
+    assert service.cache.load(first["key"]) is None
+    assert service.simulate(spec)["cache"] == "miss"
+
+
+def test_lru_eviction_bounds_cache_size(tmp_path):
+    service = SimulationService(str(tmp_path), max_cache_bytes=200_000)
+    for seed in range(3):
+        service.simulate({"seed": seed, "duration_hours": 1})
+    stats = service.cache.stats()
+    # 单个条目约 120 KB，只保留最近写入的一个
+    assert stats["entries"] == 1
+    assert service.simulate({"seed": 2, "duration_hours": 1})["cache"] == "hit"
+    assert service.simulate({"seed": 0, "duration_hours": 1})["cache"] == "miss"
+
+
+def test_http_roundtrip(tmp_path):
+    async def scenario():
+        server = await start_simulation_server(SimulationService(str(tmp_path)), port=0)
+        port = server.sockets[0].getsockname()[1]
+
+        async def request(method, path, payload=None):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            body = json.dumps(payload).encode() if payload is not None else b""
+            writer.write(f"{method} {path} HTTP/1.1\r\nHost: x\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+            await writer.drain()
+            raw = await reader.read()
+            writer.close()
+            head, _, content = raw.partition(b"\r\n\r\n")
+            return int(head.split()[1]), json.loads(content)
+
+        async with server:
+            status, result = await request("POST", "/simulate", {"seed": 3, "duration_hours": 1,
+                                                                 "resolutions": ["minute"]})
+            assert status == 200 and result["cache"] == "miss"
+            assert len(result["minute"]["power_kw"]) == 60
+            status, result = await request("POST", "/simulate", {"seed": -1})
+            assert status == 400
+            status, result = await request("GET", "/cache")
+            assert status == 200 and result["entries"] == 1
+
+    asyncio.run(scenario())
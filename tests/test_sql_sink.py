@@ -0,0 +1,92 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from src.storage.sql_sink import SqlSink, save_tables
+
+
+def _tables(n):
+    return {
+        "wind_second": {
+            "sec_id": np.arange(n),
+            "wind_speed": np.linspace(0, 20, n),
+            "power_kw": np.linspace(0, 2000, n),
+        },
+        "hourly": {
+            "hour_id": np.arange(n // 3600),
+            "ambient_temp": np.full(n // 3600, 20.0),
+        },
+    }
+
+
+def test_sqlite_roundtrip_and_indexes(tmp_path):
+    path = str(tmp_path / "sim.db")
+    n = 7200
+    with SqlSink(path, batch_size=1000) as sink:
+        tables = _tables(n)
+        for turbine_id in ("001", "002"):
+            for table, columns in tables.items():
+                sink.write_table(table, columns, turbine_id=turbine_id)
+    report = sink.report()
+    assert report["wind_second"].rows == 2 * n
+    assert report["total"].rows == 2 * n + 2 * 2
+    assert report["total"].rows_per_second > 0
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    rows = conn.execute("SELECT sec_id, wind_speed FROM wind_second WHERE turbine_id = '002' ORDER BY sec_id").fetchall()
+    assert len(rows) == n
+    assert rows[-1][1] == pytest.approx(20.0)
+    indexes = {row[1] for row in conn.execute("SELECT * FROM sqlite_master WHERE type = 'index'")}
+    assert {"idx_wind_second_turbine_time", "idx_hourly_turbine_time"} <= indexes
+    conn.close()
+
+
+def test_column_mismatch_rolls_back(tmp_path):
+    path = str(tmp_path / "sim.db")
+    with pytest.raises(ValueError):
+        with SqlSink(path) as sink:
+            sink.write_table("hourly", {"hour_id": np.arange(3)})
+            sink.write_table("hourly", {"hour_id": np.arange(3), "extra": np.zeros(3)})
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'hourly'").fetchone() is None
+    conn.close()
+
+
+def test_save_tables_and_unknown_backend(tmp_path):
+    report = save_tables(str(tmp_path / "sim.db"), _tables(3600), turbine_id="007")
+    assert report["hourly"].rows == 1
+    with pytest.raises(ValueError):
+        SqlSink(str(tmp_path / "x.db"), backend="postgres")
+
+
+def test_rerun_replaces_rows_of_same_turbine(tmp_path):
+    path = str(tmp_path / "sim.db")
+    save_tables(path, _tables(3600), turbine_id="001")
+    save_tables(path, _tables(3600), turbine_id="1")
+    save_tables(path, _tables(7200), turbine_id="001")
+    conn = sqlite3.connect(path)
+    counts = dict(conn.execute("SELECT turbine_id, COUNT(*) FROM wind_second GROUP BY turbine_id").fetchall())
+    assert counts == {"001": 7200, "1": 3600}
+    conn.close()
+
+    with SqlSink(path, replace=False) as sink:
+        assert sink.index_seconds == 0.0
+        sink.write_table("hourly", _tables(3600)["hourly"], turbine_id="1")
+    assert sink.index_seconds > 0
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT COUNT(*) FROM hourly WHERE turbine_id = '1'").fetchone()[0] == 2
+    conn.close()
+
+
+def test_registry_ids_stored_as_text(tmp_path):
+    path = str(tmp_path / "sim.db")
+    save_tables(path, _tables(3600), turbine_id="WTG-01")
+    save_tables(path, _tables(3600), turbine_id="WTG-02")
+    conn = sqlite3.connect(path)
+    column_types = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(wind_second)")}
+    assert column_types["turbine_id"] == "TEXT"
+    counts = dict(conn.execute("SELECT turbine_id, COUNT(*) FROM hourly GROUP BY turbine_id").fetchall())
+    assert counts == {"WTG-01": 1, "WTG-02": 1}
+    conn.close()
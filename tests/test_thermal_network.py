@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from src.simulations.bearing.bearing_temp_simulator import BearingTemperatureSimulator
+from src.simulations.thermal.thermal_network import DRIVETRAIN_NODES, ThermalNetwork
+
+
+class TestThermalNetwork:
+    def test_reduces_to_bearing_model(self):
+        rng = np.random.default_rng(0)
+        rpm = np.concatenate([np.full(30, 3.0), rng.uniform(7.0, 16.0, size=200), np.full(20, 0.0)])
+        ambient = 10.0 + 5.0 * np.sin(np.arange(len(rpm)) / 40.0)
+        bearing = BearingTemperatureSimulator(rpm_min=6.0, rpm_rated=15.0, tau=10.0, sigma=0.0, method="exact")
+        network = ThermalNetwork.from_bearing_simulator(bearing)
+        expected = bearing.simulate(ambient, rpm)
+        temps = network.simulate(ambient, rpm, initial=np.array([[40.0]]))
+        np.testing.assert_allclose(temps[0, :, 0], expected, atol=1e-9)
+
+    def test_noise_matches_exact_ou_variance(self):
+        bearing = BearingTemperatureSimulator(tau=10.0, sigma=1.0, dt=5.0)
+        network = ThermalNetwork.from_bearing_simulator(bearing, rng=np.random.default_rng(1))
+        # 平稳 OU 过程的方差 σ² τ / 2
+        assert network.noise_chol[0, 0] ** 2 == pytest.approx(0.5 * 10.0 * (1 - np.exp(-2 * 5.0 / 10.0)))
+
+    def test_drivetrain_converges_to_steady_state(self):
+        network = ThermalNetwork.drivetrain(sigma=0.0, dt=10.0)
+        steps = 2000
+        temps = network.simulate(np.full((3, steps), 15.0), np.full((3, steps), 15.0), np.full((3, steps), 2000.0))
+        assert temps.shape == (3, steps, len(DRIVETRAIN_NODES))
+        np.testing.assert_allclose(temps[:, -1], network.steady_state(15.0, 15.0, 2000.0).repeat(3, axis=0), atol=1e-6)
+        winding = temps[0, -1, network.node_index("generator_winding")]
+        assert winding > temps[0, -1, network.node_index("nacelle")] > 15.0
+
+    def test_coupling_heats_neighbours(self):
+        # 只有发电机绕组发热（rpm 在最低转速以下），热量经机舱传到主轴承
+        network = ThermalNetwork.drivetrain(sigma=0.0)
+        steady = network.steady_state(15.0, 0.0, 2000.0)[0]
+        assert steady[network.node_index("main_bearing")] > 15.0
+
+    def test_batched_step_is_per_turbine(self):
+        network = ThermalNetwork.drivetrain(sigma=0.0)
+        state = network.init_state(2, ambient=[10.0, 20.0])
+        batched = network.step(state, [10.0, 20.0], [12.0, 8.0], [1500.0, 300.0])
+        single = network.step(state[1:], 20.0, [8.0], [300.0])
+        np.testing.assert_allclose(batched[1], single[0])
+
+    def test_invalid_conductance(self):
+        with pytest.raises(ValueError):
+            ThermalNetwork(("a", "b"), [1.0, 1.0], [[0.0, 1.0], [0.5, 0.0]], [1.0, 1.0])
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from src.storage.tile_pyramid import TilePyramidStore
+
+
+def test_incremental_append_matches_direct_aggregation(tmp_path):
+    rng = np.random.default_rng(0)
+    power = rng.uniform(0, 2000, 3 * 3600 + 17)
+    power[100:130] = np.nan
+    store = TilePyramidStore(str(tmp_path), signals=("power_kw",))
+    # 块长度不与任何桶宽对齐，验证未满桶的合并
+    for lo in range(0, len(power), 997):
+        store.append("002", {"power_kw": power[lo:lo + 997]})
+    assert store.n_samples("002") == len(power)
+
+    result = store.query("002", "power_kw", 0, 3 * 3600, max_points=200)
+    assert result["level"] == 60
+    minutes = power[:3 * 3600].reshape(-1, 60)
+    np.testing.assert_allclose(result["mean"], np.nanmean(minutes, axis=1))
+    np.testing.assert_allclose(result["max"], np.nanmax(minutes, axis=1), rtol=1e-6)
+    np.testing.assert_array_equal(result["count"][1:3], [60 - 20, 60 - 10])
+    np.testing.assert_array_equal(result["time"][:3], [0, 60, 120])
+
+
+def test_query_selects_level_and_bounds_points(tmp_path):
+    store = TilePyramidStore(str(tmp_path), signals=("rpm",))
+    store.append(1, {"rpm": np.arange(2 * 86400, dtype=float)})
+    fine = store.query(1, "rpm", 1000, 1500)
+    assert fine["level"] == 1 and len(fine["mean"]) == 500
+    coarse = store.query(1, "rpm", 0, 2 * 86400)
+    assert coarse["level"] == 600 and len(coarse["mean"]) <= 2000
+    assert coarse["mean"][0] == pytest.approx(299.5)
+    # 超出已写入范围的部分被截断
+    tail = store.query(1, "rpm", 2 * 86400 - 30, 3 * 86400, max_points=100000)
+    assert len(tail["mean"]) == 30
+
+
+def test_reopen_from_index(tmp_path):
+    store = TilePyramidStore(str(tmp_path), signals=("power_kw",), levels=(1, 10))
+    store.append("a", {"power_kw": np.ones(25)})
+    reopened = TilePyramidStore(str(tmp_path))
+    assert reopened.levels == (1, 10)
+    reopened.append("a", {"power_kw": np.ones(5) * 3})
+    result = reopened.query("a", "power_kw", 0, 30, max_points=3)
+    np.testing.assert_allclose(result["mean"], [1, 1, 2])
+    with pytest.raises(KeyError):
+        reopened.append("a", {"rpm": np.ones(3)})
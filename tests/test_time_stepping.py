@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from src.simulations.bearing.bearing_temp_simulator import BearingTemperatureSimulator
+from src.simulations.time_stepping import OUCoefficientCache, adaptive_segments, ou_coefficients, ou_step
+from src.simulations.wind.wind_speed_simu import WindSpeedSimulator
+
+
+def test_exact_transition_keeps_stationary_variance_at_large_dt():
+    rng = np.random.default_rng(0)
+    tau, sigma, dt = 5.0, 2.0, 20.0  # dt 远大于 tau，Euler 方法会发散
+    x = np.zeros(200000)
+    for _ in range(10):
+        x = ou_step(x, 0.0, tau, sigma, dt, rng.standard_normal(x.shape), "exact")
+    assert x.var() == pytest.approx(sigma ** 2 * tau / 2, rel=0.02)
+
+    a, _ = ou_coefficients(tau, sigma, dt, "euler")
+    assert abs(a) > 1  # Euler 在该步长下不稳定
+
+
+def test_simulators_accept_method():
+    sim = WindSpeedSimulator(dt=60.0, method="exact")
+    speeds, _ = sim.simulate(10)
+    assert len(speeds) == 10
+    with pytest.raises(ValueError):
+        WindSpeedSimulator(method="rk4")
+
+
+def test_cached_coefficients_follow_parameter_changes():
+    cache = OUCoefficientCache()
+    assert cache(5.0, 2.0, 1.0, "exact") == tuple(float(v) for v in ou_coefficients(5.0, 2.0, 1.0, "exact"))
+    assert cache(5.0, 2.0, 0.5, "euler") == (0.9, 2.0 * np.sqrt(0.5))
+
+    sim = WindSpeedSimulator(dt=1.0, rng=np.random.default_rng(0))
+    sim.step()
+    sim.dt, sim.method = 30.0, "exact"
+    before = sim.wind_speed
+    sim.step()
+    noise = np.random.default_rng(0).normal(size=4)[2]
+    expected = ou_step(before, sim.mean_wind, sim.tau, sim.sigma, 30.0, noise, "exact")
+    assert sim.wind_speed == pytest.approx(max(expected, 0.0))
+
+
+def test_adaptive_segments_merge_steady_periods():
+    rpm = np.concatenate([np.zeros(1000), np.full(1000, 12.0), np.linspace(12, 15, 10)])
+    starts = adaptive_segments([rpm], [0.5], idle_mask=rpm <= 6.0)
+    assert starts[0] == 0 and starts[1] == 1000
+    assert len(starts) < 20
+
+
+def test_bearing_adaptive_matches_stepwise_statistics():
+    np.random.seed(0)
+    minutes = 20000
+    rpm = np.where(np.arange(minutes) % 5000 < 2500, 3.0, 12.0)
+    ambient = np.full(minutes, 20.0)
+
+    sim = BearingTemperatureSimulator(method="exact")
+    ends, temps = sim.simulate_adaptive(ambient, rpm)
+    assert len(ends) < minutes / 100
+
+    # 运行段末尾温度的期望为 环境温度 + 摩擦温升
+    running = rpm[ends] > 6.0
+    expected = 20.0 + sim._get_friction_heat_rise(12.0)
+    assert temps[running].mean() == pytest.approx(expected, abs=3.0)
+    np.testing.assert_allclose(temps[~running], 20.0)
@@ -0,0 +1,80 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from src.simulations.wind.wind_field_manager import WindFieldManager
+from src.simulations.wind.wind_speed_simu import WindSpeedSimulator
+from src.storage.wind_cache import BLOCK_STEPS, WindRealizationCache, generate_blocks, wind_key, wind_params
+
+
+def reference(steps, seed, **params):
+    params = wind_params(WindSpeedSimulator(dt=1.0, **params))
+    state = {"wind_speed": params["mean_wind"], "wind_dir": params["mean_dir"]}
+    speeds, dirs, _ = generate_blocks(params, np.random.default_rng(seed), state, -(-steps // BLOCK_STEPS))
+    return speeds[:steps], dirs[:steps]
+
+
+def test_hit_prefix_and_extension_match_fresh_realization(tmp_path):
+    cache = WindRealizationCache(str(tmp_path))
+    simulator = WindSpeedSimulator(dt=1.0, mean_wind=8.0)
+    speeds, dirs, status = cache.get(simulator, seed=5, steps=1000)
+    assert status == "miss" and isinstance(speeds, np.memmap)
+    steps = 2 * BLOCK_STEPS + 500
+    expected_speeds, expected_dirs = reference(steps, 5, mean_wind=8.0)
+    np.testing.assert_array_equal(speeds, expected_speeds[:1000])
+    assert abs(expected_speeds.mean() - 8.0) < 1.5
+
+    speeds, _, status = cache.get(simulator, seed=5, steps=BLOCK_STEPS)
+    assert status == "hit" and len(speeds) == BLOCK_STEPS
+    speeds, dirs, status = cache.get(simulator, seed=5, steps=steps)
+    assert status == "extended"
+    np.testing.assert_array_equal(speeds, expected_speeds)
+    np.testing.assert_array_equal(dirs, expected_dirs)
+
+    # 参数或种子不同则为不同条目
+    assert cache.get(simulator, seed=6, steps=10)[2] == "miss"
+    assert cache.get(WindSpeedSimulator(dt=1.0, mean_wind=9.0), seed=5, steps=10)[2] == "miss"
+    assert cache.stats()["entries"] == 3
+
+
+def test_state_is_plain_json_and_key_is_versioned(tmp_path, monkeypatch):
+    cache = WindRealizationCache(str(tmp_path))
+    simulator = WindSpeedSimulator(dt=1.0)
+    cache.get(simulator, seed=1, steps=10)
+    key = wind_key(wind_params(simulator), 1)
+    assert sorted(os.listdir(tmp_path / key)) == ["dirs.npy", "meta.json", "speeds.npy"]
+    with open(tmp_path / key / "meta.json", encoding="utf-8") as f:
+        assert json.load(f)["version"] == 2
+
+    monkeypatch.setattr("src.storage.wind_cache.WIND_CACHE_VERSION", 3)
+    assert wind_key(wind_params(simulator), 1) != key
+    assert cache.get(simulator, seed=1, steps=10)[2] == "miss"
+
+
+def test_lru_eviction_bounds_size(tmp_path):
+    cache = WindRealizationCache(str(tmp_path), max_bytes=150_000)
+    simulator = WindSpeedSimulator(dt=1.0)
+    for seed in range(4):
+        cache.get(simulator, seed=seed, steps=1000)     # 每个条目一块，约 58 KB
+    stats = cache.stats()
+    assert stats["bytes"] <= 150_000 and stats["entries"] == 2
+    assert cache.get(simulator, seed=3, steps=1000)[2] == "hit"
+    assert cache.get(simulator, seed=0, steps=1000)[2] == "miss"
+
+
+def test_manager_reads_consecutive_chunks_from_cache(tmp_path):
+    cache = WindRealizationCache(str(tmp_path))
+    manager = WindFieldManager(WindSpeedSimulator(dt=1.0), cache=cache, seed=1, dtype=np.float32)
+    first, _ = manager.simulate(3000)
+    second, _ = manager.simulate(2000)
+    assert manager.cache_status == "extended" and first.dtype == np.float32
+    expected, _ = reference(5000, 1)
+    np.testing.assert_allclose(np.concatenate([first, second]), expected, rtol=1e-6)
+    assert manager.get_current_conditions()[0] == pytest.approx(expected[-1])
+
+    again = WindFieldManager(WindSpeedSimulator(dt=1.0), cache=cache, seed=1)
+    speeds, _ = again.simulate(5000)
+    assert again.cache_status == "hit"
+    np.testing.assert_array_equal(speeds, expected)
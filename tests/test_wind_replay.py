@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.simulations.turbine.wind_turbine_power_simu import WindTurbinePowerSimulator
+from src.simulations.wind.wind_field_manager import WindFieldManager
+from src.simulations.wind.wind_replay import WindReplaySource, replay_chunks
+
+
+def _write_csv(path, n=5000):
+    rng = np.random.default_rng(0)
+    pd.DataFrame({
+        "sec_id": np.arange(n),
+        "wind_speed": 8 + rng.normal(size=n),
+        "wind_dir": rng.uniform(-180, 180, n),
+    }).to_csv(path, index=False)
+
+
+def test_csv_chunks_match_direct_read(tmp_path):
+    path = str(tmp_path / "wind_second.csv")
+    _write_csv(path)
+    frame = pd.read_csv(path)
+    source = WindReplaySource(path, chunk_rows=777)
+    chunks = list(source.iter_chunks(chunk_steps=1000))
+    assert [len(c[0]) for c in chunks] == [1000] * 5
+    speeds = np.concatenate([c[0] for c in chunks])
+    dirs = np.concatenate([c[1] for c in chunks])
+    np.testing.assert_allclose(speeds, frame["wind_speed"])
+    np.testing.assert_allclose(np.cos(np.deg2rad(dirs)), np.cos(np.deg2rad(frame["wind_dir"])), atol=1e-9)
+
+
+def test_irregular_timestamps_gaps_and_direction_wrap(tmp_path):
+    path = str(tmp_path / "scada.npy")
+    t = np.array([0.0, 2.0, 1.5, 4.0, 20.0, 21.0])   # 1.5 乱序被丢弃，4→20 为缺测
+    data = np.zeros(len(t), dtype=[("t", "f8"), ("v", "f8"), ("d", "f8")])
+    data["t"], data["v"], data["d"] = t, [0, 2, 9, 4, 20, 21], [170, -170, 0, 10, 10, 10]
+    np.save(path, data)
+    source = WindReplaySource(path, time_column="t", speed_column="v", dir_column="d", max_gap=5.0)
+    speeds, dirs = source.simulate(100)
+    assert len(speeds) == 22
+    np.testing.assert_allclose(speeds[:5], [0, 1, 2, 3, 4])
+    # 170° 与 -170° 之间沿短弧插值，经过 180°
+    assert abs(abs(dirs[1]) - 180.0) < 1e-9
+    np.testing.assert_allclose(speeds[5:20], 4.0)
+    assert source.gap_steps == 15
+    assert speeds[20] == pytest.approx(20.0)
+
+
+def test_binary_memmap_and_field_manager(tmp_path):
+    path = str(tmp_path / "wind.bin")
+    raw = np.column_stack([np.arange(0, 600, 10.0), np.linspace(5, 11, 60), np.zeros(60)])
+    raw.astype(np.float32).tofile(path)
+    source = WindReplaySource(path, binary_dtype=np.float32, dt=1.0)
+    manager = WindFieldManager(replay_source=source)
+    assert manager.dt == 1.0
+    speeds, _ = manager.simulate(steps=591)
+    assert len(speeds) == 591
+    assert speeds[5] == pytest.approx(5.0 + 0.5 * (6.0 / 59))
+    assert manager.get_current_conditions()[0] == pytest.approx(11.0)
+
+
+def test_replay_chunks_keep_power_state_continuous(tmp_path):
+    path = str(tmp_path / "wind_second.csv")
+    _write_csv(path, n=3 * 3600)
+    turbine = WindTurbinePowerSimulator(noise_sigma=0.0, rpm_noise_sigma=0.0)
+    chunks = list(replay_chunks(WindReplaySource(path), turbine, chunk_minutes=30))
+    assert len(chunks) == 6
+    power = np.concatenate([c["second"]["power_kw"] for c in chunks])
+    expected = turbine.power_from_speed(pd.read_csv(path)["wind_speed"].to_numpy())
+    np.testing.assert_allclose(power, expected)